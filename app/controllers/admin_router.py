@@ -3,12 +3,14 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
 
-from app.libs.sql_alchemy_lib import get_db
+from app.libs.sql_alchemy_lib import get_db, get_read_db
 from app.libs.jwt_lib import jwt_service, jwt_dto
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 from app.services import user_services, order_services, payment_services
 from app.services.admin_dashboard_summary import get_admin_dashboard_summary
-from app.dtos import user_dtos, order_dtos, payment_dtos, admin_dashboard_dtos
+from app.services.admin_metrics import get_cache_report, get_db_session_stats, get_redis_health
+from app.dtos import user_dtos, order_dtos, payment_dtos, admin_dashboard_dtos, admin_metrics_dtos
 
 
 router = APIRouter(
@@ -164,20 +166,22 @@ def admin_login(user: user_dtos.UserLoginPayloadDto, db: Session = Depends(get_d
     "/orders",
     response_model=order_dtos.GetOrderInfoResponseDto,
     summary="Admin get all orders",
-    description="Mengambil seluruh order untuk kebutuhan dashboard admin. Mendukung pagination dasar dan filter status. Allowed status: pending, paid, processing, shipped, completed, cancelled, failed, capture, refund.",
+    description="Mengambil seluruh order untuk kebutuhan dashboard admin. Mendukung pagination (`skip` atau `cursor`) dan filter status. Allowed status: pending, paid, processing, shipped, completed, cancelled, failed, capture, refund.",
 )
 def admin_get_all_orders(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
     order_status: str | None = Query(default=None, alias="status"),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: Session = Depends(get_read_db),
 ):
     result = order_services.list_all_orders(
         db=db,
         skip=skip,
         limit=limit,
         status_filter=order_status,
+        cursor=cursor,
     )
 
     if result.error:
@@ -244,20 +248,22 @@ def admin_update_order_status(
     "/payments",
     response_model=payment_dtos.AdminPaymentListResponseDto,
     summary="Admin get all payments",
-    description="Mengambil seluruh payment untuk monitoring admin, dengan filter status transaksi dan pagination dasar. Allowed status: pending, settlement, expire, cancel, deny, refund, capture.",
+    description="Mengambil seluruh payment untuk monitoring admin, dengan filter status transaksi dan pagination (`skip` atau `cursor`). Allowed status: pending, settlement, expire, cancel, deny, refund, capture.",
 )
 def admin_get_all_payments(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
     transaction_status: str | None = Query(default=None, alias="status"),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: Session = Depends(get_read_db),
 ):
     result = payment_services.list_all_payments(
         db=db,
         skip=skip,
         limit=limit,
         transaction_status_filter=transaction_status,
+        cursor=cursor,
     )
 
     if result.error:
@@ -308,7 +314,7 @@ def admin_get_payment_detail(
     "/users",
     response_model=user_dtos.AdminUserListResponseDto,
     summary="Admin get all users",
-    description="Mengambil seluruh user untuk monitoring admin dan owner. Mendukung filter role, status aktif, dan pagination dasar.",
+    description="Mengambil seluruh user untuk monitoring admin dan owner. Mendukung filter role, status aktif, dan pagination (`skip` atau `cursor`).",
 )
 def admin_get_all_users(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
@@ -316,7 +322,8 @@ def admin_get_all_users(
     limit: int = Query(default=100, ge=1, le=500),
     role: str | None = Query(default=None),
     is_active: bool | None = Query(default=None),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: Session = Depends(get_read_db),
 ):
     result = user_services.list_all_users(
         db=db,
@@ -324,6 +331,7 @@ def admin_get_all_users(
         limit=limit,
         role=role,
         is_active=is_active,
+        cursor=cursor,
     )
 
     if result.error:
@@ -428,6 +436,61 @@ def admin_dashboard_summary(
     return result.unwrap()
 
 
+@router.get(
+    "/metrics/db-sessions",
+    response_model=admin_metrics_dtos.DbSessionStatsResponseDto,
+    summary="Admin database session stats",
+    description="Menampilkan jumlah request yang dilayani tanpa menyentuh database (misalnya cache hit Redis) sejak proses berjalan.",
+)
+def admin_db_session_stats(
+    jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
+):
+    result = get_db_session_stats()
+
+    if result.error:
+        raise result.error
+
+    return result.unwrap()
+
+
+@router.get(
+    "/metrics/redis",
+    response_model=admin_metrics_dtos.RedisHealthResponseDto,
+    summary="Admin Redis health",
+    description="Menampilkan status circuit breaker Redis (closed/open), jumlah kegagalan dan perintah yang dilewati, serta pemakaian connection pool pada proses ini.",
+)
+def admin_redis_health(
+    jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
+):
+    result = get_redis_health()
+
+    if result.error:
+        raise result.error
+
+    return result.unwrap()
+
+
+@router.get(
+    "/metrics/cache",
+    response_model=admin_metrics_dtos.CacheReportResponseDto,
+    summary="Admin cache report",
+    description=(
+        "Menampilkan hit, miss, error, byte yang ditulis dan latensi Redis per namespace cache sejak proses berjalan, "
+        "ditambah estimasi jumlah key dan memori per namespace dari sampel `MEMORY USAGE`. Dipakai untuk menyetel TTL."
+    ),
+)
+def admin_cache_report(
+    jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
+    sample_keys: int = Query(100, ge=1, le=1000, description="Jumlah maksimum key contoh per namespace untuk MEMORY USAGE"),
+):
+    result = get_cache_report(sample_keys=sample_keys)
+
+    if result.error:
+        raise result.error
+
+    return result.unwrap()
+
+
 @router.get(
     "/profile",
     response_model=user_dtos.AdminSelfProfileResponseDto,
@@ -452,7 +515,7 @@ def admin_get_my_profile(
     summary="Admin update own profile without photo",
     description="Memperbarui profil pribadi akun internal yang sedang login tanpa mengganti foto.",
 )
-async def admin_update_my_profile(
+def admin_update_my_profile(
     payload: user_dtos.UserEditProfileDto,
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.admin_access_required)],
     db: Session = Depends(get_db),
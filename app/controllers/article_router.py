@@ -1,12 +1,14 @@
 # routes/article_routes.py
 
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Annotated
 from app.dtos.article_dtos import ArticleCreateDTO, ArticleIdToUpdateDto, ArticleDataUpdateDTO, ArticleInfoUpdateResponseDto, ArticleResponseDTO, ArticleCreateResponseDto, GetAllArticleDTO, AllArticleResponseDto, DeleteArticleDto, DeleteArticleResponseDto
 from app.services import article_services
+from app.libs import http_cache
 from app.libs.sql_alchemy_lib import get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 router = APIRouter(
     prefix="/articles",
@@ -93,6 +95,7 @@ def create_article(
         response_model=AllArticleResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
+        **http_cache.NOT_MODIFIED_RESPONSE,
         status.HTTP_200_OK: {
             "description": "Daftar semua artikel berhasil diambil",
             "content": {
@@ -152,24 +155,33 @@ def create_article(
         summary="Retrieve a list of all articles"
     )
 def read_articles(
+    request: Request,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=10, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """
     # Dapatkan Daftar Semua Artikel #
 
     Endpoint ini digunakan untuk mendapatkan semua artikel yang tersedia dalam database.
+
+    **Parameter:**
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
     
     **Return:**
     - **200 OK**: Daftar semua artikel berhasil diambil.
+    - **304 Not Modified**: Data tidak berubah sejak ETag pada header `If-None-Match`.
     - **409 Conflict**: Terjadi konflik saat mengambil daftar artikel.
     - **500 Internal Server Error**: Kesalahan server saat mengambil daftar artikel.
     """
-    result = article_services.get_articles(db)
+    result = article_services.get_articles(db, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
     
-    return result.unwrap()
+    return http_cache.conditional_response(request, result.unwrap(), http_cache.ARTICLES)
 
 @router.put(
         "/update/{article_id}", 
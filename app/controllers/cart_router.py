@@ -1,14 +1,16 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, status
+from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, status
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Annotated
 
 from app.dtos import cart_dtos
 from app.services import cart_services
 
-from app.libs.sql_alchemy_lib import get_db
+from app.libs.sql_alchemy_lib import get_async_db, get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 router = APIRouter(
     prefix="/cart",
@@ -188,7 +190,10 @@ def post_my_item_of_cart(
 )
 async def get_my_cart(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
-    db: Session = Depends(get_db)
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     # Ambil Keranjang Belanja Pengguna #
@@ -197,6 +202,8 @@ async def get_my_cart(
     
     **Parameter:**
     - **jwt_token**: Token JWT yang digunakan untuk mengidentifikasi pengguna yang sedang login.
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
 
     **Return:**
     - **200 OK**: Data keranjang belanja berhasil diambil.
@@ -206,7 +213,7 @@ async def get_my_cart(
     - **500 Internal Server Error**: Terjadi kesalahan server saat mengambil data keranjang.
     
     """
-    result = cart_services.my_cart(db, jwt_token.id)
+    result = await cart_services.my_cart_async(db, jwt_token.id, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
@@ -258,7 +265,7 @@ async def get_my_cart(
     },
     summary="Get User's Total Item Products in Cart"
 )
-async def get_total_item_in_my_cart(
+def get_total_item_in_my_cart(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
@@ -525,7 +532,7 @@ def update_my_activate_item(
     },    
     summary="Update activate status of all item product in my Cart"
 )
-async def update_all_cart_items(
+def update_all_cart_items(
     activate_update: cart_dtos.UpdateActivateItemDto,
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
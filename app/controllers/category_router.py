@@ -1,10 +1,11 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from sqlalchemy.orm import Session
 from typing import List, Annotated
 from app.dtos import category_dtos
 from app.models.tag_category_model import TagCategoryModel
 
 from app.services import category_services
+from app.libs import http_cache
 from app.libs.sql_alchemy_lib import get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
 
@@ -108,6 +109,7 @@ def create_categories(
     response_model=category_dtos.AllCategoryInfoResponseDto,
     status_code=status.HTTP_200_OK,
     responses={
+        **http_cache.NOT_MODIFIED_RESPONSE,
         status.HTTP_200_OK: {
             "description": "Daftar kategori berhasil diambil",
             "content": {
@@ -149,6 +151,7 @@ def create_categories(
     summary="Get all categories"
 )
 def read_categories(
+    request: Request,
     # jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],    
     db: Session = Depends(get_db)
 ):
@@ -159,6 +162,7 @@ def read_categories(
     
     **Return:**
     - **200 OK**: Daftar kategori berhasil diambil.
+    - **304 Not Modified**: Data tidak berubah sejak ETag pada header `If-None-Match`.
     - **500 Internal Server Error**: Kesalahan server saat mengambil kategori.
     
     """
@@ -167,4 +171,4 @@ def read_categories(
     if result.error:
         raise result.error
 
-    return result.unwrap()
\ No newline at end of file
+    return http_cache.conditional_response(request, result.unwrap(), http_cache.CATEGORIES)
\ No newline at end of file
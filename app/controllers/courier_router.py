@@ -201,7 +201,7 @@ def get_and_save_shipping_cost(
     },
     summary="Get all data courier in my account"
 )
-async def get_my_courier(
+def get_my_courier(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
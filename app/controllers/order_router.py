@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Annotated
 
 from app.services import order_services
 from app.dtos import order_dtos
 
-from app.libs.sql_alchemy_lib import get_db
+from app.libs.sql_alchemy_lib import get_async_db, get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.json_codec import ORJSONResponse
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 
 router = APIRouter(
@@ -192,9 +194,9 @@ def initiate_checkout(
 
     payload = result.data
     if isinstance(payload, dict):
-        return JSONResponse(status_code=payload.get("status_code", 200), content=payload)
+        return ORJSONResponse(status_code=payload.get("status_code", 200), content=payload)
     
-    return JSONResponse(status_code=200, content=payload)
+    return ORJSONResponse(status_code=200, content=payload)
 
 
 @router.get(
@@ -279,7 +281,10 @@ def initiate_checkout(
 )
 async def get_my_order(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
-    db: Session = Depends(get_db)
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     # Get My Orders
@@ -288,6 +293,8 @@ async def get_my_order(
     **Parameter:**
     - **jwt_token**: Payload dari JWT yang mengandung ID pengguna.
     - **db**: Koneksi database dari dependency.
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
 
     **Responses:**
     - **200 OK**: Informasi pesanan berhasil diambil.
@@ -296,7 +303,7 @@ async def get_my_order(
     - **500 Internal Server Error**: Kesalahan server saat mengambil data pesanan.
 
     """
-    result = order_services.my_order(db, jwt_token.id)
+    result = await order_services.my_order_async(db, jwt_token.id, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
@@ -1,14 +1,17 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Query, UploadFile, status
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Annotated
+from typing import List, Annotated, Literal, Optional
 
 from app.dtos import product_dtos, product_image_dtos
 from app.services import product_services
 
-from app.libs.sql_alchemy_lib import get_db
+from app.libs import http_cache
+from app.libs.sql_alchemy_lib import get_async_read_db, get_db, get_read_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 router = APIRouter(
     prefix="/product",
@@ -113,6 +116,7 @@ def create_product(
         response_model=product_dtos.AllProductInfoResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
+            **http_cache.NOT_MODIFIED_RESPONSE,
             status.HTTP_200_OK: {
                 "description": "Daftar semua produk berhasil diambil",
                 "content": {
@@ -170,30 +174,225 @@ def create_product(
         },
         summary="Get all products"
     )
-def read_all_products(   
-    db: Session = Depends(get_db)
+async def read_all_products(   
+    request: Request,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     # Ambil Semua Produk #
 
     Endpoint ini memungkinkan pengguna untuk mengambil semua produk yang tersedia di dalam database.
+
+    **Parameter:**
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
     
     **Return:**
     - **200 OK**: Daftar semua produk berhasil diambil.
+    - **304 Not Modified**: Data tidak berubah sejak ETag pada header `If-None-Match`.
     - **204 No Content**: Tidak ada produk yang tersedia untuk ditampilkan.
     - **500 Internal Server Error**: Kesalahan server saat mengambil daftar produk.
     """
-    result = product_services.all_product(db)
+    result = await product_services.all_product_async(db, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
     
+    return http_cache.conditional_response(request, result.unwrap(), http_cache.PRODUCT_LIST)
+
+# get-product-autocomplete-suggestions
+@router.get(
+        "/autocomplete",
+        response_model=product_dtos.ProductAutocompleteResponseDto,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Saran produk berdasarkan awalan nama produk atau brand",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "Product suggestions for 'jah' can accessed successfully",
+                            "data": [
+                                {
+                                    "id": "PROD-20241106001",
+                                    "name": "Jahe Merah Instan",
+                                    "brand_info": {"id": 1, "name": "Amimum"}
+                                }
+                            ]
+                        }
+                    }
+                }
+            },
+            status.HTTP_500_INTERNAL_SERVER_ERROR: {
+                "description": "Kesalahan server saat mengambil saran produk",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 500,
+                            "error": "Internal Server Error",
+                            "message": "Kesalahan tak terduga saat mengambil saran produk."
+                        }
+                    }
+                }
+            }
+        },
+        summary="Autocomplete product and brand names"
+    )
+def autocomplete_product(
+        q: str,
+        limit: int = 10,
+        db: Session = Depends(get_read_db)
+):
+    """
+    # Saran Autocomplete Produk #
+
+    Endpoint ini dipanggil kotak pencarian pada setiap ketikan. Saran diambil dari indeks
+    prefix di memori atas nama produk dan nama brand, sehingga tidak ada query database.
+
+    **Parameter:**
+    - **q** (str): Awalan kata yang sedang diketik.
+    - **limit** (int): Jumlah saran maksimum (default 10).
+
+    **Return:**
+    - **200 OK**: Daftar saran (bisa kosong).
+    - **500 Internal Server Error**: Kesalahan server saat mengambil saran produk.
+    """
+    result = product_services.autocomplete_product(
+        db,
+        q,
+        min(max(limit, 1), 50)
+    )
+
+    if result.error:
+        raise result.error
+
+    return result.unwrap()
+
+# get-filtered-products-with-facets
+@router.get(
+        "/filter",
+        response_model=product_dtos.ProductFilterResponseDto,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": "Produk terfilter beserta hitungan facet",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 200,
+                            "message": "Filtered list of products can accessed successfully",
+                            "total": 1,
+                            "data": [
+                                {
+                                    "id": "PROD-20241106001",
+                                    "name": "Jahe Merah Instan",
+                                    "price": 15000,
+                                    "min_variant_price": 12000,
+                                    "max_variant_price": 18000,
+                                    "brand_info": {"id": 1, "name": "Amimum"},
+                                    "all_variants": [],
+                                    "created_at": "2024-11-06T10:00:00Z"
+                                }
+                            ],
+                            "facets": {
+                                "brands": [{"id": 1, "name": "Amimum", "count": 1}],
+                                "categories": [{"id": 2, "name": "Minuman Herbal", "count": 1}],
+                                "price_buckets": [{"min_price": 0, "max_price": 25000, "count": 1}]
+                            }
+                        }
+                    }
+                }
+            },
+            status.HTTP_400_BAD_REQUEST: {
+                "description": "Parameter filter tidak valid",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 400,
+                            "error": "Bad Request",
+                            "message": "min_price must not be greater than max_price."
+                        }
+                    }
+                }
+            },
+            status.HTTP_500_INTERNAL_SERVER_ERROR: {
+                "description": "Kesalahan server saat memfilter produk",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "status_code": 500,
+                            "error": "Internal Server Error",
+                            "message": "Kesalahan tak terduga saat memfilter produk."
+                        }
+                    }
+                }
+            }
+        },
+        summary="Filter products with facet counts"
+    )
+def filter_products(
+        brand_ids: List[int] = Query(default=[]),
+        category_ids: List[int] = Query(default=[]),
+        min_price: Optional[float] = Query(default=None, ge=0),
+        max_price: Optional[float] = Query(default=None, ge=0),
+        has_discount: Optional[bool] = Query(default=None),
+        min_rating: Optional[float] = Query(default=None, ge=0, le=5),
+        in_stock: Optional[bool] = Query(default=None),
+        sort_by: Literal["newest", "price_asc", "price_desc", "rating", "discount"] = Query(default="newest"),
+        skip: int = Query(default=0, ge=0),
+        limit: int = Query(default=10, ge=1, le=100),
+        db: Session = Depends(get_read_db)
+):
+    """
+    # Filter Produk dengan Facet #
+
+    Endpoint ini memfilter katalog berdasarkan brand, kategori, rentang harga, diskon, rating
+    dan stok sekaligus, lalu mengembalikan hitungan facet per brand, per kategori dan per
+    rentang harga untuk membangun panel filter di frontend.
+
+    **Parameter:**
+    - **brand_ids** / **category_ids** (list[int]): Boleh diulang, mis. `?brand_ids=1&brand_ids=2`.
+    - **min_price** / **max_price** (float): Rentang harga "mulai dari" produk.
+    - **has_discount** (bool): Hanya produk dengan / tanpa varian diskon.
+    - **min_rating** (float): Rating rata-rata minimum.
+    - **in_stock** (bool): Hanya produk dengan / tanpa varian yang masih ada stok.
+    - **sort_by** (str): `newest`, `price_asc`, `price_desc`, `rating` atau `discount`.
+    - **skip** / **limit** (int): Paginasi.
+
+    **Return:**
+    - **200 OK**: Daftar produk terfilter, total hasil dan facet.
+    - **400 Bad Request**: Parameter filter tidak valid.
+    - **500 Internal Server Error**: Kesalahan server saat memfilter produk.
+    """
+    result = product_services.filter_product(
+        db,
+        product_dtos.ProductFilterDTO(
+            brand_ids=brand_ids,
+            category_ids=category_ids,
+            min_price=min_price,
+            max_price=max_price,
+            has_discount=has_discount,
+            min_rating=min_rating,
+            in_stock=in_stock,
+            sort_by=sort_by,
+            skip=skip,
+            limit=limit
+        )
+    )
+
+    if result.error:
+        raise result.error
+
     return result.unwrap()
 
 # get-list-product-by-keyword-search
 @router.get(
         "/{product_name}", 
-        response_model=product_dtos.AllProductInfoResponseDto,
+        response_model=product_dtos.ProductSearchResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
             status.HTTP_200_OK: {
@@ -256,12 +455,15 @@ def read_all_products(
     )
 def search_product(
         product_name: str,
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_read_db)
 ):
     """
     # Cari Produk Berdasarkan Nama #
 
     Endpoint ini memungkinkan pengguna untuk mencari produk berdasarkan nama yang diberikan.
+    Hasil diurutkan berdasarkan relevansi terhadap nama, brand, info dan deskripsi produk,
+    tetap menemukan produk walau ada salah ketik, dan menyertakan `search_snippet`
+    dengan kata yang cocok ditandai `<mark>`.
     
     **Parameter:**
     - **product_name** (str): Nama produk yang akan dicari.
@@ -595,7 +797,7 @@ def get_list_products_by_id_production(
 
 @router.get(
         "/production/{production_id}/{product_name}", 
-        response_model=product_dtos.AllProductInfoResponseDto,
+        response_model=product_dtos.ProductSearchResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
             status.HTTP_200_OK: {
@@ -683,7 +885,7 @@ def search_product_from_filtering_of_id_production(
 # get-product-discount-by-keyword-search
 @router.get(
         "/discount/name/{product_name}", 
-        response_model=product_dtos.AllProductInfoResponseDto,
+        response_model=product_dtos.ProductSearchResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
             status.HTTP_200_OK: {
@@ -788,6 +990,7 @@ def read_all_products_discount_by_id_production(
         response_model=product_dtos.ProductDetailResponseDto,
         status_code=status.HTTP_200_OK,
         responses={
+            **http_cache.NOT_MODIFIED_RESPONSE,
             status.HTTP_200_OK: {
                 "description": "Detail produk berhasil ditemukan",
                 "content": {
@@ -839,6 +1042,7 @@ def read_all_products_discount_by_id_production(
         summary="Get product details by product ID"
     )
 def get_product_detail(
+    request: Request,
     product_id: UUID, 
     db: Session = Depends(get_db)
 ):
@@ -852,6 +1056,7 @@ def get_product_detail(
 
     **Return:**
     - **200 OK**: Detail produk berhasil ditemukan berdasarkan ID produk.
+    - **304 Not Modified**: Data tidak berubah sejak ETag pada header `If-None-Match`.
     - **404 Not Found**: Produk dengan ID yang diberikan tidak ditemukan.
     - **500 Internal Server Error**: Kesalahan server saat mengambil detail produk.
     
@@ -862,7 +1067,7 @@ def get_product_detail(
     if result.error:
         raise result.error
     # Unwrap the result to raise exceptions if they exist, otherwise return the data
-    return result.unwrap()
+    return http_cache.conditional_response(request, result.unwrap(), http_cache.PRODUCT_DETAIL)
 
 
 @router.post(
@@ -872,12 +1077,12 @@ def get_product_detail(
     dependencies=[Depends(jwt_service.admin_access_required)],
     summary="Upload product image (auto-compress local storage)"
 )
-async def upload_product_image(
+def upload_product_image(
     product_id: UUID,
     file: UploadFile,
     db: Session = Depends(get_db)
 ):
-    result = await product_services.upload_product_image(
+    result = product_services.upload_product_image(
         db=db,
         product_id=str(product_id),
         file=file
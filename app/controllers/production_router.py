@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, status
+from fastapi import APIRouter, HTTPException, Depends, Request, UploadFile, status
 
 from sqlalchemy.orm import Session
 from typing import List, Annotated
@@ -6,7 +6,8 @@ from typing import List, Annotated
 from app.dtos import production_dtos
 from app.services import production_services
 
-from app.libs.sql_alchemy_lib import get_db
+from app.libs import http_cache
+from app.libs.sql_alchemy_lib import get_db, get_read_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
 
 router = APIRouter(
@@ -183,6 +184,7 @@ def read_productions(
     response_model=production_dtos.ArticleListScrollResponseDto,
     status_code=status.HTTP_200_OK,
     responses={
+        **http_cache.NOT_MODIFIED_RESPONSE,
         status.HTTP_200_OK: {
             "description": "Daftar produk berhasil diambil dengan format respons infinite scrolling",
             "content": {
@@ -207,7 +209,8 @@ def read_productions(
                             }
                         ],
                         "remaining_records": 94,
-                        "has_more": True
+                        "has_more": True,
+                        "is_exact": True
                     }
                 }
             }
@@ -252,9 +255,10 @@ def read_productions(
     summary="Fetch a paginated list of products"
 )
 def get_productions(
+    request: Request,
     skip: int = 0,               # Posisi awal data untuk pagination
     limit: int = 8,              # Jumlah data yang akan ditampilkan per halaman
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     # Menampilkan List Brand dengan Pagination #
@@ -267,6 +271,7 @@ def get_productions(
     
     **Return:**
     - **200 OK**: Daftar item produksi beserta metadata paginasi (remaining records, `has_more`).
+    - **304 Not Modified**: Data tidak berubah sejak ETag pada header `If-None-Match`.
     - **404 Not Found**: Jika tidak ada item produksi yang ditemukan.
     - **409 Conflict**: Jika terjadi kesalahan pada database.
     - **500 Internal Server Error**: Jika terjadi kesalahan yang tidak terduga.
@@ -279,7 +284,7 @@ def get_productions(
     if result.error:
         raise result.error  
     
-    return result.unwrap()
+    return http_cache.conditional_response(request, result.unwrap(), http_cache.BRAND_SCROLL)
 
 @router.get(
     "/loader/categories/{categories_id}",
@@ -310,7 +315,8 @@ def get_productions(
                             }
                         ],
                         "remaining_records": 94,
-                        "has_more": True
+                        "has_more": True,
+                        "is_exact": True
                     }
                 }
             }
@@ -358,7 +364,7 @@ def get_brands_by_categories(
     categories_id: int,
     skip: int = 0,               # Posisi awal data untuk pagination
     limit: int = 8,              # Jumlah data yang akan ditampilkan per halaman
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     # Menampilkan List Brand dengan Pagination berdasarkan kategori #
@@ -433,7 +439,7 @@ def get_brands_by_categories(
     summary="Get All Promotions of some Brand"
 )
 def read_promo(   
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     # Ambil Semua Promosi #
@@ -1,5 +1,5 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, status
+from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, status
 
 from sqlalchemy.orm import Session
 from typing import List, Annotated
@@ -9,6 +9,7 @@ from app.services import rating_services
 
 from app.libs.sql_alchemy_lib import get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 router = APIRouter(
     prefix="/rating",
@@ -180,8 +181,11 @@ def give_a_rate_of_product(
     },
     summary="Get user's product rating list"
 )
-async def get_my_list_products(
+def get_my_list_products(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """
@@ -189,6 +193,10 @@ async def get_my_list_products(
 
     Endpoint ini digunakan untuk mengambil daftar rating produk yang diberikan oleh pengguna berdasarkan ID yang terdapat dalam token JWT.
 
+    **Parameter:**
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
+
     **Return:**
 
     - **200 OK**: Daftar rating produk pengguna berhasil diambil.
@@ -196,7 +204,7 @@ async def get_my_list_products(
     - **409 Conflict**: Terjadi konflik saat mengakses data.
     - **500 Internal Server Error**: Terjadi kesalahan di server.
     """
-    result = rating_services.my_rating_list(db, jwt_token.id)
+    result = rating_services.my_rating_list(db, jwt_token.id, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
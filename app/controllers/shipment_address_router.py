@@ -146,7 +146,7 @@ def save_shipping_address(
     },
     summary="Get all data shipping address in my account"
 )
-async def get_my_shipping_address(
+def get_my_shipping_address(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
@@ -426,7 +426,7 @@ def delete_my_shipping_address(
     },
     summary="Get shipping address of the store owner (accessible by all users)"
 )
-async def get_store_owner_address(
+def get_store_owner_address(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
@@ -162,7 +162,7 @@ def create_new_shipment(
     },
     summary="Get all data shipping in my account"
 )
-async def get_my_shipping(
+def get_my_shipping(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
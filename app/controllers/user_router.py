@@ -292,7 +292,7 @@ def user_login(user: user_dtos.UserLoginPayloadDto, db: Session = Depends(get_db
         },
         summary="User login use Google account"
     )
-async def google_login(google_login_req: user_dtos.GoogleLoginRequest, db: Session = Depends(get_db)):
+def google_login(google_login_req: user_dtos.GoogleLoginRequest, db: Session = Depends(get_db)):
     """
     # Login Menggunakan Akun Google #
 
@@ -528,7 +528,7 @@ def confirm_reset_password(
     },
     summary="Get user who login profile"
 )
-async def get_user_profile_by_id(
+def get_user_profile_by_id(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):
@@ -599,7 +599,7 @@ async def get_user_profile_by_id(
     summary="Update user profile without photo"
 )
 
-async def update_user_profile_without_photo(
+def update_user_profile_without_photo(
     user: user_dtos.UserEditProfileDto,
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
@@ -1,5 +1,5 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, status
+from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, status
 
 from sqlalchemy.orm import Session
 from typing import List, Annotated
@@ -9,6 +9,7 @@ from app.services import wishlist_services
 
 from app.libs.sql_alchemy_lib import get_db
 from app.libs.jwt_lib import jwt_dto, jwt_service
+from app.libs.pagination import CURSOR_DESCRIPTION
 
 router = APIRouter(
     prefix="/wishlist",
@@ -165,7 +166,7 @@ def post_my_wishlist(
     },
     summary="Get User's Total Wishlist Products"
 )
-async def get_total_wishlist(
+def get_total_wishlist(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
     db: Session = Depends(get_db)
 ):    
@@ -205,6 +206,7 @@ async def get_total_wishlist(
                         "status_code": 200,
                         "message": "Your all of products wishlist success to access",
                         "total_records": 1,
+                        "is_exact": True,
                         "data": [
                             {
                                 "id": 0,
@@ -265,8 +267,11 @@ async def get_total_wishlist(
     },
     summary="Get User's Wishlist Products"
 )
-async def get_my_products_wishlist(
+def get_my_products_wishlist(
     jwt_token: Annotated[jwt_dto.TokenPayLoad, Depends(jwt_service.get_jwt_pyload)],
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    cursor: str | None = Query(default=None, description=CURSOR_DESCRIPTION),
     db: Session = Depends(get_db)
 ):
     """
@@ -277,6 +282,8 @@ async def get_my_products_wishlist(
     **Parameter:**
     - **jwt_token** (TokenPayLoad): Token payload yang memberikan akses ke data pengguna.
     - **db** (Session): Koneksi database untuk mendapatkan data.
+    - **skip** / **limit** (int, opsional): Paginasi offset, dipertahankan untuk kompatibilitas.
+    - **cursor** (str, opsional): Nilai `next_cursor` dari response sebelumnya untuk halaman berikutnya.
 
     **Return:**
     - **200 OK**: Berhasil mendapatkan semua produk dalam wishlist pengguna.
@@ -285,7 +292,7 @@ async def get_my_products_wishlist(
     - **500 Internal Server Error**: Kesalahan tak terduga saat mengambil wishlist.
     
     """
-    result = wishlist_services.my_wishlist(db, jwt_token.id)
+    result = wishlist_services.my_wishlist(db, jwt_token.id, skip=skip, limit=limit, cursor=cursor)
 
     if result.error:
         raise result.error
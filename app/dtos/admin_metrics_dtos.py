@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class DbSessionStatsDto(BaseModel):
+    total_requests: int = 0
+    requests_without_db: int = 0
+    requests_with_db: int = 0
+    without_db_ratio: float = 0.0
+
+
+class DbSessionStatsResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Database session stats accessed successfully")
+    data: DbSessionStatsDto
+
+
+class RedisPoolStatsDto(BaseModel):
+    max_connections: Optional[int] = None
+    created_connections: Optional[int] = None
+    in_use_connections: int = 0
+    idle_connections: int = 0
+
+
+class RedisHealthDto(BaseModel):
+    state: str
+    available: bool
+    consecutive_failures: int = 0
+    total_calls: int = 0
+    total_failures: int = 0
+    rejected_calls: int = 0
+    times_opened: int = 0
+    reconnect_attempts: int = 0
+    last_error: Optional[str] = None
+    last_failure_at: Optional[datetime] = None
+    last_recovered_at: Optional[datetime] = None
+    pool: RedisPoolStatsDto
+
+
+class RedisHealthResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Redis health accessed successfully")
+    data: RedisHealthDto
+
+
+class CacheNamespaceReportDto(BaseModel):
+    namespace: str
+    hits: int = 0
+    local_hits: int = 0
+    stale_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    errors: int = 0
+    hit_ratio: float = 0.0
+    writes: int = 0
+    bytes_written: int = 0
+    redis_calls: int = 0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    sampled_keys: int = 0
+    sampled_bytes: int = 0
+    avg_key_bytes: float = 0.0
+    estimated_keys: int = 0
+    estimated_bytes: int = 0
+
+
+class CacheReportDto(BaseModel):
+    memory_sampled: bool = False
+    scan_complete: bool = False
+    scanned_keys: int = 0
+    total_keys: int = 0
+    namespaces: List[CacheNamespaceReportDto] = []
+
+
+class CacheReportResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Cache report accessed successfully")
+    data: CacheReportDto
@@ -47,6 +47,8 @@ class AllArticleResponseDto(BaseModel):
     status_code: int = Field(default=200)
     message: str = Field(default="All list info of articles success to access")
     data: List[GetAllArticleDTO]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class DeleteArticleDto(BaseModel):
     article_id:int
@@ -41,6 +41,8 @@ class AllCartResponseCreateDto(BaseModel):
     # total_records: int = Field(default=3)
     data: List[CartInfoDetailDto]
     total_prices: CartProductTotalDto  # Pastikan tipe ini sesuai dengan data yang dikirim
+    has_more: bool = False
+    next_cursor: Optional[str] = None
     
 
 class UpdateByIdCartDto(BaseModel):
@@ -64,6 +64,8 @@ class PaginationMetaDto(BaseModel):
     skip: int = 0
     limit: int = 100
     count: int = 0
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class GetOrderInfoResponseDto(BaseModel):
     status_code: int = Field(default=200)
@@ -86,6 +86,8 @@ class AdminListMetaDto(BaseModel):
     skip: int = 0
     limit: int = 100
     count: int = 0
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class AdminPaymentListResponseDto(BaseModel):
     status_code: int = Field(default=200)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -53,6 +53,70 @@ class AllProductInfoResponseDto(BaseModel):
     status_code: int = Field(default=201)
     message: str = Field(default="Your product has been create")
     data: List[AllProductInfoDTO]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+
+class ProductSearchInfoDTO(AllProductInfoDTO):
+    search_rank: float = Field(default=0.0)
+    search_snippet: Optional[str] = None
+
+
+class ProductSearchResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Products found")
+    data: List[ProductSearchInfoDTO]
+
+
+class ProductAutocompleteDTO(BaseModel):
+    id: str
+    name: str
+    brand_info: Optional[dict] = None
+
+
+class ProductAutocompleteResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Product suggestions")
+    data: List[ProductAutocompleteDTO]
+
+
+class ProductFilterDTO(BaseModel):
+    brand_ids: List[int] = Field(default_factory=list)
+    category_ids: List[int] = Field(default_factory=list)
+    min_price: Optional[float] = Field(default=None, ge=0)
+    max_price: Optional[float] = Field(default=None, ge=0)
+    has_discount: Optional[bool] = None
+    min_rating: Optional[float] = Field(default=None, ge=0, le=5)
+    in_stock: Optional[bool] = None
+    sort_by: Literal["newest", "price_asc", "price_desc", "rating", "discount"] = "newest"
+    skip: int = Field(default=0, ge=0)
+    limit: int = Field(default=10, ge=1, le=100)
+
+
+class FacetCountDTO(BaseModel):
+    id: int
+    name: Optional[str] = None
+    count: int
+
+
+class PriceBucketFacetDTO(BaseModel):
+    min_price: float
+    max_price: Optional[float] = None
+    count: int
+
+
+class ProductFacetsDTO(BaseModel):
+    brands: List[FacetCountDTO] = Field(default_factory=list)
+    categories: List[FacetCountDTO] = Field(default_factory=list)
+    price_buckets: List[PriceBucketFacetDTO] = Field(default_factory=list)
+
+
+class ProductFilterResponseDto(BaseModel):
+    status_code: int = Field(default=200)
+    message: str = Field(default="Filtered products")
+    total: int
+    data: List[AllProductInfoDTO]
+    facets: ProductFacetsDTO
 
 
 class ProductListScrollResponseDto(BaseModel):
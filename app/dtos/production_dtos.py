@@ -58,6 +58,7 @@ class ArticleListScrollResponseDto(BaseModel):
     data: List[AllProductionsDto]
     remaining_records: int
     has_more: bool  # Indikasi apakah masih ada data lain
+    is_exact: bool = True  # False bila remaining_records dihitung dari estimasi planner
 
 class DetailProductionDto(BaseModel):
     model_config = ConfigDict()
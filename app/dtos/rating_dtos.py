@@ -56,6 +56,8 @@ class AllMyRatingListResponseDto(BaseModel):
     status_code: int = Field(default=200)
     message: str = Field(default="updated info rating and review for this product id successfully")
     data: List[MyRatingListDto]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class ReviewIdToUpdateDto(BaseModel):
     rating_id:int
@@ -188,6 +188,8 @@ class AdminUserListMetaDto(BaseModel):
     skip: int = 0
     limit: int = 100
     count: int = 0
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 class AdminUserListResponseDto(BaseModel):
     status_code: int = Field(default=200)
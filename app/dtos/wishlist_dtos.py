@@ -28,7 +28,10 @@ class AllWishlistResponseCreateDto(BaseModel):
     status_code: int = Field(default=200)
     message: str = Field(default="Your all of products wishlist success to access")
     total_records: int = Field(default=3)
+    is_exact: bool = True  # False bila total_records berupa estimasi
     data: List[WishlistInfoCreateDto]
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class TotalItemWishlistDto(BaseModel):
@@ -0,0 +1,31 @@
+from .namespaces import (
+    CATALOG,
+    PRODUCT,
+    BRAND_PRODUCTS,
+    BRANDS,
+    BRAND,
+    ARTICLES,
+    CATEGORIES,
+    USER,
+    CART,
+    WISHLIST,
+    ORDERS,
+    RATINGS,
+    L1_NAMESPACES,
+    cache_group,
+    namespace_version,
+    versioned_key,
+    bump_namespaces,
+)
+from .stats import CacheStats, cache_stats
+from .responses import CACHE_STATUS_HEADER, CachedJSONResponse
+from .local import LocalCache, local_cache
+from .invalidation import (
+    INVALIDATION_CHANNEL,
+    InvalidationListener,
+    invalidation_listener,
+    start_invalidation_listener,
+    stop_invalidation_listener,
+)
+from .decorators import DEFAULT_TTL, cached, jittered_ttl, encode_payload, decode_payload
+from .entities import cached_ids, cached_ids_async, cached_entities, cached_entities_async
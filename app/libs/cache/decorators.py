@@ -0,0 +1,411 @@
+"""
+Decorator read-through untuk service yang mengembalikan `Result`.
+
+    @cached(CART, key_fn=lambda skip, limit, **_: ("items", skip, limit),
+            scope=lambda user_id, **_: user_id, ttl=300, dto=AllCartResponseCreateDto)
+    def my_cart(db, user_id, skip=0, limit=100): ...
+
+`key_fn` dan `scope` menerima argumen service (sesudah default diterapkan)
+sebagai keyword. Hasil sukses disimpan sebagai JSON dari response DTO
+lengkap; `Result` error tidak pernah di-cache. Semua kegagalan Redis
+(mati, timeout, payload rusak) diperlakukan sebagai miss sehingga service
+tetap melayani dari database.
+
+Setiap entri punya TTL lunak (`ttl`) dan TTL keras (`ttl + stale_ttl`).
+Melewati TTL lunak, nilai lama tetap dikirim sementara satu request
+me-refresh di background (stale-while-revalidate). Miss penuh disatukan
+di belakang lock Redis (single-flight) supaya hanya satu request yang
+menjalankan query; sisanya menunggu key terisi. Miss dan refresh yang
+terjadi tepat setelah bump membaca dari primary (lihat `refill_reads`).
+
+Namespace katalog (`L1_NAMESPACES`) juga dilayani dari cache L1 in-process
+selama listener invalidasi pub/sub tersambung; hit L1 tidak menyentuh Redis
+dan mengembalikan objek DTO yang sama, jadi hasilnya harus diperlakukan
+read-only.
+
+Dengan `raw_response` (default untuk namespace katalog) hit cache tidak
+di-decode sama sekali: `Result.data` berisi `CachedJSONResponse` dengan
+body JSON tersimpan, dan L1 menyimpan byte tersebut beserta varian
+terkompresinya (`CachedBody`) sehingga hit L1 tidak mengompresi ulang. Miss tetap
+mengembalikan DTO. Key mode ini memuat sidik skema DTO (`s<hash>`) karena
+body tidak pernah divalidasi ulang, sehingga perubahan DTO antar deploy
+otomatis memakai key baru.
+
+Service `async def` (berbasis `AsyncSession`) didukung dengan perilaku yang
+sama: cek L1 tetap di event loop, tetapi setiap round trip Redis (baca,
+lock, tunggu single-flight, tulis) dijalankan di threadpool karena klien
+Redis-nya sync, dan refresh stale berjalan sebagai task di event loop.
+"""
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.libs import redis_config
+from app.libs.cache.invalidation import invalidation_listener
+from app.libs.cache.local import L1_ENABLED, local_cache
+from app.libs.cache.namespaces import L1_NAMESPACES, cache_group, recently_bumped, refill_reads, versioned_key
+from app.libs.cache.responses import CachedBody, CachedJSONResponse
+from app.libs.cache.single_flight import acquire_lock, release_lock, wait_for_value
+from app.libs.cache.stats import cache_stats
+from app.utils.result import Result, build
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL", 300))
+# Berapa lama nilai basi masih boleh dikirim sambil menunggu refresh background
+DEFAULT_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", 300))
+# TTL diacak naik hingga rasio ini agar key yang dibuat bersamaan tidak kedaluwarsa serentak
+TTL_JITTER_RATIO = float(os.getenv("CACHE_TTL_JITTER_RATIO", 0.1))
+REFRESH_WORKERS = int(os.getenv("CACHE_REFRESH_WORKERS", 4))
+RAW_RESPONSES_ENABLED = str(os.getenv("CACHE_RAW_RESPONSES", "true")).lower() == "true"
+
+ENTRY_SEPARATOR = "|"
+
+_refresh_executor = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+# Referensi task refresh async agar tidak dibuang garbage collector sebelum selesai
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+def _spawn(coroutine) -> None:
+    task = asyncio.get_running_loop().create_task(coroutine)
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+@dataclass
+class _Request:
+    """Status satu panggilan service ber-cache, dibawa dari cek L1 ke Redis lalu ke penulisan hasil."""
+    arguments: Optional[Dict[str, Any]] = None
+    scope_value: Optional[object] = None
+    parts: Tuple[str, ...] = ()
+    group: Optional[str] = None
+    skip: bool = False
+    local_key: Optional[str] = None
+    generation: Optional[int] = None
+    cache_key: Optional[str] = None
+    hit: Optional[Result] = None
+    refresh_token: Optional[str] = None
+    token: Optional[str] = None
+    bumped: bool = False
+
+
+def jittered_ttl(ttl: int, ratio: float = TTL_JITTER_RATIO) -> int:
+    return ttl + random.randint(0, max(int(ttl * ratio), 0))
+
+
+def encode_payload(data: BaseModel) -> str:
+    # Sama dengan body yang dihasilkan FastAPI untuk response_model DTO yang sama
+    return data.model_dump_json()
+
+
+def decode_payload(raw: str, dto: Type[BaseModel]) -> BaseModel:
+    return dto.model_validate_json(raw)
+
+
+def schema_fingerprint(dto: Type[BaseModel]) -> str:
+    schema = json.dumps(dto.model_json_schema(), sort_keys=True)
+    return hashlib.sha1(schema.encode()).hexdigest()[:8]
+
+
+def encode_entry(data: BaseModel, fresh_for: float, now: Optional[float] = None) -> str:
+    """Entri Redis: `<epoch fresh-until>|<payload JSON>`; header dibaca tanpa mem-parse payload."""
+    fresh_until = (time.time() if now is None else now) + fresh_for
+    return f"{fresh_until:.3f}{ENTRY_SEPARATOR}{encode_payload(data)}"
+
+
+def split_entry(raw: str) -> Tuple[float, str]:
+    header, body = raw.split(ENTRY_SEPARATOR, 1)
+    return float(header), body
+
+
+def _default_session_factory():
+    from app.libs.sql_alchemy_lib import read_session_local
+
+    return read_session_local()
+
+
+def _default_async_session_factory():
+    from app.libs.sql_alchemy_lib import async_read_session
+
+    return async_read_session()
+
+
+def l1_available() -> bool:
+    # Tanpa listener pub/sub, perubahan dari worker lain tidak terlihat sehingga L1 tidak dipakai
+    return L1_ENABLED and invalidation_listener.connected
+
+
+def cached(
+        namespace: str,
+        key_fn: Callable[..., Tuple[Any, ...]],
+        ttl: int = DEFAULT_TTL,
+        dto: Optional[Type[BaseModel]] = None,
+        scope: Optional[Callable[..., Any]] = None,
+        local: Optional[bool] = None,
+        stale_ttl: int = DEFAULT_STALE_TTL,
+        session_factory: Callable[[], Any] = _default_session_factory,
+        raw_response: Optional[bool] = None,
+        async_session_factory: Callable[[], Any] = _default_async_session_factory,
+    ):
+    """
+    Parameter:
+    - namespace: namespace berversi (lihat `app.libs.cache.namespaces`)
+    - key_fn: menghasilkan bagian key dari argumen service
+    - ttl: umur segar entri dalam detik, sebelum jitter
+    - dto: kelas response DTO untuk membangun ulang hasil dari cache
+    - scope: menghasilkan scope namespace (mis. user_id); None untuk namespace global
+    - local: pakai cache L1 in-process; default True untuk `L1_NAMESPACES`
+    - stale_ttl: jendela stale-while-revalidate setelah TTL lunak; 0 menonaktifkan
+    - session_factory: membuat session untuk refresh background (argumen `db` service)
+    - raw_response: hit dikembalikan sebagai `CachedJSONResponse`; default True untuk `L1_NAMESPACES`
+    - async_session_factory: context manager `AsyncSession` untuk refresh background service async
+    """
+    if dto is None:
+        raise ValueError("cached() requires the response DTO class")
+    use_local = namespace in L1_NAMESPACES if local is None else local
+    if raw_response is None:
+        raw_response = RAW_RESPONSES_ENABLED and namespace in L1_NAMESPACES
+    key_suffix = (f"s{schema_fingerprint(dto)}",) if raw_response else ()
+
+    def decorator(func: Callable[..., Result]):
+        signature = inspect.signature(func)
+        can_refresh = stale_ttl > 0 and "db" in signature.parameters
+        is_async = inspect.iscoroutinefunction(func)
+
+        def resolve_key(args, kwargs) -> Tuple[Dict[str, Any], Optional[object], Tuple[str, ...]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            parts = key_fn(**arguments)
+            if not isinstance(parts, tuple):
+                parts = (parts,)
+            parts = tuple(str(part) for part in parts) + key_suffix
+            return arguments, (scope(**arguments) if scope else None), parts
+
+        def store(client, cache_key: str, result) -> Optional[str]:
+            """Menulis hasil sukses ke Redis; mengembalikan body JSON yang disimpan."""
+            if not (isinstance(result, Result) and result.is_ok() and result.data is not None):
+                return None
+            fresh_for = jittered_ttl(ttl)
+            try:
+                entry = encode_entry(result.data, fresh_for)
+                with cache_stats.timed(namespace):
+                    client.setex(cache_key, fresh_for + stale_ttl, entry)
+                cache_stats.write(namespace, len(entry.encode()))
+            except Exception as e:
+                cache_stats.error(namespace)
+                logger.warning("Failed to write cache %s: %s", cache_key, e)
+                return None
+            return split_entry(entry)[1]
+
+        def release(client, cache_key: str, token: Optional[str]) -> None:
+            if token is None:
+                return
+            try:
+                release_lock(client, cache_key, token)
+            except Exception as e:
+                # Lock tetap hilang sendiri setelah LOCK_TTL_MS
+                logger.warning("Failed to release cache lock %s: %s", cache_key, e)
+
+        def refresh(client, cache_key: str, token: str, group: str, arguments: Dict[str, Any]) -> None:
+            db = session_factory()
+            try:
+                with refill_reads(group):
+                    result = func(**{**arguments, "db": db})
+                store(client, cache_key, result)
+            except Exception as e:
+                logger.warning("Background cache refresh failed for %s: %s", cache_key, e)
+            finally:
+                db.close()
+                release(client, cache_key, token)
+
+        async def refresh_async(client, cache_key: str, token: str, group: str, arguments: Dict[str, Any]) -> None:
+            try:
+                bumped = await run_in_threadpool(recently_bumped, group)
+                async with async_session_factory() as db:
+                    with refill_reads(bumped=bumped):
+                        result = await func(**{**arguments, "db": db})
+                await run_in_threadpool(store, client, cache_key, result)
+            except Exception as e:
+                logger.warning("Background cache refresh failed for %s: %s", cache_key, e)
+            finally:
+                await run_in_threadpool(release, client, cache_key, token)
+
+        def claim_refresh(client, cache_key: str) -> Optional[str]:
+            try:
+                # None berarti request lain sudah me-refresh key ini
+                return acquire_lock(client, cache_key)
+            except Exception as e:
+                logger.warning("Failed to acquire cache lock %s: %s", cache_key, e)
+                return None
+
+        def decode(cache_key: str, raw: str) -> Tuple[Optional[Any], bool]:
+            """Mengembalikan (DTO atau `CachedBody` pada mode raw, masih segar)."""
+            try:
+                fresh_until, body = split_entry(raw)
+                data = CachedBody(body.encode()) if raw_response else decode_payload(body, dto)
+                return data, fresh_until > time.time()
+            except Exception as e:
+                # Payload rusak atau skema DTO berubah; ditimpa hasil baru
+                cache_stats.error(namespace)
+                logger.warning("Failed to decode cache %s: %s", cache_key, e)
+                return None, False
+
+        def hit(data) -> Result:
+            return build(data=CachedJSONResponse(data) if raw_response else data)
+
+        def resolve(args, kwargs) -> _Request:
+            """Key dan cek L1; hanya memori proses sehingga aman dipanggil di event loop."""
+            try:
+                arguments, scope_value, parts = resolve_key(args, kwargs)
+            except Exception as e:
+                cache_stats.error(namespace)
+                logger.warning("Failed to build cache key for %s: %s", namespace, e)
+                return _Request(skip=True)
+
+            request = _Request(arguments=arguments, scope_value=scope_value, parts=parts, group=cache_group(namespace, scope_value))
+            if use_local and l1_available():
+                request.local_key = ":".join((request.group, *parts))
+                value = local_cache.get(request.local_key)
+                if value is not None:
+                    cache_stats.local_hit(namespace)
+                    request.hit = hit(value)
+                    return request
+                request.generation = local_cache.generation(request.group)
+            return request
+
+        def lookup(client, request: _Request) -> _Request:
+            """Semua round trip Redis sebelum service dipanggil; service async menjalankannya di threadpool."""
+            raw = None
+            try:
+                request.cache_key = versioned_key(namespace, *request.parts, scope=request.scope_value)
+                with cache_stats.timed(namespace):
+                    raw = client.get(request.cache_key)
+            except Exception as e:
+                # Redis tidak bisa dibaca: layani dari database tanpa mencoba menulis
+                cache_stats.error(namespace)
+                logger.warning("Failed to read cache %s: %s", request.cache_key or namespace, e)
+                request.cache_key = None
+
+            if raw:
+                data, fresh = decode(request.cache_key, raw)
+                if data is not None and fresh:
+                    if request.local_key:
+                        local_cache.set(request.group, request.local_key, data, request.generation)
+                    cache_stats.hit(namespace)
+                    request.hit = hit(data)
+                    return request
+                if data is not None and can_refresh:
+                    request.refresh_token = claim_refresh(client, request.cache_key)
+                    cache_stats.stale_hit(namespace)
+                    request.hit = hit(data)
+                    return request
+
+            if request.cache_key is None:
+                cache_stats.miss(namespace)
+                return request
+
+            try:
+                request.token = acquire_lock(client, request.cache_key)
+                if request.token is None:
+                    filled = wait_for_value(client, request.cache_key)
+                    data = decode(request.cache_key, filled)[0] if filled else None
+                    if data is not None:
+                        cache_stats.coalesced(namespace)
+                        request.hit = hit(data)
+                        return request
+            except Exception as e:
+                # Lock tidak tersedia: hitung sendiri daripada menunggu
+                logger.warning("Cache single-flight unavailable for %s: %s", request.cache_key, e)
+
+            cache_stats.miss(namespace)
+            request.bumped = recently_bumped(request.group)
+            return request
+
+        def remember(client, request: _Request, result) -> None:
+            body = store(client, request.cache_key, result)
+            if request.local_key and body is not None:
+                local_cache.set(
+                    request.group,
+                    request.local_key,
+                    CachedBody(body.encode()) if raw_response else result.data,
+                    request.generation
+                )
+
+        def finish(client, request: _Request) -> None:
+            release(client, request.cache_key, request.token)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Result:
+            client = redis_config.redis_client
+            if not client:
+                cache_stats.miss(namespace)
+                return func(*args, **kwargs)
+
+            request = resolve(args, kwargs)
+            if request.skip:
+                cache_stats.miss(namespace)
+                return func(*args, **kwargs)
+            if request.hit is None:
+                request = lookup(client, request)
+            if request.refresh_token is not None:
+                _refresh_executor.submit(refresh, client, request.cache_key, request.refresh_token, request.group, request.arguments)
+            if request.hit is not None:
+                return request.hit
+            if request.cache_key is None:
+                return func(*args, **kwargs)
+
+            try:
+                with refill_reads(bumped=request.bumped):
+                    result = func(*args, **kwargs)
+                remember(client, request, result)
+                return result
+            finally:
+                finish(client, request)
+
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Result:
+            client = redis_config.redis_client
+            if not client:
+                cache_stats.miss(namespace)
+                return await func(*args, **kwargs)
+
+            request = resolve(args, kwargs)
+            if request.skip:
+                cache_stats.miss(namespace)
+                return await func(*args, **kwargs)
+            if request.hit is None:
+                request = await run_in_threadpool(lookup, client, request)
+            if request.refresh_token is not None:
+                _spawn(refresh_async(client, request.cache_key, request.refresh_token, request.group, request.arguments))
+            if request.hit is not None:
+                return request.hit
+            if request.cache_key is None:
+                return await func(*args, **kwargs)
+
+            try:
+                with refill_reads(bumped=request.bumped):
+                    result = await func(*args, **kwargs)
+                await run_in_threadpool(remember, client, request, result)
+                return result
+            finally:
+                await run_in_threadpool(finish, client, request)
+
+        if is_async:
+            wrapper = async_wrapper
+        wrapper.cache_namespace = namespace
+        return wrapper
+
+    return decorator
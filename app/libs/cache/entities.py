@@ -0,0 +1,239 @@
+"""
+Halaman list yang disusun dari entri cache per entity.
+
+Cache halaman hanya menyimpan urutan ID (`<group>:v<N>:ids:<parts>`). Isi
+setiap item disimpan sekali per entity di `entity:<namespace>:<id>:<schema>`
+dengan nilai `<versi>|<payload JSON>`, di mana versi adalah versi namespace
+entity (`ns:<namespace>:<id>`) saat data dibaca dari database.
+
+Satu `MGET` mengambil versi dan entri semua ID halaman sekaligus; entri yang
+versinya tidak sama lagi dianggap miss, dan hanya entity yang miss dimuat
+dari database dalam satu batch (dari primary bila entity tersebut baru saja
+di-bump). Edit satu produk cukup membuang kartunya sendiri plus list ID
+(kecil) yang memuatnya, dan produk yang sama tidak lagi diduplikasi di
+puluhan halaman.
+
+Komposisi ini hanya berjalan saat halaman miss: service listing tetap
+dibungkus `@cached` sehingga hit halaman dilayani dari L1/body JSON mentah
+(beserta varian terkompresinya) tanpa MGET kartu maupun validasi DTO.
+
+`cached_ids_async`/`cached_entities_async` adalah padanan untuk service
+`AsyncSession`: loader-nya di-await, sedangkan semua panggilan Redis (klien
+sync) dijalankan di threadpool agar tidak menahan event loop.
+"""
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.libs import json_codec, redis_config
+from app.libs.cache.decorators import DEFAULT_TTL, jittered_ttl, schema_fingerprint
+from app.libs.cache.namespaces import cache_group, recent_bump_key, refill_reads, version_key, versioned_key
+from app.libs.cache.stats import cache_stats
+
+logger = logging.getLogger(__name__)
+
+ENTITY_KEY_PREFIX = "entity"
+ENTRY_SEPARATOR = "|"
+
+EntityDto = TypeVar("EntityDto", bound=BaseModel)
+
+
+def entity_key(namespace: str, entity_id: object, fingerprint: str) -> str:
+    return f"{ENTITY_KEY_PREFIX}:{namespace}:{entity_id}:{fingerprint}"
+
+
+def _read_ids(client, namespace: str, parts: Tuple[object, ...], scope: Optional[object]) -> Tuple[Optional[str], Optional[List[str]]]:
+    """Mengembalikan (key list ID, list ID tersimpan atau None). Key None berarti Redis tidak bisa dibaca."""
+    key = None
+    try:
+        key = versioned_key(namespace, "ids", *parts, scope=scope)
+        with cache_stats.timed(namespace):
+            cached = client.get(key)
+        if cached is not None:
+            cache_stats.hit(namespace)
+            return key, json_codec.loads(cached)
+    except Exception as e:
+        cache_stats.error(namespace)
+        logger.warning("Failed to read cached id list %s: %s", key or namespace, e)
+    cache_stats.miss(namespace)
+    return key, None
+
+
+def _write_ids(client, namespace: str, key: Optional[str], ids: List[str], ttl: int) -> None:
+    if key is None:
+        return
+    try:
+        payload = json_codec.dumps_str(ids)
+        with cache_stats.timed(namespace):
+            client.setex(key, jittered_ttl(ttl), payload)
+        cache_stats.write(namespace, len(payload))
+    except Exception as e:
+        logger.warning("Failed to write cached id list %s: %s", key, e)
+
+
+def cached_ids(
+        namespace: str,
+        *parts: object,
+        loader: Callable[[], Iterable[object]],
+        scope: Optional[object] = None,
+        ttl: int = DEFAULT_TTL
+    ) -> List[str]:
+    """Urutan ID satu halaman; `loader` hanya dipanggil saat cache miss atau Redis tidak tersedia."""
+    client = redis_config.redis_client
+    if not client:
+        return [str(entity_id) for entity_id in loader()]
+
+    key, cached = _read_ids(client, namespace, parts, scope)
+    if cached is not None:
+        return cached
+    ids = [str(entity_id) for entity_id in loader()]
+    _write_ids(client, namespace, key, ids, ttl)
+    return ids
+
+
+async def cached_ids_async(
+        namespace: str,
+        *parts: object,
+        loader: Callable[[], Awaitable[Iterable[object]]],
+        scope: Optional[object] = None,
+        ttl: int = DEFAULT_TTL
+    ) -> List[str]:
+    """Padanan `cached_ids` untuk loader async."""
+    client = redis_config.redis_client
+    if not client:
+        return [str(entity_id) for entity_id in await loader()]
+
+    key, cached = await run_in_threadpool(_read_ids, client, namespace, parts, scope)
+    if cached is not None:
+        return cached
+    ids = [str(entity_id) for entity_id in await loader()]
+    await run_in_threadpool(_write_ids, client, namespace, key, ids, ttl)
+    return ids
+
+
+def _read_entities(
+        client,
+        namespace: str,
+        ids: Sequence[str],
+        dto: Type[EntityDto],
+        fingerprint: str
+    ) -> Tuple[Dict[str, EntityDto], Dict[str, str], Set[str]]:
+    """Satu MGET: (entri yang masih berlaku, versi per ID, ID yang baru saja di-bump)."""
+    found: Dict[str, EntityDto] = {}
+    versions: Dict[str, str] = {}
+    bumped: Set[str] = set()
+    if not client:
+        return found, versions, bumped
+
+    try:
+        # Penanda bump ikut dibaca di MGET yang sama untuk memilih primary saat memuat yang miss
+        with cache_stats.timed(namespace):
+            values = client.mget(
+                [version_key(namespace, entity_id) for entity_id in ids]
+                + [entity_key(namespace, entity_id, fingerprint) for entity_id in ids]
+                + [recent_bump_key(cache_group(namespace, entity_id)) for entity_id in ids]
+            )
+        count = len(ids)
+        for entity_id, version, entry, marker in zip(ids, values[:count], values[count:2 * count], values[2 * count:]):
+            versions[entity_id] = version or "0"
+            if marker:
+                bumped.add(entity_id)
+            if not entry:
+                continue
+            stored_version, _, payload = entry.partition(ENTRY_SEPARATOR)
+            if stored_version == versions[entity_id]:
+                found[entity_id] = dto.model_validate_json(payload)
+    except Exception as e:
+        cache_stats.error(namespace)
+        logger.warning("Failed to read cached %s entities: %s", namespace, e)
+        versions = {}
+
+    missing = [entity_id for entity_id in ids if entity_id not in found]
+    # Dihitung per entity agar rasio hit kartu terlihat terpisah dari rasio hit halaman
+    cache_stats.record(namespace, "hits", len(found))
+    cache_stats.record(namespace, "misses", len(missing))
+    return found, versions, bumped
+
+
+def _write_entities(
+        client,
+        namespace: str,
+        fingerprint: str,
+        versions: Dict[str, str],
+        loaded: Dict[str, EntityDto],
+        ttl: int
+    ) -> None:
+    # Versi dibaca sebelum query database: bila entity berubah di antaranya,
+    # entri ini tertulis dengan versi lama dan langsung dianggap miss
+    writable = [entity_id for entity_id in loaded if entity_id in versions]
+    if not client or not writable:
+        return
+    try:
+        pipeline = client.pipeline(transaction=False)
+        size = 0
+        for entity_id in writable:
+            entry = f"{versions[entity_id]}{ENTRY_SEPARATOR}{loaded[entity_id].model_dump_json()}"
+            size += len(entry.encode())
+            pipeline.setex(entity_key(namespace, entity_id, fingerprint), jittered_ttl(ttl), entry)
+        with cache_stats.timed(namespace):
+            pipeline.execute()
+        cache_stats.write(namespace, size, count=len(writable))
+    except Exception as e:
+        logger.warning("Failed to write cached %s entities: %s", namespace, e)
+
+
+def cached_entities(
+        namespace: str,
+        ids: Sequence[str],
+        dto: Type[EntityDto],
+        loader: Callable[[List[str]], Dict[str, EntityDto]],
+        ttl: int = DEFAULT_TTL
+    ) -> List[EntityDto]:
+    """
+    Mengembalikan DTO sesuai urutan `ids`. `loader` menerima ID yang miss dan
+    mengembalikan dict `id -> DTO`; ID yang tidak dikembalikan (misalnya
+    sudah dihapus) dilewati.
+    """
+    if not ids:
+        return []
+
+    client = redis_config.redis_client
+    fingerprint = schema_fingerprint(dto)
+    found, versions, bumped = _read_entities(client, namespace, ids, dto, fingerprint)
+
+    missing = list(dict.fromkeys(entity_id for entity_id in ids if entity_id not in found))
+    if missing:
+        with refill_reads(bumped=any(entity_id in bumped for entity_id in missing)):
+            loaded = loader(missing)
+        found.update(loaded)
+        _write_entities(client, namespace, fingerprint, versions, loaded, ttl)
+
+    return [found[entity_id] for entity_id in ids if entity_id in found]
+
+
+async def cached_entities_async(
+        namespace: str,
+        ids: Sequence[str],
+        dto: Type[EntityDto],
+        loader: Callable[[List[str]], Awaitable[Dict[str, EntityDto]]],
+        ttl: int = DEFAULT_TTL
+    ) -> List[EntityDto]:
+    """Padanan `cached_entities` untuk loader async."""
+    if not ids:
+        return []
+
+    client = redis_config.redis_client
+    fingerprint = schema_fingerprint(dto)
+    found, versions, bumped = await run_in_threadpool(_read_entities, client, namespace, ids, dto, fingerprint)
+
+    missing = list(dict.fromkeys(entity_id for entity_id in ids if entity_id not in found))
+    if missing:
+        with refill_reads(bumped=any(entity_id in bumped for entity_id in missing)):
+            loaded = await loader(missing)
+        found.update(loaded)
+        if client:
+            await run_in_threadpool(_write_entities, client, namespace, fingerprint, versions, loaded, ttl)
+
+    return [found[entity_id] for entity_id in ids if entity_id in found]
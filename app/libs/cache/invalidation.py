@@ -0,0 +1,117 @@
+"""
+Sinkronisasi cache L1 antar worker lewat Redis pub/sub.
+
+`bump_namespaces` mem-publish grup namespace yang berubah ke
+`INVALIDATION_CHANNEL`; setiap worker menjalankan satu thread listener yang
+membuang grup tersebut dari `local_cache`. L1 hanya dipakai selama listener
+tersambung, dan dikosongkan setiap kali (re)subscribe karena pesan yang
+terkirim saat terputus tidak bisa diketahui.
+"""
+import logging
+import os
+import threading
+import uuid
+from typing import Iterable, List, Optional
+
+from app.libs import json_codec, redis_config
+from app.libs.cache.local import LocalCache, local_cache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+# Identitas proses ini; pesan milik sendiri tidak perlu diproses ulang
+PROCESS_ID = uuid.uuid4().hex
+
+
+def encode_invalidation(groups: Iterable[str]) -> str:
+    return json_codec.dumps_str({"origin": PROCESS_ID, "groups": list(groups)})
+
+
+class InvalidationListener:
+    def __init__(
+            self,
+            cache: LocalCache = local_cache,
+            channel: str = INVALIDATION_CHANNEL,
+            poll_timeout: float = 1.0,
+            max_backoff: float = 30.0
+        ):
+        self.cache = cache
+        self.channel = channel
+        self.poll_timeout = poll_timeout
+        self.max_backoff = max_backoff
+        self.connected = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        if self._thread is not None and self._thread.is_alive():
+            return True
+        if redis_config.redis_client is None:
+            logger.info("Redis not configured; in-process L1 cache stays disabled.")
+            return False
+
+        # Breaker yang sedang terbuka tidak menghalangi start: loop di bawah
+        # mencoba ulang dengan backoff dan L1 aktif begitu subscribe berhasil
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout * 2)
+        self._thread = None
+        self.connected = False
+
+    def handle(self, raw) -> List[str]:
+        """Memproses satu payload pesan; mengembalikan grup yang dibuang."""
+        try:
+            message = json_codec.loads(raw)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed cache invalidation message: %r", raw)
+            return []
+        if message.get("origin") == PROCESS_ID:
+            return []
+        groups = [str(group) for group in message.get("groups") or []]
+        self.cache.invalidate(*groups)
+        return groups
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = redis_config.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.cache.clear()
+                self.connected = True
+                backoff = 1.0
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=self.poll_timeout)
+                    if message and message.get("type") == "message":
+                        self.handle(message["data"])
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+            finally:
+                self.connected = False
+                self.cache.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+
+invalidation_listener = InvalidationListener()
+
+
+def start_invalidation_listener() -> bool:
+    return invalidation_listener.start()
+
+
+def stop_invalidation_listener() -> None:
+    invalidation_listener.stop()
@@ -0,0 +1,92 @@
+"""
+Cache L1 di memori proses (LRU dibatasi jumlah entri dan TTL).
+
+Entri menyimpan response DTO yang sudah di-decode sehingga hit L1 tidak
+butuh round trip Redis maupun `json.loads`/validasi pydantic. Key L1 tidak
+memuat versi namespace; entri dikelompokkan per `<namespace>[:<scope>]`
+dan satu grup dibuang sekaligus saat namespace itu di-bump (lokal maupun
+lewat pesan pub/sub dari worker lain, lihat `invalidation.py`).
+
+Setiap grup punya nomor generasi. Pemanggil mencatat generasi sebelum
+membaca Redis/database dan `set` menolak hasilnya bila grup sudah
+diinvalidasi di tengah jalan, supaya data lama tidak masuk kembali ke L1.
+"""
+import os
+import time
+from collections import OrderedDict, defaultdict
+from threading import RLock
+from typing import Any, Dict, Optional, Set, Tuple
+
+L1_ENABLED = str(os.getenv("CACHE_L1_ENABLED", "true")).lower() == "true"
+L1_MAX_ENTRIES = int(os.getenv("CACHE_L1_MAX_ENTRIES", 2048))
+# TTL pendek membatasi data basi bila pesan invalidasi pub/sub sempat terlewat
+L1_TTL_SECONDS = float(os.getenv("CACHE_L1_TTL_SECONDS", 30))
+
+
+class LocalCache:
+    def __init__(self, max_entries: int = L1_MAX_ENTRIES, ttl_seconds: float = L1_TTL_SECONDS, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = RLock()
+        self._entries: "OrderedDict[str, Tuple[str, float, Any]]" = OrderedDict()
+        self._groups: Dict[str, Set[str]] = defaultdict(set)
+        self._generations: Dict[str, int] = defaultdict(int)
+        # Dinaikkan oleh clear(); ikut dalam token generasi agar grup yang belum pernah dilihat juga terlindungi
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, group: str) -> Tuple[int, int]:
+        with self._lock:
+            return self._epoch, self._generations.get(group, 0)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            group, expires_at, value = entry
+            if expires_at <= self._clock():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, group: str, key: str, value: Any, generation: Optional[Tuple[int, int]] = None) -> bool:
+        with self._lock:
+            if generation is not None and generation != (self._epoch, self._generations.get(group, 0)):
+                return False
+            self._discard(key)
+            self._entries[key] = (group, self._clock() + self.ttl_seconds, value)
+            self._groups[group].add(key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+            return True
+
+    def invalidate(self, *groups: str) -> None:
+        with self._lock:
+            for group in groups:
+                self._generations[group] += 1
+                for key in self._groups.pop(group, set()):
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._groups.clear()
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._groups.get(entry[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[entry[0]]
+
+
+local_cache = LocalCache()
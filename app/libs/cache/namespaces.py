@@ -0,0 +1,174 @@
+"""
+Namespace cache berversi.
+
+Setiap key cache menyertakan nomor versi namespace-nya, misalnya
+`cart:<user_id>:v3:items:0:10`. Invalidasi cukup satu `INCR` pada key
+versi (`ns:cart:<user_id>`): key lama tidak lagi dibaca dan habis sendiri
+oleh TTL-nya, tanpa `SCAN` + `DELETE` per key.
+
+Namespace dengan `scope` (user, produk, brand) punya versi sendiri sehingga
+perubahan keranjang satu user tidak menyentuh cache user lain. Key versi
+ber-scope diberi TTL `CACHE_SCOPED_VERSION_TTL` (diperpanjang di setiap
+bump) agar tidak menumpuk satu key per user selamanya. Setelah key versi
+habis, bump berikutnya tidak mulai lagi dari 1: key diisi dulu dengan
+waktu sekarang dalam milidetik (`SET NX`) sebelum `INCR`, sehingga versi
+baru selalu lebih besar dari versi mana pun yang pernah dipakai dan entri
+versi lama yang masih hidup tidak pernah terbaca ulang. Selama key versi
+tidak ada, pembaca memakai v0; entri v0 yang ditulis sebelum bump pertama
+sudah kedaluwarsa jauh sebelum key versi habis karena TTL key versi lebih
+panjang dari TTL entri mana pun.
+
+Bump juga membuang grup yang sama dari cache L1 proses ini dan mem-publish
+grup tersebut ke worker lain (lihat `local.py` dan `invalidation.py`).
+
+Setiap bump meninggalkan penanda `bumped:<grup>` selama
+`CACHE_PRIMARY_REFILL_SECONDS`. Selama penanda ada, query yang mengisi ulang
+grup tersebut dijalankan di primary (`refill_reads`) karena replica mungkin
+belum menerima tulisan yang memicu bump; tanpa ini data lama bisa tersimpan
+di bawah versi baru sepanjang TTL.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional, Tuple, Union
+
+from app.libs import redis_config
+from app.libs.cache.invalidation import INVALIDATION_CHANNEL, encode_invalidation
+from app.libs.cache.local import local_cache
+from app.libs.cache.stats import cache_stats
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY_PREFIX = "ns"
+RECENT_BUMP_KEY_PREFIX = "bumped"
+# Harus lebih panjang dari TTL entri terpanjang (ttl + jitter + stale_ttl)
+SCOPED_VERSION_TTL = int(os.getenv("CACHE_SCOPED_VERSION_TTL", 7 * 24 * 3600))
+# Perkiraan lag replica; default mengikuti jendela read-your-writes
+PRIMARY_REFILL_SECONDS = int(os.getenv("CACHE_PRIMARY_REFILL_SECONDS", os.getenv("DB_READ_YOUR_WRITES_SECONDS", 10)))
+
+# Katalog global: list ID /product/all dan listing promo produk (anggota dan urutan, bukan isi kartu)
+CATALOG = "catalog"
+# Detail satu produk; scope = product_id
+PRODUCT = "product"
+# Listing, scroll dan diskon produk milik satu brand; scope = production_id
+BRAND_PRODUCTS = "brand_products"
+# Listing brand, brand per kategori dan promo brand
+BRANDS = "brands"
+# Detail satu brand; scope = production_id
+BRAND = "brand"
+ARTICLES = "articles"
+CATEGORIES = "categories"
+# Namespace per user; scope = user_id
+USER = "user"
+CART = "cart"
+WISHLIST = "wishlist"
+ORDERS = "orders"
+RATINGS = "ratings"
+
+# Namespace katalog yang jarang berubah dan boleh dilayani dari cache L1 in-process
+L1_NAMESPACES = frozenset({CATALOG, PRODUCT, BRAND_PRODUCTS, BRANDS, BRAND, ARTICLES, CATEGORIES})
+
+NamespaceTarget = Union[str, Tuple[str, Optional[object]]]
+
+
+def cache_group(namespace: str, scope: Optional[object] = None) -> str:
+    """Nama grup `<namespace>[:<scope>]`; satuan invalidasi untuk versi Redis maupun L1."""
+    return namespace if scope is None else f"{namespace}:{scope}"
+
+
+def version_key(namespace: str, scope: Optional[object] = None) -> str:
+    return f"{VERSION_KEY_PREFIX}:{cache_group(namespace, scope)}"
+
+
+def namespace_version(namespace: str, scope: Optional[object] = None) -> int:
+    """Versi namespace saat ini; 0 bila belum pernah diinvalidasi atau Redis tidak tersedia."""
+    client = redis_config.redis_client
+    if not client:
+        return 0
+    try:
+        with cache_stats.timed(namespace):
+            return int(client.get(version_key(namespace, scope)) or 0)
+    except Exception as e:
+        logger.warning("Failed to read cache namespace version %s: %s", version_key(namespace, scope), e)
+        return 0
+
+
+def versioned_key(namespace: str, *parts: object, scope: Optional[object] = None) -> str:
+    """Menyusun key cache `<namespace>[:<scope>]:v<versi>:<parts...>`."""
+    version = namespace_version(namespace, scope)
+    return ":".join([cache_group(namespace, scope), f"v{version}", *(str(part) for part in parts)])
+
+
+def recent_bump_key(group: str) -> str:
+    return f"{RECENT_BUMP_KEY_PREFIX}:{group}"
+
+
+def recently_bumped(*groups: str) -> bool:
+    """True bila salah satu grup di-bump dalam `PRIMARY_REFILL_SECONDS` terakhir (best-effort)."""
+    client = redis_config.redis_client
+    if not client or not groups or PRIMARY_REFILL_SECONDS <= 0:
+        return False
+    try:
+        return bool(client.exists(*(recent_bump_key(group) for group in groups)))
+    except Exception as e:
+        logger.warning("Failed to read cache bump markers %s: %s", groups, e)
+        return False
+
+
+@contextmanager
+def refill_reads(*groups: str, bumped: Optional[bool] = None):
+    """
+    Query pengisi cache di dalam blok ini memakai primary bila grupnya baru saja
+    di-bump. `bumped` dipakai pemanggil yang sudah membaca penanda sendiri.
+    """
+    if not (recently_bumped(*groups) if bumped is None else bumped):
+        yield
+        return
+
+    from app.libs.sql_alchemy_lib import primary_reads
+
+    with primary_reads():
+        yield
+
+
+def version_seed() -> int:
+    """Nilai awal key versi ber-scope: waktu sekarang (ms), tidak pernah lebih kecil dari versi yang sudah kedaluwarsa."""
+    return int(time.time() * 1000)
+
+
+def bump_namespaces(*targets: NamespaceTarget) -> None:
+    """
+    Menaikkan versi namespace (best-effort). Target berupa nama namespace
+    global atau tuple `(namespace, scope)`; semua INCR (didahului SET NX
+    seed dan diikuti EXPIRE untuk versi ber-scope), penanda bump dan PUBLISH
+    invalidasi L1 dikirim dalam satu pipeline.
+    """
+    if not targets:
+        return
+
+    groups = [cache_group(target) if isinstance(target, str) else cache_group(*target) for target in targets]
+    scoped = [not isinstance(target, str) and target[1] is not None for target in targets]
+    local_cache.invalidate(*groups)
+
+    client = redis_config.redis_client
+    if not client:
+        return
+
+    keys = [f"{VERSION_KEY_PREFIX}:{group}" for group in groups]
+    seed = version_seed()
+    try:
+        pipeline = client.pipeline(transaction=False)
+        for key, is_scoped in zip(keys, scoped):
+            if is_scoped:
+                pipeline.set(key, seed, nx=True)
+            pipeline.incr(key)
+            if is_scoped:
+                pipeline.expire(key, SCOPED_VERSION_TTL)
+        if PRIMARY_REFILL_SECONDS > 0:
+            for group in groups:
+                pipeline.setex(recent_bump_key(group), PRIMARY_REFILL_SECONDS, "1")
+        pipeline.publish(INVALIDATION_CHANNEL, encode_invalidation(groups))
+        pipeline.execute()
+    except Exception as e:
+        logger.warning("Failed to bump cache namespaces %s: %s", keys, e)
@@ -0,0 +1,94 @@
+"""
+Laporan pemakaian memori cache per namespace.
+
+Key di-sampling lewat beberapa putaran `SCAN` (dibatasi, tidak menyapu seluruh
+keyspace) lalu dikelompokkan per namespace dari prefix key-nya: `<namespace>:...`
+untuk entri `@cached`/list ID, `entity:<namespace>:...` untuk entri per entity,
+dan prefix lain (misalnya `shipping_cost`, `origin_address`) apa adanya. Key
+versi (`ns:`), penanda bump (`bumped:`) dan lock single-flight (`lock:`) dilewati.
+
+Ukuran setiap key contoh diambil dengan `MEMORY USAGE` dalam satu pipeline.
+Jumlah key dan byte per namespace diestimasi dari proporsi contoh terhadap
+`DBSIZE`; `scan_complete` menandakan seluruh keyspace sempat terbaca sehingga
+hitungan key adalah angka pasti.
+"""
+import logging
+import os
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from app.libs import redis_config
+from app.libs.cache.entities import ENTITY_KEY_PREFIX
+from app.libs.cache.namespaces import RECENT_BUMP_KEY_PREFIX, VERSION_KEY_PREFIX
+from app.libs.cache.single_flight import LOCK_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
+
+CACHE_REPORT_SAMPLE_KEYS = int(os.getenv("CACHE_REPORT_SAMPLE_KEYS", 100))
+CACHE_REPORT_MAX_SCANS = int(os.getenv("CACHE_REPORT_MAX_SCANS", 20))
+SCAN_COUNT = 500
+
+_SKIPPED_PREFIXES = frozenset({VERSION_KEY_PREFIX, RECENT_BUMP_KEY_PREFIX, LOCK_KEY_PREFIX})
+
+
+def report_namespace(key: str) -> str:
+    prefix, _, rest = key.partition(":")
+    if prefix == ENTITY_KEY_PREFIX and rest:
+        return rest.split(":", 1)[0]
+    return prefix
+
+
+def sample_cache_memory(
+        sample_keys: int = CACHE_REPORT_SAMPLE_KEYS,
+        max_scans: int = CACHE_REPORT_MAX_SCANS
+    ) -> Dict[str, Any]:
+    """Mengembalikan `{"scan_complete", "scanned_keys", "total_keys", "namespaces": {ns: {...}}}`."""
+    client = redis_config.redis_client
+    if not client:
+        return {"scan_complete": False, "scanned_keys": 0, "total_keys": 0, "namespaces": {}}
+
+    counts: Dict[str, int] = defaultdict(int)
+    samples: Dict[str, List[str]] = defaultdict(list)
+    scanned = 0
+    cursor = 0
+    for _ in range(max_scans):
+        cursor, keys = client.scan(cursor=cursor, count=SCAN_COUNT)
+        for key in keys:
+            scanned += 1
+            namespace = report_namespace(key)
+            if namespace in _SKIPPED_PREFIXES:
+                continue
+            counts[namespace] += 1
+            if len(samples[namespace]) < sample_keys:
+                samples[namespace].append(key)
+        if cursor == 0:
+            break
+    scan_complete = cursor == 0
+    total_keys = client.dbsize()
+
+    sampled_keys = [key for keys in samples.values() for key in keys]
+    pipeline = client.pipeline(transaction=False)
+    for key in sampled_keys:
+        pipeline.memory_usage(key)
+    sizes = dict(zip(sampled_keys, pipeline.execute())) if sampled_keys else {}
+
+    # Key yang kedaluwarsa di antara SCAN dan MEMORY USAGE mengembalikan None
+    namespaces = {}
+    for namespace, keys in samples.items():
+        measured = [sizes[key] for key in keys if sizes.get(key) is not None]
+        avg_bytes = sum(measured) / len(measured) if measured else 0.0
+        estimated_keys = counts[namespace] if scan_complete or not scanned else round(total_keys * counts[namespace] / scanned)
+        namespaces[namespace] = {
+            "sampled_keys": len(measured),
+            "sampled_bytes": sum(measured),
+            "avg_key_bytes": round(avg_bytes, 1),
+            "estimated_keys": estimated_keys,
+            "estimated_bytes": round(estimated_keys * avg_bytes),
+        }
+
+    return {
+        "scan_complete": scan_complete,
+        "scanned_keys": scanned,
+        "total_keys": total_keys,
+        "namespaces": namespaces,
+    }
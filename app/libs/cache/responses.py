@@ -0,0 +1,71 @@
+"""
+Response untuk hit cache yang body JSON-nya sudah final.
+
+Service yang di-cache dengan `raw_response=True` mengembalikan objek ini
+pada cache hit sehingga router (`return result.unwrap()`) mengirim byte
+tersimpan apa adanya: tanpa `json.loads`, validasi DTO, maupun serialisasi
+ulang `response_model` oleh FastAPI.
+
+Body dibungkus `CachedBody` yang juga menyimpan varian terkompresinya
+(brotli/gzip). Varian dibuat sekali per entri pada request pertama yang
+memintanya; entri di cache L1 membawa varian tersebut sehingga hit panas
+langsung mengirim byte terkompresi tanpa melewati kompresi per request.
+Hit dari Redis selalu membawa `CachedBody` baru tanpa varian, jadi kompresi
+yang belum ada dijalankan di threadpool agar tidak menahan event loop.
+"""
+from typing import Dict, Mapping, Optional, Union
+
+from fastapi import Response, status
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+
+from app.libs.compression import compress, is_compressible, mark_encoded, negotiate_encoding
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+
+class CachedBody:
+    __slots__ = ("raw", "_encoded")
+
+    def __init__(self, raw: bytes):
+        self.raw = raw
+        self._encoded: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def stored(self, encoding: str) -> Optional[bytes]:
+        """Varian terkompresi yang sudah ada, tanpa mengompresi."""
+        return self._encoded.get(encoding)
+
+    def encoded(self, encoding: str) -> bytes:
+        # Dua thread yang mengompresi bersamaan menghasilkan byte yang sama; cukup yang terakhir disimpan
+        variant = self._encoded.get(encoding)
+        if variant is None:
+            variant = self._encoded[encoding] = compress(self.raw, encoding)
+        return variant
+
+
+class CachedJSONResponse(Response):
+    media_type = "application/json"
+
+    def __init__(
+            self,
+            body: Union[bytes, CachedBody],
+            status_code: int = status.HTTP_200_OK,
+            headers: Optional[Mapping[str, str]] = None,
+            cache_status: str = "HIT"
+        ):
+        self.cached_body = body if isinstance(body, CachedBody) else CachedBody(body)
+        super().__init__(content=self.cached_body.raw, status_code=status_code, headers=headers)
+        self.headers[CACHE_STATUS_HEADER] = cache_status
+
+    async def __call__(self, scope, receive, send):
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding and "content-encoding" not in self.headers and is_compressible(self.media_type, len(self.cached_body)):
+            body = self.cached_body.stored(encoding)
+            if body is None:
+                body = await run_in_threadpool(self.cached_body.encoded, encoding)
+            self.body = body
+            mark_encoded(self.headers, encoding, len(self.body))
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,72 @@
+"""
+Lock Redis untuk menyatukan cache miss (single-flight).
+
+Hanya pemegang lock `lock:<cache_key>` yang menghitung ulang nilai; request
+lain menunggu sebentar sampai key terisi. Lock dilepas dengan
+compare-and-delete sehingga lock yang sudah kedaluwarsa dan diambil proses
+lain tidak ikut terhapus.
+
+Menunggu memakai `time.sleep`, jadi hanya dilakukan di thread worker
+(route `def`). Bila dipanggil dari thread event loop, penantian dilewati
+dan pemanggil menghitung sendiri agar satu miss tidak membekukan worker.
+"""
+import asyncio
+import os
+import time
+import uuid
+from typing import Callable, Optional
+
+LOCK_KEY_PREFIX = "lock"
+LOCK_TTL_MS = int(os.getenv("CACHE_LOCK_TTL_MS", 10000))
+LOCK_WAIT_MS = int(os.getenv("CACHE_LOCK_WAIT_MS", 3000))
+LOCK_POLL_MS = int(os.getenv("CACHE_LOCK_POLL_MS", 50))
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def lock_key(cache_key: str) -> str:
+    return f"{LOCK_KEY_PREFIX}:{cache_key}"
+
+
+def acquire_lock(client, cache_key: str, ttl_ms: int = LOCK_TTL_MS) -> Optional[str]:
+    """Mengembalikan token bila lock didapat, None bila sedang dipegang proses lain. Error Redis diteruskan."""
+    token = uuid.uuid4().hex
+    if client.set(lock_key(cache_key), token, nx=True, px=ttl_ms):
+        return token
+    return None
+
+
+def release_lock(client, cache_key: str, token: str) -> None:
+    client.eval(_RELEASE_SCRIPT, 1, lock_key(cache_key), token)
+
+
+def on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def wait_for_value(
+        client,
+        cache_key: str,
+        wait_ms: int = LOCK_WAIT_MS,
+        poll_ms: int = LOCK_POLL_MS,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> Optional[str]:
+    """Polling key sampai terisi pemegang lock atau batas tunggu habis; None langsung bila di event loop."""
+    if on_event_loop():
+        return None
+    deadline = time.monotonic() + wait_ms / 1000
+    while time.monotonic() < deadline:
+        sleep(poll_ms / 1000)
+        raw = client.get(cache_key)
+        if raw:
+            return raw
+    return None
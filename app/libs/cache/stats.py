@@ -0,0 +1,95 @@
+"""
+Penghitung cache per namespace di memori proses.
+`local_hits` adalah hit cache L1 in-process, `hits` hit segar dari Redis,
+`stale_hits` nilai basi yang dikirim selama refresh background, dan
+`coalesced` request yang menunggu hasil pemegang lock single-flight.
+`writes`/`bytes_written` menghitung entri yang ditulis, sedangkan
+`redis_calls` dan latensinya mengukur round trip GET/MGET/SETEX.
+
+Angka ini per worker; cukup untuk melihat rasio hit sebuah namespace,
+membandingkan TTL antar namespace, dan mendeteksi Redis yang bermasalah
+(error naik, hit turun ke nol, latensi naik).
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Iterator
+
+
+class CacheStats:
+    FIELDS = ("hits", "local_hits", "stale_hits", "coalesced", "misses", "errors", "writes", "bytes_written", "redis_calls")
+    HIT_FIELDS = ("hits", "local_hits", "stale_hits", "coalesced")
+
+    def __init__(self):
+        self._lock = Lock()
+        self._counters: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+        self._latency: Dict[str, Dict[str, float]] = defaultdict(lambda: {"total": 0.0, "max": 0.0})
+
+    def record(self, namespace: str, field: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[namespace][field] += amount
+
+    def hit(self, namespace: str) -> None:
+        self.record(namespace, "hits")
+
+    def local_hit(self, namespace: str) -> None:
+        self.record(namespace, "local_hits")
+
+    def stale_hit(self, namespace: str) -> None:
+        self.record(namespace, "stale_hits")
+
+    def coalesced(self, namespace: str) -> None:
+        self.record(namespace, "coalesced")
+
+    def miss(self, namespace: str) -> None:
+        self.record(namespace, "misses")
+
+    def error(self, namespace: str) -> None:
+        self.record(namespace, "errors")
+
+    def write(self, namespace: str, size: int, count: int = 1) -> None:
+        with self._lock:
+            counters = self._counters[namespace]
+            counters["writes"] += count
+            counters["bytes_written"] += size
+
+    def observe_latency(self, namespace: str, seconds: float) -> None:
+        with self._lock:
+            self._counters[namespace]["redis_calls"] += 1
+            latency = self._latency[namespace]
+            latency["total"] += seconds
+            latency["max"] = max(latency["max"], seconds)
+
+    @contextmanager
+    def timed(self, namespace: str) -> Iterator[None]:
+        """Mencatat durasi satu round trip Redis, termasuk yang gagal."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_latency(namespace, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            result = {}
+            for namespace, counters in self._counters.items():
+                hits = sum(counters[field] for field in self.HIT_FIELDS)
+                lookups = hits + counters["misses"]
+                latency = self._latency[namespace]
+                calls = counters["redis_calls"]
+                result[namespace] = {
+                    **counters,
+                    "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+                    "avg_latency_ms": round(latency["total"] / calls * 1000, 3) if calls else 0.0,
+                    "max_latency_ms": round(latency["max"] * 1000, 3),
+                }
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._latency.clear()
+
+
+cache_stats = CacheStats()
@@ -0,0 +1,158 @@
+"""
+Kompresi response HTTP (brotli / gzip).
+
+`CompressionMiddleware` mengompresi body response yang lengkap (bukan
+streaming) bila klien mengirim `Accept-Encoding` yang didukung, tipe
+kontennya ada di allowlist, dan ukurannya minimal `COMPRESSION_MIN_SIZE`
+byte. Response yang sudah membawa `Content-Encoding` dilewatkan apa adanya:
+hit cache katalog (`CachedJSONResponse`) mengirim varian yang sudah
+dikompresi dan disimpan bersama body-nya, sehingga hit panas tidak
+mengompresi ulang per request.
+
+Brotli dipakai bila paket `brotli` terpasang; tanpa itu hanya gzip.
+ETag tidak diubah: nilainya hash body JSON sebelum kompresi, dan response
+terkompresi selalu membawa `Vary: Accept-Encoding`.
+"""
+import gzip
+import os
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli opsional, fallback ke gzip
+    brotli = None
+
+BROTLI = "br"
+GZIP = "gzip"
+
+COMPRESSION_ENABLED = str(os.getenv("COMPRESSION_ENABLED", "true")).lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+# Kualitas menengah: rasio mendekati level 11 dengan CPU jauh lebih kecil untuk kompresi per request
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+COMPRESSIBLE_CONTENT_TYPES = frozenset(
+    content_type.strip().lower()
+    for content_type in os.getenv(
+        "COMPRESSION_CONTENT_TYPES",
+        "application/json,text/html,text/plain,text/css,text/csv,application/javascript",
+    ).split(",")
+    if content_type.strip()
+)
+
+# Urutan preferensi server bila klien menerima beberapa encoding dengan q yang sama
+SUPPORTED_ENCODINGS = (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Encoding terbaik dari header `Accept-Encoding`; None berarti kirim tanpa kompresi."""
+    if not COMPRESSION_ENABLED or not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        token, _, params = item.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[token] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    if encoding == GZIP:
+        # mtime=0 membuat output deterministik untuk body yang sama
+        return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def is_compressible(content_type: Optional[str], size: int, minimum_size: int = COMPRESSION_MIN_SIZE) -> bool:
+    if size < minimum_size or not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in COMPRESSIBLE_CONTENT_TYPES
+
+
+def mark_encoded(headers: MutableHeaders, encoding: str, size: int) -> None:
+    """Header untuk body yang sudah dikompresi dengan `encoding`."""
+    headers["Content-Encoding"] = encoding
+    headers["Content-Length"] = str(size)
+    add_vary_accept_encoding(headers)
+
+
+def add_vary_accept_encoding(headers: MutableHeaders) -> None:
+    vary = headers.get("Vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware yang mengompresi body response lengkap. Response
+    streaming (`more_body`) dan response yang sudah ber-`Content-Encoding`
+    diteruskan tanpa diubah.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            body = message.get("body", b"")
+            content_type = headers.get("Content-Type")
+            if headers.get("Content-Encoding") or message.get("more_body", False):
+                passthrough = True
+            elif is_compressible(content_type, len(body), self.minimum_size):
+                body = compress(body, encoding)
+                mark_encoded(headers, encoding, len(body))
+                message = {**message, "body": body}
+            elif is_compressible(content_type, self.minimum_size, self.minimum_size):
+                # Tipe yang bisa dikompresi tetap dibedakan per Accept-Encoding oleh cache bersama
+                add_vary_accept_encoding(headers)
+
+            await send(start_message)
+            await send(message)
+            # Body berikutnya (streaming) diteruskan langsung
+            passthrough = True
+
+        await self.app(scope, receive, send_compressed)
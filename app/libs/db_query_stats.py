@@ -0,0 +1,129 @@
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+"""
+############################Per-request SQL instrumentation (statement count, DB time, N+1)###################
+"""
+N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", 20))
+REPEATED_STATEMENT_THRESHOLD = int(os.getenv("DB_REPEATED_STATEMENT_THRESHOLD", 5))
+# Header X-DB-* membuka bentuk query ke client, jadi harus diaktifkan secara eksplisit
+EXPOSE_HEADERS = str(os.getenv("DB_QUERY_STATS_HEADERS", "false")).lower() == "true"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|:\w+|\$\d+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Ubah SQL menjadi 'bentuk' tanpa literal/parameter supaya query berulang bisa dikelompokkan."""
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _BIND_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_seconds += elapsed
+        self.shapes[normalize_statement(statement)] += 1
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_seconds * 1000, 2)
+
+    def repeated_shapes(self, threshold: int | None = None) -> list[tuple[str, int]]:
+        threshold = REPEATED_STATEMENT_THRESHOLD if threshold is None else threshold
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    @property
+    def max_repeats(self) -> int:
+        return max(self.shapes.values(), default=0)
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_started_at")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+class QueryStatsMiddleware:
+    """
+    ASGI middleware yang mengumpulkan statistik query per request.
+    Statistik dikirim lewat header X-DB-* hanya bila `DB_QUERY_STATS_HEADERS=true`;
+    warning selalu dicatat ketika endpoint melewati ambang N+1.
+    """
+
+    def __init__(self, app, expose_headers: bool = EXPOSE_HEADERS):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = str(stats.total_ms)
+                headers["X-DB-Max-Repeated-Statement"] = str(stats.max_repeats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            self._warn_if_n_plus_one(scope, stats)
+
+    @staticmethod
+    def _warn_if_n_plus_one(scope, stats: QueryStats):
+        repeated = stats.repeated_shapes()
+        if stats.count <= N_PLUS_ONE_THRESHOLD and not repeated:
+            return
+        logger.warning(
+            "Possible N+1 on %s %s: %s statements, %sms DB time, repeated shapes: %s",
+            scope.get("method"),
+            scope.get("path"),
+            stats.count,
+            stats.total_ms,
+            "; ".join(f"{count}x {shape[:120]}" for shape, count in repeated[:3]) or "-",
+        )
@@ -0,0 +1,94 @@
+"""
+Conditional request HTTP (ETag / 304) dan `Cache-Control` untuk endpoint katalog.
+
+ETag adalah hash body JSON final. Pada cache hit body tersebut sudah berupa
+byte tersimpan (`CachedJSONResponse`), sehingga `If-None-Match` yang cocok
+dijawab `304 Not Modified` tanpa decode, validasi DTO, maupun serialisasi.
+Pada cache miss DTO diserialisasi sekali di sini dan byte yang sama dipakai
+untuk hash dan body, bukan diserialisasi ulang oleh FastAPI. Hit cache
+dikirim lewat objek `CachedJSONResponse` itu sendiri agar varian
+terkompresi yang tersimpan bersamanya ikut terpakai.
+
+`Cache-Control` per route diatur lewat env `HTTP_CACHE_CONTROL_<ROUTE>`
+(misalnya `HTTP_CACHE_CONTROL_PRODUCT_DETAIL="public, max-age=120"`), dengan
+`HTTP_CACHE_CONTROL_DEFAULT` sebagai nilai bawaan.
+"""
+import hashlib
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.libs import json_codec
+from app.libs.cache.responses import CACHE_STATUS_HEADER, CachedJSONResponse
+
+DEFAULT_CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL_DEFAULT", "public, max-age=60, stale-while-revalidate=300")
+
+PRODUCT_LIST = "product_list"
+PRODUCT_DETAIL = "product_detail"
+CATEGORIES = "categories"
+ARTICLES = "articles"
+BRAND_SCROLL = "brand_scroll"
+
+_ROUTE_DEFAULTS = {
+    PRODUCT_LIST: DEFAULT_CACHE_CONTROL,
+    PRODUCT_DETAIL: DEFAULT_CACHE_CONTROL,
+    # Kategori dan artikel jarang berubah
+    CATEGORIES: "public, max-age=300, stale-while-revalidate=600",
+    ARTICLES: "public, max-age=300, stale-while-revalidate=600",
+    BRAND_SCROLL: DEFAULT_CACHE_CONTROL,
+}
+
+ROUTE_CACHE_CONTROL: Dict[str, str] = {
+    route: os.getenv(f"HTTP_CACHE_CONTROL_{route.upper()}", default)
+    for route, default in _ROUTE_DEFAULTS.items()
+}
+
+NOT_MODIFIED_RESPONSE = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Data tidak berubah sejak ETag pada header `If-None-Match`; body kosong",
+    }
+}
+
+
+def cache_control_for(route: str) -> str:
+    return ROUTE_CACHE_CONTROL.get(route, DEFAULT_CACHE_CONTROL)
+
+
+def compute_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Perbandingan lemah sesuai RFC 9110: prefix `W/` diabaikan, `*` cocok dengan apa pun."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == target for candidate in if_none_match.split(","))
+
+
+def _body_of(data: Any) -> bytes:
+    if isinstance(data, Response):
+        return bytes(data.body)
+    if isinstance(data, BaseModel):
+        return data.model_dump_json().encode()
+    return json_codec.dumps(data)
+
+
+def conditional_response(request: Request, data: Any, route: str) -> Response:
+    """Mengembalikan body JSON ber-ETag, atau 304 bila `If-None-Match` klien masih cocok."""
+    body = _body_of(data)
+    etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control_for(route)}
+    if isinstance(data, Response) and CACHE_STATUS_HEADER in data.headers:
+        headers[CACHE_STATUS_HEADER] = data.headers[CACHE_STATUS_HEADER]
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if isinstance(data, CachedJSONResponse):
+        data.headers.update(headers)
+        return data
+    return Response(content=body, media_type="application/json", headers=headers)
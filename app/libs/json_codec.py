@@ -0,0 +1,48 @@
+"""
+Codec JSON berbasis orjson untuk response API dan payload cache Redis.
+
+orjson menangani `datetime`, `date`, `UUID`, enum dan dataclass secara
+native. Sisanya lewat `_default`: `Decimal` diubah seperti
+`jsonable_encoder` FastAPI (int bila tanpa pecahan, selain itu float) agar
+format angka di API tidak berubah, model Pydantic lewat
+`model_dump(mode="json")`, dan set menjadi list.
+
+`ORJSONResponse` dipasang sebagai `default_response_class` aplikasi, jadi
+dict hasil validasi `response_model` di-render orjson, bukan `json.dumps`.
+"""
+from decimal import Decimal
+from typing import Any, Union
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    """Untuk nilai Redis; client memakai `decode_responses` sehingga nilai dibaca kembali sebagai str."""
+    return dumps(obj).decode()
+
+
+def loads(raw: Union[str, bytes]) -> Any:
+    return orjson.loads(raw)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
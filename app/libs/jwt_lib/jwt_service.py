@@ -8,6 +8,7 @@ from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
 from fastapi import Depends, HTTPException, status
 
 from .jwt_dto import TokenPayLoad, AccessTokenDto
+from app.libs.sql_alchemy_lib import current_db_user
 
 from dotenv import load_dotenv
 
@@ -82,6 +83,9 @@ async def get_jwt_pyload(token: Annotated[HTTPAuthorizationCredentials, Depends(
                 # message="Invalid token payload"
             )
 
+        # Dipakai RoutingSession untuk read-your-writes setelah user ini commit
+        current_db_user.set(payload["id"])
+
         return TokenPayLoad(id=payload["id"], role=payload["role"])
     
     except ExpiredSignatureError:
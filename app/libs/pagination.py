@@ -0,0 +1,142 @@
+"""
+Pagination keyset (cursor) untuk endpoint list.
+
+`OFFSET n` tetap membaca dan membuang n baris pertama, jadi halaman dalam
+makin lambat secara linear. Dengan keyset, halaman berikutnya dimulai
+tepat setelah baris terakhir halaman sebelumnya:
+
+    WHERE (created_at, id) < (:created_at, :id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit + 1
+
+sehingga biaya per halaman konstan selama ada index pada kolom kunci.
+Baris ekstra (limit + 1) menentukan `has_more` tanpa `COUNT(*)`.
+
+Cursor adalah nilai kunci baris terakhir yang di-encode base64 (opaque bagi
+klien). Parameter `skip` tetap didukung untuk kompatibilitas: tanpa cursor
+query memakai `OFFSET skip` dengan urutan yang sama, dan response tetap
+membawa `next_cursor` sehingga klien bisa pindah ke cursor kapan saja.
+Kolom kunci harus NOT NULL dan kombinasinya unik (akhiri dengan primary key).
+"""
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.dtos.error_response_dtos import ErrorResponseDto
+from app.libs import json_codec
+
+CURSOR_DESCRIPTION = (
+    "Cursor halaman berikutnya dari `next_cursor` response sebelumnya. "
+    "Bila diisi, `skip` diabaikan."
+)
+
+Row = TypeVar("Row")
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[Row]):
+    items: List[Row]
+    has_more: bool
+    next_cursor: Optional[str]
+
+
+def invalid_cursor_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=ErrorResponseDto(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error="Bad Request",
+            message="Pagination cursor is invalid or expired."
+        ).dict()
+    )
+
+
+def encode_cursor(*values: Any) -> str:
+    return base64.urlsafe_b64encode(json_codec.dumps(list(values))).decode().rstrip("=")
+
+
+def _coerce(column, value: Any) -> Any:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type in (int, float):
+        return python_type(value)
+    return value
+
+
+def decode_cursor(cursor: str, keys: Sequence) -> tuple:
+    """Nilai kunci dari cursor, dikonversi ke tipe kolomnya; cursor rusak menjadi 400."""
+    try:
+        values = json_codec.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match pagination keys")
+        return tuple(_coerce(column, value) for column, value in zip(keys, values))
+    except (binascii.Error, TypeError, ValueError):
+        raise invalid_cursor_error()
+
+
+def keyset_query(
+        stmt: Select,
+        keys: Sequence,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        descending: bool = True
+    ) -> Select:
+    """Menambahkan urutan kunci, filter cursor (atau `OFFSET skip`) dan `LIMIT limit + 1`."""
+    stmt = stmt.order_by(*(key.desc() if descending else key.asc() for key in keys))
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        boundary = tuple_(*(literal(value, type_=key.type) for key, value in zip(keys, values)))
+        stmt = stmt.where(tuple_(*keys) < boundary if descending else tuple_(*keys) > boundary)
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt.limit(limit + 1)
+
+
+def build_page(rows: Sequence[Row], limit: int, keys: Sequence) -> KeysetPage[Row]:
+    """Memotong baris ekstra; `next_cursor` dibaca dari atribut kunci baris terakhir (model, Row, atau DTO)."""
+    has_more = len(rows) > limit
+    items = list(rows[:limit])
+    next_cursor = None
+    if has_more and items:
+        next_cursor = encode_cursor(*(getattr(items[-1], key.key) for key in keys))
+    return KeysetPage(items=items, has_more=has_more, next_cursor=next_cursor)
+
+
+def keyset_paginate(
+        db: Session,
+        stmt: Select,
+        keys: Sequence,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        descending: bool = True
+    ) -> KeysetPage:
+    """Menjalankan `stmt` (select satu entity) sebagai satu halaman keyset."""
+    rows = db.execute(keyset_query(stmt, keys, limit, cursor, skip, descending)).scalars().all()
+    return build_page(rows, limit, keys)
+
+
+async def keyset_paginate_async(
+        db: AsyncSession,
+        stmt: Select,
+        keys: Sequence,
+        limit: int,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        descending: bool = True
+    ) -> KeysetPage:
+    """Padanan `keyset_paginate` untuk `AsyncSession`."""
+    rows = (await db.execute(keyset_query(stmt, keys, limit, cursor, skip, descending))).scalars().all()
+    return build_page(rows, limit, keys)
@@ -1,11 +1,16 @@
 import logging
 import os
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Callable, Dict, Optional
 
 import redis
 from dotenv import load_dotenv
 
+from app.libs.cache.stats import cache_stats
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
@@ -13,34 +18,237 @@ REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
 REDIS_DB = int(os.getenv("REDIS_DB", 0))
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD", None)
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+# Timeout pendek: cache yang lambat lebih buruk daripada langsung ke database
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.5))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 0.5))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+REDIS_BREAKER_THRESHOLD = int(os.getenv("REDIS_BREAKER_THRESHOLD", 5))
+REDIS_BREAKER_COOLDOWN = float(os.getenv("REDIS_BREAKER_COOLDOWN", 30))
+REDIS_RECONNECT_MAX_BACKOFF = float(os.getenv("REDIS_RECONNECT_MAX_BACKOFF", 60))
+
+CLOSED = "closed"
+OPEN = "open"
+
+# Perintah yang hanya membuat objek lokal (tanpa round trip) tetap diblok saat breaker terbuka;
+# round trip-nya lewat method objek tersebut, yang dibungkus agar kegagalannya ikut dihitung breaker.
+# Nilai False: hanya kegagalan yang dicatat. Polling `get_message` listener berjalan terus-menerus,
+# jadi poll yang sukses tidak boleh menggelembungkan total_calls atau mereset consecutive_failures.
+_LOCAL_COMMANDS = {
+    "pipeline": {"execute": True},
+    "pubsub": {"subscribe": True, "get_message": False},
+}
+_FAILURES = (redis.ConnectionError, redis.TimeoutError, OSError)
+
+
+class CircuitOpenError(redis.ConnectionError):
+    """Dilempar tanpa menyentuh jaringan selama circuit breaker terbuka."""
+
+
+def build_connection_pool() -> redis.ConnectionPool:
+    return redis.ConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        db=REDIS_DB,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+
+class ResilientRedisClient:
+    """
+    Klien Redis dengan connection pool eksplisit dan circuit breaker.
+
+    Setelah `failure_threshold` kegagalan koneksi/timeout berturut-turut,
+    breaker terbuka: objek ini bernilai False (`if redis_client:` melewati
+    cache) dan setiap perintah gagal cepat dengan `CircuitOpenError`. Thread
+    background mencoba PING dengan backoff eksponensial mulai dari
+    `cooldown_seconds` dan menutup breaker begitu Redis kembali, termasuk
+    bila Redis belum hidup saat aplikasi start.
+    """
+
+    def __init__(
+            self,
+            client: Optional[redis.Redis] = None,
+            pool: Optional[redis.ConnectionPool] = None,
+            failure_threshold: int = REDIS_BREAKER_THRESHOLD,
+            cooldown_seconds: float = REDIS_BREAKER_COOLDOWN,
+            max_backoff: float = REDIS_RECONNECT_MAX_BACKOFF,
+            connect: bool = True
+        ):
+        self.pool = pool if pool is not None else (None if client is not None else build_connection_pool())
+        self._client = client if client is not None else redis.StrictRedis(connection_pool=self.pool)
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._commands: Dict[str, Callable] = {}
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.total_calls = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+        self.reconnect_attempts = 0
+        self.last_error: Optional[str] = None
+        self.last_failure_at: Optional[datetime] = None
+        self.last_recovered_at: Optional[datetime] = None
+
+        if connect:
+            self.connect()
+
+    def __bool__(self) -> bool:
+        return self.state == CLOSED
+
+    @property
+    def client(self) -> redis.Redis:
+        return self._client
+
+    def connect(self) -> bool:
+        """PING sinkron; gagal langsung membuka breaker dan menjadwalkan reconnect."""
+        logger.info("Connecting to Redis at %s:%s, DB=%s", REDIS_HOST, REDIS_PORT, REDIS_DB)
+        try:
+            self._client.ping()
+        except _FAILURES as e:
+            logger.warning("Failed to connect to Redis at %s:%s. Error: %s", REDIS_HOST, REDIS_PORT, e)
+            self._open(e)
+            return False
+        logger.info("Successfully connected to Redis!")
+        return True
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        command = self._commands.get(name)
+        if command is not None:
+            return command
+
+        target = getattr(self._client, name)
+        if not callable(target):
+            return target
+
+        tracked_methods = _LOCAL_COMMANDS.get(name)
+        call = target if tracked_methods is not None else self._tracked(target)
 
+        @wraps(target)
+        def command(*args, **kwargs):
+            if self.state == OPEN:
+                with self._lock:
+                    self.rejected_calls += 1
+                raise CircuitOpenError(f"Redis circuit open; skipping {name}")
+            result = call(*args, **kwargs)
+            if tracked_methods is not None:
+                for method, count_success in tracked_methods.items():
+                    setattr(result, method, self._tracked(getattr(result, method), count_success))
+            return result
 
-class RedisClient:
-    _instance: Optional[redis.StrictRedis] = None
+        self._commands[name] = command
+        return command
 
-    def __new__(cls):
-        if cls._instance is None:
-            logger.info("Connecting to Redis at %s:%s, DB=%s", REDIS_HOST, REDIS_PORT, REDIS_DB)
+    def _tracked(self, target: Callable, count_success: bool = True) -> Callable:
+        """Membungkus satu round trip supaya hasilnya tercatat di breaker."""
+
+        @wraps(target)
+        def call(*args, **kwargs):
+            try:
+                result = target(*args, **kwargs)
+            except _FAILURES as e:
+                self._record_failure(e)
+                raise
+            if count_success:
+                self._record_success()
+            return result
+
+        return call
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self.total_calls += 1
+            self.consecutive_failures = 0
+
+    def _record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.total_calls += 1
+            self.total_failures += 1
+            self.consecutive_failures += 1
+            self.last_error = str(error)
+            self.last_failure_at = datetime.now(timezone.utc)
+            should_open = self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        if should_open:
+            logger.warning(
+                "Redis circuit opened after %s consecutive failures: %s", self.consecutive_failures, error
+            )
+            self._open(error)
+
+    def _open(self, error: Exception) -> None:
+        with self._lock:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.last_error = str(error)
+            self.last_failure_at = self.last_failure_at or datetime.now(timezone.utc)
+            if self._reconnect_thread is not None and self._reconnect_thread.is_alive():
+                return
+            self._reconnect_thread = threading.Thread(target=self._reconnect_loop, name="redis-reconnect", daemon=True)
+            self._reconnect_thread.start()
+
+    def _reconnect_loop(self) -> None:
+        delay = self.cooldown_seconds
+        while not self._stop.wait(delay):
             try:
-                client = redis.StrictRedis(
-                    host=REDIS_HOST,
-                    port=REDIS_PORT,
-                    db=REDIS_DB,
-                    password=REDIS_PASSWORD,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5,
-                )
-                client.ping()
-                cls._instance = client
-                logger.info("Successfully connected to Redis!")
-            except redis.ConnectionError as e:
-                logger.warning("Failed to connect to Redis at %s:%s. Error: %s", REDIS_HOST, REDIS_PORT, e)
-                cls._instance = None
-        return cls._instance
-
-
-redis_client = RedisClient()
+                self._client.ping()
+            except _FAILURES as e:
+                with self._lock:
+                    self.reconnect_attempts += 1
+                    self.last_error = str(e)
+                delay = min(delay * 2, self.max_backoff)
+                continue
+
+            with self._lock:
+                self.state = CLOSED
+                self.consecutive_failures = 0
+                self.last_recovered_at = datetime.now(timezone.utc)
+            logger.info("Redis connection recovered; circuit closed.")
+            return
+
+    def close(self) -> None:
+        self._stop.set()
+        if self.pool is not None:
+            self.pool.disconnect()
+
+    def health(self) -> dict:
+        with self._lock:
+            snapshot = {
+                "state": self.state,
+                "available": self.state == CLOSED,
+                "consecutive_failures": self.consecutive_failures,
+                "total_calls": self.total_calls,
+                "total_failures": self.total_failures,
+                "rejected_calls": self.rejected_calls,
+                "times_opened": self.times_opened,
+                "reconnect_attempts": self.reconnect_attempts,
+                "last_error": self.last_error,
+                "last_failure_at": self.last_failure_at,
+                "last_recovered_at": self.last_recovered_at,
+            }
+        snapshot["pool"] = {
+            "max_connections": getattr(self.pool, "max_connections", None),
+            "created_connections": getattr(self.pool, "_created_connections", None),
+            "in_use_connections": len(getattr(self.pool, "_in_use_connections", ()) or ()),
+            "idle_connections": len(getattr(self.pool, "_available_connections", ()) or ()),
+        }
+        return snapshot
+
+
+redis_client = ResilientRedisClient()
 
 
 def check_redis_connection():
@@ -53,11 +261,41 @@ def check_redis_connection():
     return False
 
 
-def custom_json_serializer(obj):
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()
-    if hasattr(obj, "dict"):
-        return obj.dict()
-    raise TypeError(f"Type {type(obj)} not serializable")
+def key_namespace(key: str) -> str:
+    """Namespace statistik sebuah key: segmen sebelum `:` pertama."""
+    return key.split(":", 1)[0]
+
+
+def cache_get(key: str) -> Optional[str]:
+    """GET best-effort: None bila Redis tidak tersedia, breaker terbuka, atau perintah gagal."""
+    namespace = key_namespace(key)
+    if not redis_client:
+        cache_stats.miss(namespace)
+        return None
+    try:
+        with cache_stats.timed(namespace):
+            value = redis_client.get(key)
+    except Exception as e:
+        cache_stats.error(namespace)
+        logger.warning("Failed to read cache key %s: %s", key, e)
+        return None
+    if value is None:
+        cache_stats.miss(namespace)
+    else:
+        cache_stats.hit(namespace)
+    return value
+
+
+def cache_setex(key: str, ttl: int, value: str) -> None:
+    """SETEX best-effort; kegagalan cache tidak boleh menggagalkan request."""
+    if not redis_client:
+        return
+    namespace = key_namespace(key)
+    try:
+        with cache_stats.timed(namespace):
+            redis_client.setex(key, ttl, value)
+        cache_stats.write(namespace, len(value.encode()))
+    except Exception as e:
+        cache_stats.error(namespace)
+        logger.warning("Failed to write cache key %s: %s", key, e)
+
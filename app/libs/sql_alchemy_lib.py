@@ -1,10 +1,17 @@
+import logging
 import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 
 from dotenv import load_dotenv
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Delete, Engine, Insert, Update, create_engine, event
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 load_dotenv()
+logger = logging.getLogger(__name__)
 """
 #######################This use to create connection with database###########################################
 """
@@ -23,11 +30,187 @@ engine = create_engine(
     pool_recycle=1800,
 )
 
+"""
+######################Optional read replica for read-only service calls#####################################
+"""
+SQLALCHEMY_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+READ_YOUR_WRITES_SECONDS = int(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 10))
+replica_engine: Engine | None = None
+
+if SQLALCHEMY_REPLICA_URL:
+    replica_engine = create_engine(
+        SQLALCHEMY_REPLICA_URL,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=1800,
+    )
+
+# Diisi oleh jwt_service.get_jwt_pyload supaya session tahu siapa user yang sedang request
+current_db_user: ContextVar[str | None] = ContextVar("current_db_user", default=None)
+# Diisi oleh pengisian ulang cache setelah invalidasi: query read-only dipaksa ke primary
+prefer_primary: ContextVar[bool] = ContextVar("prefer_primary", default=False)
+
+
+@contextmanager
+def primary_reads():
+    """Semua session read-only di dalam blok ini membaca dari primary, bukan replica."""
+    token = prefer_primary.set(True)
+    try:
+        yield
+    finally:
+        prefer_primary.reset(token)
+
+
+def _shared_redis_client():
+    from app.libs import redis_config
+
+    return redis_config.redis_client
+
+
+class RecentWriters:
+    """
+    Mencatat kapan user terakhir commit, untuk read-your-writes setelah menulis ke primary.
+
+    Penanda disimpan di Redis (`ryw:<user_id>` dengan TTL sepanjang jendela) supaya
+    request berikutnya tetap ke primary walau dilayani worker lain. Salinan lokal
+    tetap dipakai bila Redis tidak tersedia.
+    """
+
+    MAX_ENTRIES = 10000
+    KEY_PREFIX = "ryw"
+
+    def __init__(self, window_seconds: int = READ_YOUR_WRITES_SECONDS, client_getter=_shared_redis_client):
+        self.window_seconds = window_seconds
+        self._client_getter = client_getter
+        self._lock = threading.Lock()
+        self._last_write: dict[str, float] = {}
+
+    def key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    def mark(self, user_id: str, remote: bool = True):
+        """`remote=False` hanya mencatat lokal; session async mengirim penanda Redis lewat `mark_remote` di threadpool."""
+        now = time.monotonic()
+        with self._lock:
+            self._last_write[user_id] = now
+            if len(self._last_write) > self.MAX_ENTRIES:
+                self._last_write = {
+                    key: written_at
+                    for key, written_at in self._last_write.items()
+                    if now - written_at < self.window_seconds
+                }
+        if remote:
+            self.mark_remote(user_id)
+
+    def mark_remote(self, user_id: str):
+        client = self._client_getter()
+        if not client:
+            return
+        try:
+            client.setex(self.key(user_id), self.window_seconds, "1")
+        except Exception as e:
+            logger.warning("Failed to store read-your-writes marker for %s: %s", user_id, e)
+
+    def is_sticky(self, user_id: str | None) -> bool:
+        if not user_id:
+            return False
+        with self._lock:
+            written_at = self._last_write.get(user_id)
+        if written_at is not None and time.monotonic() - written_at < self.window_seconds:
+            return True
+
+        client = self._client_getter()
+        if not client:
+            return False
+        try:
+            return bool(client.exists(self.key(user_id)))
+        except Exception as e:
+            logger.warning("Failed to read read-your-writes marker for %s: %s", user_id, e)
+            return False
+
+
+recent_writers = RecentWriters()
+
+
+class RoutingSession(Session):
+    """
+    Session yang mengarahkan query read-only (session.info["read_only"]) ke replica.
+    Flush, INSERT/UPDATE/DELETE, user yang baru saja commit dan blok `primary_reads()`
+    tetap memakai primary.
+    """
+
+    def __init__(self, *args, replica_bind=None, writers: RecentWriters | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.writers = writers if writers is not None else recent_writers
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            self.replica_bind is not None
+            and self.info.get("read_only")
+            and not self._flushing
+            and not isinstance(clause, (Insert, Update, Delete))
+            and not prefer_primary.get()
+            and not self._writer_is_sticky()
+        ):
+            return self.replica_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _writer_is_sticky(self) -> bool:
+        # Dicek sekali per user per session supaya tidak ada round-trip Redis di setiap statement
+        user_id = current_db_user.get()
+        checked = self.info.get("sticky_writer")
+        if checked is None or checked[0] != user_id:
+            checked = (user_id, self.writers.is_sticky(user_id))
+            self.info["sticky_writer"] = checked
+        return checked[1]
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_pending_write(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_executed_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+# Session dari async engine: penanda Redis read-your-writes ditunda ke threadpool (lihat get_async_db)
+DEFER_REMOTE_MARKS_INFO_KEY = "defer_remote_marks"
+PENDING_MARKS_INFO_KEY = "pending_remote_marks"
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_writer(session):
+    user_id = current_db_user.get()
+    if session.info.pop("has_writes", False) and user_id:
+        deferred = bool(session.info.get(DEFER_REMOTE_MARKS_INFO_KEY))
+        session.writers.mark(user_id, remote=not deferred)
+        if deferred:
+            session.info.setdefault(PENDING_MARKS_INFO_KEY, set()).add(user_id)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_pending_write(session):
+    session.info.pop("has_writes", None)
+
+
 """
 ######################Tis code use to make interact with database object###################################
 ######################Mostly to do manipulation to define entity of database###############################
 """
-session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+session_local = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
+read_session_local = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replica_bind=replica_engine,
+    info={"read_only": True},
+)
 """
 #########################Base is abstract object use to define table on database############################
 #########################Developer will use it as abstract object to inherit################################
@@ -42,10 +225,192 @@ Base = declarative_base()
 """
 
 
+DB_TOUCHED_INFO_KEY = "db_touched"
+
+
+@event.listens_for(Session, "after_begin")
+def _mark_session_touched(session, transaction, connection):
+    session.info[DB_TOUCHED_INFO_KEY] = True
+
+
+class LazySession:
+    """
+    Proxy Session yang baru dibuat saat atribut pertama kali diakses.
+    Koneksi pool baru di-checkout saat statement pertama dieksekusi,
+    sehingga request yang dilayani penuh dari Redis tidak menyentuh pool sama sekali.
+    """
+
+    def __init__(self, factory=session_local):
+        self._factory = factory
+        self._session = None
+
+    def __getattr__(self, name):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    @property
+    def touched_database(self) -> bool:
+        return self._session is not None and bool(self._session.info.get(DB_TOUCHED_INFO_KEY))
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+class DbSessionStats:
+    """Counter per proses untuk melihat berapa request yang selesai tanpa query ke database."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.requests_without_db = 0
+
+    def record(self, touched_database: bool):
+        with self._lock:
+            self.total_requests += 1
+            if not touched_database:
+                self.requests_without_db += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.total_requests
+            without_db = self.requests_without_db
+        return {
+            "total_requests": total,
+            "requests_without_db": without_db,
+            "requests_with_db": total - without_db,
+            "without_db_ratio": round(without_db / total, 4) if total else 0.0,
+        }
+
+
+db_session_stats = DbSessionStats()
+
+
 # Dependency to get the database session
 def get_db():
-    database = session_local()
+    database = LazySession(session_local)
     try:
         yield database
     finally:
         database.close()
+        db_session_stats.record(database.touched_database)
+
+
+# Dependency for read-only service calls (catalog browsing, admin listings).
+# Routed to DATABASE_REPLICA_URL when configured, otherwise identical to get_db.
+def get_read_db():
+    database = LazySession(read_session_local)
+    try:
+        yield database
+    finally:
+        database.close()
+        db_session_stats.record(database.touched_database)
+
+
+"""
+############################Async engine (asyncpg) for async def routes#####################################
+############################Engine is built on first use so import stays cheap##############################
+"""
+ASYNC_DRIVER_PREFIXES = ("postgresql+psycopg2://", "postgresql://", "postgres://")
+
+
+def build_async_database_url(database_url: str) -> str:
+    for prefix in ASYNC_DRIVER_PREFIXES:
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix):]
+    return database_url
+
+
+ASYNC_SQLALCHEMY_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or build_async_database_url(SQLALCHEMY_DATABASE_URL)
+
+ASYNC_SQLALCHEMY_REPLICA_URL = (
+    os.getenv("ASYNC_DATABASE_REPLICA_URL")
+    or (build_async_database_url(SQLALCHEMY_REPLICA_URL) if SQLALCHEMY_REPLICA_URL else None)
+)
+
+_async_engine = None
+_async_session_local = None
+_async_read_session_local = None
+
+
+def get_async_engine():
+    global _async_engine, _async_session_local, _async_read_session_local
+
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        engine_options = dict(pool_pre_ping=True, pool_size=5, max_overflow=10, pool_recycle=1800)
+        _async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, **engine_options)
+        async_replica_engine = (
+            create_async_engine(ASYNC_SQLALCHEMY_REPLICA_URL, **engine_options)
+            if ASYNC_SQLALCHEMY_REPLICA_URL
+            else None
+        )
+        _async_session_local = async_sessionmaker(
+            bind=_async_engine,
+            sync_session_class=RoutingSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={DEFER_REMOTE_MARKS_INFO_KEY: True},
+        )
+        _async_read_session_local = async_sessionmaker(
+            bind=_async_engine,
+            sync_session_class=RoutingSession,
+            autoflush=False,
+            expire_on_commit=False,
+            replica_bind=async_replica_engine.sync_engine if async_replica_engine else None,
+            info={"read_only": True, DEFER_REMOTE_MARKS_INFO_KEY: True},
+        )
+    return _async_engine
+
+
+async def prime_sticky_writer(database) -> None:
+    """
+    Cek read-your-writes (Redis) di threadpool lalu simpan hasilnya di session,
+    sehingga `RoutingSession.get_bind` tidak memanggil Redis dari event loop.
+    """
+    session = database.sync_session
+    if session.replica_bind is None:
+        return
+    user_id = current_db_user.get()
+    sticky = await run_in_threadpool(session.writers.is_sticky, user_id)
+    session.info["sticky_writer"] = (user_id, sticky)
+
+
+async def flush_remote_marks(database) -> None:
+    """Kirim penanda read-your-writes yang ditunda `_remember_writer` ke Redis lewat threadpool."""
+    pending = database.sync_session.info.pop(PENDING_MARKS_INFO_KEY, None)
+    for user_id in pending or ():
+        await run_in_threadpool(database.sync_session.writers.mark_remote, user_id)
+
+
+@asynccontextmanager
+async def async_session(factory=None):
+    get_async_engine()
+    async with (factory or _async_session_local)() as database:
+        await prime_sticky_writer(database)
+        try:
+            yield database
+        finally:
+            await flush_remote_marks(database)
+            db_session_stats.record(bool(database.sync_session.info.get(DB_TOUCHED_INFO_KEY)))
+
+
+def async_read_session():
+    """Session async read-only (replica bila dikonfigurasi); dipakai juga oleh refresh cache service async."""
+    get_async_engine()
+    return async_session(_async_read_session_local)
+
+
+# Dependency to get the async database session for `async def` routes.
+# Services on this path run their queries with `await db.execute(...)`; Redis calls go through the threadpool.
+async def get_async_db():
+    async with async_session() as database:
+        yield database
+
+
+# Async counterpart of get_read_db
+async def get_async_read_db():
+    async with async_read_session() as database:
+        yield database
@@ -4,16 +4,23 @@ from fastapi.staticfiles import StaticFiles
 import os
 
 # Import scheduler untuk penghapusan user yang belum diverifikasi
-from app.utils.scheduler import start_scheduler
+from app.utils.scheduler import start_scheduler, refresh_autocomplete_index
 
 # Import semua router dari controller
 from app import controllers
+from app.libs.compression import CompressionMiddleware
+from app.libs.json_codec import ORJSONResponse
+from app.libs.db_query_stats import QueryStatsMiddleware
+from app.libs.cache import start_invalidation_listener, stop_invalidation_listener
+from app.libs.redis_config import redis_client
 
 # Inisialisasi aplikasi FastAPI
 app = FastAPI(
     title="Dokumentasi API -> App. AmImUm Herbal",  
     description="Media API untuk mengelola serta melakukan testing CRUD pada proyek App. AmImUm Herbal",
     version="1.0.0",
+    # Response di-render orjson (lihat app/libs/json_codec.py)
+    default_response_class=ORJSONResponse,
     terms_of_service="https://github.com/imanmaris99/AmImUmProjectBE",
     contact={
         "name": "Developer API",
@@ -48,6 +55,12 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+# Middleware untuk menghitung query SQL per request dan mendeteksi pola N+1
+app.add_middleware(QueryStatsMiddleware)
+
+# Middleware kompresi brotli/gzip untuk response JSON besar (listing produk)
+app.add_middleware(CompressionMiddleware)
+
 # Mount directory untuk akses gambar statis
 root_directory = os.getcwd()  # Mendapatkan direktori kerja saat ini
 images_directory = os.path.join(root_directory, "images")
@@ -58,6 +71,16 @@ app.mount("/images", StaticFiles(directory=images_directory), name="images")
 async def startup_event():
     # Memulai scheduler untuk menghapus user yang belum diverifikasi
     start_scheduler()
+    # Bangun indeks autocomplete produk sebelum request pertama masuk
+    refresh_autocomplete_index()
+    # Listener pub/sub yang menjaga cache L1 katalog tetap koheren antar worker
+    start_invalidation_listener()
+
+# Event shutdown
+@app.on_event("shutdown")
+async def shutdown_event():
+    stop_invalidation_listener()
+    redis_client.close()
 
 # Menyertakan semua router
 app.include_router(controllers.admin_router.router)
@@ -30,7 +30,7 @@ class CartProductModel(Base):
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="cart_products",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
 
     def __repr__(self):
@@ -32,12 +32,12 @@ class CourierModel(Base):
     shipments: Mapped[list["ShipmentModel"]] = relationship(
         "ShipmentModel",
         back_populates="courier",
-        lazy='selectin')  # Satu pilihan courier dapat direferensikan banyak shipment historis
+        lazy="raise_on_sql")  # Satu pilihan courier dapat direferensikan banyak shipment historis
     
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="couriers",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
 
     def __repr__(self):
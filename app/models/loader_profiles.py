@@ -0,0 +1,103 @@
+"""
+Profil loader SQLAlchemy per kasus penggunaan.
+
+Relationship pada model tidak lagi memakai `selectin` secara menyeluruh; setiap
+service memilih profil di bawah ini secara eksplisit, misalnya:
+
+    select(ProductModel).options(*loader_profiles.PRODUCT_CARD)
+
+Setiap profil memuat tepat relasi yang dibaca oleh DTO terkait dan memasang
+`raiseload(..., sql_only=True)` pada relasi lain sehingga akses yang tidak
+direncanakan langsung gagal saat pengembangan alih-alih memicu N+1 diam-diam.
+Jumlah statement tiap profil dijaga oleh tests/test_loader_profiles.py.
+"""
+
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.models.cart_product_model import CartProductModel
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.payment_model import PaymentModel
+from app.models.product_model import ProductModel
+from app.models.rating_model import RatingModel
+from app.models.shipment_model import ShipmentModel
+
+
+# Kartu produk pada listing: varian + nama brand, tanpa rating dan kategori.
+PRODUCT_CARD = (
+    selectinload(ProductModel.pack_type).raiseload("*", sql_only=True),
+    selectinload(ProductModel.product_bies).raiseload("*", sql_only=True),
+    raiseload(ProductModel.ratings, sql_only=True),
+)
+
+# Halaman detail produk membaca relasi yang sama dengan kartu: varian + nama brand.
+# Rata-rata dan jumlah rating dibaca dari kolom agregat products, bukan dari koleksi ratings.
+PRODUCT_DETAIL = PRODUCT_CARD
+
+# Baris keranjang: produk dan varian yang dipilih.
+CART_LINE = (
+    selectinload(CartProductModel.products).raiseload("*", sql_only=True),
+    selectinload(CartProductModel.pack_type).raiseload("*", sql_only=True),
+    raiseload(CartProductModel.user, sql_only=True),
+)
+
+# Ringkasan order (listing order user/admin): nama customer, ongkir dan item.
+ORDER_SUMMARY = (
+    selectinload(OrderModel.user).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).selectinload(ShipmentModel.courier).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).raiseload(ShipmentModel.shipment_address, sql_only=True),
+    selectinload(OrderModel.shipments).raiseload(ShipmentModel.user, sql_only=True),
+    selectinload(OrderModel.order_items).selectinload(OrderItemModel.products).raiseload("*", sql_only=True),
+    selectinload(OrderModel.order_items).selectinload(OrderItemModel.pack_type).raiseload("*", sql_only=True),
+    raiseload(OrderModel.payment, sql_only=True),
+)
+
+# Detail order: ringkasan order + alamat pengiriman.
+ORDER_DETAIL = (
+    selectinload(OrderModel.user).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).selectinload(ShipmentModel.courier).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).selectinload(ShipmentModel.shipment_address).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).raiseload(ShipmentModel.user, sql_only=True),
+    selectinload(OrderModel.order_items).selectinload(OrderItemModel.products).raiseload("*", sql_only=True),
+    selectinload(OrderModel.order_items).selectinload(OrderItemModel.pack_type).raiseload("*", sql_only=True),
+    raiseload(OrderModel.payment, sql_only=True),
+)
+
+# Payload transaksi Midtrans: data customer dan ongkir, tanpa item order.
+ORDER_PAYMENT = (
+    selectinload(OrderModel.user).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).selectinload(ShipmentModel.courier).raiseload("*", sql_only=True),
+    selectinload(OrderModel.shipments).raiseload(ShipmentModel.shipment_address, sql_only=True),
+    selectinload(OrderModel.shipments).raiseload(ShipmentModel.user, sql_only=True),
+    raiseload(OrderModel.order_items, sql_only=True),
+    raiseload(OrderModel.payment, sql_only=True),
+)
+
+# Listing/detail pembayaran di admin: status order beserta nama dan email customer.
+PAYMENT_SUMMARY = (
+    selectinload(PaymentModel.order).selectinload(OrderModel.user).raiseload("*", sql_only=True),
+    selectinload(PaymentModel.order).raiseload("*", sql_only=True),
+)
+
+# Rating milik user: nama produk yang dirating.
+RATING_LINE = (
+    selectinload(RatingModel.products).raiseload("*", sql_only=True),
+    raiseload(RatingModel.user, sql_only=True),
+)
+
+# Profil user dan listing/detail user di admin: hanya kolom user.
+ADMIN_USER_SUMMARY = (
+    raiseload("*", sql_only=True),
+)
+
+__all__ = [
+    "PRODUCT_CARD",
+    "PRODUCT_DETAIL",
+    "CART_LINE",
+    "ORDER_SUMMARY",
+    "ORDER_DETAIL",
+    "ORDER_PAYMENT",
+    "PAYMENT_SUMMARY",
+    "RATING_LINE",
+    "ADMIN_USER_SUMMARY",
+]
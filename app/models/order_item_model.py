@@ -35,7 +35,7 @@ class OrderItemModel(Base):
     order: Mapped[list["OrderModel"]] = relationship(
         "OrderModel", 
         back_populates="order_items", 
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
     
     def __repr__(self):
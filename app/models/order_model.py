@@ -44,26 +44,26 @@ class OrderModel(Base):
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="orders",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
 
     shipments: Mapped["ShipmentModel"] = relationship(
         "ShipmentModel", 
         back_populates="order",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
 
     order_items: Mapped[list["OrderItemModel"]] = relationship(
         "OrderItemModel",
         back_populates="order",
-        lazy='selectin'  # Menggunakan selectin untuk optimasi eager loading jika diperlukan
+        lazy="raise_on_sql"  # Dimuat eksplisit lewat loader_profiles.ORDER_SUMMARY
     )
     
     payment: Mapped["PaymentModel"] = relationship(
         "PaymentModel",
         back_populates="order",
         uselist=False,
-        lazy='selectin'  # Menggunakan selectin untuk optimasi eager loading jika diperlukan
+        lazy="raise_on_sql"  # Belum dibaca service mana pun; muat eksplisit bila dibutuhkan
     )
     
     def __repr__(self):
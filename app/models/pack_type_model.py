@@ -1,11 +1,30 @@
 from decimal import Decimal, ROUND_HALF_UP
-from sqlalchemy import Column, Float, ForeignKey, String, Integer, DateTime, func, DECIMAL
+from sqlalchemy import Column, Float, ForeignKey, Index, String, Integer, DateTime, func, DECIMAL
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.dialects.mysql import CHAR
 from app.libs import sql_alchemy_lib
 
+def calculate_discount_amount(price, discount) -> Decimal:
+    """Potongan harga varian; dipakai juga oleh read model kartu produk."""
+    if not discount:
+        return Decimal("0.00")
+    base_price = Decimal(str(price)) if price is not None else Decimal("0.00")
+    discount_value = Decimal(str(discount))
+    return (base_price * (discount_value / Decimal("100"))).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def calculate_discounted_price(price, discount) -> Decimal:
+    base_price = Decimal(str(price)) if price is not None else Decimal("0.00")
+    discounted = base_price - calculate_discount_amount(base_price, discount)
+    return discounted.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
 class PackTypeModel(sql_alchemy_lib.Base):
     __tablename__ = "pack_types"
+    # Dipakai filter stok (EXISTS per produk) di /product/filter
+    __table_args__ = (
+        Index("ix_pack_types_product_stock", "product_id", "stock"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     product_id = Column(CHAR(36), ForeignKey("products.id"), nullable=False, index=True)
@@ -43,10 +62,7 @@ class PackTypeModel(sql_alchemy_lib.Base):
 
     @property
     def discount_amount(self) -> Decimal:
-        if not self.discount:
-            return Decimal("0.00")
-        discount_value = Decimal(str(self.discount))
-        return (self.base_price * (discount_value / Decimal("100"))).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return calculate_discount_amount(self.base_price, self.discount)
 
     @property
     def promo(self):
@@ -54,8 +70,7 @@ class PackTypeModel(sql_alchemy_lib.Base):
 
     @property
     def discounted_price(self):
-        discounted = self.base_price - self.discount_amount
-        return discounted.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return calculate_discounted_price(self.base_price, self.discount)
 
     # @property
     # def discounted_price(self):
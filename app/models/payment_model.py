@@ -29,7 +29,7 @@ class PaymentModel(Base):
     order: Mapped["OrderModel"] = relationship(
         "OrderModel",
         back_populates="payment",
-        lazy="selectin"  # Optimized eager loading
+        lazy="raise_on_sql"  # Dimuat eksplisit lewat loader_profiles.PAYMENT_SUMMARY
     )
     
     def __repr__(self):
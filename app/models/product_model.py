@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, DECIMAL, Boolean, func
+from sqlalchemy import Column, Index, Integer, String, Text, DateTime, ForeignKey, DECIMAL, Boolean, Float, func
 from sqlalchemy.dialects.mysql import CHAR
 from decimal import Decimal
 from sqlalchemy.orm import relationship, Mapped
@@ -8,6 +8,14 @@ from app.libs import sql_alchemy_lib
 
 class ProductModel(sql_alchemy_lib.Base):
     __tablename__ = "products"
+    # Indeks komposit untuk endpoint /product/filter (filter + urutan selalu diawali is_active)
+    __table_args__ = (
+        Index("ix_products_active_brand_price", "is_active", "product_by_id", "min_variant_price"),
+        Index("ix_products_active_price", "is_active", "min_variant_price"),
+        Index("ix_products_active_rating", "is_active", "avg_rating"),
+        Index("ix_products_active_promo", "is_active", "highest_promo"),
+        Index("ix_products_active_created_at", "is_active", "created_at"),
+    )
     
     # Menggunakan UUID untuk ID produk
     id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()), unique=True, index=True)
@@ -19,6 +27,17 @@ class ProductModel(sql_alchemy_lib.Base):
     price = Column(DECIMAL(10, 2), nullable=False, index=True)
     is_active = Column(Boolean, default=True, index=True)
     product_by_id = Column(Integer, ForeignKey("productions.id"), nullable=False, index=True)
+    # Agregat terdenormalisasi; dipelihara oleh product_services.product_stats
+    # setiap kali rating atau pack type berubah (lihat juga backfill_product_stats)
+    avg_rating = Column(Float, nullable=False, default=0, server_default="0", index=True)
+    total_rater = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    min_variant_price = Column(DECIMAL(10, 2), nullable=True, index=True)
+    max_variant_price = Column(DECIMAL(10, 2), nullable=True)
+    highest_promo = Column(Float, nullable=False, default=0, server_default="0", index=True)
+    avg_promo = Column(Float, nullable=False, default=0, server_default="0")
+    # Kolom `search_vector` (tsvector) sengaja tidak dipetakan: diisi trigger
+    # PostgreSQL dari migrasi 1b7f3c9d2e4a dan hanya dibaca product_search
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
@@ -26,6 +45,7 @@ class ProductModel(sql_alchemy_lib.Base):
     pack_type: Mapped[list["PackTypeModel"]] = relationship(
         "PackTypeModel", 
         back_populates="products", 
+        order_by="PackTypeModel.id",  # Urutan varian stabil, sama dengan read model kartu produk
         lazy='selectin')  # Optimasi eager loading
 
     product_bies: Mapped["ProductionModel"] = relationship(
@@ -62,46 +82,6 @@ class ProductModel(sql_alchemy_lib.Base):
         productions_model: ProductionModel = self.product_bies
         return productions_model.name if productions_model else ""
 
-    @property
-    def highest_promo(self):
-        if not self.pack_type:
-            return 0
-        # Mengambil nilai diskon tertinggi dari pack_type
-        max_discount = max((pt.discount for pt in self.pack_type if pt.discount), default=0)
-        return round(max_discount, 1)
-
-    # Properti untuk menghitung rata-rata promo
-    @property
-    def avg_promo(self):
-        if not self.pack_type:
-            return 0
-        total_discount = sum(pt.discount for pt in self.pack_type if pt.discount)
-        return round(total_discount / len(self.pack_type), 1) if self.pack_type else 0
-
-    @property
-    def min_variant_price(self):
-        if not self.pack_type:
-            return float(self.price or 0)
-        return float(min(variant.base_price for variant in self.pack_type))
-
-    @property
-    def max_variant_price(self):
-        if not self.pack_type:
-            return float(self.price or 0)
-        return float(max(variant.base_price for variant in self.pack_type))
-
-    # Properti untuk menghitung rata-rata rating
-    @property
-    def avg_rating(self):
-        if not self.ratings:
-            return 0
-        total_rating = sum(r.rate for r in self.ratings)
-        return round(total_rating / len(self.ratings), 1) if self.ratings else 0
-
-    @property
-    def total_rater(self):
-        return len(self.ratings)
-
     # Properti untuk mendapatkan semua varian produk
     @property
     def all_variants(self):
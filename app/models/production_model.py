@@ -26,7 +26,7 @@ class ProductionModel(sql_alchemy_lib.Base):
     products: Mapped[list["ProductModel"]] = relationship(
         "ProductModel",
         back_populates="product_bies",
-        lazy="selectin"  # Optimized eager loading
+        lazy="raise_on_sql"  # Jumlah produk dan promo brand dihitung dengan query agregat, bukan koleksi ini
     )
 
     def __repr__(self):
@@ -41,24 +41,3 @@ class ProductionModel(sql_alchemy_lib.Base):
     @property
     def category(self):
         return self.herbal_category.name if self.herbal_category else ""
-    
-    # @property
-    # def promo_special(self):
-    #     return self.products.highest_promo if self.products else 0
-    @property
-    def promo_special(self) -> float:
-        """Mengembalikan promo tertinggi dari produk, jika ada."""
-        if self.products:
-            return max((product.highest_promo for product in self.products), default=0)
-        return 0
-    
-    @property
-    def total_product(self):
-        return len(self.products)
-    
-    @property
-    def total_product_with_promo(self):
-        """Menghitung jumlah produk dengan promo."""
-        if not self.products:
-            return 0
-        return sum(1 for product in self.products if product.highest_promo > 0)
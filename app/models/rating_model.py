@@ -18,7 +18,7 @@ class RatingModel(Base):
     products: Mapped["ProductModel"] = relationship(
         "ProductModel",
         back_populates="ratings",
-        lazy='selectin'  # Menggunakan selectin untuk optimasi eager loading
+        lazy="raise_on_sql"  # Dimuat eksplisit lewat loader_profiles.RATING_LINE
     )
 
     user: Mapped["UserModel"] = relationship(
@@ -25,4 +25,4 @@ class ShipmentAddressModel(Base):
     shipments: Mapped[list["ShipmentModel"]] = relationship(
         "ShipmentModel",
         back_populates="shipment_address",
-        lazy='selectin')  # Satu alamat dapat dipakai banyak shipment historis
\ No newline at end of file
+        lazy="raise_on_sql")  # Satu alamat dapat dipakai banyak shipment historis
\ No newline at end of file
@@ -37,12 +37,12 @@ class ShipmentModel(Base):
     order: Mapped[list["OrderModel"]] = relationship(
         "OrderModel", 
         back_populates="shipments", 
-        lazy="selectin")  # Lazy loading
+        lazy="raise_on_sql")  # Unit of work tetap me-NULL-kan orders.shipment_id saat shipment dihapus
 
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="shipments",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
     
     def __repr__(self):
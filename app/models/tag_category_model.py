@@ -15,7 +15,7 @@ class TagCategoryModel(sql_alchemy_lib.Base):
     product_bies: Mapped[list["ProductionModel"]] = relationship(
         "ProductionModel",
         back_populates="herbal_category",
-        lazy="selectin")
+        lazy="raise_on_sql")
     
     def __init__(self, name: str, description: Optional[str] = None):
         self.name = name
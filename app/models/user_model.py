@@ -28,28 +28,33 @@ class UserModel(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
+    # Koleksi milik user tidak pernah dimuat otomatis; gunakan app.models.loader_profiles
     cart_products: Mapped[list["CartProductModel"]] = relationship(
         "CartProductModel",
         back_populates="user",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     orders: Mapped[list["OrderModel"]] = relationship(
         "OrderModel",
         back_populates="user",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     shipments: Mapped[list["ShipmentModel"]] = relationship(
         "ShipmentModel",
         back_populates="user",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     couriers: Mapped[list["CourierModel"]] = relationship(
         "CourierModel",
         back_populates="user",
-        lazy="selectin"
+        lazy="raise_on_sql",
+        passive_deletes=True
     )
 
     def __repr__(self):
@@ -0,0 +1,91 @@
+import logging
+
+from fastapi import HTTPException, status
+
+from app.dtos import admin_metrics_dtos
+from app.dtos.error_response_dtos import ErrorResponseDto
+from app.libs import redis_config
+from app.libs.cache import cache_stats
+from app.libs.cache.report import CACHE_REPORT_SAMPLE_KEYS, sample_cache_memory
+from app.libs.sql_alchemy_lib import db_session_stats
+from app.utils.result import build, Result
+
+
+DB_SESSION_STATS_MESSAGE = "Database session stats accessed successfully"
+REDIS_HEALTH_MESSAGE = "Redis health accessed successfully"
+CACHE_REPORT_MESSAGE = "Cache report accessed successfully"
+
+logger = logging.getLogger(__name__)
+
+
+def get_db_session_stats() -> Result[admin_metrics_dtos.DbSessionStatsResponseDto, Exception]:
+    try:
+        return build(data=admin_metrics_dtos.DbSessionStatsResponseDto(
+            status_code=status.HTTP_200_OK,
+            message=DB_SESSION_STATS_MESSAGE,
+            data=admin_metrics_dtos.DbSessionStatsDto(**db_session_stats.snapshot()),
+        ))
+    except Exception as e:
+        return build(error=HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponseDto(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error="Internal Server Error",
+                message=f"Unexpected error: {str(e)}"
+            ).dict()
+        ))
+
+
+def get_redis_health() -> Result[admin_metrics_dtos.RedisHealthResponseDto, Exception]:
+    try:
+        return build(data=admin_metrics_dtos.RedisHealthResponseDto(
+            status_code=status.HTTP_200_OK,
+            message=REDIS_HEALTH_MESSAGE,
+            data=admin_metrics_dtos.RedisHealthDto(**redis_config.redis_client.health()),
+        ))
+    except Exception as e:
+        return build(error=HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponseDto(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error="Internal Server Error",
+                message=f"Unexpected error: {str(e)}"
+            ).dict()
+        ))
+
+
+def get_cache_report(sample_keys: int = CACHE_REPORT_SAMPLE_KEYS) -> Result[admin_metrics_dtos.CacheReportResponseDto, Exception]:
+    try:
+        try:
+            memory = sample_cache_memory(sample_keys=sample_keys)
+            memory_sampled = bool(redis_config.redis_client)
+        except Exception as e:
+            # Statistik hit/miss tetap berguna saat Redis sedang bermasalah
+            logger.warning("Failed to sample cache memory usage: %s", e)
+            memory, memory_sampled = {"namespaces": {}}, False
+
+        counters = cache_stats.snapshot()
+        memory_by_namespace = memory.pop("namespaces")
+        namespaces = [
+            admin_metrics_dtos.CacheNamespaceReportDto(
+                namespace=namespace,
+                **counters.get(namespace, {}),
+                **memory_by_namespace.get(namespace, {}),
+            )
+            for namespace in sorted(set(counters) | set(memory_by_namespace))
+        ]
+
+        return build(data=admin_metrics_dtos.CacheReportResponseDto(
+            status_code=status.HTTP_200_OK,
+            message=CACHE_REPORT_MESSAGE,
+            data=admin_metrics_dtos.CacheReportDto(memory_sampled=memory_sampled, namespaces=namespaces, **memory),
+        ))
+    except Exception as e:
+        return build(error=HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponseDto(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error="Internal Server Error",
+                message=f"Unexpected error: {str(e)}"
+            ).dict()
+        ))
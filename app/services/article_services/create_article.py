@@ -9,11 +9,10 @@ from app.models.article_model import ArticleModel
 from app.dtos.article_dtos import ArticleCreateDTO, ArticleResponseDTO, ArticleCreateResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
-from app.services.article_services.update_article import delete_cache_by_pattern
 from app.utils import optional
 from app.utils.result import build, Result
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import ARTICLES, bump_namespaces
     
 def create_article(
         db: Session, articles: ArticleCreateDTO
@@ -38,7 +37,7 @@ def create_article(
         )
 
         # Invalidate Redis cache
-        delete_cache_by_pattern("articles:*")
+        bump_namespaces(ARTICLES)
 
         return build(data=ArticleCreateResponseDto(
             status_code=status.HTTP_201_CREATED,
@@ -7,11 +7,10 @@ from app.models.article_model import ArticleModel
 from app.dtos.article_dtos import DeleteArticleDto, InfoDeleteArticleDto, DeleteArticleResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
-from app.services.article_services.update_article import delete_cache_by_pattern
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import ARTICLES, bump_namespaces
 
 def reorder_ids(session: Session):
     """Mengatur ulang display_id untuk semua artikel berdasarkan urutan created_at."""
@@ -54,7 +53,7 @@ def delete_article(
         reorder_ids(db)
 
         # Invalidate Redis cache
-        delete_cache_by_pattern("articles:*")
+        bump_namespaces(ARTICLES)
         
         return build(data=DeleteArticleResponseDto(
             status_code=200,
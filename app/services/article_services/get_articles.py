@@ -10,59 +10,26 @@ from app.models.article_model import ArticleModel
 from app.dtos import article_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
-import json
-import logging
-
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
-from app.libs.redis_config import custom_json_serializer, redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import ARTICLES, cached
+from app.libs.pagination import keyset_paginate
 
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "All List of Articles accessed successfully"
+# display_id dinomori ulang mengikuti created_at, jadi urutannya sama dengan urutan display_id
+PAGE_KEYS = (ArticleModel.created_at, ArticleModel.id)
 
+@cached(ARTICLES, key_fn=lambda skip, limit, cursor, **_: ("list", skip, limit, cursor or ""), ttl=CACHE_TTL, dto=article_dtos.AllArticleResponseDto)
 def get_articles(
         db: Session, 
         skip: int = 0, 
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
     ) -> Result[article_dtos.AllArticleResponseDto, Exception]:
-    cache_key = f"articles:{skip}:{limit}"
-
     try:
-        # Check if product data exists in Redis
-        cached_article = None
-        if redis_client:
-            try:
-                cached_article = redis_client.get(cache_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read article cache for key %s: %s", cache_key, cache_error)
-        
-        if cached_article:
-            cached_article_data = json.loads(cached_article)
-            if all(isinstance(addr, dict) and addr.get('id') is not None for addr in cached_article_data):
-                article_dto = [
-                    article_dtos.GetAllArticleDTO(**addr)
-                    for addr in cached_article_data
-                ]
-                return build(data=article_dtos.AllArticleResponseDto(
-                    status_code=status.HTTP_200_OK,
-                    message=RESPONSE_MESSAGE,
-                    data=article_dto
-                ))
-
-            logger.info("Article cache key %s is stale, refreshing from database.", cache_key)
-            try:
-                redis_client.delete(cache_key)
-            except Exception as cache_error:
-                logger.warning("Failed to delete stale article cache for key %s: %s", cache_key, cache_error)
-
-        article = db.execute(
-            select(ArticleModel)
-            .order_by(ArticleModel.display_id)
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
+        page = keyset_paginate(db, select(ArticleModel), PAGE_KEYS, limit, cursor=cursor, skip=skip, descending=False)
+        article = page.items
 
         if not article:
             return build(data=article_dtos.AllArticleResponseDto(
@@ -83,20 +50,12 @@ def get_articles(
             for art in article
         ]
 
-        # Cache the data in Redis
-        if redis_client:
-            try:
-                redis_client.setex(cache_key, CACHE_TTL, json.dumps(
-                    [dto.dict() for dto in article_dto], 
-                    default=custom_json_serializer
-                ))
-            except Exception as cache_error:
-                logger.warning("Failed to write article cache for key %s: %s", cache_key, cache_error)
-
         return build(data=article_dtos.AllArticleResponseDto(
             status_code=status.HTTP_200_OK,
             message=RESPONSE_MESSAGE,
-            data=article_dto
+            data=article_dto,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor
         ))
     
     except SQLAlchemyError as e:
@@ -109,6 +68,9 @@ def get_articles(
                 message=f"Database conflict: {find_errr_from_args('articles', str(e.args))}"
             ).dict()
         ))
+
+    except HTTPException as http_ex:
+        return build(error=http_ex)
     
     except Exception as e:
         return build(error= HTTPException(
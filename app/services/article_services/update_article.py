@@ -13,7 +13,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import ARTICLES, bump_namespaces
 
 
 # Setup logger
@@ -46,7 +46,7 @@ def update_article(
         db.refresh(article)
 
         # Invalidate Redis cache
-        delete_cache_by_pattern("articles:*")
+        bump_namespaces(ARTICLES)
 
 
         return build(data=ArticleInfoUpdateResponseDto(
@@ -78,15 +78,3 @@ def update_article(
                 message=f"An error occurred: {str(e)}"            
             ).dict()
         ))
-
-def delete_cache_by_pattern(pattern: str):
-    """Menghapus semua cache dengan pola tertentu."""
-    try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            redis_client.delete(*keys)
-            logger.info(f"Deleted cache keys: {keys}")
-        else:
-            logger.info("No keys matched the pattern.")
-    except Exception as e:
-        logger.error(f"Error deleting cache by pattern {pattern}: {e}")
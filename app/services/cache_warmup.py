@@ -0,0 +1,137 @@
+"""
+Pemanasan cache katalog.
+
+Setelah deploy atau Redis di-flush, pengunjung pertama menanggung query
+dingin untuk listing produk, promo, brand, kategori dan detail produk. Job
+ini memanggil service ber-`@cached` yang sama dengan router (argumen yang
+sama berarti key cache yang sama), sehingga entri yang kosong dihitung
+ulang dan entri yang basi disegarkan lewat stale-while-revalidate.
+
+Setiap tugas membuka session read sendiri dan jumlah tugas yang berjalan
+bersamaan dibatasi `CACHE_WARM_CONCURRENCY`, jadi job ini tidak pernah
+memakai lebih dari itu koneksi database dari pool yang dipakai traffic live.
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.libs import redis_config
+from app.libs.sql_alchemy_lib import read_session_local
+from app.models.order_item_model import OrderItemModel
+from app.models.order_model import OrderModel
+from app.models.product_model import ProductModel
+from app.services.category_services import get_all_categories
+from app.services.product_services import all_product, get_product_by_id
+from app.services.production_services import get_all_promo, get_infinite_scrolling
+from app.utils.result import Result
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARM_PAGES = int(os.getenv("CACHE_WARM_PAGES", 3))
+CACHE_WARM_TOP_PRODUCTS = int(os.getenv("CACHE_WARM_TOP_PRODUCTS", 50))
+CACHE_WARM_ORDER_DAYS = int(os.getenv("CACHE_WARM_ORDER_DAYS", 7))
+CACHE_WARM_CONCURRENCY = int(os.getenv("CACHE_WARM_CONCURRENCY", 2))
+# Ukuran halaman default endpoint scroll brand (/production/loader)
+SCROLL_PAGE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class WarmupTask:
+    name: str
+    func: Callable[..., Any]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+def top_ordered_product_ids(db: Session, limit: int, days: int = CACHE_WARM_ORDER_DAYS) -> List[str]:
+    """Produk aktif dengan total kuantitas pesanan terbanyak dalam `days` hari terakhir."""
+    if limit <= 0:
+        return []
+
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    volume = func.sum(OrderItemModel.quantity)
+    rows = db.execute(
+        select(OrderItemModel.product_id)
+        .join(OrderModel, OrderModel.id == OrderItemModel.order_id)
+        .join(ProductModel, ProductModel.id == OrderItemModel.product_id)
+        .where(OrderModel.created_at >= since, ProductModel.is_active.is_(True))
+        .group_by(OrderItemModel.product_id)
+        .order_by(volume.desc(), OrderItemModel.product_id)
+        .limit(limit)
+    ).scalars().all()
+    return [str(product_id) for product_id in rows]
+
+
+def catalog_warmup_tasks(pages: int = CACHE_WARM_PAGES, product_ids: List[str] = ()) -> List[WarmupTask]:
+    """
+    Daftar tugas dengan argumen persis seperti yang dikirim router. Listing
+    produk, promo dan kategori hanya dipanggil router dengan argumen default,
+    sehingga cukup satu halaman; scroll brand dipaginasi frontend.
+    """
+    tasks = [
+        WarmupTask("all_product", all_product),
+        WarmupTask("get_all_promo", get_all_promo),
+        WarmupTask("get_all_categories", get_all_categories),
+    ]
+    tasks.extend(
+        WarmupTask("get_infinite_scrolling", get_infinite_scrolling, {"skip": page * SCROLL_PAGE_SIZE, "limit": SCROLL_PAGE_SIZE})
+        for page in range(pages)
+    )
+    # id tersimpan sebagai string UUID kanonis, sama dengan str(uuid.UUID) dari path router
+    tasks.extend(
+        WarmupTask("get_product_by_id", get_product_by_id, {"product_id": product_id})
+        for product_id in product_ids
+    )
+    return tasks
+
+
+def _run_task(task: WarmupTask, session_factory: Callable[[], Session]) -> bool:
+    db = session_factory()
+    try:
+        result = task.func(db, **task.kwargs)
+        return isinstance(result, Result) and result.is_ok()
+    except Exception as e:
+        logger.warning("Cache warm-up task %s%s failed: %s", task.name, task.kwargs, e)
+        return False
+    finally:
+        db.close()
+
+
+def warm_catalog_cache(
+        session_factory: Callable[[], Session] = read_session_local,
+        pages: int = CACHE_WARM_PAGES,
+        top_products: int = CACHE_WARM_TOP_PRODUCTS,
+        concurrency: int = CACHE_WARM_CONCURRENCY
+    ) -> Dict[str, Any]:
+    """Menjalankan semua tugas pemanasan; mengembalikan ringkasan untuk log."""
+    if not redis_config.redis_client:
+        logger.info("Redis unavailable; skipping cache warm-up.")
+        return {"tasks": 0, "warmed": 0, "failed": 0, "duration_ms": 0.0}
+
+    started = time.perf_counter()
+    db = session_factory()
+    try:
+        product_ids = top_ordered_product_ids(db, top_products)
+    except Exception as e:
+        logger.warning("Failed to load top ordered products for cache warm-up: %s", e)
+        product_ids = []
+    finally:
+        db.close()
+
+    tasks = catalog_warmup_tasks(pages, product_ids)
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1), thread_name_prefix="cache-warmup") as executor:
+        outcomes = list(executor.map(lambda task: _run_task(task, session_factory), tasks))
+
+    warmed = sum(outcomes)
+    return {
+        "tasks": len(tasks),
+        "warmed": warmed,
+        "failed": len(tasks) - warmed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
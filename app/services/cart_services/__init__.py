@@ -2,10 +2,10 @@ from .post_item import post_item
 
 # from .total_records import get_total_records
 
-from .my_cart import my_cart
+from .my_cart import my_cart, my_cart_async
 from .total_items import total_items
 
-from .support_function import get_cart_total, get_cart_item, get_total_records, handle_db_error
+from .support_function import get_cart_total, get_cart_item, get_total_records, handle_db_error, handle_db_error_async
 
 from .update_quantity_item import update_quantity_item
 from .update_activate_item import update_activate_item
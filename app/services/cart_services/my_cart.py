@@ -1,123 +1,53 @@
 from fastapi import HTTPException, status
 
 from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
+from app.models import loader_profiles
 from app.models.cart_product_model import CartProductModel
 from app.dtos import cart_dtos
 
-import json
-import logging
-
 from app.dtos.error_response_dtos import ErrorResponseDto
 
-from app.services.cart_services.support_function import get_cart_total, handle_db_error
+from app.services.cart_services.support_function import get_cart_total, handle_db_error, handle_db_error_async
 # from app.services.cart_services.support_function import get_total_records
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client, custom_json_serializer
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import CART, cached
+from app.libs.pagination import KeysetPage, keyset_paginate, keyset_paginate_async
 
 CACHE_TTL = 300
 RESPONSE_MESSAGE = "All products in cart accessed successfully"
-
+PAGE_KEYS = (CartProductModel.created_at, CartProductModel.id)
+
+@cached(
+    CART,
+    key_fn=lambda skip, limit, cursor, **_: ("items", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=cart_dtos.AllCartResponseCreateDto,
+)
 def my_cart(
         db: Session, 
         user_id: str,  
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> Result[cart_dtos.AllCartResponseCreateDto, Exception]:
     try:
-        # Redis key for caching
-        redis_key = f"cart:{user_id}:{skip}:{limit}"
-
-        # Check if wishlist data exists in Redis
-        cached_cart = None
-        if redis_client:
-            try:
-                cached_cart = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read cart cache for key %s: %s", redis_key, cache_error)
-
-        if cached_cart:
-            # Data is found in cache, return it
-            cart_data = json.loads(cached_cart)
-            return build(data=cart_dtos.AllCartResponseCreateDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                total_prices=cart_data['total_prices'],
-                data=cart_data['data']
-            ))
-        
-        # Query untuk mengambil cart berdasarkan user_id dengan pagination
-        cart_items = db.execute(
-            select(CartProductModel)
-            .where(CartProductModel.customer_id == user_id)
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
-
-        if not cart_items:
-            return build(data=cart_dtos.AllCartResponseCreateDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=[],
-                total_prices=cart_dtos.CartProductTotalDto()
-            ))
+        # Query untuk mengambil cart berdasarkan user_id dengan pagination keyset, terbaru dulu
+        page = keyset_paginate(db, _cart_query(user_id), PAGE_KEYS, limit, cursor=cursor, skip=skip)
 
         # Hitung total_records
         # total_records = get_total_records(db, user_id)
 
-        # Konversi cart_items menjadi DTO
-        cart_dto = [
-            cart_dtos.CartInfoDetailDto(
-                id=cart_item.id,
-                product_name=cart_item.product_name,
-                product_price=float(cart_item.product_price or 0),
-                variant_info=cart_item.variant_info,
-                quantity=cart_item.quantity,
-                is_active=cart_item.is_active,
-                created_at=cart_item.created_at
-            )
-            for cart_item in cart_items
-        ]
-
-        cart_total_items_response = get_cart_total(cart_items)
-
-        # Save the result to Redis cache
-        cache_data = {
-            'total_prices': cart_total_items_response,
-            'data': [wish.model_dump() for wish in cart_dto]
-        }
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(cache_data, default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write cart cache for key %s: %s", redis_key, cache_error)
-
-        # Return DTO dengan respons yang telah dibangun
-        return build(data=cart_dtos.AllCartResponseCreateDto(
-            status_code=status.HTTP_200_OK,
-            message=RESPONSE_MESSAGE,
-            # total_records=total_records,
-            data=cart_dto,
-            total_prices=cart_total_items_response
-        ))
+        return build(data=_cart_response(page))
     
     except (IntegrityError, DataError) as db_error:
         db.rollback()
-        error_type = "Conflict" if isinstance(db_error, IntegrityError) else "Unprocessable Entity"
-        status_code = status.HTTP_409_CONFLICT if isinstance(db_error, IntegrityError) else status.HTTP_422_UNPROCESSABLE_ENTITY
-        return build(error=HTTPException(
-            status_code=status_code,
-            detail=ErrorResponseDto(
-                status_code=status_code,
-                error=error_type,
-                message=f"Database error: {str(db_error)}"
-            ).dict()
-        ))
+        return build(error=_data_error(db_error))
     
     except SQLAlchemyError as e:
         return build(error=handle_db_error(db, e))
@@ -128,11 +58,111 @@ def my_cart(
     
     except Exception as e:
         db.rollback()
-        return build(error=HTTPException(
+        return build(error=_internal_error(e))
+
+
+@cached(
+    CART,
+    key_fn=lambda skip, limit, cursor, **_: ("items", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=cart_dtos.AllCartResponseCreateDto,
+)
+async def my_cart_async(
+        db: AsyncSession,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> Result[cart_dtos.AllCartResponseCreateDto, Exception]:
+    """Padanan `my_cart` untuk route async; key cache-nya sama sehingga kedua versi berbagi entri."""
+    try:
+        page = await keyset_paginate_async(db, _cart_query(user_id), PAGE_KEYS, limit, cursor=cursor, skip=skip)
+        return build(data=_cart_response(page))
+
+    except (IntegrityError, DataError) as db_error:
+        await db.rollback()
+        return build(error=_data_error(db_error))
+
+    except SQLAlchemyError as e:
+        return await handle_db_error_async(db, e)
+
+    except HTTPException as http_ex:
+        await db.rollback()
+        return build(error=http_ex)
+
+    except Exception as e:
+        await db.rollback()
+        return build(error=_internal_error(e))
+
+
+def _cart_query(user_id: str):
+    # Cart milik user_id, terbaru dulu; relasi yang dibaca DTO dimuat lewat CART_LINE
+    return (
+        select(CartProductModel)
+        .options(*loader_profiles.CART_LINE)
+        .where(CartProductModel.customer_id == user_id)
+    )
+
+
+def _cart_response(page: KeysetPage) -> cart_dtos.AllCartResponseCreateDto:
+    cart_items = page.items
+
+    if not cart_items:
+        return cart_dtos.AllCartResponseCreateDto(
+            status_code=status.HTTP_200_OK,
+            message=RESPONSE_MESSAGE,
+            data=[],
+            total_prices=cart_dtos.CartProductTotalDto()
+        )
+
+    # Konversi cart_items menjadi DTO
+    cart_dto = [
+        cart_dtos.CartInfoDetailDto(
+            id=cart_item.id,
+            product_name=cart_item.product_name,
+            product_price=float(cart_item.product_price or 0),
+            variant_info=cart_item.variant_info,
+            quantity=cart_item.quantity,
+            is_active=cart_item.is_active,
+            created_at=cart_item.created_at
+        )
+        for cart_item in cart_items
+    ]
+
+    cart_total_items_response = get_cart_total(cart_items)
+
+    # Return DTO dengan respons yang telah dibangun
+    return cart_dtos.AllCartResponseCreateDto(
+        status_code=status.HTTP_200_OK,
+        message=RESPONSE_MESSAGE,
+        # total_records=total_records,
+        data=cart_dto,
+        total_prices=cart_total_items_response,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor
+    )
+
+
+def _data_error(db_error: Exception) -> HTTPException:
+    error_type = "Conflict" if isinstance(db_error, IntegrityError) else "Unprocessable Entity"
+    status_code = status.HTTP_409_CONFLICT if isinstance(db_error, IntegrityError) else status.HTTP_422_UNPROCESSABLE_ENTITY
+    return HTTPException(
+        status_code=status_code,
+        detail=ErrorResponseDto(
+            status_code=status_code,
+            error=error_type,
+            message=f"Database error: {str(db_error)}"
+        ).dict()
+    )
+
+
+def _internal_error(error: Exception) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=ErrorResponseDto(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponseDto(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                error="Internal Server Error",
-                message=f"Unexpected error: {str(e)}"
-            ).dict()
-        ))
\ No newline at end of file
+            error="Internal Server Error",
+            message=f"Unexpected error: {str(error)}"
+        ).dict()
+    )
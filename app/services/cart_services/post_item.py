@@ -7,6 +7,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.models.product_model import ProductModel
 from app.models.pack_type_model import PackTypeModel
 from app.models.cart_product_model import CartProductModel
+from app.models.user_model import UserModel
 
 from app.dtos import cart_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
@@ -14,7 +15,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import CART, bump_namespaces
 
 def post_item(
         db: Session, 
@@ -80,6 +81,9 @@ def post_item(
         db.add(cart_instance)
         db.commit()
         db.refresh(cart_instance)
+        customer_name = db.execute(
+            select(UserModel.firstname).where(UserModel.id == user_id)
+        ).scalar()
 
         # Buat DTO response
         post_cart_response = cart_dtos.CartInfoCreateDto(
@@ -88,15 +92,12 @@ def post_item(
             variant_product=variant.variant,
             quantity=cart_instance.quantity,
             is_active=cart_instance.is_active,
-            customer_name=cart_instance.customer_name,
+            customer_name=customer_name or "",
             created_at=cart_instance.created_at
         )
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [f"cart:{user_id}:*", f"carts:{user_id}"]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache keranjang user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((CART, user_id))
 
         return build(data=cart_dtos.CartResponseCreateDto(
             status_code=201,
@@ -2,6 +2,7 @@ from decimal import Decimal
 
 from fastapi import HTTPException, status
 from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -42,6 +43,15 @@ def get_total_records(db: Session, user_id: str):
 # Utility Function for Handling Database Errors
 def handle_db_error(db: Session, error: SQLAlchemyError) -> Result:
     db.rollback()
+    return _conflict(error)
+
+
+async def handle_db_error_async(db: AsyncSession, error: SQLAlchemyError) -> Result:
+    await db.rollback()
+    return _conflict(error)
+
+
+def _conflict(error: SQLAlchemyError) -> Result:
     return build(error=HTTPException(
         status_code=status.HTTP_409_CONFLICT,
         detail=ErrorResponseDto(
@@ -7,45 +7,29 @@ from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 from app.models.cart_product_model import CartProductModel
 from app.dtos import cart_dtos
 
-import json
-import logging
-
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.cart_services.support_function import handle_db_error
 from app.services.cart_services.support_function import get_total_records
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import CART, cached
 
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "Total cart items retrieved successfully"
 
+@cached(
+    CART,
+    key_fn=lambda **_: ("total",),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=cart_dtos.AllItemNotificationDto,
+)
 def total_items(
         db: Session, 
         user_id: str
     ) -> Result[cart_dtos.AllItemNotificationDto, Exception]:
     try:
-        # Redis key for caching
-        redis_key = f"carts:{user_id}"
-
-        # Check if product data exists in Redis
-        cached_user = None
-        if redis_client:
-            try:
-                cached_user = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read cart total cache for key %s: %s", redis_key, cache_error)
-        if cached_user:
-            total_notifications = cart_dtos.TotalItemNotificationDto(**json.loads(cached_user))
-            return build(data=cart_dtos.AllItemNotificationDto(
-                status_code=200,
-                message=RESPONSE_MESSAGE,
-                data=total_notifications
-            ))
-
         # Query untuk mengambil cart berdasarkan user_id dengan pagination
         cart_items = db.execute(
             select(CartProductModel)
@@ -66,12 +50,6 @@ def total_items(
             total_items=total_records
         )
 
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(total_notifications.model_dump(), default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write cart total cache for key %s: %s", redis_key, cache_error)
-
         # Return DTO dengan respons yang telah dibangun
         return build(data=cart_dtos.AllItemNotificationDto(
             status_code=status.HTTP_200_OK,
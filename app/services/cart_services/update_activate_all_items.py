@@ -11,7 +11,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.cart_services.support_function import get_cart_item, handle_db_error
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import CART, bump_namespaces
 
 def update_activate_all_items(
         db: Session, 
@@ -36,14 +36,8 @@ def update_activate_all_items(
         # Commit perubahan
         db.commit()
 
-        # Invalidate the cached wishlist for this user
-        patterns_to_invalidate = [
-            f"cart:{user_id}:*",
-            f"carts:{user_id}"
-        ]
-        for pattern in patterns_to_invalidate:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache keranjang user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((CART, user_id))
 
         # Buat response
         return build(data=cart_dtos.CartInfoUpdateAllActivateResponseDto(
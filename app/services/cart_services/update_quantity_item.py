@@ -12,7 +12,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import get_cart_item, handle_db_error
 from app.utils.result import build, Result
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import CART, bump_namespaces
 
 # Fungsi untuk Mengupdate Kuantitas Item
 def update_quantity_item(
@@ -48,11 +48,8 @@ def update_quantity_item(
         db.commit()
         db.refresh(quantity_model)
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [f"cart:{user_id}:*", f"carts:{user_id}"]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache keranjang user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((CART, user_id))
 
         return build(data=cart_dtos.CartInfoUpdateResponseDto(
             status_code=status.HTTP_200_OK,
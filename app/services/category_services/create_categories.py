@@ -6,7 +6,7 @@ from app.dtos import category_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.models.tag_category_model import TagCategoryModel
 
-from app.services.article_services.update_article import delete_cache_by_pattern
+from app.libs.cache import CATEGORIES, bump_namespaces
 from app.utils import optional
 from app.utils.result import build, Result
 
@@ -29,7 +29,7 @@ def create_categories(
         )
 
         # Invalidate Redis cache
-        delete_cache_by_pattern("categories:*")
+        bump_namespaces(CATEGORIES)
         
         return optional.build(data=category_dtos.CategoryCreateResponseDto(
             status_code=201,
@@ -3,48 +3,23 @@ from sqlalchemy import select
 
 from fastapi import HTTPException, status
 
-import json
-import logging
-
 from app.models.tag_category_model import TagCategoryModel
 from app.dtos.category_dtos import AllCategoryResponseDto, AllCategoryInfoResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import CATEGORIES, cached
 
 CACHE_TTL = 3600  # Cache TTL dalam detik (1 jam)
 RESPONSE_MESSAGE = "All List of tag Categories accessed successfully"
 
+@cached(CATEGORIES, key_fn=lambda skip, limit, **_: ("list", skip, limit), ttl=CACHE_TTL, dto=AllCategoryInfoResponseDto)
 def get_all_categories(
         db: Session, 
         skip: int = 0, 
         limit: int = 10
     ) -> Result[AllCategoryInfoResponseDto, Exception]:
-    cache_key = f"categories:{skip}:{limit}"
-
     try:
-        # Check if product data exists in Redis
-        cached_categorie = None
-        if redis_client:
-            try:
-                cached_categorie = redis_client.get(cache_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read category cache for key %s: %s", cache_key, cache_error)
-
-        if cached_categorie:
-            categories_data = [
-                AllCategoryResponseDto(**addr)
-                for addr in json.loads(cached_categorie)
-            ]
-            return build(data=AllCategoryInfoResponseDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=categories_data
-            ))
-                
         categories = db.execute(
             select(TagCategoryModel)
             .offset(skip)
@@ -68,16 +43,6 @@ def get_all_categories(
             ) for category in categories
         ]
 
-        # Cache the data in Redis
-        if redis_client:
-            try:
-                redis_client.setex(cache_key, CACHE_TTL, json.dumps(
-                    [dto.dict() for dto in categories_data], 
-                    default=custom_json_serializer
-                ))
-            except Exception as cache_error:
-                logger.warning("Failed to write category cache for key %s: %s", cache_key, cache_error)
-
         # return build(data=response_data)
         return build(data=AllCategoryInfoResponseDto(
             status_code=status.HTTP_200_OK,
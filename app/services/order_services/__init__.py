@@ -1,6 +1,6 @@
 from .create_order import create_order
 from .checkout import checkout
 from .edit_order import edit_order
-from .my_order import my_order
+from .my_order import my_order, my_order_async
 from .detail_order import detail_order
 from .admin_order import list_all_orders, get_order_detail_admin, update_order_status_admin
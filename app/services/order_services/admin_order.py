@@ -3,12 +3,14 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
+from app.models import loader_profiles
 from app.models.order_model import OrderModel
 from app.dtos import order_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.admin_filter_utils import validate_allowed_filter
 from app.services.cart_services.support_function import handle_db_error
 from app.utils.result import build, Result
+from app.libs.pagination import keyset_paginate
 
 
 ADMIN_ORDER_LIST_MESSAGE = "Admin order list accessed successfully"
@@ -25,6 +27,7 @@ ALLOWED_ADMIN_ORDER_STATUSES = {
     "capture",
     "refund",
 }
+ORDER_PAGE_KEYS = (OrderModel.created_at, OrderModel.id)
 
 
 def _to_order_info_dto(order: OrderModel) -> order_dtos.GetOrderInfoDto:
@@ -47,9 +50,10 @@ def list_all_orders(
     skip: int = 0,
     limit: int = 100,
     status_filter: str | None = None,
+    cursor: str | None = None,
 ) -> Result[order_dtos.GetOrderInfoResponseDto, Exception]:
     try:
-        stmt = select(OrderModel)
+        stmt = select(OrderModel).options(*loader_profiles.ORDER_SUMMARY)
         normalized_status_filter = validate_allowed_filter(
             value=status_filter,
             allowed_values=ALLOWED_ADMIN_ORDER_STATUSES,
@@ -59,11 +63,9 @@ def list_all_orders(
         if normalized_status_filter:
             stmt = stmt.where(OrderModel.status == normalized_status_filter)
 
-        order_models = db.execute(
-            stmt.order_by(OrderModel.created_at.desc()).offset(skip).limit(limit)
-        ).scalars().all()
+        page = keyset_paginate(db, stmt, ORDER_PAGE_KEYS, limit, cursor=cursor, skip=skip)
 
-        order_dtos_list = [_to_order_info_dto(order) for order in order_models]
+        order_dtos_list = [_to_order_info_dto(order) for order in page.items]
 
         return build(data=order_dtos.GetOrderInfoResponseDto(
             status_code=status.HTTP_200_OK,
@@ -73,6 +75,8 @@ def list_all_orders(
                 skip=skip,
                 limit=limit,
                 count=len(order_dtos_list),
+                has_more=page.has_more,
+                next_cursor=page.next_cursor,
             ),
         ))
 
@@ -101,7 +105,9 @@ def get_order_detail_admin(
 ) -> Result[order_dtos.GetOrderDetailResponseDto, Exception]:
     try:
         order = db.execute(
-            select(OrderModel).where(OrderModel.id == order_id)
+            select(OrderModel)
+            .options(*loader_profiles.ORDER_DETAIL)
+            .where(OrderModel.id == order_id)
         ).scalars().first()
 
         if not order:
@@ -13,7 +13,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import get_cart_total, handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import CART, ORDERS, bump_namespaces
 
 
 def create_order(
@@ -118,14 +118,8 @@ def create_order(
 
         db.commit()
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [
-            f"orders:{user_id}:*", 
-            f"order:{user_id}:*"
-        ]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Order baru dan keranjang yang dikosongkan: invalidasi kedua namespace user
+        bump_namespaces((ORDERS, user_id), (CART, user_id))
 
         return build(data={
             "status_code": 201,
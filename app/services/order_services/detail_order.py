@@ -2,63 +2,40 @@ from decimal import Decimal
 from fastapi import HTTPException, status
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
+from app.models import loader_profiles
 from app.models.order_model import OrderModel
-from app.models.shipment_model import ShipmentModel
-from app.models.order_item_model import OrderItemModel
 from app.dtos import order_dtos
 
-import json
-import logging
-
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.cart_services.support_function import get_cart_total, handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import ORDERS, cached
 
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "Order details accessed successfully"
 
+@cached(
+    ORDERS,
+    key_fn=lambda order_id, **_: ("detail", order_id),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=order_dtos.GetOrderDetailResponseDto,
+)
 def detail_order(
         db: Session, 
         user_id: str,  
         order_id: str
     ) -> Result[order_dtos.GetOrderDetailResponseDto, Exception]:
     try:
-        # Redis key for caching
-        redis_key = f"order:{user_id}:{order_id}"
-
-        # Check if product data exists in Redis
-        cached_order = None
-        if redis_client:
-            try:
-                cached_order = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read order detail cache for key %s: %s", redis_key, cache_error)
-        if cached_order:
-            order_detail_dto = order_dtos.GetOrderDetailDto(**json.loads(cached_order))
-            return build(data=order_dtos.GetOrderDetailResponseDto(
-                status_code=200,
-                message=RESPONSE_MESSAGE,
-                data=order_detail_dto
-            ))
-        
         # Query untuk mengambil order berdasarkan user_id dan order_id
         order = db.execute(
             select(OrderModel)
-            .options(
-                selectinload(OrderModel.user),
-                selectinload(OrderModel.shipments).selectinload(ShipmentModel.shipment_address),
-                selectinload(OrderModel.shipments).selectinload(ShipmentModel.courier),
-                selectinload(OrderModel.order_items).selectinload(OrderItemModel.products),
-                selectinload(OrderModel.order_items).selectinload(OrderItemModel.pack_type),
-            )
+            .options(*loader_profiles.ORDER_DETAIL)
             .where(
                 OrderModel.id == order_id,
                 OrderModel.customer_id == user_id
@@ -89,13 +66,6 @@ def detail_order(
             order_item_lists=order.order_item_lists
         )
 
-        # Cache the result in Redis
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(order_detail_dto.model_dump(), default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write order detail cache for key %s: %s", redis_key, cache_error)
-
         # Return DTO dengan respons yang telah dibangun
         return build(data=order_dtos.GetOrderDetailResponseDto(
             status_code=status.HTTP_200_OK,
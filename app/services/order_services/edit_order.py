@@ -15,7 +15,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import get_cart_total, handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import ORDERS, bump_namespaces
 
 def edit_order(
     db: Session,
@@ -79,15 +79,8 @@ def edit_order(
         db.commit()
         db.refresh(order_model)
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [
-            f"orders:{user_id}:*", 
-            f"order:{user_id}:*"
-        ]
-        if redis_client:
-            for pattern in redis_keys:
-                for key in redis_client.scan_iter(pattern):
-                    redis_client.delete(key)
+        # Invalidasi cache order user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((ORDERS, user_id))
 
         return build(data={
             "status_code": 200,
@@ -2,110 +2,44 @@ from decimal import Decimal
 from fastapi import HTTPException, status
 
 from sqlalchemy import select, func
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
+from app.models import loader_profiles
 from app.models.order_model import OrderModel
-from app.models.shipment_model import ShipmentModel
-from app.models.order_item_model import OrderItemModel
 from app.dtos import order_dtos
 
-import json
-import logging
-
 from app.dtos.error_response_dtos import ErrorResponseDto
 
-from app.services.cart_services.support_function import get_cart_total, handle_db_error
+from app.services.cart_services.support_function import get_cart_total, handle_db_error, handle_db_error_async
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client, custom_json_serializer
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import ORDERS, cached
+from app.libs.pagination import KeysetPage, keyset_paginate, keyset_paginate_async
 
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "All orders accessed successfully"
-
+PAGE_KEYS = (OrderModel.created_at, OrderModel.id)
+
+@cached(
+    ORDERS,
+    key_fn=lambda skip, limit, cursor, **_: ("list", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=order_dtos.GetOrderInfoResponseDto,
+)
 def my_order(
         db: Session, 
         user_id: str,  
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> Result[order_dtos.GetOrderInfoResponseDto, Exception]:
     try:
-        # Redis key for caching
-        redis_key = f"orders:{user_id}:{skip}:{limit}"
-
-        # Check if wishlist data exists in Redis
-        cached_order = None
-        if redis_client:
-            try:
-                cached_order = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read order list cache for key %s: %s", redis_key, cache_error)
-        if cached_order:
-            # Data is found in cache, return it
-            order_data = json.loads(cached_order)
-            return build(data=order_dtos.GetOrderInfoResponseDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=order_data['data']
-            ))
-        
-        # Query untuk mengambil cart berdasarkan user_id dengan pagination
-        order_models = db.execute(
-            select(OrderModel)
-            .options(
-                selectinload(OrderModel.user),
-                selectinload(OrderModel.shipments).selectinload(ShipmentModel.shipment_address),
-                selectinload(OrderModel.shipments).selectinload(ShipmentModel.courier),
-                selectinload(OrderModel.order_items).selectinload(OrderItemModel.products),
-                selectinload(OrderModel.order_items).selectinload(OrderItemModel.pack_type),
-            )
-            .where(OrderModel.customer_id == user_id)
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
-
-        if not order_models:
-            return build(data=order_dtos.GetOrderInfoResponseDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=[]
-            ))
-
-        order_dto = [
-            order_dtos.GetOrderInfoDto(
-                id=order.id,
-                status=order.status,
-                total_price=order.total_price,
-                shipment_id=order.shipment_id,
-                delivery_type=order.delivery_type,
-                notes=order.notes,
-                customer_name=order.customer_name,
-                created_at=order.created_at,
-                shipping_cost=order.shipping_cost,
-                order_item_lists=order.order_item_lists
-            )
-            for order in order_models
-        ]
-
-        # Save the result to Redis cache
-        cache_data = {
-            'data': [wish.model_dump() for wish in order_dto]
-        }
-
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(cache_data, default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write order list cache for key %s: %s", redis_key, cache_error)
-
-        # Return DTO dengan respons yang telah dibangun
-        return build(data=order_dtos.GetOrderInfoResponseDto(
-            status_code=status.HTTP_200_OK,
-            message=RESPONSE_MESSAGE,
-            data=order_dto,
-        ))
+        # Query untuk mengambil order berdasarkan user_id dengan pagination keyset, terbaru dulu
+        page = keyset_paginate(db, _order_query(user_id), PAGE_KEYS, limit, cursor=cursor, skip=skip)
+        return build(data=_order_response(page, skip, limit))
     
     except (IntegrityError, DataError) as db_error:
         return build(error=handle_db_error(db, db_error))
@@ -119,11 +53,96 @@ def my_order(
     
     except Exception as e:
         db.rollback()
-        return build(error=HTTPException(
+        return build(error=_internal_error(e))
+
+
+@cached(
+    ORDERS,
+    key_fn=lambda skip, limit, cursor, **_: ("list", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=order_dtos.GetOrderInfoResponseDto,
+)
+async def my_order_async(
+        db: AsyncSession,
+        user_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> Result[order_dtos.GetOrderInfoResponseDto, Exception]:
+    """Padanan `my_order` untuk route async; key cache-nya sama sehingga kedua versi berbagi entri."""
+    try:
+        page = await keyset_paginate_async(db, _order_query(user_id), PAGE_KEYS, limit, cursor=cursor, skip=skip)
+        return build(data=_order_response(page, skip, limit))
+
+    except SQLAlchemyError as e:
+        return await handle_db_error_async(db, e)
+
+    except HTTPException as http_ex:
+        await db.rollback()
+        return build(error=http_ex)
+
+    except Exception as e:
+        await db.rollback()
+        return build(error=_internal_error(e))
+
+
+def _order_query(user_id: str):
+    # Order milik user_id, terbaru dulu; relasi yang dibaca DTO dimuat lewat ORDER_SUMMARY
+    return (
+        select(OrderModel)
+        .options(*loader_profiles.ORDER_SUMMARY)
+        .where(OrderModel.customer_id == user_id)
+    )
+
+
+def _order_response(page: KeysetPage, skip: int, limit: int) -> order_dtos.GetOrderInfoResponseDto:
+    order_models = page.items
+
+    if not order_models:
+        return order_dtos.GetOrderInfoResponseDto(
+            status_code=status.HTTP_200_OK,
+            message=RESPONSE_MESSAGE,
+            data=[]
+        )
+
+    order_dto = [
+        order_dtos.GetOrderInfoDto(
+            id=order.id,
+            status=order.status,
+            total_price=order.total_price,
+            shipment_id=order.shipment_id,
+            delivery_type=order.delivery_type,
+            notes=order.notes,
+            customer_name=order.customer_name,
+            created_at=order.created_at,
+            shipping_cost=order.shipping_cost,
+            order_item_lists=order.order_item_lists
+        )
+        for order in order_models
+    ]
+
+    # Return DTO dengan respons yang telah dibangun
+    return order_dtos.GetOrderInfoResponseDto(
+        status_code=status.HTTP_200_OK,
+        message=RESPONSE_MESSAGE,
+        data=order_dto,
+        meta=order_dtos.PaginationMetaDto(
+            skip=skip,
+            limit=limit,
+            count=len(order_dto),
+            has_more=page.has_more,
+            next_cursor=page.next_cursor,
+        ),
+    )
+
+
+def _internal_error(error: Exception) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=ErrorResponseDto(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=ErrorResponseDto(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                error="Internal Server Error",
-                message=f"Unexpected error: {str(e)}"
-            ).dict()
-        ))
\ No newline at end of file
+            error="Internal Server Error",
+            message=f"Unexpected error: {str(error)}"
+        ).dict()
+    )
@@ -9,6 +9,9 @@ from app.dtos.pack_type_dtos import PackTypeCreateDto, PackTypeInfoDto, PackType
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.pack_type_services.support_function import handle_db_error
+from app.services.product_services.product_stats import refresh_variant_stats
+from app.services.product_services.cache_utils import invalidate_product_cache
+from app.libs.cache import BRANDS
 
 from app.utils.result import build, Result
 
@@ -35,8 +38,12 @@ def create_type(
             fk_admin_id=admin_id
         )
         db.add(pack_type_instance)
+        refresh_variant_stats(db, pack_type_instance.product_id)
         db.commit()
         db.refresh(pack_type_instance)
+        # Harga/diskon varian tampil di kartu produk dan promo brand; varian berdiskon
+        # bisa memasukkan produk ke listing promo
+        invalidate_product_cache(db, pack_type_instance.product_id, BRANDS, listings=bool(pack_type_instance.discount))
 
         pack_type_response = PackTypeInfoDto(
             id=pack_type_instance.id,
@@ -11,6 +11,9 @@ from app.dtos.pack_type_dtos import DeletePackTypeDto, InfoDeletePackTypeDto, De
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.pack_type_services.support_function import handle_db_error
+from app.services.product_services.product_stats import refresh_variant_stats
+from app.services.product_services.cache_utils import invalidate_product_cache
+from app.libs.cache import BRANDS
 
 from app.utils.result import build, Result
 
@@ -64,8 +67,13 @@ def delete_type(
             variant=variant.variant or variant.name
         )
 
+        product_id = variant.product_id
+        had_discount = bool(variant.discount)
         db.delete(variant)
+        refresh_variant_stats(db, product_id)
         db.commit()
+        # Menghapus varian berdiskon bisa mengeluarkan produk dari listing promo
+        invalidate_product_cache(db, product_id, BRANDS, listings=had_discount)
 
         return build(data=DeletePackTypeResponseDto(
             status_code=200,
@@ -17,6 +17,7 @@ from app.libs.supabase_client import supabase
 from app.libs.storage_media_utils import cloudinary_creds, delete_media_url
 from app.models.pack_type_model import PackTypeModel
 from app.services.pack_type_services.support_function import handle_db_error
+from app.services.product_services.cache_utils import invalidate_product_cache
 from app.utils.result import build, Result
 
 logger = logging.getLogger(__name__)
@@ -197,6 +198,7 @@ async def post_photo(
         db.add(image_model)
         db.commit()
         db.refresh(image_model)
+        invalidate_product_cache(db, image_model.product_id)
 
         if file:
             elapsed_ms = int((time.time() - started_at) * 1000)
@@ -7,6 +7,10 @@ from app.models.pack_type_model import PackTypeModel
 from app.dtos.pack_type_dtos import TypeIdToUpdateDto, PackTypeEditInfoDto, PackTypeUpdatedInfoDto, PackTypeEditInfoResponseDto 
 from app.dtos.error_response_dtos import ErrorResponseDto
 
+from app.services.product_services.product_stats import refresh_variant_stats
+from app.services.product_services.cache_utils import invalidate_product_cache
+from app.libs.cache import BRANDS
+
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
 
@@ -32,8 +36,13 @@ def update_stock(
         for attr, value in update_payload.items():
             setattr(type_model, attr, value)
 
+        if {"price", "discount"} & update_payload.keys():
+            refresh_variant_stats(db, type_model.product_id)
+
         db.commit()
         db.refresh(type_model)
+        # Perubahan diskon bisa memindahkan produk masuk/keluar listing promo
+        invalidate_product_cache(db, type_model.product_id, BRANDS, listings="discount" in update_payload)
 
         response_data = PackTypeUpdatedInfoDto(
             id=type_model.id,
@@ -5,11 +5,13 @@ from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
 from app.models.payment_model import PaymentModel
 from app.models.order_model import OrderModel
+from app.models import loader_profiles
 from app.dtos import payment_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.admin_filter_utils import validate_allowed_filter
 from app.services.cart_services.support_function import handle_db_error
 from app.utils.result import build, Result
+from app.libs.pagination import keyset_paginate
 
 
 ADMIN_PAYMENT_LIST_MESSAGE = "Admin payment list accessed successfully"
@@ -23,6 +25,7 @@ ALLOWED_ADMIN_PAYMENT_STATUSES = {
     "refund",
     "capture",
 }
+PAYMENT_PAGE_KEYS = (PaymentModel.created_at, PaymentModel.id)
 
 
 def _build_payment_item(payment: PaymentModel) -> payment_dtos.AdminPaymentInfoDto:
@@ -48,9 +51,10 @@ def list_all_payments(
     skip: int = 0,
     limit: int = 100,
     transaction_status_filter: str | None = None,
+    cursor: str | None = None,
 ) -> Result[payment_dtos.AdminPaymentListResponseDto, Exception]:
     try:
-        stmt = select(PaymentModel)
+        stmt = select(PaymentModel).options(*loader_profiles.PAYMENT_SUMMARY)
         normalized_transaction_status_filter = validate_allowed_filter(
             value=transaction_status_filter,
             allowed_values=ALLOWED_ADMIN_PAYMENT_STATUSES,
@@ -60,11 +64,9 @@ def list_all_payments(
         if normalized_transaction_status_filter:
             stmt = stmt.where(PaymentModel.transaction_status == normalized_transaction_status_filter)
 
-        payment_models = db.execute(
-            stmt.order_by(PaymentModel.created_at.desc()).offset(skip).limit(limit)
-        ).scalars().all()
+        page = keyset_paginate(db, stmt, PAYMENT_PAGE_KEYS, limit, cursor=cursor, skip=skip)
 
-        payment_items = [_build_payment_item(payment) for payment in payment_models]
+        payment_items = [_build_payment_item(payment) for payment in page.items]
 
         return build(data=payment_dtos.AdminPaymentListResponseDto(
             status_code=status.HTTP_200_OK,
@@ -74,6 +76,8 @@ def list_all_payments(
                 skip=skip,
                 limit=limit,
                 count=len(payment_items),
+                has_more=page.has_more,
+                next_cursor=page.next_cursor,
             ),
         ))
 
@@ -116,7 +120,9 @@ def get_payment_detail_by_id(
 ) -> Result[payment_dtos.AdminPaymentDetailResponseDto, Exception]:
     try:
         payment = db.execute(
-            select(PaymentModel).where(PaymentModel.id == payment_id)
+            select(PaymentModel)
+            .options(*loader_profiles.PAYMENT_SUMMARY)
+            .where(PaymentModel.id == payment_id)
         ).scalars().first()
 
         if not payment:
@@ -157,7 +163,9 @@ def get_payment_detail_by_order_id(
 ) -> Result[payment_dtos.AdminPaymentDetailResponseDto, Exception]:
     try:
         payment = db.execute(
-            select(PaymentModel).where(PaymentModel.order_id == order_id)
+            select(PaymentModel)
+            .options(*loader_profiles.PAYMENT_SUMMARY)
+            .where(PaymentModel.order_id == order_id)
         ).scalars().first()
 
         if not payment:
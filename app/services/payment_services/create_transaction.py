@@ -9,6 +9,7 @@ from app.models.payment_model import PaymentModel
 from app.models.order_model import OrderModel
 from app.models.order_item_model import OrderItemModel
 from app.models.cart_product_model import CartProductModel
+from app.models import loader_profiles
 
 from app.dtos.payment_dtos import PaymentOrderByIdDto, PaymentCreateDto, PaymentMidtransResponseDTO, PaymentInfoResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
@@ -19,7 +20,7 @@ from app.libs.midtrans_config import snap
 from app.services.payment_services.support_function import generate_midtrans_payload, validate_midtrans_response
 from app.utils.result import build, Result
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import CART, ORDERS, bump_namespaces
 
 # Logger untuk Midtrans
 logger = logging.getLogger("midtrans")
@@ -43,6 +44,7 @@ def create_transaction(
         # Ambil detail order dari database
         order = db.execute(
             select(OrderModel)
+            .options(*loader_profiles.ORDER_PAYMENT)
             .filter(
                 OrderModel.id == payment_data.order_id,
                 OrderModel.customer_id == user_id,
@@ -146,15 +148,8 @@ def create_transaction(
         db.commit()
         db.refresh(payment)
 
-        # Invalidasi cache dengan pendekatan best-effort
-        if redis_client:
-            try:
-                redis_keys = [f"cart:{user_id}:*", f"carts:{user_id}"]
-                for pattern in redis_keys:
-                    for key in redis_client.scan_iter(pattern):
-                        redis_client.delete(key)
-            except Exception as cache_error:
-                logger.warning("Failed to invalidate cart cache for user %s: %s", user_id, cache_error)
+        # Invalidasi cache keranjang dan order user (best-effort, gagal Redis hanya dicatat)
+        bump_namespaces((CART, user_id), (ORDERS, user_id))
 
         # Buat DTO response
         payment_callback = PaymentMidtransResponseDTO(
@@ -1,5 +1,5 @@
 from .create_product import create_product
-from .all_product import all_product
+from .all_product import all_product, all_product_async
 from .all_product_with_discount import all_product_with_discount
 from .all_product_by_id_production import all_product_by_id_production
 from .infinite_scrolling_list_products_by_id_production import infinite_scrolling_list_products_by_id_production
@@ -7,11 +7,16 @@ from .all_discount_by_id_production import all_discount_by_id_production
 from .search_product import search_product
 from .search_product_discount import search_product_discount
 from .search_product_of_id_production import search_product_of_id_production
+from .autocomplete_product import autocomplete_product
+from .filter_product import filter_product
 from .detail_product import get_product_by_id
 from .update_product import update_product
 from .delete_product import delete_product
 from .upload_product_image import upload_product_image
 from .manage_product_images import set_primary_product_image, delete_product_image, reorder_product_images
 from .list_product_images import list_product_images
+from .product_stats import apply_rating_delta, refresh_variant_stats, backfill_product_stats
+from .product_search import search_products
+from .product_autocomplete import build_autocomplete_index, sync_autocomplete_brand, sync_autocomplete_product
 
-from .support_function import handle_db_error
\ No newline at end of file
+from .support_function import handle_db_error, handle_db_error_async, load_product_galleries
\ No newline at end of file
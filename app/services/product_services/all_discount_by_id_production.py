@@ -1,21 +1,20 @@
 from fastapi import HTTPException, status
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-import json
-
 from app.models.product_model import ProductModel
 
 from app.models.pack_type_model import PackTypeModel
-from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.product_dtos import AllProductInfoResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_card_read_model import load_product_cards, product_id_query
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import BRAND_PRODUCTS, cached_ids
 
 CACHE_TTL = 3600
 
@@ -25,41 +24,33 @@ def all_discount_by_id_production(
         skip: int = 0, 
         limit: int = 100
     ) -> Result[AllProductInfoResponseDto, Exception]:
-    cache_key = f"discounts:{production_id}:{skip}:{limit}"
-
     try:
-        # Cek data di Redis cache
-        cached_data = redis_client.get(cache_key)
-        if cached_data:
-            # Parse JSON dari Redis dan kirim sebagai response
-            cached_response = json.loads(cached_data)
-            return build(data=cached_response)
-        
         subquery = (
             select(PackTypeModel.product_id)
             .filter(PackTypeModel.discount > 0)
             .scalar_subquery()
         )
 
-        product_model = (
-            db.execute(
-                select(ProductModel)
-                .options(
-                    selectinload(ProductModel.pack_type),
-                    selectinload(ProductModel.product_bies))  # Eager loading untuk pack_type
-                .where(ProductModel.product_by_id == production_id,
-                       ProductModel.is_active.is_(True), 
-                       ProductModel.id.in_(subquery))
-                .offset(skip)
-                .limit(limit)
-            ).scalars()  # Mengambil hasil sebagai scalar
-            .all()
+        product_ids = cached_ids(
+            BRAND_PRODUCTS, "discounts", skip, limit,
+            scope=production_id,
+            ttl=CACHE_TTL,
+            loader=lambda: [
+                row.id for row in db.execute(
+                    product_id_query()
+                    .where(ProductModel.product_by_id == production_id,
+                           ProductModel.is_active.is_(True),
+                           ProductModel.id.in_(subquery))
+                    .offset(skip)
+                    .limit(limit)
+                ).all()
+            ],
         )
 
         # # Jika tidak ada produk ditemukan, kembalikan list kosong
         # if not product_model:
         #     return build(data=[])
-        if not product_model:
+        if not product_ids:
             return build(error= HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=ErrorResponseDto(
@@ -70,19 +61,7 @@ def all_discount_by_id_production(
             ))
 
         # Konversi produk menjadi DTO
-        all_products_discount_by_production_dto = [
-            AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_model
-        ]
+        all_products_discount_by_production_dto = load_product_cards(db, product_ids)
 
         response_dto = AllProductInfoResponseDto(
             status_code=status.HTTP_200_OK,
@@ -90,9 +69,6 @@ def all_discount_by_id_production(
             data=all_products_discount_by_production_dto
         )
 
-        # Simpan data ke Redis (dengan TTL 300 detik)
-        redis_client.setex(cache_key, CACHE_TTL, json.dumps(response_dto.model_dump(), default=custom_json_serializer))
-        
         return build(data=response_dto)
     
     except SQLAlchemyError as e:
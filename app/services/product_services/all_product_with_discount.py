@@ -1,21 +1,21 @@
 from fastapi import HTTPException, status
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload  # Menggunakan selectinload untuk efisiensi
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from typing import List, Type
-import json
 
 from app.models.product_model import ProductModel
 from app.models.pack_type_model import PackTypeModel  
-from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.product_dtos import AllProductInfoResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_card_read_model import load_product_cards, product_id_query
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import CATALOG, cached_ids
 
 CACHE_TTL = 3600
 
@@ -24,16 +24,7 @@ def all_product_with_discount(
         skip: int = 0, 
         limit: int = 100
     ) -> Result[AllProductInfoResponseDto, Exception]:
-    cache_key = f"promotions:{skip}:{limit}"
-
     try:
-        # Cek data di Redis cache
-        cached_data = redis_client.get(cache_key)
-        if cached_data:
-            # Parse JSON dari Redis dan kirim sebagai response
-            cached_response = json.loads(cached_data)
-            return build(data=cached_response)
-        
         # Subquery untuk mendapatkan produk yang memiliki pack type dengan diskon
         subquery = (
             select(PackTypeModel.product_id)
@@ -42,18 +33,21 @@ def all_product_with_discount(
         )
 
         # Mengambil produk yang aktif dan memiliki variasi dengan diskon
-        product_model = (
-            db.execute(
-                select(ProductModel)
-                .options(selectinload(ProductModel.pack_type))  # Eager loading untuk pack_type
-                .where(ProductModel.is_active.is_(True), 
-                        ProductModel.id.in_(subquery))  # Menggunakan in_() dengan subquery
-                .offset(skip)
-                .limit(limit)
-            ).scalars().all()
+        product_ids = cached_ids(
+            CATALOG, "promotions", skip, limit,
+            ttl=CACHE_TTL,
+            loader=lambda: [
+                row.id for row in db.execute(
+                    product_id_query()
+                    .where(ProductModel.is_active.is_(True),
+                            ProductModel.id.in_(subquery))  # Menggunakan in_() dengan subquery
+                    .offset(skip)
+                    .limit(limit)
+                ).all()
+            ],
         )
 
-        if not product_model:
+        if not product_ids:
             raise HTTPException(
                 status_code=status.HTTP_204_NO_CONTENT,
                 detail=ErrorResponseDto(
@@ -64,19 +58,7 @@ def all_product_with_discount(
             )
 
         # Konversi produk menjadi DTO
-        all_products_dto = [
-            AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_model
-        ]
+        all_products_dto = load_product_cards(db, product_ids)
 
         # return build(data=all_products_dto)
     
@@ -92,9 +74,6 @@ def all_product_with_discount(
             data=all_products_dto
         )
 
-        # Simpan data ke Redis (dengan TTL 300 detik)
-        redis_client.setex(cache_key, CACHE_TTL, json.dumps(response_dto.model_dump(), default=custom_json_serializer))
-        
         return build(data=response_dto)
 
 
@@ -0,0 +1,51 @@
+from fastapi import HTTPException, status
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.dtos.product_dtos import ProductAutocompleteDTO, ProductAutocompleteResponseDto
+from app.dtos.error_response_dtos import ErrorResponseDto
+
+from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_autocomplete import build_autocomplete_index, product_autocomplete_index
+
+from app.utils.result import build, Result
+
+
+def autocomplete_product(
+        db: Session,
+        keyword: str,
+        limit: int = 10
+    ) -> Result[ProductAutocompleteResponseDto, Exception]:
+    try:
+        # Indeks normalnya sudah dibangun saat startup; database hanya disentuh bila belum siap
+        if not product_autocomplete_index.ready:
+            build_autocomplete_index(db)
+
+        suggestions = [
+            ProductAutocompleteDTO.model_construct(
+                id=entry.product_id,
+                name=entry.name,
+                brand_info={"id": entry.brand_id, "name": entry.brand_name} if entry.brand_id is not None else None,
+            )
+            for entry in product_autocomplete_index.suggest(keyword, limit)
+        ]
+
+        return build(data=ProductAutocompleteResponseDto(
+            status_code=status.HTTP_200_OK,
+            message=f"Product suggestions for '{keyword}' can accessed successfully",
+            data=suggestions
+        ))
+
+    except SQLAlchemyError as e:
+        return build(error=handle_db_error(db, e))
+
+    except Exception as e:
+        return build(error= HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponseDto(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error="Internal Server Error",
+                message=f"An error occurred: {str(e)}"
+            ).dict()
+        ))
@@ -1,12 +1,37 @@
-from app.libs.redis_config import redis_client
-
-
-def invalidate_product_cache(product_id: str | None = None) -> None:
-    if not redis_client:
-        return
-    patterns = ["products:*", "product:*"]
-    if product_id:
-        patterns.append(f"product:{product_id}")
-    for pattern in patterns:
-        for key in redis_client.scan_iter(pattern):
-            redis_client.delete(key)
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.product_model import ProductModel
+from app.libs.cache import CATALOG, PRODUCT, BRAND_PRODUCTS, bump_namespaces
+from app.libs.cache.namespaces import NamespaceTarget
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_product_cache(
+        db: Session,
+        product_id: str,
+        *extra_targets: NamespaceTarget,
+        listings: bool = False
+    ) -> None:
+    """
+    Invalidasi cache yang menampilkan produk ini.
+
+    Listing hanya meng-cache urutan ID, jadi edit yang tidak mengubah anggota
+    atau urutan listing cukup mem-bump `(PRODUCT, id)` (detail dan kartu).
+    `listings=True` untuk perubahan yang bisa memindahkan produk masuk/keluar
+    listing (mis. diskon varian untuk listing promo); ikut di-bump katalog dan
+    listing brand-nya.
+    """
+    targets = [(PRODUCT, product_id), *extra_targets]
+    if listings:
+        targets.append(CATALOG)
+        try:
+            production_id = db.scalar(select(ProductModel.product_by_id).where(ProductModel.id == str(product_id)))
+            if production_id is not None:
+                targets.append((BRAND_PRODUCTS, production_id))
+        except Exception as e:
+            logger.warning("Failed to resolve production of product %s for cache invalidation: %s", product_id, e)
+    bump_namespaces(*targets)
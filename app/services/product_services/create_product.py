@@ -8,9 +8,10 @@ from app.dtos.product_dtos import ProductCreateDTO, ProductInfoDTO, ProductRespo
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_autocomplete import sync_autocomplete_product
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import CATALOG, BRAND_PRODUCTS, bump_namespaces
 
 def create_product(
         db: Session, 
@@ -21,6 +22,9 @@ def create_product(
         product_instance = ProductModel(
             **create_product.model_dump()
         )
+        # Belum ada varian: rentang harga mengikuti harga dasar produk
+        product_instance.min_variant_price = product_instance.price
+        product_instance.max_variant_price = product_instance.price
 
         db.add(product_instance)
         db.commit()
@@ -41,16 +45,11 @@ def create_product(
             updated_at=product_instance.updated_at
         )
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [
-            f"products:*", 
-            f"product:*",
-            f"discounts:*",
-            f"promotions:*"
-        ]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache: satu INCR per namespace, key lama habis oleh TTL
+        bump_namespaces(CATALOG, (BRAND_PRODUCTS, product_instance.product_by_id))
+
+        # Perbarui indeks autocomplete di proses ini tanpa menunggu rebuild berkala
+        sync_autocomplete_product(db, product_instance.id)
 
         return build(data=ProductResponseDto(
             status_code=201,
@@ -9,9 +9,10 @@ from app.dtos.product_dtos import DeleteByIdProductDto, InfoDeleteProductDto, De
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_autocomplete import product_autocomplete_index
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import CATALOG, PRODUCT, BRAND_PRODUCTS, bump_namespaces
 
 def delete_product(
         db: Session, 
@@ -41,20 +42,21 @@ def delete_product(
             name= product_model.name
         )
 
+        production_id = product_model.product_by_id
+
         # Hapus artikel
         db.delete(product_model)
         db.commit()
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [
-            f"products:*", 
-            f"product:*",
-            f"discounts:*",
-            f"promotions:*"
-        ]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache: satu INCR per namespace, key lama habis oleh TTL
+        bump_namespaces(
+            CATALOG,
+            (PRODUCT, product_delete_info.product_id),
+            (BRAND_PRODUCTS, production_id)
+        )
+
+        # Keluarkan produk dari indeks autocomplete di proses ini
+        product_autocomplete_index.remove(product_delete_info.product_id)
 
         return build(data=DeleteProductResponseDto(
             status_code=200,
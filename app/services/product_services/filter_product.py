@@ -0,0 +1,69 @@
+from fastapi import HTTPException, status
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.dtos.product_dtos import ProductFilterDTO, ProductFilterResponseDto
+from app.dtos.error_response_dtos import ErrorResponseDto
+
+from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_card_read_model import load_product_cards, product_id_query
+from app.services.product_services.product_facets import SORT_OPTIONS, load_product_facets, product_filter_conditions
+
+from app.utils.result import build, Result
+
+
+def filter_product(
+        db: Session,
+        filters: ProductFilterDTO
+    ) -> Result[ProductFilterResponseDto, Exception]:
+    try:
+        if filters.min_price is not None and filters.max_price is not None and filters.min_price > filters.max_price:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=ErrorResponseDto(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    error="Bad Request",
+                    message="min_price must not be greater than max_price."
+                ).dict()
+            )
+
+        # Total dan semua facet dihitung dalam satu statement
+        total, facets = load_product_facets(db, filters)
+
+        # Kombinasi filter terlalu banyak untuk di-cache per halaman; kartunya tetap diambil dari cache per produk
+        product_ids = []
+        if total > filters.skip:
+            product_ids = [
+                row.id for row in db.execute(
+                    product_id_query()
+                    .where(*product_filter_conditions(filters))
+                    .order_by(*SORT_OPTIONS[filters.sort_by])
+                    .offset(filters.skip)
+                    .limit(filters.limit)
+                ).all()
+            ]
+
+        return build(data=ProductFilterResponseDto(
+            status_code=status.HTTP_200_OK,
+            message="Filtered list of products can accessed successfully",
+            total=total,
+            data=load_product_cards(db, product_ids),
+            facets=facets
+        ))
+
+    except SQLAlchemyError as e:
+        return build(error=handle_db_error(db, e))
+
+    except HTTPException as http_ex:
+        return build(error=http_ex)
+
+    except Exception as e:
+        return build(error= HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=ErrorResponseDto(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error="Internal Server Error",
+                message=f"An error occurred: {str(e)}"
+            ).dict()
+        ))
@@ -1,20 +1,19 @@
 from fastapi import HTTPException, status
 
-from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
 from typing import Dict, Any
-import json
 
 from app.models.product_model import ProductModel
 from app.dtos import product_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_card_read_model import load_product_cards, product_id_query
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import BRAND_PRODUCTS, cached_ids
 
 CACHE_TTL = 3600
 
@@ -24,28 +23,23 @@ def infinite_scrolling_list_products_by_id_production(
         skip: int = 0, 
         limit: int = 9
     ) -> Result[Dict[str, Any], Exception]:
-    cache_key = f"products:{production_id}:{skip}:{limit}"
-
     try:
-        # Cek data di Redis cache
-        cached_data = redis_client.get(cache_key)
-        if cached_data:
-            # Parse JSON dari Redis dan kirim sebagai response
-            cached_response = json.loads(cached_data)
-            return build(data=cached_response)
-        
-        # Ambil data produk dengan lazy loading, ambil kolom yang relevan saja
-        product_list = (
-            db.execute(
-                select(ProductModel)
-                .options(selectinload(ProductModel.pack_type))  # Eager load untuk pack_type
-                .where(ProductModel.product_by_id == production_id)  # Filter dengan production_id
-                .offset(skip)
-                .limit(limit)
-            )
-        ).scalars().all()
+        # Ambil satu ID lebih banyak dari limit untuk menentukan has_more tanpa query COUNT
+        product_ids = cached_ids(
+            BRAND_PRODUCTS, "scroll", skip, limit,
+            scope=production_id,
+            ttl=CACHE_TTL,
+            loader=lambda: [
+                row.id for row in db.execute(
+                    product_id_query()
+                    .where(ProductModel.product_by_id == production_id)  # Filter dengan production_id
+                    .offset(skip)
+                    .limit(limit + 1)
+                ).all()
+            ],
+        )
 
-        if not product_list:
+        if not product_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=ErrorResponseDto(
@@ -55,27 +49,10 @@ def infinite_scrolling_list_products_by_id_production(
                 ).dict()
             )
 
-        # Hitung total_records
-        total_records = db.execute(select(func.count()).select_from(ProductModel)).scalar()
-
-        # Hitung sisa data
-        displayed_records = skip + len(product_list)
-        has_more = displayed_records < total_records
+        has_more = len(product_ids) > limit
 
         # Konversi produk menjadi DTO
-        products_dto = [
-            product_dtos.AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_list
-        ]
+        products_dto = load_product_cards(db, product_ids[:limit])
 
         # Bangun respons dengan data produk dan has_more
         response_data = product_dtos.ProductListScrollResponseDto(
@@ -83,9 +60,6 @@ def infinite_scrolling_list_products_by_id_production(
             has_more=has_more
         )
 
-        # Simpan data ke Redis (dengan TTL 300 detik)
-        redis_client.setex(cache_key, CACHE_TTL, json.dumps(response_data.model_dump(), default=custom_json_serializer))
-
         return build(data=response_data)
     
     except SQLAlchemyError as e:
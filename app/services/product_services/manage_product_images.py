@@ -19,7 +19,7 @@ def set_primary_product_image(db: Session, product_id: str, image_id: int) -> Re
     image.is_primary = True
     db.add(image)
     db.commit()
-    invalidate_product_cache(product_id)
+    invalidate_product_cache(db, product_id)
     return build(data={"status_code": 200, "message": "Primary image updated"})
 
 
@@ -46,7 +46,7 @@ def delete_product_image(db: Session, product_id: str, image_id: int) -> Result[
             db.add(next_image)
             db.commit()
 
-    invalidate_product_cache(product_id)
+    invalidate_product_cache(db, product_id)
     return build(data={"status_code": 200, "message": "Image deleted"})
 
 
@@ -63,5 +63,5 @@ def reorder_product_images(db: Session, product_id: str, image_ids: list[int]) -
         ).update({"sort_order": idx})
 
     db.commit()
-    invalidate_product_cache(product_id)
+    invalidate_product_cache(db, product_id)
     return build(data={"status_code": 200, "message": "Image order updated"})
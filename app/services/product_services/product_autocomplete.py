@@ -0,0 +1,187 @@
+"""
+Indeks autocomplete produk di memori proses.
+
+Kunci indeks adalah nama produk dan nama brand yang dinormalisasi (huruf
+kecil, tanpa aksen, tanpa tanda baca), ditambah potongan mulai dari setiap
+kata sehingga "merah" juga menemukan "Jahe Merah". Kunci disimpan dalam
+list terurut; pencarian prefix cukup `bisect` lalu membaca maju sampai
+prefix tidak cocok lagi, tanpa query database.
+
+Indeks dibangun saat startup, diperbarui per produk oleh service
+create/update/delete produk dan per brand oleh edit/delete brand, serta
+dibangun ulang berkala oleh scheduler karena setiap worker memegang
+salinannya sendiri.
+"""
+import logging
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from threading import RLock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.product_model import ProductModel
+from app.models.production_model import ProductionModel
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_WORD.sub(" ", stripped.lower()).strip()
+
+
+def _word_suffixes(normalized: str) -> List[str]:
+    words = normalized.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+@dataclass(frozen=True)
+class AutocompleteEntry:
+    product_id: str
+    name: str
+    brand_id: Optional[int]
+    brand_name: Optional[str]
+
+
+class ProductAutocompleteIndex:
+    def __init__(self):
+        self._lock = RLock()
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, AutocompleteEntry] = {}
+        self._entry_keys: Dict[str, List[Tuple[str, str]]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _keys_for(entry: AutocompleteEntry) -> List[Tuple[str, str]]:
+        keys = set(_word_suffixes(normalize_text(entry.name)))
+        keys.update(_word_suffixes(normalize_text(entry.brand_name)))
+        return sorted((key, entry.product_id) for key in keys if key)
+
+    def rebuild(self, entries: Iterable[AutocompleteEntry]) -> None:
+        """Mengganti seluruh isi indeks; list baru disusun di luar lock lalu ditukar sekaligus."""
+        new_entries = {entry.product_id: entry for entry in entries}
+        new_entry_keys = {product_id: self._keys_for(entry) for product_id, entry in new_entries.items()}
+        new_keys = sorted(key for keys in new_entry_keys.values() for key in keys)
+
+        with self._lock:
+            self._keys, self._entries, self._entry_keys = new_keys, new_entries, new_entry_keys
+            self.ready = True
+
+    def upsert(self, entry: AutocompleteEntry) -> None:
+        with self._lock:
+            self._remove_keys(entry.product_id)
+            keys = self._keys_for(entry)
+            for key in keys:
+                insort(self._keys, key)
+            self._entries[entry.product_id] = entry
+            self._entry_keys[entry.product_id] = keys
+
+    def remove(self, product_id: str) -> None:
+        with self._lock:
+            self._remove_keys(product_id)
+            self._entries.pop(product_id, None)
+
+    def replace_brand(self, brand_id: int, entries: Iterable[AutocompleteEntry]) -> None:
+        """Mengganti semua entri satu brand; produk brand itu yang tidak ada di `entries` dikeluarkan."""
+        entries = list(entries)
+        with self._lock:
+            current = {entry.product_id for entry in entries}
+            stale = [
+                product_id for product_id, entry in self._entries.items()
+                if entry.brand_id == brand_id and product_id not in current
+            ]
+            for product_id in stale:
+                self.remove(product_id)
+            for entry in entries:
+                self.upsert(entry)
+
+    def _remove_keys(self, product_id: str) -> None:
+        for key in self._entry_keys.pop(product_id, []):
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[AutocompleteEntry]:
+        normalized = normalize_text(prefix)
+        if not normalized or limit <= 0:
+            return []
+
+        suggestions: List[AutocompleteEntry] = []
+        seen = set()
+        with self._lock:
+            position = bisect_left(self._keys, (normalized, ""))
+            while position < len(self._keys) and len(suggestions) < limit:
+                key, product_id = self._keys[position]
+                if not key.startswith(normalized):
+                    break
+                if product_id not in seen:
+                    seen.add(product_id)
+                    suggestions.append(self._entries[product_id])
+                position += 1
+        return suggestions
+
+
+product_autocomplete_index = ProductAutocompleteIndex()
+
+
+def _entry_query():
+    return (
+        select(
+            ProductModel.id,
+            ProductModel.name,
+            ProductionModel.id.label("brand_id"),
+            ProductionModel.name.label("brand_name"),
+        )
+        .outerjoin(ProductionModel, ProductionModel.id == ProductModel.product_by_id)
+        .where(ProductModel.is_active.is_(True))
+    )
+
+
+def _to_entry(row) -> AutocompleteEntry:
+    return AutocompleteEntry(str(row.id), row.name, row.brand_id, row.brand_name)
+
+
+def build_autocomplete_index(db: Session, index: ProductAutocompleteIndex = product_autocomplete_index) -> int:
+    """Membangun ulang indeks dari database. Mengembalikan jumlah produk terindeks."""
+    index.rebuild(_to_entry(row) for row in db.execute(_entry_query()).all())
+    return len(index)
+
+
+def sync_autocomplete_product(
+        db: Session,
+        product_id: str,
+        index: ProductAutocompleteIndex = product_autocomplete_index
+    ) -> None:
+    """Menyelaraskan satu produk setelah commit; produk terhapus atau nonaktif dikeluarkan dari indeks."""
+    try:
+        row = db.execute(_entry_query().where(ProductModel.id == str(product_id))).first()
+        if row is None:
+            index.remove(str(product_id))
+        else:
+            index.upsert(_to_entry(row))
+    except Exception as e:
+        # Indeks hanya turunan data; rebuild berkala akan menyusulkan perubahan ini
+        logger.warning("Failed to sync autocomplete index for product %s: %s", product_id, e)
+
+
+def sync_autocomplete_brand(
+        db: Session,
+        production_id: int,
+        index: ProductAutocompleteIndex = product_autocomplete_index
+    ) -> None:
+    """Menyelaraskan semua produk satu brand setelah nama brand berubah atau brand dihapus."""
+    try:
+        rows = db.execute(_entry_query().where(ProductModel.product_by_id == production_id)).all()
+        index.replace_brand(production_id, [_to_entry(row) for row in rows])
+    except Exception as e:
+        logger.warning("Failed to sync autocomplete index for brand %s: %s", production_id, e)
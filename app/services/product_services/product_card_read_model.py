@@ -0,0 +1,163 @@
+"""
+Read model kartu produk untuk endpoint listing.
+
+Listing hanya butuh kolom kartu (id, nama, harga, brand, gambar utama dan
+harga/diskon varian), jadi query di sini memilih kolom tersebut sebagai
+baris biasa tanpa memuat entity `ProductModel` beserta kolom TEXT
+`description`/`instruction`. Baris berasal dari database sendiri sehingga
+DTO dibangun lewat `model_construct` tanpa validasi ulang.
+
+Service listing hanya meng-cache urutan ID per halaman; kartunya diambil
+lewat `load_product_cards` yang menyimpan satu entri cache per produk
+(lihat `app.libs.cache.entities`). `load_product_cards_async` menjalankan
+query yang sama lewat `AsyncSession`.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.dtos.pack_type_dtos import VariantAllProductDto
+from app.dtos.product_dtos import AllProductInfoDTO
+from app.models.pack_type_model import PackTypeModel, calculate_discounted_price
+from app.models.product_model import ProductModel
+from app.models.production_model import ProductionModel
+from app.libs.cache import PRODUCT, cached_entities, cached_entities_async
+
+from app.services.product_services.support_function import load_product_galleries, load_product_galleries_async
+
+
+CARD_CACHE_TTL = 3600
+
+
+def product_id_query() -> Select:
+    """Query ID produk untuk list ID halaman; join sama dengan `product_card_query` agar filternya bisa dipakai ulang."""
+    return (
+        select(ProductModel.id)
+        .outerjoin(ProductionModel, ProductionModel.id == ProductModel.product_by_id)
+    )
+
+
+def product_card_query() -> Select:
+    """Query dasar kartu produk; service menambahkan filter, offset dan limit."""
+    return (
+        select(
+            ProductModel.id,
+            ProductModel.name,
+            ProductModel.price,
+            ProductModel.created_at,
+            ProductionModel.id.label("brand_id"),
+            ProductionModel.name.label("brand_name"),
+        )
+        .outerjoin(ProductionModel, ProductionModel.id == ProductModel.product_by_id)
+    )
+
+
+def _card_variant_query(product_ids: List[str]) -> Select:
+    return (
+        select(
+            PackTypeModel.id,
+            PackTypeModel.product_id,
+            PackTypeModel.name,
+            PackTypeModel.variant,
+            PackTypeModel.img,
+            PackTypeModel.expiration,
+            PackTypeModel.stock,
+            PackTypeModel.price,
+            PackTypeModel.discount,
+            PackTypeModel.updated_at,
+        )
+        .where(PackTypeModel.product_id.in_(product_ids))
+        .order_by(PackTypeModel.product_id, PackTypeModel.id)
+    )
+
+
+def _group_variants(rows: Sequence[Any]) -> Dict[str, List[Any]]:
+    variants_by_product: Dict[str, List[Any]] = defaultdict(list)
+    for row in rows:
+        variants_by_product[row.product_id].append(row)
+    return variants_by_product
+
+
+def build_product_cards(db: Session, rows: Sequence[Any]) -> List[AllProductInfoDTO]:
+    """Memetakan baris `product_card_query` menjadi `AllProductInfoDTO` dengan dua query tambahan."""
+    product_ids = [str(row.id) for row in rows]
+    if not product_ids:
+        return []
+
+    variants_by_product = _group_variants(db.execute(_card_variant_query(product_ids)).all())
+    return _assemble_cards(rows, variants_by_product, load_product_galleries(db, product_ids))
+
+
+async def build_product_cards_async(db: AsyncSession, rows: Sequence[Any]) -> List[AllProductInfoDTO]:
+    """Padanan `build_product_cards` untuk `AsyncSession`."""
+    product_ids = [str(row.id) for row in rows]
+    if not product_ids:
+        return []
+
+    variants_by_product = _group_variants((await db.execute(_card_variant_query(product_ids))).all())
+    return _assemble_cards(rows, variants_by_product, await load_product_galleries_async(db, product_ids))
+
+
+def _assemble_cards(
+        rows: Sequence[Any],
+        variants_by_product: Dict[str, List[Any]],
+        galleries: Dict[str, Dict[str, Any]]
+    ) -> List[AllProductInfoDTO]:
+    cards = []
+    for row in rows:
+        product_id = str(row.id)
+        variants = variants_by_product.get(product_id, [])
+        variant_prices = [float(variant.price or 0) for variant in variants]
+
+        cards.append(AllProductInfoDTO.model_construct(
+            id=product_id,
+            name=row.name,
+            price=float(row.price),
+            min_variant_price=min(variant_prices) if variant_prices else float(row.price or 0),
+            max_variant_price=max(variant_prices) if variant_prices else float(row.price or 0),
+            brand_info={"id": row.brand_id, "name": row.brand_name} if row.brand_id is not None else None,
+            primary_image_url=galleries[product_id]["primary_image_url"],
+            gallery_images=galleries[product_id]["gallery_images"],
+            all_variants=[
+                VariantAllProductDto.model_construct(
+                    id=variant.id,
+                    product_id=variant.product_id,
+                    product=row.name,
+                    name=variant.name,
+                    variant=variant.variant,
+                    img=variant.img,
+                    expiration=variant.expiration,
+                    stock=variant.stock,
+                    price=float(variant.price or 0),
+                    discount=variant.discount,
+                    discounted_price=float(calculate_discounted_price(variant.price, variant.discount)),
+                    updated_at=variant.updated_at,
+                )
+                for variant in variants
+            ],
+            created_at=row.created_at,
+        ))
+    return cards
+
+
+def load_product_cards(db: Session, product_ids: Sequence[str]) -> List[AllProductInfoDTO]:
+    """Kartu produk sesuai urutan `product_ids`; hanya kartu yang tidak ada di cache dimuat dari database."""
+    def load_missing(missing: List[str]) -> Dict[str, AllProductInfoDTO]:
+        rows = db.execute(product_card_query().where(ProductModel.id.in_(missing))).all()
+        return {card.id: card for card in build_product_cards(db, rows)}
+
+    return cached_entities(PRODUCT, [str(product_id) for product_id in product_ids], AllProductInfoDTO, load_missing, CARD_CACHE_TTL)
+
+
+async def load_product_cards_async(db: AsyncSession, product_ids: Sequence[str]) -> List[AllProductInfoDTO]:
+    """Padanan `load_product_cards` untuk `AsyncSession`."""
+    async def load_missing(missing: List[str]) -> Dict[str, AllProductInfoDTO]:
+        rows = (await db.execute(product_card_query().where(ProductModel.id.in_(missing)))).all()
+        return {card.id: card for card in await build_product_cards_async(db, rows)}
+
+    return await cached_entities_async(
+        PRODUCT, [str(product_id) for product_id in product_ids], AllProductInfoDTO, load_missing, CARD_CACHE_TTL
+    )
@@ -0,0 +1,134 @@
+"""
+Kondisi filter katalog dan hitungan facet produk.
+
+Semua facet (brand, kategori, rentang harga) serta total hasil dihitung
+dalam satu statement `UNION ALL` sehingga cukup satu round trip. Setiap
+facet memakai semua filter kecuali filter dimensinya sendiri, supaya
+frontend tetap bisa menampilkan jumlah untuk pilihan brand/kategori/harga
+lain yang belum dicentang.
+"""
+import os
+from typing import Collection, List, Optional, Tuple
+
+from sqlalchemy import String, case, cast, exists, func, literal, literal_column, select, union_all
+from sqlalchemy.orm import Session
+
+from app.dtos.product_dtos import FacetCountDTO, PriceBucketFacetDTO, ProductFacetsDTO, ProductFilterDTO
+from app.models.pack_type_model import PackTypeModel
+from app.models.product_model import ProductModel
+from app.models.production_model import ProductionModel
+from app.models.tag_category_model import TagCategoryModel
+
+# Batas bawah tiap bucket harga; bucket terakhir tanpa batas atas
+PRICE_BUCKET_BOUNDS: List[float] = [
+    float(bound) for bound in os.getenv("PRODUCT_PRICE_BUCKETS", "0,25000,50000,100000,250000").split(",")
+]
+
+# Harga "mulai dari" kartu produk. Kolom ini selalu terisi (harga dasar bila belum ada
+# varian): migrasi 6300e7deaf37 mengisinya untuk produk lama, create_product dan
+# refresh_variant_stats menjaganya untuk produk baru, sehingga bisa dilayani indeks komposit
+effective_price = ProductModel.min_variant_price
+
+SORT_OPTIONS = {
+    "newest": (ProductModel.created_at.desc(), ProductModel.id),
+    "price_asc": (effective_price.asc(), ProductModel.id),
+    "price_desc": (effective_price.desc(), ProductModel.id),
+    "rating": (ProductModel.avg_rating.desc(), ProductModel.total_rater.desc(), ProductModel.id),
+    "discount": (ProductModel.highest_promo.desc(), ProductModel.id),
+}
+
+
+def product_filter_conditions(filters: ProductFilterDTO, exclude: Collection[str] = ()) -> list:
+    """Klausa WHERE atas `ProductModel`/`ProductionModel`; `exclude` melewati dimensi facet tertentu."""
+    conditions = [ProductModel.is_active.is_(True)]
+
+    if filters.brand_ids and "brand" not in exclude:
+        conditions.append(ProductModel.product_by_id.in_(filters.brand_ids))
+    if filters.category_ids and "category" not in exclude:
+        conditions.append(ProductionModel.herbal_category_id.in_(filters.category_ids))
+    if "price" not in exclude:
+        if filters.min_price is not None:
+            conditions.append(effective_price >= filters.min_price)
+        if filters.max_price is not None:
+            conditions.append(effective_price <= filters.max_price)
+    if filters.has_discount is not None:
+        conditions.append(ProductModel.highest_promo > 0 if filters.has_discount else ProductModel.highest_promo == 0)
+    if filters.min_rating is not None:
+        conditions.append(ProductModel.avg_rating >= filters.min_rating)
+    if filters.in_stock is not None:
+        has_stock = exists().where(PackTypeModel.product_id == ProductModel.id, PackTypeModel.stock > 0)
+        conditions.append(has_stock if filters.in_stock else ~has_stock)
+    return conditions
+
+
+def _price_bucket():
+    # Konstanta ditulis inline (bukan bind parameter) agar ekspresi di SELECT dan GROUP BY identik
+    return case(
+        *[
+            (effective_price < literal_column(repr(upper)), literal_column(str(index)))
+            for index, upper in enumerate(PRICE_BUCKET_BOUNDS[1:])
+        ],
+        else_=literal_column(str(len(PRICE_BUCKET_BOUNDS) - 1)),
+    )
+
+
+def _facet_select(facet: str, key, label, conditions: list):
+    query = (
+        select(
+            literal(facet).label("facet"),
+            cast(key, String).label("key"),
+            cast(label, String).label("label"),
+            func.count(ProductModel.id).label("total"),
+        )
+        .select_from(ProductModel)
+        .join(ProductionModel, ProductionModel.id == ProductModel.product_by_id)
+        .join(TagCategoryModel, TagCategoryModel.id == ProductionModel.herbal_category_id)
+        .where(*conditions)
+    )
+    if key is None:
+        return query
+    return query.group_by(*[column for column in (key, label) if column is not None])
+
+
+def facet_counts_query(filters: ProductFilterDTO):
+    return union_all(
+        _facet_select("total", None, None, product_filter_conditions(filters)),
+        _facet_select("brand", ProductionModel.id, ProductionModel.name, product_filter_conditions(filters, {"brand"})),
+        _facet_select(
+            "category", TagCategoryModel.id, TagCategoryModel.name, product_filter_conditions(filters, {"category"})
+        ),
+        _facet_select("price", _price_bucket(), None, product_filter_conditions(filters, {"price"})),
+    )
+
+
+def _bucket_range(index: int) -> Tuple[float, Optional[float]]:
+    upper = PRICE_BUCKET_BOUNDS[index + 1] if index + 1 < len(PRICE_BUCKET_BOUNDS) else None
+    return PRICE_BUCKET_BOUNDS[index], upper
+
+
+def load_product_facets(db: Session, filters: ProductFilterDTO) -> Tuple[int, ProductFacetsDTO]:
+    """Menjalankan query facet; mengembalikan (total hasil terfilter, facet)."""
+    total = 0
+    brands, categories, price_counts = [], [], {}
+    for row in db.execute(facet_counts_query(filters)).all():
+        if row.facet == "total":
+            total = row.total
+        elif row.facet == "brand":
+            brands.append(FacetCountDTO.model_construct(id=int(row.key), name=row.label, count=row.total))
+        elif row.facet == "category":
+            categories.append(FacetCountDTO.model_construct(id=int(row.key), name=row.label, count=row.total))
+        else:
+            price_counts[int(row.key)] = row.total
+
+    price_buckets = []
+    for index in range(len(PRICE_BUCKET_BOUNDS)):
+        min_price, max_price = _bucket_range(index)
+        price_buckets.append(PriceBucketFacetDTO.model_construct(
+            min_price=min_price, max_price=max_price, count=price_counts.get(index, 0)
+        ))
+
+    return total, ProductFacetsDTO.model_construct(
+        brands=sorted(brands, key=lambda facet: (-facet.count, facet.name or "")),
+        categories=sorted(categories, key=lambda facet: (-facet.count, facet.name or "")),
+        price_buckets=price_buckets,
+    )
@@ -0,0 +1,228 @@
+"""
+Mesin pencarian produk berbasis relevansi.
+
+Di PostgreSQL pencarian memakai kolom `products.search_vector` (tsvector
+berbobot: nama 'A', brand 'B', info 'C', deskripsi 'D') yang dirawat trigger
+migrasi 1b7f3c9d2e4a, ditambah indeks trigram `pg_trgm` atas nama produk
+agar salah ketik tetap ketemu. Operator `<%` memakai ambang
+`SEARCH_WORD_SIMILARITY_THRESHOLD` yang disetel lokal per transaksi.
+Peringkat = `ts_rank_cd` + `word_similarity`, dan cuplikan dibuat
+`ts_headline` hanya untuk baris pada halaman hasil.
+
+Database lain (SQLite saat test) memakai fallback Python murni dengan
+aturan yang sama: pencocokan prefix per token berbobot, kemiripan trigram
+ala pg_trgm, dan cuplikan bertanda `<mark>`.
+
+Cuplikan berasal dari teks produk yang diisi admin, jadi teksnya di-escape
+sebelum penanda `<mark>` dipasang; `ts_headline` memakai penanda non-HTML
+yang baru diganti `<mark>` setelah escape.
+"""
+import html
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+from sqlalchemy import func, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from app.dtos.product_dtos import ProductSearchInfoDTO
+from app.models.product_model import ProductModel
+from app.models.production_model import ProductionModel
+
+from app.services.product_services.product_card_read_model import load_product_cards
+
+SEARCH_CONFIG = "simple"
+WORD_SIMILARITY_THRESHOLD = float(os.getenv("SEARCH_WORD_SIMILARITY_THRESHOLD", 0.6))
+SNIPPET_START, SNIPPET_STOP = "<mark>", "</mark>"
+SNIPPET_MAX_WORDS = 20
+# Karakter private-use: tidak tersentuh html.escape dan tidak muncul di teks produk biasa
+HEADLINE_START, HEADLINE_STOP = "\ue000", "\ue001"
+HEADLINE_OPTIONS = f'StartSel="{HEADLINE_START}", StopSel="{HEADLINE_STOP}", MaxWords={SNIPPET_MAX_WORDS}, MinWords=5'
+
+# Bobot default ts_rank_cd untuk label D, C, B, A
+FIELD_WEIGHTS = {"name": 1.0, "brand": 0.4, "info": 0.2, "description": 0.1}
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_WORD_PATTERN = re.compile(r"\S+")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    product_id: str
+    rank: float
+    snippet: Optional[str]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+
+def _trigrams(text: str) -> set:
+    grams = set()
+    for word in tokenize(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def trigram_similarity(left: str, right: str) -> float:
+    """Padanan `similarity()` pg_trgm: rasio trigram bersama terhadap gabungan trigram."""
+    left_grams, right_grams = _trigrams(left), _trigrams(right)
+    if not left_grams or not right_grams:
+        return 0.0
+    return len(left_grams & right_grams) / len(left_grams | right_grams)
+
+
+def word_similarity(query: str, text: str) -> float:
+    """Pendekatan `word_similarity()` pg_trgm: porsi trigram query yang ada di potongan kata terbaik teks."""
+    query_grams = _trigrams(query)
+    words = tokenize(text)
+    if not query_grams or not words:
+        return 0.0
+
+    size = len(tokenize(query))
+    windows = (" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1)))
+    return max(len(query_grams & _trigrams(window)) / len(query_grams) for window in windows)
+
+
+def render_headline(headline: Optional[str]) -> Optional[str]:
+    """Escape hasil `ts_headline` lalu ganti penanda non-HTML dengan `<mark>`."""
+    if headline is None:
+        return None
+    return html.escape(headline).replace(HEADLINE_START, SNIPPET_START).replace(HEADLINE_STOP, SNIPPET_STOP)
+
+
+def prefix_tsquery(tokens: Sequence[str]) -> str:
+    """Token hasil `tokenize` hanya berisi karakter kata sehingga aman disusun menjadi tsquery."""
+    return " & ".join(f"{token}:*" for token in tokens)
+
+
+def search_products(
+        db: Session,
+        query: str,
+        filters: Iterable = (),
+        skip: int = 0,
+        limit: int = 10
+    ) -> List[SearchHit]:
+    """Mengembalikan hit terurut relevansi; `filters` adalah klausa WHERE tambahan atas `ProductModel`."""
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+
+    filters = list(filters)
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, tokens, filters, skip, limit)
+    return _search_python(db, tokens, filters, skip, limit)
+
+
+def _search_postgres(db: Session, tokens: List[str], filters: list, skip: int, limit: int) -> List[SearchHit]:
+    normalized = " ".join(tokens)
+    ts_query = func.to_tsquery(SEARCH_CONFIG, prefix_tsquery(tokens))
+    search_vector = literal_column("products.search_vector", TSVECTOR)
+    lowered_name = func.lower(ProductModel.name)
+
+    rank = (func.ts_rank_cd(search_vector, ts_query) + func.word_similarity(normalized, lowered_name)).label("rank")
+    # `<%` membaca pg_trgm.word_similarity_threshold sesi; disetel lokal agar indeks trigram tetap terpakai
+    db.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(WORD_SIMILARITY_THRESHOLD), True)))
+    page = (
+        select(ProductModel.id.label("product_id"), rank)
+        .where(
+            or_(search_vector.op("@@")(ts_query), literal(normalized).op("<%")(lowered_name)),
+            *filters
+        )
+        .order_by(rank.desc(), ProductModel.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+
+    # ts_headline mahal, jadi hanya dihitung untuk baris di halaman ini
+    snippet = func.ts_headline(
+        SEARCH_CONFIG,
+        func.coalesce(ProductModel.description, ProductModel.info, ProductModel.name),
+        ts_query,
+        HEADLINE_OPTIONS,
+    )
+    rows = db.execute(
+        select(page.c.product_id, page.c.rank, snippet.label("snippet"))
+        .join(ProductModel, ProductModel.id == page.c.product_id)
+        .order_by(page.c.rank.desc(), page.c.product_id)
+    ).all()
+    return [SearchHit(str(row.product_id), float(row.rank), render_headline(row.snippet)) for row in rows]
+
+
+def _matches_prefix(token: str, words: List[str]) -> bool:
+    return any(word.startswith(token) for word in words)
+
+
+def _matches_prefix_any(word_tokens: List[str], tokens: Sequence[str]) -> bool:
+    return any(_matches_prefix(token, word_tokens) for token in tokens)
+
+
+def highlight_snippet(text: Optional[str], tokens: Sequence[str], max_words: int = SNIPPET_MAX_WORDS) -> Optional[str]:
+    """Menandai kata yang diawali token pencarian dan memotong teks di sekitar kecocokan pertama."""
+    if not text:
+        return None
+
+    words = _WORD_PATTERN.findall(text)
+    marked = [_matches_prefix_any(tokenize(word), tokens) for word in words]
+    first = marked.index(True) if any(marked) else 0
+    start = max(0, min(first - max_words // 4, len(words) - max_words))
+    window = range(start, min(start + max_words, len(words)))
+    return " ".join(
+        f"{SNIPPET_START}{html.escape(words[i])}{SNIPPET_STOP}" if marked[i] else html.escape(words[i])
+        for i in window
+    )
+
+
+def _search_python(db: Session, tokens: List[str], filters: list, skip: int, limit: int) -> List[SearchHit]:
+    rows = db.execute(
+        select(
+            ProductModel.id,
+            ProductModel.name,
+            ProductModel.info,
+            ProductModel.description,
+            ProductionModel.name.label("brand"),
+        )
+        .outerjoin(ProductionModel, ProductionModel.id == ProductModel.product_by_id)
+        .where(*filters)
+    ).all()
+
+    normalized = " ".join(tokens)
+    hits = []
+    for row in rows:
+        fields = {field: tokenize(getattr(row, field)) for field in FIELD_WEIGHTS}
+        token_scores = [
+            sum(weight for field, weight in FIELD_WEIGHTS.items() if _matches_prefix(token, fields[field]))
+            for token in tokens
+        ]
+        similarity = word_similarity(normalized, row.name or "")
+        full_text_match = all(token_scores)
+        if not full_text_match and similarity < WORD_SIMILARITY_THRESHOLD:
+            continue
+
+        rank = (sum(token_scores) / len(tokens) if full_text_match else 0.0) + similarity
+        snippet = highlight_snippet(row.description or row.info or row.name, tokens)
+        hits.append(SearchHit(str(row.id), round(rank, 6), snippet))
+
+    hits.sort(key=lambda hit: (-hit.rank, hit.product_id))
+    return hits[skip:skip + limit]
+
+
+def build_search_results(db: Session, hits: Sequence[SearchHit]) -> List[ProductSearchInfoDTO]:
+    """Memuat kartu produk untuk hit lalu menyusunnya sesuai urutan relevansi."""
+    if not hits:
+        return []
+
+    cards = {card.id: card for card in load_product_cards(db, [hit.product_id for hit in hits])}
+    return [
+        ProductSearchInfoDTO.model_construct(
+            **dict(cards[hit.product_id]),
+            search_rank=hit.rank,
+            search_snippet=hit.snippet,
+        )
+        for hit in hits
+        if hit.product_id in cards
+    ]
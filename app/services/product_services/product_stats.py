@@ -0,0 +1,86 @@
+"""
+Pemeliharaan kolom agregat produk (rating, rentang harga varian, promo).
+
+Fungsi di sini hanya menjalankan UPDATE di session pemanggil tanpa commit,
+sehingga agregat selalu ikut transaksi yang sama dengan perubahan rating
+atau pack type yang memicunya.
+"""
+from sqlalchemy import Numeric, case, cast, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.pack_type_model import PackTypeModel
+from app.models.product_model import ProductModel
+from app.models.rating_model import RatingModel
+
+
+def _rounded_ratio(numerator, denominator):
+    return case(
+        (denominator > 0, func.round(cast(numerator, Numeric(12, 4)) / denominator, 1)),
+        else_=0,
+    )
+
+
+def apply_rating_delta(db: Session, product_id: str, rate_delta: int, rater_delta: int) -> None:
+    """Menambah/mengurangi total rating secara atomik lalu menghitung ulang rata-ratanya."""
+    new_sum = ProductModel.rating_sum + rate_delta
+    new_total = ProductModel.total_rater + rater_delta
+    db.execute(
+        update(ProductModel)
+        .where(ProductModel.id == str(product_id))
+        .values(
+            rating_sum=new_sum,
+            total_rater=new_total,
+            avg_rating=_rounded_ratio(new_sum, new_total),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _variant_stats_values():
+    variants = PackTypeModel.__table__
+    of_product = variants.c.product_id == ProductModel.id
+
+    def aggregate(expression):
+        return select(expression).where(of_product).scalar_subquery()
+
+    return {
+        "min_variant_price": func.coalesce(aggregate(func.min(variants.c.price)), ProductModel.price),
+        "max_variant_price": func.coalesce(aggregate(func.max(variants.c.price)), ProductModel.price),
+        "highest_promo": func.coalesce(
+            aggregate(func.round(cast(func.max(variants.c.discount), Numeric(12, 4)), 1)), 0
+        ),
+        "avg_promo": func.coalesce(
+            aggregate(_rounded_ratio(func.coalesce(func.sum(variants.c.discount), 0), func.count(variants.c.id))), 0
+        ),
+    }
+
+
+def refresh_variant_stats(db: Session, product_id: str) -> None:
+    """Menghitung ulang rentang harga dan promo satu produk dari pack type miliknya."""
+    db.flush()  # Perubahan pack type yang belum di-flush harus ikut terhitung
+    db.execute(
+        update(ProductModel)
+        .where(ProductModel.id == str(product_id))
+        .values(**_variant_stats_values())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def backfill_product_stats(db: Session) -> int:
+    """Menghitung ulang seluruh kolom agregat untuk semua produk. Mengembalikan jumlah baris."""
+    ratings = RatingModel.__table__
+    of_product = ratings.c.product_id == ProductModel.id
+    rating_sum = func.coalesce(select(func.sum(ratings.c.rate)).where(of_product).scalar_subquery(), 0)
+    total_rater = select(func.count(ratings.c.id)).where(of_product).scalar_subquery()
+
+    result = db.execute(
+        update(ProductModel)
+        .values(
+            rating_sum=rating_sum,
+            total_rater=total_rater,
+            avg_rating=_rounded_ratio(rating_sum, total_rater),
+            **_variant_stats_values(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
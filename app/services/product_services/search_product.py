@@ -1,16 +1,16 @@
 from fastapi import HTTPException, status
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from typing import List, Type
 
 from app.models.product_model import ProductModel
-from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.product_dtos import ProductSearchResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_search import build_search_results, search_products
 
 from app.utils.result import build, Result
 
@@ -20,22 +20,11 @@ def search_product(
         product_name: str,
         skip: int = 0, 
         limit: int = 10
-    ) -> Result[AllProductInfoResponseDto, Exception]:
+    ) -> Result[ProductSearchResponseDto, Exception]:
     try:
-        search_query = f"{product_name}%"
-
-        product_model = (
-            db.execute(
-                select(ProductModel)
-                .options(selectinload(ProductModel.pack_type))  # Eager loading untuk pack_type
-                .filter(
-                    ProductModel.name.ilike(search_query)
-                )
-                .offset(skip)
-                .limit(limit)
-            ).scalars().all()
-        )
-        if not product_model:
+        # Hit sudah terurut berdasarkan relevansi (nama, brand, info, deskripsi) dan toleran salah ketik
+        search_hits = search_products(db, product_name, skip=skip, limit=limit)
+        if not search_hits:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=ErrorResponseDto(
@@ -50,23 +39,11 @@ def search_product(
         #     return build(data=[])
 
         # Konversi produk menjadi DTO, cek `all_variants` agar tidak menyebabkan error jika None
-        all_products_dto = [
-            AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_model
-        ]
+        all_products_dto = build_search_results(db, search_hits)
 
         # return build(data=all_products_dto)
     
-        return build(data=AllProductInfoResponseDto(
+        return build(data=ProductSearchResponseDto(
             status_code=status.HTTP_200_OK,
             message=f"All List product search name containing '{product_name}' can accessed successfully",
             data=all_products_dto
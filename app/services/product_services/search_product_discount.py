@@ -1,17 +1,18 @@
 from fastapi import HTTPException, status
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload  # Menggunakan selectinload untuk efisiensi
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from typing import List, Type
 
 from app.models.product_model import ProductModel
 from app.models.pack_type_model import PackTypeModel  
-from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.product_dtos import ProductSearchResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_search import build_search_results, search_products
 
 from app.utils.result import build, Result
 
@@ -20,7 +21,7 @@ def search_product_discount(
         product_name: str,
         skip: int = 0, 
         limit: int = 10
-    ) -> Result[AllProductInfoResponseDto, Exception]:
+    ) -> Result[ProductSearchResponseDto, Exception]:
     try:
         # Subquery untuk produk dengan diskon
         subquery = (
@@ -29,24 +30,19 @@ def search_product_discount(
             .scalar_subquery()
         )
 
-        search_query = f"%{product_name}%"  # Pencarian menggunakan ilike
-        
-        # Query untuk produk yang cocok dengan nama dan aktif serta memiliki diskon
-        product_model = (
-            db.execute(
-                select(ProductModel)
-                .options(selectinload(ProductModel.pack_type))  # Eager loading untuk pack_type
-                .filter(
-                    ProductModel.name.ilike(search_query),
-                    ProductModel.is_active.is_(True),
-                    ProductModel.id.in_(subquery)
-                )
-                .offset(skip)
-                .limit(limit)
-            ).scalars().all()
+        # Pencarian relevansi hanya untuk produk aktif yang memiliki diskon
+        search_hits = search_products(
+            db,
+            product_name,
+            filters=[
+                ProductModel.is_active.is_(True),
+                ProductModel.id.in_(subquery)
+            ],
+            skip=skip,
+            limit=limit
         )
 
-        if not product_model:
+        if not search_hits:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=ErrorResponseDto(
@@ -61,23 +57,11 @@ def search_product_discount(
         #     return build(data=[])
         
         # Konversi produk menjadi DTO
-        product_discount_dto = [
-            AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_model
-        ]
+        product_discount_dto = build_search_results(db, search_hits)
 
         # return build(data=product_discount_dto)
 
-        return build(data=AllProductInfoResponseDto(
+        return build(data=ProductSearchResponseDto(
             status_code=status.HTTP_200_OK,
             message=f"All List of product discount name containing '{product_name}' can accessed successfully",
             data=product_discount_dto
@@ -1,16 +1,17 @@
 from fastapi import HTTPException, status
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from typing import List, Type
 
 from app.models.product_model import ProductModel
-from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.product_dtos import ProductSearchResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.product_services.support_function import handle_db_error
+from app.services.product_services.product_search import build_search_results, search_products
 
 from app.utils.result import build, Result
 
@@ -20,7 +21,7 @@ def search_product_of_id_production(
         product_name: str,
         skip: int = 0, 
         limit: int = 10
-    ) -> Result[AllProductInfoResponseDto, Exception]:  # Mengembalikan List DTO
+    ) -> Result[ProductSearchResponseDto, Exception]:  # Mengembalikan List DTO
     try:
         # Memeriksa apakah production_id valid
         if not production_id:
@@ -33,21 +34,17 @@ def search_product_of_id_production(
                 ).dict()
             )
 
-        search_query = f"%{product_name}%"
-        # Query untuk mengambil produk berdasarkan product_by_id
-        product_model = db.execute(
-            select(ProductModel)
-            .options(selectinload(ProductModel.pack_type))  # Eager load untuk pack_type
-            .where(
-                ProductModel.product_by_id == production_id,
-                ProductModel.name.ilike(search_query)
-            )  
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
+        # Query pencarian relevansi untuk produk berdasarkan product_by_id
+        search_hits = search_products(
+            db,
+            product_name,
+            filters=[ProductModel.product_by_id == production_id],
+            skip=skip,
+            limit=limit
+        )
 
         # Memeriksa apakah ada produk ditemukan
-        if not product_model:
+        if not search_hits:
             # Memisahkan pesan kesalahan
             if db.execute(
                 select(ProductModel)
@@ -74,23 +71,11 @@ def search_product_of_id_production(
 
 
         # Konversi produk ke DTO
-        all_products_dto = [
-            AllProductInfoDTO(
-                id=product.id, 
-                name=product.name,
-                price=float(product.price),
-                min_variant_price=product.min_variant_price,
-                max_variant_price=product.max_variant_price,
-                brand_info=product.brand_info,
-                all_variants=product.all_variants or [],
-                created_at=product.created_at
-            )
-            for product in product_model
-        ]
+        all_products_dto = build_search_results(db, search_hits)
 
         # return build(data=all_products_dto)
     
-        return build(data=AllProductInfoResponseDto(
+        return build(data=ProductSearchResponseDto(
             status_code=status.HTTP_200_OK,
             message=f"All List of product by production ID '{production_id}' with name containing '{product_name}' can accessed successfully",
             data=all_products_dto
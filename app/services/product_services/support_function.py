@@ -1,13 +1,31 @@
+import logging
+import os
+from typing import Any, Dict, Iterable, List
+
 from fastapi import HTTPException, status
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.dtos.error_response_dtos import ErrorResponseDto
+from app.models.product_image_model import ProductImageModel
+
+logger = logging.getLogger(__name__)
 
 # Utility Function for Handling Database Errors
 def handle_db_error(db: Session, error: SQLAlchemyError) -> HTTPException:
     db.rollback()
+    return _conflict(error)
+
+
+async def handle_db_error_async(db: AsyncSession, error: SQLAlchemyError) -> HTTPException:
+    await db.rollback()
+    return _conflict(error)
+
+
+def _conflict(error: SQLAlchemyError) -> HTTPException:
     return HTTPException(
         status_code=status.HTTP_409_CONFLICT,
         detail=ErrorResponseDto(
@@ -16,3 +34,96 @@ def handle_db_error(db: Session, error: SQLAlchemyError) -> HTTPException:
             message=f"Database error: {str(error)}"
         ).dict()
     )
+
+
+def normalize_image_url(url: str | None) -> str | None:
+    if not url:
+        return url
+    if "127.0.0.1" not in url and "localhost" not in url:
+        return url
+    host_url = os.getenv("HOST_URL", "").rstrip("/")
+    if not host_url:
+        railway_domain = os.getenv("RAILWAY_PUBLIC_DOMAIN", "").strip()
+        if railway_domain:
+            host_url = f"https://{railway_domain.strip('/')}"
+    if not host_url:
+        return url
+    try:
+        path = url.split("/images/", 1)[1]
+        return f"{host_url}/images/{path}"
+    except Exception:
+        return url
+
+
+def load_product_galleries(db: Session, product_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Memuat galeri gambar untuk satu halaman produk dengan satu query lalu
+    mengelompokkannya per product_id.
+
+    Hasil selalu berisi setiap product_id yang diminta dengan kunci
+    `primary_image_url` dan `gallery_images`. Kegagalan query gambar tidak
+    pernah menggagalkan endpoint; produk tetap memakai gambar default.
+    """
+    ids = [str(product_id) for product_id in product_ids]
+    rows = []
+    if ids:
+        try:
+            rows = db.execute(product_gallery_query(ids)).all()
+        except Exception as image_error:
+            logger.warning("Failed to load product images for products %s: %s", ids, image_error)
+    return group_product_galleries(ids, rows)
+
+
+async def load_product_galleries_async(db: AsyncSession, product_ids: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """Padanan `load_product_galleries` untuk `AsyncSession`."""
+    ids = [str(product_id) for product_id in product_ids]
+    rows = []
+    if ids:
+        try:
+            rows = (await db.execute(product_gallery_query(ids))).all()
+        except Exception as image_error:
+            logger.warning("Failed to load product images for products %s: %s", ids, image_error)
+    return group_product_galleries(ids, rows)
+
+
+def product_gallery_query(ids: List[str]) -> Select:
+    return (
+        select(
+            ProductImageModel.id,
+            ProductImageModel.product_id,
+            ProductImageModel.url,
+            ProductImageModel.is_primary,
+            ProductImageModel.sort_order,
+        )
+        .where(ProductImageModel.product_id.in_(ids))
+        .order_by(
+            ProductImageModel.product_id,
+            ProductImageModel.sort_order.asc(),
+            ProductImageModel.id.asc(),
+        )
+    )
+
+
+def group_product_galleries(ids: List[str], rows: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    default_image_url = os.getenv("DEFAULT_PRODUCT_IMAGE_URL")
+    gallery_by_product: Dict[str, List[Dict[str, Any]]] = {product_id: [] for product_id in ids}
+    primary_by_product: Dict[str, str | None] = {}
+
+    for row in rows:
+        url = normalize_image_url(row.url)
+        gallery_by_product[row.product_id].append({
+            "id": row.id,
+            "url": url,
+            "is_primary": row.is_primary,
+            "sort_order": row.sort_order,
+        })
+        if row.is_primary and row.product_id not in primary_by_product:
+            primary_by_product[row.product_id] = url
+
+    return {
+        product_id: {
+            "primary_image_url": primary_by_product.get(product_id) or default_image_url,
+            "gallery_images": gallery_by_product[product_id],
+        }
+        for product_id in ids
+    }
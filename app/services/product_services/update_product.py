@@ -8,9 +8,12 @@ from app.models.product_model import ProductModel
 from app.dtos.product_dtos import ProductIdToUpdateDTO, ProductUpdateDTO, ProductInfoDTO, ProductResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
+from app.services.product_services.product_stats import refresh_variant_stats
+from app.services.product_services.product_autocomplete import sync_autocomplete_product
+
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
-from app.libs.redis_config import redis_client
+from app.libs.cache import PRODUCT, bump_namespaces
 
 def update_product(
         db: Session, 
@@ -40,6 +43,9 @@ def update_product(
         for attr, value in product_update.model_dump().items():
             setattr(product_model, attr, value)
 
+        # Harga dasar menjadi fallback rentang harga saat produk belum punya varian
+        refresh_variant_stats(db, product_model.id)
+
         # Simpan perubahan ke dalam database   
         db.commit()
         db.refresh(product_model)
@@ -58,16 +64,12 @@ def update_product(
                 updated_at=product_model.updated_at
             )
 
-        # Invalidasi cache dengan pendekatan yang lebih efisien
-        redis_keys = [
-            f"products:*", 
-            f"product:*",
-            f"discounts:*",
-            f"promotions:*"
-        ]
-        for pattern in redis_keys:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Field yang bisa diedit tidak mengubah anggota maupun urutan listing,
+        # jadi cukup detail dan kartu produk ini yang diinvalidasi
+        bump_namespaces((PRODUCT, product_model.id))
+
+        # Nama, brand atau status aktif bisa berubah; selaraskan indeks autocomplete
+        sync_autocomplete_product(db, product_model.id)
 
         # Menggunakan model ter-update untuk membuat respons
         return build(data=ProductResponseDto(
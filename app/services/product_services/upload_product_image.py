@@ -85,7 +85,7 @@ def _upload_to_supabase_bytes(image_bytes: bytes, product_id: str, public_id_see
     return (public_url if isinstance(public_url, str) else None), None, None
 
 
-async def upload_product_image(db: Session, product_id: str, file: UploadFile) -> Result[ProductImageResponseDto, Exception]:
+def upload_product_image(db: Session, product_id: str, file: UploadFile) -> Result[ProductImageResponseDto, Exception]:
     product = db.query(ProductModel).filter(ProductModel.id == product_id).first()
     if not product:
         return build(error=_http_error(status.HTTP_404_NOT_FOUND, "Not Found", "Product not found"))
@@ -96,7 +96,7 @@ async def upload_product_image(db: Session, product_id: str, file: UploadFile) -
     request_id = uuid.uuid4().hex[:12]
     started_at = time.time()
 
-    raw = await file.read()
+    raw = file.file.read()
     if len(raw) > MAX_FILE_SIZE:
         logger.warning(
             "product_image_upload_rejected request_id=%s product_id=%s reason=image_too_large input_size=%s",
@@ -223,7 +223,7 @@ async def upload_product_image(db: Session, product_id: str, file: UploadFile) -
     db.add(image_model)
     db.commit()
     db.refresh(image_model)
-    invalidate_product_cache(product_id)
+    invalidate_product_cache(db, product_id)
 
     elapsed_ms = int((time.time() - started_at) * 1000)
     logger.info(
@@ -11,7 +11,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.production_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
+from app.libs.cache import BRANDS, bump_namespaces
     
 def create_production(
         db: Session, 
@@ -35,16 +35,8 @@ def create_production(
             herbal_category_id=production.herbal_category_id,
             description=production.description
         )
-        # Invalidate the cached wishlist for this user
-        if redis_client:
-            patterns_to_invalidate = [
-                f"productions:*",
-                f"all_brand_by_categories:*",
-                f"brand_promotions:*"
-            ]
-            for pattern in patterns_to_invalidate:
-                for key in redis_client.scan_iter(pattern):
-                    redis_client.delete(key)
+        # Invalidasi cache listing brand: satu INCR, key lama habis oleh TTL
+        bump_namespaces(BRANDS)
 
         return build(data=production_dtos.ProductionCreateResponseDto(
             status_code=201,
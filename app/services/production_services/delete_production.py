@@ -10,7 +10,8 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
 
-from app.libs.redis_config import redis_client
+from app.libs.cache import BRANDS, BRAND, bump_namespaces
+from app.services.product_services.product_autocomplete import sync_autocomplete_brand
 
 def delete_production(
         db: Session, 
@@ -37,16 +38,10 @@ def delete_production(
         db.delete(company)
         db.commit()
 
-        # Invalidate the cached wishlist for this user
-        if redis_client:
-            patterns_to_invalidate = [
-                f"productions:*",
-                f"all_brand_by_categories:*",
-                f"brand_promotions:*"
-            ]
-            for pattern in patterns_to_invalidate:
-                for key in redis_client.scan_iter(pattern):
-                    redis_client.delete(key)
+        # Invalidasi cache listing dan detail brand
+        bump_namespaces(BRANDS, (BRAND, deleted_data.production_id))
+        # Keluarkan sisa entri brand ini dari indeks autocomplete di proses ini
+        sync_autocomplete_brand(db, deleted_data.production_id)
 
         return build(data=production_dtos.DeleteProdutionResponseDto(
             status_code=200,
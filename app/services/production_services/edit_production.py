@@ -2,16 +2,19 @@
 
 from fastapi import HTTPException, status
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.models.product_model import ProductModel
 from app.models.production_model import ProductionModel
 from app.dtos import production_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.utils.result import build, Result
 from app.utils.error_parser import find_errr_from_args
-from app.libs.redis_config import redis_client
+from app.libs.cache import BRANDS, BRAND, PRODUCT, bump_namespaces
+from app.services.product_services.product_autocomplete import sync_autocomplete_brand
 
     
 def edit_production(
@@ -39,16 +42,18 @@ def edit_production(
         db.commit()
         db.refresh(production)
 
-        # Invalidate the cached wishlist for this user
-        patterns_to_invalidate = [
-            f"productions:*",
-            f"all_brand_by_categories:*",
-            f"brand_promotions:*",
-            f"production:{company_id.production_id}"
-        ]
-        for pattern in patterns_to_invalidate:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Nama brand juga tampil di kartu produk, jadi kartu cache tiap produk brand ini
+        # ikut diinvalidasi; list ID katalog dan listing brand tidak berubah
+        product_ids = db.execute(
+            select(ProductModel.id).where(ProductModel.product_by_id == company_id.production_id)
+        ).scalars().all()
+        bump_namespaces(
+            BRANDS,
+            (BRAND, company_id.production_id),
+            *[(PRODUCT, product_id) for product_id in product_ids]
+        )
+        # Nama brand juga kunci autocomplete produk-produknya
+        sync_autocomplete_brand(db, company_id.production_id)
 
         return build(data=production_dtos.ProductionInfoUpdateResponseDto(
             status_code=200,
@@ -4,9 +4,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-import json
-import logging
-
 from app.models.production_model import ProductionModel
 from app.dtos import production_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
@@ -14,37 +11,23 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.production_services.support_function import handle_db_error
 from app.utils.result import build, Result
 
-from app.libs.redis_config import custom_json_serializer, redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import BRANDS, cached
 
 CACHE_TTL = 300
 RESPONSE_MESSAGE = "All list of brands can accessed successfully"
 
+@cached(
+    BRANDS,
+    key_fn=lambda skip, limit, **_: ("productions", skip, limit),
+    ttl=CACHE_TTL,
+    dto=production_dtos.AllListProductionResponseDto,
+)
 def get_all_productions(
         db: Session, 
         skip: int = 0, 
         limit: int = 100
     ) -> Result[production_dtos.AllListProductionResponseDto, Exception]:
-    cache_key = f"productions:{skip}:{limit}"
-
     try:
-        # Cek data di Redis cache
-        cached_data = None
-        if redis_client:
-            try:
-                cached_data = redis_client.get(cache_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read production cache for key %s: %s", cache_key, cache_error)
-
-        if cached_data:
-            cached_response = json.loads(cached_data)
-            return build(data=production_dtos.AllListProductionResponseDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=cached_response['data']
-            ))
-
         # Query ke database untuk mendapatkan data produksi
         productions = db.execute(
             select(ProductionModel)
@@ -73,25 +56,6 @@ def get_all_productions(
             for production in productions
         ]
 
-        # Save the result to Redis cache
-        cache_data = {
-            'data': [brand.dict() for brand in productions_dto]
-        }
-
-        # # Buat response DTO
-        # response_dto = production_dtos.AllListProductionResponseDto(
-        #     status_code=status.HTTP_200_OK,
-        #     message="All productions retrieved successfully.",
-        #     data=productions_dto
-        # )
-
-        # Simpan hasil ke Redis dengan TTL
-        if redis_client:
-            try:
-                redis_client.setex(cache_key, CACHE_TTL, json.dumps(cache_data, default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write production cache for key %s: %s", cache_key, cache_error)
-
         # Kembalikan response
         return build(data=production_dtos.AllListProductionResponseDto(
             status_code=status.HTTP_200_OK,
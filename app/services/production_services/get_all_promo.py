@@ -1,9 +1,7 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-import json
-import logging
-
 from app.models.product_model import ProductModel
 from app.models.production_model import ProductionModel
 from app.dtos import production_dtos
@@ -11,50 +9,40 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.production_services.support_function import handle_db_error
 from app.utils.result import build, Result
-from app.libs.redis_config import redis_client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import BRANDS, cached
 
 CACHE_TTL = 300
 RESPONSE_MESSAGE = "All promotions retrieved successfully"
 
+@cached(
+    BRANDS,
+    key_fn=lambda skip, limit, **_: ("promotions", skip, limit),
+    ttl=CACHE_TTL,
+    dto=production_dtos.AllProductionPromoResponseDto,
+)
 def get_all_promo(
         db: Session, 
         skip: int = 0, 
         limit: int = 100
     ) -> Result[production_dtos.AllProductionPromoResponseDto, Exception]:
-    cache_key = f"brand_promotions:{skip}:{limit}"
-
     try:
-        # Check Redis cache
-        cached_data = None
-        if redis_client:
-            try:
-                cached_data = redis_client.get(cache_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read promotion cache for key %s: %s", cache_key, cache_error)
-        if cached_data:
-            # Parse JSON from Redis
-            cached_response = json.loads(cached_data)
-            return build(data=production_dtos.AllProductionPromoResponseDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                data=cached_response['data']
-            ))
-
-        # Query database for promotions
-        product_bies = (
-            db.query(ProductionModel)
-            .options(joinedload(ProductionModel.products))  # Eager loading of related products
-            .join(ProductModel)
-            .filter(
-                ProductModel.is_active.is_(True),
-                ProductionModel.products != None  # Only those with associated products
+        # Promo tertinggi per brand dihitung dari kolom agregat products.highest_promo
+        promo_special = func.max(ProductModel.highest_promo).label("promo_special")
+        product_bies = db.execute(
+            select(
+                ProductionModel.id,
+                ProductionModel.name,
+                ProductionModel.photo_url,
+                promo_special,
             )
+            .join(ProductModel, ProductModel.product_by_id == ProductionModel.id)
+            .where(ProductModel.is_active.is_(True))
+            .group_by(ProductionModel.id, ProductionModel.name, ProductionModel.photo_url)
+            .having(func.max(ProductModel.highest_promo) > 0)  # Only those with promo
+            .order_by(ProductionModel.id)
             .offset(skip)
             .limit(limit)
-            .all()
-        )
+        ).all()
 
         if not product_bies:
             return build(data=production_dtos.AllProductionPromoResponseDto(
@@ -66,24 +54,14 @@ def get_all_promo(
         # Convert data to promo DTO
         info_promo = [
             production_dtos.AllProductionPromoDto(
-                id=prod.id,  # UUID to string
+                id=prod.id,
                 name=prod.name,
                 photo_url=prod.photo_url,
                 promo_special=prod.promo_special
             )
-            for prod in product_bies if prod.promo_special > 0  # Only those with promo
+            for prod in product_bies
         ]
 
-        # Save the result to Redis cache
-        cache_data = {
-            'data': [brand.dict() for brand in info_promo]
-        }
-        if redis_client:
-            try:
-                redis_client.setex(cache_key, CACHE_TTL, json.dumps(cache_data))
-            except Exception as cache_error:
-                logger.warning("Failed to write promotion cache for key %s: %s", cache_key, cache_error)
-
         # Return response
         return build(data=production_dtos.AllProductionPromoResponseDto(
             status_code=status.HTTP_200_OK,
@@ -1,11 +1,10 @@
 from fastapi import HTTPException, status
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from typing import Dict, Any
-import json
 
 from app.models.production_model import ProductionModel
 from app.dtos import production_dtos
@@ -14,32 +13,30 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.production_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import BRANDS, cached
+from app.services.record_counts import count_records
 
 
 CACHE_TTL = 300  
 
+@cached(
+    BRANDS,
+    key_fn=lambda skip, limit, **_: ("scroll", skip, limit),
+    ttl=CACHE_TTL,
+    dto=production_dtos.ArticleListScrollResponseDto,
+)
 def get_infinite_scrolling(
         db: Session, 
         skip: int = 0, 
         limit: int = 8
     ) -> Result[Dict[str, Any], Exception]:
-    cache_key = f"productions:{skip}:{limit}"
-
     try:
-        # Cek data di Redis cache
-        cached_data = redis_client.get(cache_key)
-        if cached_data:
-            # Parse JSON dari Redis dan kirim sebagai response
-            cached_response = json.loads(cached_data)
-            return build(data=cached_response)
-        
         # Ambil data produk dengan lazy loading, ambil kolom yang relevan saja
         product_bies = (
             db.execute(
                 select(ProductionModel)
                 .offset(skip)
-                .limit(limit)
+                .limit(limit + 1)
             )
         ).scalars().all()
 
@@ -53,13 +50,16 @@ def get_infinite_scrolling(
                 ).dict()
             )
 
-        # Hitung total_records
-        total_records = db.execute(select(func.count()).select_from(ProductionModel)).scalar()
-
-        # Hitung sisa data
+        # Baris ekstra menentukan has_more secara pasti; jumlah sisa hanya dihitung bila masih ada data
+        has_more = len(product_bies) > limit
+        product_bies = product_bies[:limit]
         displayed_records = skip + len(product_bies)
-        remaining_records = max(total_records - displayed_records, 0)
-        has_more = displayed_records < total_records
+        if has_more:
+            total = count_records(db, ProductionModel, namespace=BRANDS, name="all")
+            remaining_records = max(total.value - displayed_records, 1)
+            is_exact = total.is_exact
+        else:
+            remaining_records, is_exact = 0, True
 
         # Konversi produk menjadi DTO
         productions_dto = [
@@ -78,12 +78,10 @@ def get_infinite_scrolling(
         response_data = production_dtos.ArticleListScrollResponseDto(
             data=productions_dto,
             remaining_records=remaining_records,
-            has_more=has_more
+            has_more=has_more,
+            is_exact=is_exact
         )
 
-        # Simpan data ke Redis (dengan TTL 300 detik)
-        redis_client.setex(cache_key, CACHE_TTL, json.dumps(response_data.dict(), default=custom_json_serializer))
-
         return build(data=response_data)
 
     except SQLAlchemyError as e:
@@ -1,9 +1,8 @@
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, selectinload
 from typing import Dict, Any
-import json
 
 from app.models.production_model import ProductionModel
 from app.dtos import production_dtos
@@ -11,26 +10,26 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.production_services.support_function import handle_db_error
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import BRANDS, cached
+from app.services.record_counts import count_records
 
 
 CACHE_TTL = 300  # Waktu cache dalam detik
 
 
+@cached(
+    BRANDS,
+    key_fn=lambda categories_id, skip, limit, **_: ("by_category", categories_id, skip, limit),
+    ttl=CACHE_TTL,
+    dto=production_dtos.ArticleListScrollResponseDto,
+)
 def get_infinite_scrolling_by_category(
     db: Session, 
     categories_id: int, 
     skip: int = 0, 
     limit: int = 8
 ) -> Result[Dict[str, Any], Exception]:
-    cache_key = f"all_brand_by_categories:{categories_id}:{skip}:{limit}"
-
     try:
-        # Periksa Redis Cache
-        cached_data = redis_client.get(cache_key)
-        if cached_data:
-            return build(data=json.loads(cached_data))
-        
         # Ambil data produk dengan query
         product_bies = (
             db.execute(
@@ -38,7 +37,7 @@ def get_infinite_scrolling_by_category(
                 .options(selectinload(ProductionModel.herbal_category))
                 .where(ProductionModel.herbal_category_id == categories_id)
                 .offset(skip)
-                .limit(limit)
+                .limit(limit + 1)
             )
         ).scalars().all()
 
@@ -52,17 +51,19 @@ def get_infinite_scrolling_by_category(
                 ).dict()
             )
         
-        # Hitung total records tanpa memuat data relasi
-        total_records = db.execute(
-            select(func.count())
-            .select_from(ProductionModel)
-            .where(ProductionModel.herbal_category_id == categories_id)
-        ).scalar()
-        
-        # Hitung sisa data
+        # Baris ekstra menentukan has_more secara pasti; jumlah sisa hanya dihitung bila masih ada data
+        has_more = len(product_bies) > limit
+        product_bies = product_bies[:limit]
         displayed_records = skip + len(product_bies)
-        remaining_records = max(total_records - displayed_records, 0)
-        has_more = displayed_records < total_records
+        if has_more:
+            total = count_records(
+                db, ProductionModel, ProductionModel.herbal_category_id == categories_id,
+                namespace=BRANDS, name=f"category:{categories_id}",
+            )
+            remaining_records = max(total.value - displayed_records, 1)
+            is_exact = total.is_exact
+        else:
+            remaining_records, is_exact = 0, True
 
         # Konversi produk menjadi DTO
         productions_dto = [
@@ -81,12 +82,10 @@ def get_infinite_scrolling_by_category(
         response_data = production_dtos.ArticleListScrollResponseDto(
             data=productions_dto,
             remaining_records=remaining_records,
-            has_more=has_more
+            has_more=has_more,
+            is_exact=is_exact
         )
 
-        # Simpan data ke Redis Cache
-        redis_client.setex(cache_key, CACHE_TTL, json.dumps(response_data.dict(), default=custom_json_serializer))
-
         return build(data=response_data)
 
     except SQLAlchemyError as e:
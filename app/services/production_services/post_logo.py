@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 
 from app.dtos import production_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
-from app.libs.redis_config import redis_client
+from app.libs.cache import BRANDS, BRAND, bump_namespaces
 from app.libs.upload_image_to_supabase import validate_file
 from app.models.production_model import ProductionModel
 from app.services.production_services.support_function import handle_db_error
@@ -210,16 +210,8 @@ async def post_logo(
             photo_url=logo_model.photo_url,
         )
 
-        # Invalidate the cached wishlist for this user
-        patterns_to_invalidate = [
-            f"productions:*",
-            f"all_brand_by_categories:*",
-            f"brand_promotions:*",
-            f"production:{production_id}"
-        ]
-        for pattern in patterns_to_invalidate:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache listing dan detail brand
+        bump_namespaces(BRANDS, (BRAND, production_id))
 
         # return build(data=user_model)
         return build(data=production_dtos.PostLogoCompanyResponseDto(
@@ -1,14 +1,13 @@
 from typing import List
 
-import json
-
 from fastapi import HTTPException, status
 
 from app.utils.rajaongkir_utils import send_get_request
 from app.dtos.rajaongkir_dtos import CityDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.libs.rajaongkir_config import Config
-from app.libs.redis_config import redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
 from app.utils import optional
 
 CACHE_TTL = 3600
@@ -95,9 +94,9 @@ def parse_city_data(cities: List[dict]) -> List[CityDto]:
 def get_city_data(province_id: int) -> optional.Optional[List[CityDto], HTTPException]:
     try:
         cache_key = f"cities:{province_id}"
-        cached_data = redis_client.get(cache_key)
+        cached_data = cache_get(cache_key)
         if cached_data:
-            city_dtos = [CityDto(**city) for city in json.loads(cached_data)]
+            city_dtos = [CityDto(**city) for city in json_codec.loads(cached_data)]
             return optional.build(data=city_dtos)
 
         headers = {'key': Config.RAJAONGKIR_API_KEY}
@@ -107,10 +106,10 @@ def get_city_data(province_id: int) -> optional.Optional[List[CityDto], HTTPExce
         cities = validate_response(response)
         city_dtos = parse_city_data(cities)
 
-        redis_client.setex(
+        cache_setex(
             cache_key,
             CACHE_TTL,
-            json.dumps([city.dict() for city in city_dtos])
+            json_codec.dumps_str([city.dict() for city in city_dtos])
         )
 
         return optional.build(data=city_dtos)
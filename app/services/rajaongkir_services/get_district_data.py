@@ -1,14 +1,13 @@
 from typing import List
 
-import json
-
 from fastapi import HTTPException, status
 
 from app.utils.rajaongkir_utils import send_get_request
 from app.dtos.rajaongkir_dtos import DistrictDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.libs.rajaongkir_config import Config
-from app.libs.redis_config import redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
 from app.utils import optional
 
 CACHE_TTL = 3600
@@ -81,9 +80,9 @@ def parse_district_data(districts: List[dict]) -> List[DistrictDto]:
 def get_district_data(city_id: int) -> optional.Optional[List[DistrictDto], HTTPException]:
     try:
         cache_key = f"districts:{city_id}"
-        cached_data = redis_client.get(cache_key)
+        cached_data = cache_get(cache_key)
         if cached_data:
-            district_dtos = [DistrictDto(**district) for district in json.loads(cached_data)]
+            district_dtos = [DistrictDto(**district) for district in json_codec.loads(cached_data)]
             return optional.build(data=district_dtos)
 
         headers = {'key': Config.RAJAONGKIR_API_KEY}
@@ -93,10 +92,10 @@ def get_district_data(city_id: int) -> optional.Optional[List[DistrictDto], HTTP
         districts = validate_response(response)
         district_dtos = parse_district_data(districts)
 
-        redis_client.setex(
+        cache_setex(
             cache_key,
             CACHE_TTL,
-            json.dumps([district.dict() for district in district_dtos])
+            json_codec.dumps_str([district.dict() for district in district_dtos])
         )
 
         return optional.build(data=district_dtos)
@@ -2,14 +2,13 @@ from typing import List, Optional
 
 from fastapi import HTTPException, status
 
-import json
-
 from app.utils.rajaongkir_utils import send_get_request
 from app.dtos.rajaongkir_dtos import ProvinceDto, AllProvincesResponseCreateDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.libs.rajaongkir_config import Config
-from app.libs.redis_config import redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
 
 from app.utils import optional
 
@@ -108,10 +107,10 @@ def parse_province_data(provinces: List[dict]) -> List[ProvinceDto]:
 def get_province_data() -> optional.Optional[List[ProvinceDto], HTTPException]:
     try:
         # Cek apakah data kota ada di Redis
-        cached_data = redis_client.get("provinces")
+        cached_data = cache_get("provinces")
         if cached_data:
             # Parse data dari Redis
-            province_dtos = [ProvinceDto(**province) for province in json.loads(cached_data)]
+            province_dtos = [ProvinceDto(**province) for province in json_codec.loads(cached_data)]
             return optional.build(data=province_dtos)
         
         headers = {'key': Config.RAJAONGKIR_API_KEY}
@@ -124,10 +123,10 @@ def get_province_data() -> optional.Optional[List[ProvinceDto], HTTPException]:
         province_dtos = parse_province_data(provinces)
 
         # Simpan data di Redis
-        redis_client.setex(
+        cache_setex(
             "provinces",
             CACHE_TTL,
-            json.dumps([province.dict() for province in province_dtos])
+            json_codec.dumps_str([province.dict() for province in province_dtos])
         )
 
         return optional.build(data=province_dtos)
@@ -7,7 +7,7 @@ from app.dtos.rajaongkir_dtos import ShippingCostRequest, ShippingCostDto, Shipp
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.libs.rajaongkir_config import Config
-from app.libs.redis_config import redis_client
+from app.libs.redis_config import cache_get, cache_setex
 
 from app.utils.rajaongkir_utils import send_post_request
 from app.utils import optional
@@ -89,7 +89,7 @@ def get_shipping_cost(request_data: ShippingCostRequest) -> optional.Optional[Sh
 
     try:
         # Cek apakah data tersedia di Redis
-        cached_data = redis_client.get(redis_key)
+        cached_data = cache_get(redis_key)
         if cached_data:
             # Jika data ditemukan, kembalikan dari cache
             return optional.build(data=ShippingCostDto.parse_raw(cached_data))
@@ -112,7 +112,7 @@ def get_shipping_cost(request_data: ShippingCostRequest) -> optional.Optional[Sh
         )
 
         # Simpan data ke Redis dengan TTL (Time To Live)
-        redis_client.setex(redis_key, 3600, shipping_cost_dto.json())  # TTL = 1 jam
+        cache_setex(redis_key, 3600, shipping_cost_dto.json())  # TTL = 1 jam
 
         return optional.build(data=shipping_cost_dto)
 
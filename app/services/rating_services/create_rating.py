@@ -11,8 +11,10 @@ from app.dtos.rating_dtos import RatingCreateOfIdProductDto, RatingCreateDto, Ra
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.rating_services.support_function import handle_db_error
+from app.services.product_services.product_stats import apply_rating_delta
 
 from app.utils.result import build, Result
+from app.libs.cache import PRODUCT, RATINGS, bump_namespaces
 
 def create_rating(
         db: Session, 
@@ -40,14 +42,16 @@ def create_rating(
         rate_instance.product_id = str(rate.product_id)  # Konversi UUID ke string
         rate_instance.user_id = user_id
         db.add(rate_instance)
+        apply_rating_delta(db, rate_instance.product_id, rate_instance.rate, 1)
         db.commit()
         db.refresh(rate_instance)
+        bump_namespaces((RATINGS, user_id), (PRODUCT, rate_instance.product_id))
 
         create_rate_response = RatingInfoCreateDto(
             id=rate_instance.id,
             rate=rate_instance.rate,
             review=rate_instance.review,
-            product_name=rate_instance.product_name,
+            product_name=product.name,
             rater_name=rate_instance.rater_name,
             created_at=rate_instance.created_at
         )
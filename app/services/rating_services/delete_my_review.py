@@ -9,11 +9,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.models.rating_model import RatingModel
+from app.models import loader_profiles
 from app.dtos import rating_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
+from app.services.product_services.product_stats import apply_rating_delta
+
 from app.utils.error_parser import find_errr_from_args
 from app.utils.result import build, Result
+from app.libs.cache import PRODUCT, RATINGS, bump_namespaces
 
 def delete_my_review(
         db: Session, 
@@ -23,6 +27,7 @@ def delete_my_review(
     try:
         rate_model = db.execute(
             select(RatingModel)
+            .options(*loader_profiles.RATING_LINE)
             .where(
                 RatingModel.id == review_id_delete.rating_id,
                 RatingModel.user_id == user_id
@@ -48,7 +53,9 @@ def delete_my_review(
 
         # Simpan perubahan ke dalam database   
         db.delete(rate_model)
+        apply_rating_delta(db, rate_model.product_id, -rate_model.rate, -1)
         db.commit()
+        bump_namespaces((RATINGS, user_id), (PRODUCT, rate_model.product_id))
 
         return build(data=rating_dtos.DeleteReviewResponseDto(
             status_code=status.HTTP_200_OK,
@@ -11,8 +11,11 @@ from app.models.rating_model import RatingModel
 from app.dtos import rating_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
+from app.services.product_services.product_stats import apply_rating_delta
+
 from app.utils.error_parser import find_errr_from_args
 from app.utils.result import build, Result
+from app.libs.cache import PRODUCT, RATINGS, bump_namespaces
 
 def edit_my_review(
         db: Session, 
@@ -39,12 +42,17 @@ def edit_my_review(
                 ).dict()
             ))
         
+        previous_rate = rate_model.rate
         for attr, value in review_update.model_dump().items():
             setattr(rate_model, attr, value)
 
+        if rate_model.rate != previous_rate:
+            apply_rating_delta(db, rate_model.product_id, rate_model.rate - previous_rate, 0)
+
         # Simpan perubahan ke dalam database   
         db.commit()
         db.refresh(rate_model)
+        bump_namespaces((RATINGS, user_id), (PRODUCT, rate_model.product_id))
 
         return build(data=rating_dtos.ReviewInfoUpdateResponseDto(
             status_code=status.HTTP_200_OK,
@@ -4,50 +4,44 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
-import json
-
 from app.models.rating_model import RatingModel
+from app.models import loader_profiles
 from app.dtos.rating_dtos import MyRatingListDto, AllMyRatingListResponseDto
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.services.rating_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import RATINGS, cached
+from app.libs.pagination import keyset_paginate
 
 CACHE_TTL = 3600 
-
+PAGE_KEYS = (RatingModel.created_at, RatingModel.id)
+
+@cached(
+    RATINGS,
+    key_fn=lambda skip, limit, cursor, **_: ("list", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=AllMyRatingListResponseDto,
+)
 def my_rating_list(
         db: Session, 
         user_id: str,  
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> Result[AllMyRatingListResponseDto, Exception]:  # Mengembalikan List DTO
     try:
-        # Redis key for caching
-        redis_key = f"ratinglists:{user_id}:{skip}:{limit}"
-
-        # Check if address data exists in Redis
-        cached_rates = redis_client.get(redis_key)
-        if cached_rates:
-            all_rate_products_dto = [
-                MyRatingListDto(**addr)
-                for addr in json.loads(cached_rates)
-            ]
-
-            return build(data=AllMyRatingListResponseDto(
-                status_code=status.HTTP_200_OK,
-                message="All lists of rating product successfully retrieved (from cache)",
-                data=all_rate_products_dto
-            ))
-
-        # Query untuk mengambil produk berdasarkan product_by_id
-        rate_model = db.execute(
+        # Query untuk mengambil rating milik user dengan pagination keyset, terbaru dulu
+        page = keyset_paginate(
+            db,
             select(RatingModel)
-            .where(RatingModel.user_id == user_id)  # Filter dengan production_id
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
+            .options(*loader_profiles.RATING_LINE)
+            .where(RatingModel.user_id == user_id),
+            PAGE_KEYS, limit, cursor=cursor, skip=skip,
+        )
+        rate_model = page.items
 
         if not rate_model:
             raise HTTPException(
@@ -71,17 +65,13 @@ def my_rating_list(
             for rate_count in rate_model
         ]
 
-        # Cache the data in Redis
-        redis_client.setex(redis_key, CACHE_TTL, json.dumps(
-            [dto.dict() for dto in all_rate_products_dto], 
-            default=custom_json_serializer
-        ))
-
         # return build(data=all_rate_products_dto)
         return build(data=AllMyRatingListResponseDto(
             status_code=status.HTTP_200_OK,
             message="All List of your rating products accessed successfully",
-            data=all_rate_products_dto
+            data=all_rate_products_dto,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor
         ))
 
     # Error SQLAlchemy untuk data yang tidak valid, seperti id tidak ditemukan
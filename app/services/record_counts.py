@@ -0,0 +1,79 @@
+"""
+Jumlah record untuk metadata pagination (`remaining_records`, `total_records`).
+
+Endpoint scroll tidak butuh angka pasti untuk tabel besar, jadi hitungan
+dipilih sesuai ukuran set:
+
+- tabel tanpa filter yang menurut planner PostgreSQL (`pg_class.reltuples`)
+  lebih besar dari `COUNT_ESTIMATE_THRESHOLD` memakai estimasi tersebut,
+  tanpa memindai tabel (`is_exact=False`);
+- selain itu `COUNT(*)` dijalankan sekali lalu disimpan sebagai counter di
+  Redis pada key berversi namespace pemanggil. Write path yang sudah mem-bump
+  namespace itu (misalnya tambah/hapus wishlist, tambah/hapus brand)
+  otomatis membuat counter dihitung ulang, sehingga nilainya tetap pasti.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.libs.cache import versioned_key
+from app.libs.redis_config import cache_get, cache_setex
+
+logger = logging.getLogger(__name__)
+
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", 10000))
+COUNT_CACHE_TTL = int(os.getenv("COUNT_CACHE_TTL", 3600))
+
+
+@dataclass(frozen=True)
+class RecordCount:
+    value: int
+    is_exact: bool
+
+
+def planner_estimate(db: Session, table_name: str) -> Optional[int]:
+    """Estimasi jumlah baris dari statistik planner; None bila bukan PostgreSQL atau tabel belum di-ANALYZE."""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        ).scalar()
+    except Exception as e:
+        logger.warning("Failed to read planner estimate for %s: %s", table_name, e)
+        return None
+    # reltuples bernilai -1 (PostgreSQL 14+) atau 0 sebelum tabel pernah di-VACUUM/ANALYZE
+    return int(estimate) if estimate and estimate > 0 else None
+
+
+def count_records(
+        db: Session,
+        model,
+        *criteria,
+        namespace: str,
+        name: str,
+        scope: Optional[object] = None
+    ) -> RecordCount:
+    """
+    Jumlah baris `model` yang memenuhi `criteria`. `namespace`/`scope` adalah
+    namespace cache yang di-bump oleh write path tabel tersebut; `name`
+    membedakan counter dalam namespace yang sama (misalnya per kategori).
+    """
+    if not criteria:
+        estimate = planner_estimate(db, model.__tablename__)
+        if estimate is not None and estimate > COUNT_ESTIMATE_THRESHOLD:
+            return RecordCount(value=estimate, is_exact=False)
+
+    key = versioned_key(namespace, "count", name, scope=scope)
+    cached = cache_get(key)
+    if cached is not None:
+        return RecordCount(value=int(cached), is_exact=True)
+
+    value = db.execute(select(func.count()).select_from(model).where(*criteria)).scalar() or 0
+    cache_setex(key, COUNT_CACHE_TTL, str(value))
+    return RecordCount(value=value, is_exact=True)
@@ -4,9 +4,6 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
-import json
-import logging
-
 from app.models.shipment_address_model import ShipmentAddressModel
 from app.models.user_model import UserModel
 from app.dtos import shipment_address_dtos
@@ -15,10 +12,10 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
 
 OWNER_SHOP_ID = "9d899cc1-ec4e-4f54-9e3d-89502657db91"  # Constant ID for shop owner
-logger = logging.getLogger(__name__)
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "Origin address accessed successfully"
 
@@ -69,14 +66,9 @@ def accessible_address(
         redis_key = f"origin_address:{target_user_id}"
 
         # Check if product data exists in Redis
-        cached_origin = None
-        if redis_client:
-            try:
-                cached_origin = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read accessible address cache for key %s: %s", redis_key, cache_error)
+        cached_origin = cache_get(redis_key)
         if cached_origin:
-            address_dto = shipment_address_dtos.ShipmentAddressInfoDto(**json.loads(cached_origin))
+            address_dto = shipment_address_dtos.ShipmentAddressInfoDto(**json_codec.loads(cached_origin))
             return build(data=shipment_address_dtos.ShipmentAddressResponseDto(
                 status_code=200,
                 message=RESPONSE_MESSAGE,
@@ -120,11 +112,7 @@ def accessible_address(
             created_at=address_model.created_at
         )
 
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(address_dto.dict(), default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write accessible address cache for key %s: %s", redis_key, cache_error)
+        cache_setex(redis_key, CACHE_TTL, json_codec.dumps_str(address_dto.dict()))
 
         return build(data=shipment_address_dtos.ShipmentAddressResponseDto(
             status_code=status.HTTP_200_OK,
@@ -4,9 +4,6 @@ from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
-import json
-import logging
-
 from app.models.shipment_address_model import ShipmentAddressModel
 from app.dtos import shipment_address_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
@@ -14,9 +11,9 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.cart_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
 
-logger = logging.getLogger(__name__)
 
 CACHE_TTL = 3600
 RESPONSE_MESSAGE = "Shipping address list accessed successfully"
@@ -32,16 +29,11 @@ def my_shipping_address(
         redis_key = f"origin_address:{user_id}:{skip}:{limit}"
 
         # Check if address data exists in Redis
-        cached_address = None
-        if redis_client:
-            try:
-                cached_address = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read shipping address cache for key %s: %s", redis_key, cache_error)
+        cached_address = cache_get(redis_key)
         if cached_address:
             address_dto = [
                 shipment_address_dtos.ShipmentAddressInfoDto(**addr)
-                for addr in json.loads(cached_address)
+                for addr in json_codec.loads(cached_address)
             ]
             return build(data=shipment_address_dtos.AllAddressListResponseDto(
                 status_code=status.HTTP_200_OK,
@@ -82,14 +74,9 @@ def my_shipping_address(
         ]
 
         # Cache the data in Redis
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(
-                    [dto.dict() for dto in address_dto], 
-                    default=custom_json_serializer
-                ))
-            except Exception as cache_error:
-                logger.warning("Failed to write shipping address cache for key %s: %s", redis_key, cache_error)
+        cache_setex(redis_key, CACHE_TTL, json_codec.dumps_str(
+            [dto.dict() for dto in address_dto]
+        ))
 
         # Return the response DTO
         return build(data=shipment_address_dtos.AllAddressListResponseDto(
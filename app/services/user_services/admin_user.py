@@ -3,17 +3,20 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.models import loader_profiles
 from app.models.user_model import UserModel
 from app.dtos import user_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.services.admin_filter_utils import normalize_optional_filter, validate_allowed_filter
 from app.utils import optional
+from app.libs.pagination import keyset_paginate
 
 
 ADMIN_USER_LIST_MESSAGE = "Admin user list accessed successfully"
 ADMIN_USER_DETAIL_MESSAGE = "Admin user detail accessed successfully"
 ADMIN_USER_STATUS_MESSAGE = "Admin user status updated successfully"
 ALLOWED_ADMIN_USER_ROLES = {"admin", "customer"}
+USER_PAGE_KEYS = (UserModel.created_at, UserModel.id)
 
 
 def _to_user_summary(user: UserModel) -> user_dtos.AdminUserInfoDto:
@@ -36,9 +39,10 @@ def list_all_users(
     limit: int = 100,
     role: str | None = None,
     is_active: bool | None = None,
+    cursor: str | None = None,
 ):
     try:
-        stmt = select(UserModel)
+        stmt = select(UserModel).options(*loader_profiles.ADMIN_USER_SUMMARY)
 
         normalized_role = validate_allowed_filter(
             value=role,
@@ -51,11 +55,9 @@ def list_all_users(
         if is_active is not None:
             stmt = stmt.where(UserModel.is_active == is_active)
 
-        user_models = db.execute(
-            stmt.order_by(UserModel.created_at.desc()).offset(skip).limit(limit)
-        ).scalars().all()
+        page = keyset_paginate(db, stmt, USER_PAGE_KEYS, limit, cursor=cursor, skip=skip)
 
-        user_items = [_to_user_summary(user) for user in user_models]
+        user_items = [_to_user_summary(user) for user in page.items]
 
         return optional.build(data=user_dtos.AdminUserListResponseDto(
             status_code=status.HTTP_200_OK,
@@ -65,6 +67,8 @@ def list_all_users(
                 skip=skip,
                 limit=limit,
                 count=len(user_items),
+                has_more=page.has_more,
+                next_cursor=page.next_cursor,
             ),
         ))
 
@@ -82,7 +86,9 @@ def list_all_users(
 def get_user_detail_admin(db: Session, user_id: str):
     try:
         user = db.execute(
-            select(UserModel).where(UserModel.id == user_id)
+            select(UserModel)
+            .options(*loader_profiles.ADMIN_USER_SUMMARY)
+            .where(UserModel.id == user_id)
         ).scalars().first()
 
         if not user:
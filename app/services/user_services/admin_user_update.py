@@ -7,7 +7,7 @@ from app.dtos import user_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 from app.models.user_model import UserModel
 from app.utils import optional
-from app.libs.redis_config import redis_client
+from app.libs.cache import USER, bump_namespaces
 
 
 ADMIN_USER_UPDATE_MESSAGE = "Admin user updated successfully"
@@ -38,13 +38,7 @@ def update_user_profile_admin(db: Session, user_id: str, payload: user_dtos.Admi
         db.commit()
         db.refresh(user)
 
-        try:
-            if redis_client:
-                redis_client.delete(f"user:{user_id}")
-                for key in redis_client.scan_iter(f"user:{user_id}:*"):
-                    redis_client.delete(key)
-        except Exception:
-            pass
+        bump_namespaces((USER, user_id))
 
         return optional.build(data=user_dtos.AdminUserEditResponseDto(
             status_code=status.HTTP_200_OK,
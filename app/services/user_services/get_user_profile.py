@@ -4,11 +4,9 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-import json
-import logging
-
 from fastapi import HTTPException, status
 
+from app.models import loader_profiles
 from app.models.user_model import UserModel
 from app.dtos import user_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
@@ -16,9 +14,10 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 from app.utils import optional
 from app.utils.result import build, Result
 
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs import json_codec
+from app.libs.redis_config import cache_get, cache_setex
+from app.libs.cache import USER, versioned_key
 
-logger = logging.getLogger(__name__)
 
 CACHE_TTL = 300
 RESPONSE_MESSAGE = "User profile retrieved successfully."
@@ -29,17 +28,12 @@ def get_user_profile(
     ) -> optional.Optional[Type[UserModel], HTTPException]:
     try:
         # Redis key for caching
-        redis_key = f"user:{user_id}"
+        redis_key = versioned_key(USER, "profile", scope=user_id)
 
         # Check if product data exists in Redis
-        cached_user = None
-        if redis_client:
-            try:
-                cached_user = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read user profile cache for key %s: %s", redis_key, cache_error)
+        cached_user = cache_get(redis_key)
         if cached_user:
-            user_response = user_dtos.UserCreateResponseDto(**json.loads(cached_user))
+            user_response = user_dtos.UserCreateResponseDto(**json_codec.loads(cached_user))
             return build(data=user_dtos.UserResponseDto(
                 status_code=200,
                 message=RESPONSE_MESSAGE,
@@ -50,7 +44,8 @@ def get_user_profile(
         #     .filter(UserModel.id == user_id).first()
         
         user_model: Type[UserModel] = db.execute(
-           select(UserModel) 
+           select(UserModel)
+           .options(*loader_profiles.ADMIN_USER_SUMMARY)
            .filter(UserModel.id == user_id)
         ).scalars().first()
 
@@ -81,11 +76,7 @@ def get_user_profile(
             updated_at=user_model.updated_at,
         )
 
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(user_response.model_dump(), default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write user profile cache for key %s: %s", redis_key, cache_error)
+        cache_setex(redis_key, CACHE_TTL, json_codec.dumps_str(user_response.model_dump()))
 
         return optional.build(data=user_dtos.UserResponseDto(
             status_code=200,
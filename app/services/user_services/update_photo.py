@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.dtos import user_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
-from app.libs.redis_config import custom_json_serializer, redis_client
+from app.libs.cache import USER, bump_namespaces
 from app.libs.upload_image_to_supabase import upload_image_to_supabase, validate_file
 from app.models.user_model import UserModel
 from app.utils.result import build, Result
@@ -70,10 +70,8 @@ async def update_my_photo(
             photo_url=user_model.photo_url,
         )
 
-        # Invalidate the cached wishlist for this user
-        keys_to_invalidate = redis_client.scan_iter(f"user:{user_id}:*")
-        for key in keys_to_invalidate:
-            redis_client.delete(key)
+        # Invalidasi cache profil user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((USER, user_id))
 
         # return build(data=user_model)
         return build(data=user_dtos.UserEditPhotoProfileResponseDto(
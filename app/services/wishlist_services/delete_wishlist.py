@@ -10,7 +10,7 @@ from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.utils.error_parser import find_errr_from_args
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client  # Redis client
+from app.libs.cache import WISHLIST, bump_namespaces
 
 
 def delete_wishlist(
@@ -47,14 +47,8 @@ def delete_wishlist(
         db.delete(wishlist_model)
         db.commit()
 
-        # Invalidate the cached wishlist for this user
-        patterns_to_invalidate = [
-            f"wishlist:{user_id}:*",
-            f"wishlists:{user_id}"
-        ]
-        for pattern in patterns_to_invalidate:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache wishlist user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((WISHLIST, user_id))
         
         return build(data=wishlist_dtos.DeleteWishlistResponseDto(
             status_code=status.HTTP_200_OK,
@@ -1,6 +1,6 @@
 from fastapi import HTTPException, status
 
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError, DataError, IntegrityError
 
@@ -12,50 +12,36 @@ from app.services.cart_services.support_function import handle_db_error
 
 from app.utils.result import build, Result
 
-import json
-import logging
-
-from app.libs.redis_config import custom_json_serializer, redis_client  # Redis client
-
-logger = logging.getLogger(__name__)
+from app.libs.cache import WISHLIST, cached
+from app.libs.pagination import keyset_paginate
+from app.services.record_counts import count_records
 
 CACHE_TTL = 300
 RESPONSE_MESSAGE = "Wishlist accessed successfully"
-
+PAGE_KEYS = (WishlistModel.created_at, WishlistModel.id)
+
+@cached(
+    WISHLIST,
+    key_fn=lambda skip, limit, cursor, **_: ("items", skip, limit, cursor or ""),
+    scope=lambda user_id, **_: user_id,
+    ttl=CACHE_TTL,
+    dto=wishlist_dtos.AllWishlistResponseCreateDto,
+)
 def my_wishlist(
         db: Session, 
         user_id: str,  
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> Result[wishlist_dtos.AllWishlistResponseCreateDto, Exception]:
     try:
-        # Redis key for caching
-        redis_key = f"wishlist:{user_id}:{skip}:{limit}"
-
-        # Check if wishlist data exists in Redis
-        cached_wishlist = None
-        if redis_client:
-            try:
-                cached_wishlist = redis_client.get(redis_key)
-            except Exception as cache_error:
-                logger.warning("Failed to read wishlist cache for key %s: %s", redis_key, cache_error)
-        if cached_wishlist:
-            # Data is found in cache, return it
-            wishlist_data = json.loads(cached_wishlist)
-            return build(data=wishlist_dtos.AllWishlistResponseCreateDto(
-                status_code=status.HTTP_200_OK,
-                message=RESPONSE_MESSAGE,
-                total_records=wishlist_data['total_records'],
-                data=wishlist_data['data']
-            ))
-
-        # Query untuk mengambil wishlist berdasarkan user_id dengan pagination
-        wishlist_model = db.execute(
-            select(WishlistModel)
-            .where(WishlistModel.customer_id == user_id)
-            .offset(skip)
-            .limit(limit)
-        ).scalars().all()
+        # Query untuk mengambil wishlist berdasarkan user_id dengan pagination keyset, terbaru dulu
+        page = keyset_paginate(
+            db,
+            select(WishlistModel).where(WishlistModel.customer_id == user_id),
+            PAGE_KEYS, limit, cursor=cursor, skip=skip,
+        )
+        wishlist_model = page.items
 
         if not wishlist_model:
             return build(data=wishlist_dtos.AllWishlistResponseCreateDto(
@@ -65,14 +51,16 @@ def my_wishlist(
                 data=[]
             ))
 
-        # Hitung total_records
-        total_records = db.execute(
-            select(func.count())
-            .select_from(WishlistModel)
-            .where(
-                WishlistModel.customer_id == user_id
+        # Halaman offset terakhir sudah memberi jumlah pasti tanpa COUNT
+        if not page.has_more and not cursor:
+            total_records, is_exact = skip + len(wishlist_model), True
+        else:
+            # Counter ikut di-refresh saat namespace wishlist user di-bump oleh tambah/hapus wishlist
+            count = count_records(
+                db, WishlistModel, WishlistModel.customer_id == user_id,
+                namespace=WISHLIST, scope=user_id, name="items",
             )
-        ).scalar()
+            total_records, is_exact = count.value, count.is_exact
 
         # Konversi wishlist menjadi DTO
         wishlist_dto = [
@@ -85,23 +73,15 @@ def my_wishlist(
             for wish in wishlist_model
         ]
 
-        # Save the result to Redis cache
-        cache_data = {
-            'total_records': total_records,
-            'data': [wish.model_dump() for wish in wishlist_dto]
-        }
-        if redis_client:
-            try:
-                redis_client.setex(redis_key, CACHE_TTL, json.dumps(cache_data, default=custom_json_serializer))
-            except Exception as cache_error:
-                logger.warning("Failed to write wishlist cache for key %s: %s", redis_key, cache_error)
-
         # Return DTO with success message
         return build(data=wishlist_dtos.AllWishlistResponseCreateDto(
             status_code=status.HTTP_200_OK,
             message=RESPONSE_MESSAGE,
             total_records=total_records,
-            data=wishlist_dto
+            is_exact=is_exact,
+            data=wishlist_dto,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor
         ))
 
     except IntegrityError as ie:
@@ -11,7 +11,7 @@ from app.dtos import wishlist_dtos
 from app.dtos.error_response_dtos import ErrorResponseDto
 
 from app.utils.result import build, Result
-from app.libs.redis_config import custom_json_serializer, redis_client  # Redis client
+from app.libs.cache import WISHLIST, bump_namespaces
 
 
 def post_wishlist(
@@ -52,14 +52,8 @@ def post_wishlist(
             created_at=wishlist_instance.created_at
         )
 
-        # Invalidate the cached wishlist for this user
-        patterns_to_invalidate = [
-            f"wishlist:{user_id}:*",
-            f"wishlists:{user_id}"
-        ]
-        for pattern in patterns_to_invalidate:
-            for key in redis_client.scan_iter(pattern):
-                redis_client.delete(key)
+        # Invalidasi cache wishlist user: satu INCR, key lama habis oleh TTL
+        bump_namespaces((WISHLIST, user_id))
         
         return build(data=wishlist_dtos.WishlistResponseCreateDto(
             status_code=201,
@@ -0,0 +1,32 @@
+"""
+Hitung ulang kolom agregat produk (rating, rentang harga varian, promo).
+
+Jalankan sekali setelah migrasi 6300e7deaf37, atau kapan pun agregat
+dicurigai tidak sinkron:
+
+    poetry run python -m app.utils.backfill_product_stats
+"""
+import logging
+
+from app.libs.sql_alchemy_lib import session_local
+from app.services.product_services.product_stats import backfill_product_stats
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    db = session_local()
+    try:
+        updated = backfill_product_stats(db)
+        db.commit()
+        logger.info("Product aggregate columns backfilled for %s products.", updated)
+        print(f"Backfilled aggregate columns for {updated} products.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
 import logging
+import os
+from datetime import datetime
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.libs.sql_alchemy_lib import session_local
+from app.services.cache_warmup import warm_catalog_cache
 from app.services.user_services import delete_unverified_users
+from app.services.product_services.product_autocomplete import build_autocomplete_index
 
 logger = logging.getLogger(__name__)
 scheduler = None
 
+AUTOCOMPLETE_REFRESH_MINUTES = int(os.getenv("AUTOCOMPLETE_REFRESH_MINUTES", 10))
+CACHE_WARM_INTERVAL_MINUTES = int(os.getenv("CACHE_WARM_INTERVAL_MINUTES", 15))
+
 
 def _cleanup_unverified_users():
     db = session_local()
@@ -17,6 +24,27 @@ def _cleanup_unverified_users():
         db.close()
 
 
+def refresh_autocomplete_index():
+    db = session_local()
+    try:
+        total = build_autocomplete_index(db)
+        logger.info("Autocomplete index rebuilt with %s products.", total)
+    except Exception as e:
+        # Endpoint autocomplete akan membangun indeks saat dipanggil pertama kali
+        logger.warning("Failed to rebuild autocomplete index: %s", e)
+    finally:
+        db.close()
+
+
+def warm_cache():
+    try:
+        summary = warm_catalog_cache()
+        logger.info("Catalog cache warm-up finished: %s", summary)
+    except Exception as e:
+        # Cache yang dingin hanya memperlambat request pertama, bukan menggagalkannya
+        logger.warning("Catalog cache warm-up failed: %s", e)
+
+
 def start_scheduler():
     global scheduler
 
@@ -35,6 +63,25 @@ def start_scheduler():
         id='cleanup_unverified_users',
         replace_existing=True,
     )
+    # Setiap worker memegang indeks sendiri; rebuild berkala menyusulkan perubahan dari worker lain
+    scheduler.add_job(
+        func=refresh_autocomplete_index,
+        trigger='interval',
+        minutes=AUTOCOMPLETE_REFRESH_MINUTES,
+        id='refresh_autocomplete_index',
+        replace_existing=True,
+    )
+    # Jalan sekali saat startup (di thread scheduler, tidak menahan startup) lalu berkala
+    scheduler.add_job(
+        func=warm_cache,
+        trigger='interval',
+        minutes=CACHE_WARM_INTERVAL_MINUTES,
+        next_run_time=datetime.now(),
+        id='warm_catalog_cache',
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+    )
     scheduler.start()
     logger.info("Scheduler started.")
     return scheduler
@@ -0,0 +1,92 @@
+"""
+Bandingkan requests/sec service sync (`def` + get_db) dan service async
+(`async def` + get_async_db) untuk `/product/all`, `/cart/my-cart` dan
+`/order/my-order` pada satu worker.
+
+Jalankan terhadap database yang berisi data uji:
+
+    poetry run python -m benchmarks.async_db_benchmark --user-id <uuid> --requests 500 --concurrency 50
+
+Cache Redis dimatikan selama benchmark supaya setiap request benar-benar ke
+database. Jalur async memanggil service yang sama dengan route aplikasi
+(`all_product_async`, `my_cart_async`, `my_order_async`), yang menjalankan
+query lewat `AsyncSession` dan panggilan Redis-nya di threadpool.
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.libs import redis_config
+from app.libs.sql_alchemy_lib import get_async_db, get_async_read_db, get_db, get_read_db
+from app.services import cart_services, order_services, product_services
+
+
+def build_app(user_id: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync/product/all")
+    def sync_all_product(db: Session = Depends(get_read_db)):
+        return product_services.all_product(db).unwrap()
+
+    @app.get("/async/product/all")
+    async def async_all_product(db: AsyncSession = Depends(get_async_read_db)):
+        return (await product_services.all_product_async(db)).unwrap()
+
+    @app.get("/sync/cart/my-cart")
+    def sync_my_cart(db: Session = Depends(get_db)):
+        return cart_services.my_cart(db, user_id).unwrap()
+
+    @app.get("/async/cart/my-cart")
+    async def async_my_cart(db: AsyncSession = Depends(get_async_db)):
+        return (await cart_services.my_cart_async(db, user_id)).unwrap()
+
+    @app.get("/sync/order/my-order")
+    def sync_my_order(db: Session = Depends(get_db)):
+        return order_services.my_order(db, user_id).unwrap()
+
+    @app.get("/async/order/my-order")
+    async def async_my_order(db: AsyncSession = Depends(get_async_db)):
+        return (await order_services.my_order_async(db, user_id)).unwrap()
+
+    return app
+
+
+async def run_case(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_request():
+        async with semaphore:
+            response = await client.get(path)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace):
+    # Bandingkan jalur database, bukan cache
+    redis_config.redis_client = None
+
+    transport = httpx.ASGITransport(app=build_app(args.user_id))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'endpoint':<20}{'sync req/s':>14}{'async req/s':>14}")
+        for endpoint in ("/product/all", "/cart/my-cart", "/order/my-order"):
+            await client.get(f"/sync{endpoint}")
+            await client.get(f"/async{endpoint}")
+            sync_rps = await run_case(client, f"/sync{endpoint}", args.requests, args.concurrency)
+            async_rps = await run_case(client, f"/async{endpoint}", args.requests, args.concurrency)
+            print(f"{endpoint:<20}{sync_rps:>14.1f}{async_rps:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", required=True, help="ID user pemilik cart dan order untuk /cart/my-cart dan /order/my-order")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
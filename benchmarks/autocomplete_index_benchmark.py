@@ -0,0 +1,80 @@
+"""
+Ukur latensi `ProductAutocompleteIndex.suggest` (p50/p99) pada 10k dan
+100k produk sintetis, termasuk biaya build dan upsert inkremental.
+
+Benchmark tidak memakai database:
+
+    poetry run python -m benchmarks.autocomplete_index_benchmark --sizes 10000 100000 --lookups 20000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.product_services.product_autocomplete import AutocompleteEntry, ProductAutocompleteIndex
+
+WORDS = [
+    "jahe", "merah", "kunyit", "asam", "beras", "kencur", "temulawak", "sereh", "kayu", "manis",
+    "madu", "hutan", "teh", "hijau", "sirih", "daun", "kelor", "habbatussauda", "pegagan", "secang",
+]
+BRANDS = ["Amimum", "Sido Muncul", "Jamu Jago", "Nyonya Meneer", "Herbal Nusantara", "Air Mancur"]
+
+
+def make_entries(total: int, rng: random.Random):
+    return [
+        AutocompleteEntry(
+            product_id=f"product-{index:07d}",
+            name=" ".join(rng.sample(WORDS, 3)) + f" {index}",
+            brand_id=index % len(BRANDS),
+            brand_name=BRANDS[index % len(BRANDS)],
+        )
+        for index in range(total)
+    ]
+
+
+def percentile(samples, ratio: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def run(total: int, lookups: int, rng: random.Random):
+    entries = make_entries(total, rng)
+    index = ProductAutocompleteIndex()
+
+    started = time.perf_counter()
+    index.rebuild(entries)
+    build_seconds = time.perf_counter() - started
+
+    prefixes = [rng.choice(WORDS + BRANDS)[: rng.randint(1, 6)] for _ in range(lookups)]
+    samples = []
+    for prefix in prefixes:
+        started = time.perf_counter_ns()
+        index.suggest(prefix, 10)
+        samples.append((time.perf_counter_ns() - started) / 1000)
+
+    upserts = []
+    for entry in rng.sample(entries, min(1000, total)):
+        started = time.perf_counter_ns()
+        index.upsert(AutocompleteEntry(entry.product_id, entry.name + " baru", entry.brand_id, entry.brand_name))
+        upserts.append((time.perf_counter_ns() - started) / 1000)
+
+    print(
+        f"{total:>7} produk | build {build_seconds:6.2f} s | suggest p50 {statistics.median(samples):7.1f} µs "
+        f"p99 {percentile(samples, 0.99):7.1f} µs | upsert p99 {percentile(upserts, 0.99):8.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for total in args.sizes:
+        run(total, args.lookups, rng)
+
+
+if __name__ == "__main__":
+    main()
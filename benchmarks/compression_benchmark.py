@@ -0,0 +1,105 @@
+"""
+Ukur byte yang dikirim dan waktu CPU server per request untuk halaman
+listing 100 produk: tanpa kompresi, dikompresi `CompressionMiddleware`
+per request, dan hit cache (`CachedJSONResponse`) yang memakai varian
+terkompresi tersimpan.
+
+Aplikasi dipanggil langsung lewat ASGI (tanpa HTTP client) agar CPU yang
+terukur hanya sisi server, termasuk middleware:
+
+    poetry run python -m benchmarks.compression_benchmark --products 100 --requests 300
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI, Response
+
+from app.libs.cache.responses import CachedBody, CachedJSONResponse
+from app.libs.compression import SUPPORTED_ENCODINGS, CompressionMiddleware
+from benchmarks.two_tier_cache_benchmark import make_listing
+
+
+def build_app(body: bytes) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+    # Satu entri cache dipakai ulang oleh semua request, seperti entri L1 yang panas
+    cached_body = CachedBody(body)
+
+    @app.get("/fresh")
+    def fresh():
+        return Response(body, media_type="application/json")
+
+    @app.get("/cached")
+    def cached():
+        return CachedJSONResponse(cached_body)
+
+    return app
+
+
+async def call(app, path: str, accept_encoding: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return sent
+
+
+async def measure(app, path: str, accept_encoding: str, requests: int):
+    await call(app, path, accept_encoding)  # pemanasan: routing + varian pertama
+    cpu_samples, sizes = [], set()
+    for _ in range(requests):
+        started = time.process_time()
+        sizes.add(await call(app, path, accept_encoding))
+        cpu_samples.append(time.process_time() - started)
+    return statistics.mean(cpu_samples) * 1_000_000, sorted(sizes)
+
+
+async def run(args):
+    body = make_listing(args.products, args.variants).model_dump_json().encode()
+    app = build_app(body)
+    print(f"uncompressed body: {len(body)} bytes")
+
+    scenarios = [("identity", "/fresh", "identity")]
+    for encoding in SUPPORTED_ENCODINGS:
+        scenarios.append((f"{encoding} per request", "/fresh", encoding))
+        scenarios.append((f"{encoding} precompressed", "/cached", encoding))
+
+    for label, path, accept_encoding in scenarios:
+        cpu, sizes = await measure(app, path, accept_encoding, args.requests)
+        print(f"{label:22}: {cpu:9.1f} us CPU/request, {sizes} bytes on the wire")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
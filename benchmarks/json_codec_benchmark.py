@@ -0,0 +1,105 @@
+"""
+Bandingkan waktu encode dan decode JSON stdlib vs `app.libs.json_codec`
+(orjson) untuk response terbesar: listing produk, riwayat order user dan
+daftar order admin.
+
+Per payload diukur tiga jalur:
+- render response: dict hasil `response_model` (mode JSON) menjadi body,
+  seperti `JSONResponse.render` lama vs `ORJSONResponse.render`
+- encode cache: `model_dump()` menjadi string Redis (`json.dumps` dengan
+  serializer kustom lama vs `json_codec.dumps_str`)
+- decode cache: string Redis kembali menjadi dict (`json.loads` vs `json_codec.loads`)
+
+    poetry run python -m benchmarks.json_codec_benchmark --products 100 --orders 100 --repeat 200
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+
+from app.dtos.order_dtos import GetOrderInfoDto, GetOrderInfoResponseDto
+from app.dtos.order_item_dtos import OrderItemDto
+from app.libs import json_codec
+from benchmarks.two_tier_cache_benchmark import make_listing
+
+
+def legacy_serializer(obj):
+    # Serializer cache sebelum json_codec (dulu `redis_config.custom_json_serializer`)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def stdlib_render(content) -> bytes:
+    # Sama dengan starlette.responses.JSONResponse.render
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def make_orders(total_orders: int, items: int, customer_name=None) -> GetOrderInfoResponseDto:
+    now = datetime(2026, 1, 1, 8, 30)
+    return GetOrderInfoResponseDto(
+        data=[
+            GetOrderInfoDto(
+                id=f"order-{index:06d}",
+                status="paid",
+                total_price=125000.0,
+                shipment_id=f"shipment-{index:06d}",
+                delivery_type="delivery",
+                notes="Tolong dikemas rapi",
+                customer_name=customer_name,
+                created_at=now,
+                shipping_cost=18000.0,
+                order_item_lists=[
+                    OrderItemDto(
+                        id=index * 10 + item, product_name=f"Jamu Herbal {item}", variant_product="Botol 250ml",
+                        variant_discount=10.0, quantity=2, price_per_item=25000.0, total_price=50000.0,
+                        created_at=now,
+                    )
+                    for item in range(items)
+                ],
+            )
+            for index in range(total_orders)
+        ],
+    )
+
+
+def per_call_us(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=repeat, repeat=3)) / repeat * 1_000_000
+
+
+def report(label: str, dto, repeat: int) -> None:
+    content = dto.model_dump(mode="json")
+    python_content = dto.model_dump()
+    stored = json.dumps(python_content, default=legacy_serializer)
+    assert json.loads(json_codec.dumps(content)) == json.loads(stdlib_render(content))
+
+    rows = [
+        ("render response", lambda: stdlib_render(content), lambda: json_codec.dumps(content)),
+        ("encode cache", lambda: json.dumps(python_content, default=legacy_serializer), lambda: json_codec.dumps_str(python_content)),
+        ("decode cache", lambda: json.loads(stored), lambda: json_codec.loads(stored)),
+    ]
+    print(f"{label} ({len(stored)} bytes)")
+    for name, stdlib_call, orjson_call in rows:
+        stdlib_us = per_call_us(stdlib_call, repeat)
+        orjson_us = per_call_us(orjson_call, repeat)
+        print(f"  {name:16}: stdlib {stdlib_us:9.1f} us, orjson {orjson_us:9.1f} us, {stdlib_us / orjson_us:5.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--orders", type=int, default=100)
+    parser.add_argument("--items", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    report("product list", make_listing(args.products, args.variants), args.repeat)
+    report("order history", make_orders(args.orders, args.items), args.repeat)
+    report("admin order list", make_orders(args.orders, args.items, customer_name="Budi Santoso"), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Bandingkan biaya mapping kartu produk per produk antara jalur entity
+(`ProductModel` + `all_variants` + validasi `AllProductInfoDTO`) dan read
+model proyeksi kolom (`product_card_read_model`).
+
+Benchmark memakai SQLite in-memory sehingga tidak butuh database aplikasi:
+
+    poetry run python -m benchmarks.product_card_mapping_benchmark --products 100 --variants 3 --rounds 50
+"""
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.dtos.product_dtos import AllProductInfoDTO
+from app.libs.sql_alchemy_lib import Base
+from app.models import loader_profiles
+from app.services.product_services.product_card_read_model import build_product_cards, product_card_query
+
+
+def seed(session, total_products: int, variants_per_product: int):
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Brand", herbal_category_id=category.id))
+    for index in range(total_products):
+        product_id = f"product-{index:06d}"
+        session.add(models.ProductModel(
+            id=product_id, name=f"Jamu {index}", weight=100, price=10000, product_by_id=1,
+            description="Deskripsi panjang\n" * 40, instruction="Aturan pakai\n" * 20,
+        ))
+        for variant in range(variants_per_product):
+            session.add(models.PackTypeModel(
+                product_id=product_id, name=f"Varian {variant}", min_amount=1, stock=10,
+                price=10000 + variant * 1000, discount=10 if variant == 0 else None,
+            ))
+    session.commit()
+
+
+def entity_cards(session):
+    products = session.execute(
+        select(models.ProductModel).options(*loader_profiles.PRODUCT_CARD)
+    ).scalars().all()
+    return [
+        AllProductInfoDTO(
+            id=product.id,
+            name=product.name,
+            price=float(product.price),
+            min_variant_price=product.min_variant_price,
+            max_variant_price=product.max_variant_price,
+            brand_info=product.brand_info,
+            all_variants=product.all_variants or [],
+            created_at=product.created_at,
+        )
+        for product in products
+    ]
+
+
+def projection_cards(session):
+    return build_product_cards(session, session.execute(product_card_query()).all())
+
+
+def measure(session_factory, build, rounds: int, total_products: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        with session_factory() as session:
+            started = time.perf_counter()
+            cards = build(session)
+            samples.append((time.perf_counter() - started) / len(cards))
+    assert len(cards) == total_products
+    return statistics.median(samples) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        seed(session, args.products, args.variants)
+
+    before = measure(session_factory, entity_cards, args.rounds, args.products)
+    after = measure(session_factory, projection_cards, args.rounds, args.products)
+    print(f"entity + validate     : {before:8.1f} us/product")
+    print(f"projection + construct: {after:8.1f} us/product ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
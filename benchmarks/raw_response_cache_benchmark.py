@@ -0,0 +1,79 @@
+"""
+Ukur waktu CPU per request untuk hit cache halaman katalog 100 produk:
+jalur DTO (decode JSON + validasi `AllProductInfoResponseDto` + serialisasi
+ulang `response_model` oleh FastAPI) dibanding jalur raw (`CachedJSONResponse`
+berisi body tersimpan).
+
+Kedua endpoint dilayani aplikasi FastAPI kecil lewat `TestClient` dengan
+Redis in-memory dan L1 dimatikan, sehingga yang diukur hanya jalur hit Redis:
+
+    poetry run python -m benchmarks.raw_response_cache_benchmark --products 100 --requests 500
+"""
+import argparse
+import statistics
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.dtos.product_dtos import AllProductInfoResponseDto
+from app.libs import redis_config
+from app.libs.cache import CATALOG, cached, invalidation_listener
+from app.utils.result import build
+from benchmarks.two_tier_cache_benchmark import SimulatedRedis, make_listing
+
+
+def build_app(listing: AllProductInfoResponseDto) -> FastAPI:
+    app = FastAPI()
+
+    @cached(CATALOG, key_fn=lambda **_: ("bench-dto",), ttl=600, dto=AllProductInfoResponseDto, raw_response=False)
+    def dto_listing(db):
+        return build(data=listing)
+
+    @cached(CATALOG, key_fn=lambda **_: ("bench-raw",), ttl=600, dto=AllProductInfoResponseDto, raw_response=True)
+    def raw_listing(db):
+        return build(data=listing)
+
+    @app.get("/dto", response_model=AllProductInfoResponseDto)
+    def read_dto():
+        return dto_listing(None).unwrap()
+
+    @app.get("/raw", response_model=AllProductInfoResponseDto)
+    def read_raw():
+        return raw_listing(None).unwrap()
+
+    return app
+
+
+def measure(client: TestClient, path: str, requests: int):
+    client.get(path)  # miss: isi cache
+    cpu_samples, bodies = [], set()
+    for _ in range(requests):
+        started = time.process_time()
+        response = client.get(path)
+        cpu_samples.append(time.process_time() - started)
+        bodies.add(len(response.content))
+    return statistics.mean(cpu_samples) * 1_000_000, bodies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    redis_config.redis_client = SimulatedRedis(rtt_seconds=0)
+    invalidation_listener.connected = False
+
+    client = TestClient(build_app(make_listing(args.products, args.variants)))
+    dto_cpu, dto_sizes = measure(client, "/dto", args.requests)
+    raw_cpu, raw_sizes = measure(client, "/raw", args.requests)
+
+    print(f"DTO hit (decode + validate + serialize): {dto_cpu:9.1f} us CPU/request, body {sorted(dto_sizes)} bytes")
+    print(f"raw hit (stored bytes)                 : {raw_cpu:9.1f} us CPU/request, body {sorted(raw_sizes)} bytes")
+    print(f"speedup                                : {dto_cpu / raw_cpu:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Ukur penghematan cache L1 in-process di depan Redis untuk listing katalog
+(`AllProductInfoResponseDto` berisi N kartu produk): jumlah round trip
+Redis, waktu decode JSON + validasi DTO, dan latensi per request.
+
+Tanpa `--redis-url` benchmark memakai klien Redis in-memory dengan RTT
+simulasi (`--rtt-us`); dengan `--redis-url` round trip-nya nyata:
+
+    poetry run python -m benchmarks.two_tier_cache_benchmark --products 100 --requests 5000 --rtt-us 300
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from app.dtos.product_dtos import AllProductInfoDTO, AllProductInfoResponseDto
+from app.dtos.pack_type_dtos import VariantAllProductDto
+from app.libs import redis_config
+from app.libs.cache import CATALOG, cached, decode_payload, encode_payload, invalidation_listener, local_cache
+from app.utils.result import build
+
+
+class SimulatedRedis:
+    def __init__(self, rtt_seconds: float):
+        self.rtt_seconds = rtt_seconds
+        self.store = {}
+        self.round_trips = 0
+
+    def _round_trip(self):
+        self.round_trips += 1
+        if self.rtt_seconds:
+            deadline = time.perf_counter() + self.rtt_seconds
+            while time.perf_counter() < deadline:
+                pass
+
+    def get(self, key):
+        self._round_trip()
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self._round_trip()
+        self.store[key] = value
+
+
+class CountingRedis:
+    def __init__(self, client):
+        self.client = client
+        self.round_trips = 0
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.client.get(key)
+
+    def setex(self, key, ttl, value):
+        self.round_trips += 1
+        return self.client.setex(key, ttl, value)
+
+
+def make_listing(total_products: int, variants: int) -> AllProductInfoResponseDto:
+    now = datetime(2026, 1, 1)
+    return AllProductInfoResponseDto(
+        status_code=200,
+        message="All List product can accessed successfully",
+        data=[
+            AllProductInfoDTO(
+                id=f"product-{index:06d}",
+                name=f"Jamu Herbal {index}",
+                price=10000.0,
+                min_variant_price=9000.0,
+                max_variant_price=12000.0,
+                brand_info={"id": 1, "name": "Brand", "photo_url": "https://cdn.example/brand.png"},
+                primary_image_url=f"https://cdn.example/{index}.png",
+                gallery_images=[{"id": 1, "image_url": f"https://cdn.example/{index}-1.png", "is_primary": True}],
+                all_variants=[
+                    VariantAllProductDto(
+                        id=index * 10 + variant, product_id=f"product-{index:06d}", name=f"Varian {variant}",
+                        stock=10, price=10000.0 + variant * 1000, discount=10.0, discounted_price=9000.0,
+                        updated_at=now,
+                    )
+                    for variant in range(variants)
+                ],
+                created_at=now,
+            )
+            for index in range(total_products)
+        ],
+    )
+
+
+def run(service, requests: int):
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        service(None)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return statistics.median(samples) * 1_000_000, samples[int(len(samples) * 0.99) - 1] * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=100)
+    parser.add_argument("--variants", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rtt-us", type=float, default=300.0, help="RTT simulasi bila tanpa --redis-url")
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    listing = make_listing(args.products, args.variants)
+    payload = encode_payload(listing)
+
+    if args.redis_url:
+        import redis
+        client = CountingRedis(redis.Redis.from_url(args.redis_url, decode_responses=True))
+    else:
+        client = SimulatedRedis(args.rtt_us / 1_000_000)
+    redis_config.redis_client = client
+
+    @cached(
+        CATALOG, key_fn=lambda **_: ("benchmark", args.products), ttl=600, dto=AllProductInfoResponseDto,
+        raw_response=False,
+    )
+    def catalog_listing(db):
+        return build(data=listing)
+
+    decode_samples = []
+    for _ in range(min(args.requests, 500)):
+        started = time.perf_counter()
+        decode_payload(payload, AllProductInfoResponseDto)
+        decode_samples.append(time.perf_counter() - started)
+    decode_us = statistics.median(decode_samples) * 1_000_000
+
+    invalidation_listener.connected = False
+    catalog_listing(None)
+    before = client.round_trips
+    redis_p50, redis_p99 = run(catalog_listing, args.requests)
+    redis_trips = client.round_trips - before
+
+    invalidation_listener.connected = True
+    local_cache.clear()
+    catalog_listing(None)
+    before = client.round_trips
+    l1_p50, l1_p99 = run(catalog_listing, args.requests)
+    l1_trips = client.round_trips - before
+
+    print(f"payload               : {len(payload) / 1024:8.1f} KiB, decode + validate {decode_us:8.1f} us")
+    print(f"Redis only            : p50 {redis_p50:8.1f} us  p99 {redis_p99:8.1f} us  round trips {redis_trips}")
+    print(f"L1 + Redis            : p50 {l1_p50:8.1f} us  p99 {l1_p99:8.1f} us  round trips {l1_trips}")
+    print(f"saved per {args.requests} requests: {redis_trips - l1_trips} round trips, "
+          f"{(redis_p50 - l1_p50) * args.requests / 1000:.1f} ms at p50")
+
+
+if __name__ == "__main__":
+    main()
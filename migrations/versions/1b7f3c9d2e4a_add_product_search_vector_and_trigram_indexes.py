@@ -0,0 +1,78 @@
+"""add product search vector and trigram indexes
+
+Revision ID: 1b7f3c9d2e4a
+Revises: 6300e7deaf37
+Create Date: 2026-10-17 10:00:00.000000
+
+Kolom `products.search_vector` dirawat trigger database (bukan ORM) agar
+tetap sinkron untuk semua jalur tulis, termasuk rename brand di `productions`.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7f3c9d2e4a'
+down_revision: Union[str, None] = '6300e7deaf37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('products', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION products_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(
+                    (SELECT name FROM productions WHERE id = NEW.product_by_id), ''
+                )), 'B') ||
+                setweight(to_tsvector('simple', coalesce(NEW.info, '')), 'C') ||
+                setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'D');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER products_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, info, description, product_by_id ON products
+        FOR EACH ROW EXECUTE FUNCTION products_search_vector_refresh()
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION productions_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            UPDATE products SET name = name WHERE product_by_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER productions_search_vector_trigger
+        AFTER UPDATE OF name ON productions
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION productions_search_vector_refresh()
+    """)
+
+    # Isi nilai awal lewat trigger di atas
+    op.execute("UPDATE products SET name = name")
+
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+    op.execute("CREATE INDEX ix_products_name_trgm ON products USING gin (lower(name) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_products_name_trgm")
+    op.drop_index('ix_products_search_vector', table_name='products', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS productions_search_vector_trigger ON productions")
+    op.execute("DROP FUNCTION IF EXISTS productions_search_vector_refresh()")
+    op.execute("DROP TRIGGER IF EXISTS products_search_vector_trigger ON products")
+    op.execute("DROP FUNCTION IF EXISTS products_search_vector_refresh()")
+    op.drop_column('products', 'search_vector')
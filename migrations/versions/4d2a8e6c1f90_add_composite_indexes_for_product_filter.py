@@ -0,0 +1,40 @@
+"""add composite indexes for product filter
+
+Revision ID: 4d2a8e6c1f90
+Revises: 1b7f3c9d2e4a
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2a8e6c1f90'
+down_revision: Union[str, None] = '1b7f3c9d2e4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Produk lama tanpa varian belum tentu punya min_variant_price sebelum backfill
+    op.execute("UPDATE products SET min_variant_price = price WHERE min_variant_price IS NULL")
+    op.execute("UPDATE products SET max_variant_price = price WHERE max_variant_price IS NULL")
+
+    op.create_index('ix_products_active_brand_price', 'products', ['is_active', 'product_by_id', 'min_variant_price'], unique=False)
+    op.create_index('ix_products_active_price', 'products', ['is_active', 'min_variant_price'], unique=False)
+    op.create_index('ix_products_active_rating', 'products', ['is_active', 'avg_rating'], unique=False)
+    op.create_index('ix_products_active_promo', 'products', ['is_active', 'highest_promo'], unique=False)
+    op.create_index('ix_products_active_created_at', 'products', ['is_active', 'created_at'], unique=False)
+    op.create_index('ix_pack_types_product_stock', 'pack_types', ['product_id', 'stock'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pack_types_product_stock', table_name='pack_types')
+    op.drop_index('ix_products_active_created_at', table_name='products')
+    op.drop_index('ix_products_active_promo', table_name='products')
+    op.drop_index('ix_products_active_rating', table_name='products')
+    op.drop_index('ix_products_active_price', table_name='products')
+    op.drop_index('ix_products_active_brand_price', table_name='products')
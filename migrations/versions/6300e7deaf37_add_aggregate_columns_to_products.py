@@ -0,0 +1,72 @@
+"""add denormalized aggregate columns to products
+
+Revision ID: 6300e7deaf37
+Revises: 9e7c1a2b3f4d
+Create Date: 2026-10-17 09:00:00.000000
+
+Upgrade langsung mengisi nilai awal dari ratings dan pack_types dengan agregat
+yang sama seperti `backfill_product_stats`; skrip berikut tetap bisa dipakai
+untuk menyinkronkan ulang kapan pun:
+
+    poetry run python -m app.utils.backfill_product_stats
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6300e7deaf37'
+down_revision: Union[str, None] = '9e7c1a2b3f4d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('products', sa.Column('avg_rating', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('products', sa.Column('total_rater', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('products', sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('products', sa.Column('min_variant_price', sa.DECIMAL(10, 2), nullable=True))
+    op.add_column('products', sa.Column('max_variant_price', sa.DECIMAL(10, 2), nullable=True))
+    op.add_column('products', sa.Column('highest_promo', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('products', sa.Column('avg_promo', sa.Float(), nullable=False, server_default='0'))
+
+    # Backfill: produk tanpa varian memakai harga dasar sebagai rentang harga
+    op.execute('UPDATE products SET min_variant_price = price, max_variant_price = price')
+    op.execute(
+        'UPDATE products AS p '
+        'SET rating_sum = r.rating_sum, total_rater = r.total_rater, '
+        'avg_rating = ROUND(CAST(r.rating_sum AS NUMERIC(12, 4)) / CAST(r.total_rater AS NUMERIC), 1) '
+        'FROM (SELECT product_id, SUM(rate) AS rating_sum, COUNT(id) AS total_rater '
+        'FROM ratings GROUP BY product_id) AS r '
+        'WHERE r.product_id = p.id'
+    )
+    op.execute(
+        'UPDATE products AS p '
+        'SET min_variant_price = v.min_price, max_variant_price = v.max_price, '
+        'highest_promo = v.highest_promo, avg_promo = v.avg_promo '
+        'FROM (SELECT product_id, MIN(price) AS min_price, MAX(price) AS max_price, '
+        'COALESCE(ROUND(CAST(MAX(discount) AS NUMERIC(12, 4)), 1), 0) AS highest_promo, '
+        'ROUND(CAST(COALESCE(SUM(discount), 0) AS NUMERIC(12, 4)) / CAST(COUNT(id) AS NUMERIC), 1) AS avg_promo '
+        'FROM pack_types GROUP BY product_id) AS v '
+        'WHERE v.product_id = p.id'
+    )
+
+    op.create_index(op.f('ix_products_avg_rating'), 'products', ['avg_rating'], unique=False)
+    op.create_index(op.f('ix_products_min_variant_price'), 'products', ['min_variant_price'], unique=False)
+    op.create_index(op.f('ix_products_highest_promo'), 'products', ['highest_promo'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_products_highest_promo'), table_name='products')
+    op.drop_index(op.f('ix_products_min_variant_price'), table_name='products')
+    op.drop_index(op.f('ix_products_avg_rating'), table_name='products')
+    op.drop_column('products', 'avg_promo')
+    op.drop_column('products', 'highest_promo')
+    op.drop_column('products', 'max_variant_price')
+    op.drop_column('products', 'min_variant_price')
+    op.drop_column('products', 'rating_sum')
+    op.drop_column('products', 'total_rater')
+    op.drop_column('products', 'avg_rating')
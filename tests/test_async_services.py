@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def models():
+    import importlib
+
+    return importlib.import_module("app.models")
+
+
+@pytest.fixture
+def database_path(models, tmp_path, monkeypatch):
+    from app.libs import redis_config
+    from app.libs.sql_alchemy_lib import Base
+
+    # Bandingkan jalur database, bukan cache
+    monkeypatch.setattr(redis_config, "redis_client", None)
+
+    path = tmp_path / "shop.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        user = models.UserModel(id="user-1", firstname="Ani", email="ani@example.com", phone="0812", role="customer")
+        category = models.TagCategoryModel(name="Herbal")
+        session.add_all([user, category])
+        session.flush()
+        session.add(models.ProductionModel(id=1, name="Brand", herbal_category_id=category.id))
+        session.flush()
+
+        for index in range(3):
+            product_id = f"product-{index}"
+            session.add(models.ProductModel(id=product_id, name=f"Jamu {index}", weight=100, price=10000, product_by_id=1))
+            session.flush()
+            session.add_all([
+                models.PackTypeModel(product_id=product_id, name="Botol", min_amount=1, stock=10, price=10000, discount=10),
+                models.PackTypeModel(product_id=product_id, name="Sachet", min_amount=1, stock=10, price=5000),
+            ])
+        session.flush()
+
+        courier = models.CourierModel(id=1, courier_name="jne", customer_id="user-1", weight=100, cost=9000)
+        address = models.ShipmentAddressModel(
+            id=1, name="Ani", phone="0812", address="Jl. Melati", city="Bandung",
+            state="Jabar", country="ID", zip_code="40111", customer_id="user-1",
+        )
+        session.add_all([courier, address])
+        session.flush()
+        session.add(models.ShipmentModel(id="shipment-1", code_tracking="TRK", courier_id=1, address_id=1, customer_id="user-1"))
+        session.flush()
+
+        for index in range(2):
+            order_id = f"order-{index}"
+            session.add(models.OrderModel(id=order_id, status="pending", total_price=20000, customer_id="user-1", shipment_id="shipment-1"))
+            session.flush()
+            session.add_all([
+                models.OrderItemModel(order_id=order_id, product_id="product-0", variant_id=1, quantity=1, price_per_item=10000, total_price=10000),
+                models.OrderItemModel(order_id=order_id, product_id="product-1", variant_id=3, quantity=1, price_per_item=10000, total_price=10000),
+            ])
+            session.add(models.CartProductModel(quantity=2, product_id=f"product-{index}", variant_id=1, customer_id="user-1"))
+        session.commit()
+    engine.dispose()
+    return path
+
+
+def run_both(database_path, sync_service, async_service, *args, **kwargs):
+    engine = create_engine(f"sqlite:///{database_path}")
+    with sessionmaker(bind=engine)() as session:
+        expected = sync_service(session, *args, **kwargs)
+    engine.dispose()
+
+    async def run_async():
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+        try:
+            async with async_sessionmaker(bind=async_engine, expire_on_commit=False)() as session:
+                return await async_service(session, *args, **kwargs)
+        finally:
+            await async_engine.dispose()
+
+    return expected, asyncio.run(run_async())
+
+
+@pytest.mark.parametrize("limit", [2, 100])
+def test_all_product_async_matches_sync(database_path, limit):
+    from app.services import product_services
+
+    expected, actual = run_both(database_path, product_services.all_product, product_services.all_product_async, limit=limit)
+
+    assert actual.is_ok()
+    assert actual.unwrap().model_dump() == expected.unwrap().model_dump()
+    assert len(actual.unwrap().data) == min(limit, 3)
+
+
+def test_my_cart_async_matches_sync(database_path):
+    from app.services import cart_services
+
+    expected, actual = run_both(database_path, cart_services.my_cart, cart_services.my_cart_async, "user-1")
+
+    assert actual.is_ok()
+    assert actual.unwrap().model_dump() == expected.unwrap().model_dump()
+    assert len(actual.unwrap().data) == 2
+
+
+def test_my_order_async_matches_sync(database_path):
+    from app.services import order_services
+
+    expected, actual = run_both(database_path, order_services.my_order, order_services.my_order_async, "user-1", limit=1)
+
+    assert actual.is_ok()
+    assert actual.unwrap().model_dump() == expected.unwrap().model_dump()
+    assert actual.unwrap().meta.has_more is True
@@ -0,0 +1,175 @@
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.libs.cache import PRODUCT, CATALOG, bump_namespaces, cached_entities, cached_ids, cache_stats
+
+
+class CardDto(BaseModel):
+    id: str
+    name: str
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.mget_calls = 0
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            def set(self, key, value, nx=False):
+                self.ops.append(lambda: None if nx and key in client.store else client.store.__setitem__(key, str(value)))
+
+            def incr(self, key):
+                self.ops.append(lambda: client.store.__setitem__(key, str(int(client.store.get(key, 0)) + 1)))
+
+            def expire(self, key, ttl):
+                pass
+
+            def setex(self, key, ttl, value):
+                self.ops.append(lambda: client.setex(key, ttl, value))
+
+            def publish(self, channel, message):
+                pass
+
+            def execute(self):
+                for op in self.ops:
+                    op()
+
+        return Pipeline()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    cache_stats.reset()
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    return client
+
+
+def make_loader(loaded, names):
+    def loader(missing):
+        loaded.append(list(missing))
+        return {product_id: CardDto(id=product_id, name=names[product_id]) for product_id in missing if product_id in names}
+    return loader
+
+
+def test_cached_ids_reads_through_and_follows_namespace_version(client):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ["a", "b"]
+
+    assert cached_ids(CATALOG, "products", 0, 2, loader=loader) == ["a", "b"]
+    assert cached_ids(CATALOG, "products", 0, 2, loader=loader) == ["a", "b"]
+    assert len(calls) == 1
+
+    bump_namespaces(CATALOG)
+    cached_ids(CATALOG, "products", 0, 2, loader=loader)
+    assert len(calls) == 2
+
+
+def test_cached_entities_loads_only_missing_and_keeps_order(client):
+    names = {"a": "Jahe", "b": "Kunyit", "c": "Temulawak"}
+    loaded = []
+
+    first = cached_entities(PRODUCT, ["b", "a"], CardDto, make_loader(loaded, names))
+    assert [card.id for card in first] == ["b", "a"]
+    assert loaded == [["b", "a"]]
+
+    second = cached_entities(PRODUCT, ["c", "a", "b"], CardDto, make_loader(loaded, names))
+    assert [card.name for card in second] == ["Temulawak", "Jahe", "Kunyit"]
+    assert loaded[-1] == ["c"]
+    assert client.mget_calls == 2
+
+
+def test_bumping_one_product_only_reloads_its_card(client):
+    names = {"a": "Jahe", "b": "Kunyit"}
+    loaded = []
+    cached_entities(PRODUCT, ["a", "b"], CardDto, make_loader(loaded, names))
+
+    names["a"] = "Jahe Merah"
+    bump_namespaces((PRODUCT, "a"))
+    cards = cached_entities(PRODUCT, ["a", "b"], CardDto, make_loader(loaded, names))
+
+    assert loaded[-1] == ["a"]
+    assert [card.name for card in cards] == ["Jahe Merah", "Kunyit"]
+
+
+def test_cached_entities_skips_deleted_entities_and_works_without_redis(monkeypatch):
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
+    loaded = []
+
+    cards = cached_entities(PRODUCT, ["a", "gone"], CardDto, make_loader(loaded, {"a": "Jahe"}))
+
+    assert [card.id for card in cards] == ["a"]
+    assert loaded == [["a", "gone"]]
+
+
+def test_product_list_hit_reads_ids_and_cards_without_queries(client):
+    from app import models
+    from app.libs.sql_alchemy_lib import Base
+    from app.services.product_services import all_product
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id))
+    session.add_all([
+        models.ProductModel(id=f"product-{index}", name=f"Produk {index}", weight=50, price=1000, product_by_id=1)
+        for index in range(3)
+    ])
+    session.commit()
+
+    first = all_product(session, limit=2)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    second = all_product(session, limit=2)
+
+    assert len(first.data.data) == 2 and first.data.has_more
+    # Halaman tidak di-cache utuh: list ID dibaca dengan GET dan kartunya dengan satu MGET
+    assert second.data.model_dump() == first.data.model_dump()
+    assert statements == []
+    assert client.mget_calls == 2
+
+    # Edit produk hanya mem-bump (PRODUCT, id): list ID tetap dipakai, kartu itu saja yang dimuat ulang
+    edited_id = first.data.data[0].id
+    session.get(models.ProductModel, edited_id).name = "Produk Baru"
+    session.commit()
+    bump_namespaces((PRODUCT, edited_id))
+    third = all_product(session, limit=2)
+
+    assert third.data.data[0].name == "Produk Baru"
+    assert [card.id for card in third.data.data] == [card.id for card in first.data.data]
+    assert not any("ORDER BY" in statement and "LIMIT" in statement for statement in statements)
+    session.close()
@@ -0,0 +1,130 @@
+import pytest
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.markers = {}
+        self.published = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def exists(self, *keys):
+        return sum(key in self.markers for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value, nx=False):
+        self.commands.append(("set", key, value, nx))
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, ttl):
+        self.client.ttls[key] = ttl
+
+    def setex(self, key, ttl, value):
+        self.client.markers[key] = (value, ttl)
+
+    def publish(self, channel, message):
+        self.client.published.append((channel, message))
+
+    def execute(self):
+        results = []
+        for command, key, *args in self.commands:
+            if command == "set":
+                value, nx = args
+                if not (nx and key in self.client.store):
+                    self.client.store[key] = str(value)
+                results.append(True)
+            else:
+                results.append(self.client.incr(key))
+        return results
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    import importlib
+
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    return importlib.import_module("app.libs.cache"), client
+
+
+def test_bump_changes_only_the_targeted_namespace(cache):
+    cache_lib, client = cache
+    cart_key = cache_lib.versioned_key(cache_lib.CART, "items", 0, 10, scope="user-1")
+    other_cart_key = cache_lib.versioned_key(cache_lib.CART, "items", 0, 10, scope="user-2")
+    catalog_key = cache_lib.versioned_key(cache_lib.CATALOG, "products", 0, 100)
+    assert cart_key == "cart:user-1:v0:items:0:10"
+
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"), cache_lib.CATALOG)
+    version = int(client.store["ns:cart:user-1"])
+
+    assert cache_lib.versioned_key(cache_lib.CART, "items", 0, 10, scope="user-1") == f"cart:user-1:v{version}:items:0:10"
+    assert cache_lib.versioned_key(cache_lib.CART, "items", 0, 10, scope="user-2") == other_cart_key
+    assert cache_lib.versioned_key(cache_lib.CATALOG, "products", 0, 100) == "catalog:v1:products:0:100"
+    assert set(client.store) == {"ns:cart:user-1", "ns:catalog"}
+
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"))
+    assert int(client.store["ns:cart:user-1"]) == version + 1
+
+
+def test_scoped_version_restarts_above_expired_versions(cache, monkeypatch):
+    cache_lib, client = cache
+    from app.libs.cache import namespaces
+
+    monkeypatch.setattr(namespaces, "version_seed", lambda: 1_000)
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"))
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"))
+    assert client.store["ns:cart:user-1"] == "1002"
+
+    # Key versi habis oleh TTL; bump berikutnya tidak boleh memakai ulang v1001/v1002
+    del client.store["ns:cart:user-1"]
+    monkeypatch.setattr(namespaces, "version_seed", lambda: 5_000)
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"))
+    assert client.store["ns:cart:user-1"] == "5001"
+
+
+def test_namespaces_fail_open_without_redis(monkeypatch):
+    from app.libs import cache as cache_lib
+
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
+    cache_lib.bump_namespaces(cache_lib.CATALOG, (cache_lib.ORDERS, "user-1"))
+    assert cache_lib.versioned_key(cache_lib.ORDERS, "list", 0, 10, scope="user-1") == "orders:user-1:v0:list:0:10"
+
+
+def test_bump_marks_group_for_primary_refill(cache):
+    cache_lib, client = cache
+    from app.libs.cache.namespaces import PRIMARY_REFILL_SECONDS, recently_bumped
+
+    assert not recently_bumped("cart:user-1")
+    cache_lib.bump_namespaces((cache_lib.CART, "user-1"))
+
+    assert client.markers == {"bumped:cart:user-1": ("1", PRIMARY_REFILL_SECONDS)}
+    assert recently_bumped("catalog", "cart:user-1")
+    assert not recently_bumped("cart:user-2")
+
+
+def test_scoped_version_keys_expire_and_global_ones_do_not(cache):
+    cache_lib, client = cache
+    from app.libs.cache.decorators import DEFAULT_STALE_TTL
+    from app.libs.cache.namespaces import SCOPED_VERSION_TTL
+
+    cache_lib.bump_namespaces(cache_lib.CATALOG, (cache_lib.CART, "user-1"), (cache_lib.PRODUCT, None))
+
+    assert client.ttls == {"ns:cart:user-1": SCOPED_VERSION_TTL}
+    assert SCOPED_VERSION_TTL > 3600 * 1.1 + DEFAULT_STALE_TTL
@@ -0,0 +1,106 @@
+from app.libs.cache import cache_stats
+from app.libs.cache.report import report_namespace, sample_cache_memory
+
+
+class FakeRedis:
+    def __init__(self, keys, page_size=2):
+        self.keys = list(keys)
+        self.page_size = page_size
+
+    def scan(self, cursor=0, count=None):
+        page = self.keys[cursor:cursor + self.page_size]
+        next_cursor = cursor + self.page_size
+        return (0 if next_cursor >= len(self.keys) else next_cursor), page
+
+    def dbsize(self):
+        return len(self.keys)
+
+    def get(self, key):
+        return None
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.sizes = []
+
+            def memory_usage(self, key):
+                self.sizes.append(None if key == "catalog:v0:expired" else 100 * len(key.split(":")))
+
+            def execute(self):
+                return self.sizes
+
+        return Pipeline()
+
+
+KEYS = [
+    "catalog:v0:products:0:100",
+    "catalog:v0:expired",
+    "ns:catalog",
+    "lock:catalog:v0:products:0:100",
+    "entity:product:prod-1:abcd1234",
+    "product:prod-1:v2:detail",
+    "shipping_cost:9f86d081",
+]
+
+
+def test_report_namespace_groups_entities_under_their_namespace():
+    assert report_namespace("entity:product:prod-1:abcd1234") == "product"
+    assert report_namespace("brand_products:3:v1:list:0:100") == "brand_products"
+    assert report_namespace("provinces") == "provinces"
+
+
+def test_sample_cache_memory_groups_and_skips_bookkeeping_keys(monkeypatch):
+    monkeypatch.setattr("app.libs.redis_config.redis_client", FakeRedis(KEYS))
+
+    report = sample_cache_memory(sample_keys=10, max_scans=10)
+
+    assert report["scan_complete"] is True
+    assert report["scanned_keys"] == len(KEYS)
+    assert set(report["namespaces"]) == {"catalog", "product", "shipping_cost"}
+    assert report["namespaces"]["catalog"] == {
+        "sampled_keys": 1, "sampled_bytes": 500, "avg_key_bytes": 500.0, "estimated_keys": 2, "estimated_bytes": 1000,
+    }
+    assert report["namespaces"]["product"]["sampled_keys"] == 2
+
+
+def test_sample_cache_memory_extrapolates_partial_scans(monkeypatch):
+    monkeypatch.setattr("app.libs.redis_config.redis_client", FakeRedis(KEYS))
+
+    report = sample_cache_memory(sample_keys=10, max_scans=1)
+
+    assert report["scan_complete"] is False
+    assert report["scanned_keys"] == 2
+    # Dua key pertama sama-sama catalog, sehingga seluruh DBSIZE diatribusikan ke catalog
+    assert report["namespaces"]["catalog"]["estimated_keys"] == len(KEYS)
+
+
+def test_admin_cache_report_merges_counters_and_memory(monkeypatch):
+    from app.services.admin_metrics import get_cache_report
+
+    cache_stats.reset()
+    cache_stats.hit("catalog")
+    cache_stats.miss("articles")
+    monkeypatch.setattr("app.libs.redis_config.redis_client", FakeRedis(KEYS))
+
+    report = get_cache_report(sample_keys=5).unwrap().data
+
+    assert report.memory_sampled is True
+    by_namespace = {item.namespace: item for item in report.namespaces}
+    assert by_namespace["catalog"].hits == 1
+    assert by_namespace["catalog"].estimated_keys == 2
+    assert by_namespace["articles"].misses == 1
+    assert by_namespace["articles"].sampled_keys == 0
+    cache_stats.reset()
+
+
+def test_admin_cache_report_without_redis(monkeypatch):
+    from app.services.admin_metrics import get_cache_report
+
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
+
+    report = get_cache_report().unwrap().data
+
+    assert report.memory_sampled is False
+    assert report.total_keys == 0
@@ -0,0 +1,104 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.utils.result import build
+
+
+@pytest.fixture
+def warmup():
+    import importlib
+
+    return importlib.import_module("app.services.cache_warmup")
+
+
+@pytest.fixture
+def session_factory():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id))
+    session.add_all([
+        models.ProductModel(id=f"00000000-0000-0000-0000-00000000000{i}", name=f"Produk {i}", weight=50, price=1000, product_by_id=1)
+        for i in range(1, 4)
+    ])
+    session.flush()
+
+    recent = datetime.now(timezone.utc)
+    old = recent - timedelta(days=30)
+    orders = [("recent-1", recent), ("recent-2", recent), ("old", old)]
+    session.add_all([
+        models.OrderModel(id=order_id, status="paid", total_price=0, created_at=created_at)
+        for order_id, created_at in orders
+    ])
+    session.flush()
+    session.add_all([
+        models.OrderItemModel(order_id="recent-1", product_id="00000000-0000-0000-0000-000000000001", quantity=1, price_per_item=1000, total_price=1000),
+        models.OrderItemModel(order_id="recent-1", product_id="00000000-0000-0000-0000-000000000002", quantity=3, price_per_item=1000, total_price=3000),
+        models.OrderItemModel(order_id="recent-2", product_id="00000000-0000-0000-0000-000000000001", quantity=1, price_per_item=1000, total_price=1000),
+        models.OrderItemModel(order_id="old", product_id="00000000-0000-0000-0000-000000000003", quantity=99, price_per_item=1000, total_price=99000),
+    ])
+    session.commit()
+    session.close()
+    return factory
+
+
+def test_top_ordered_products_use_recent_volume(warmup, session_factory):
+    db = session_factory()
+    try:
+        assert warmup.top_ordered_product_ids(db, limit=5, days=7) == [
+            "00000000-0000-0000-0000-000000000002",
+            "00000000-0000-0000-0000-000000000001",
+        ]
+        assert warmup.top_ordered_product_ids(db, limit=1, days=7) == ["00000000-0000-0000-0000-000000000002"]
+    finally:
+        db.close()
+
+
+def test_warm_catalog_cache_bounds_concurrency(monkeypatch, warmup, session_factory):
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+    calls = []
+
+    def fake_service(name):
+        def service(db, **kwargs):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+                calls.append((name, kwargs))
+            time.sleep(0.02)
+            with lock:
+                running["now"] -= 1
+            return build(data={"ok": True})
+        return service
+
+    for name in ("all_product", "get_all_promo", "get_all_categories", "get_infinite_scrolling", "get_product_by_id"):
+        monkeypatch.setattr(warmup, name, fake_service(name))
+    monkeypatch.setattr("app.libs.redis_config.redis_client", object())
+
+    summary = warmup.warm_catalog_cache(session_factory=session_factory, pages=3, top_products=2, concurrency=2)
+
+    assert summary["tasks"] == 3 + 3 + 2
+    assert summary["warmed"] == 8
+    assert summary["failed"] == 0
+    assert running["peak"] <= 2
+    assert ("get_infinite_scrolling", {"skip": 16, "limit": 8}) in calls
+    assert sum(name == "get_product_by_id" for name, _ in calls) == 2
+
+
+def test_warm_catalog_cache_skips_without_redis(monkeypatch, warmup, session_factory):
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
+
+    assert warmup.warm_catalog_cache(session_factory=session_factory)["tasks"] == 0
@@ -0,0 +1,362 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.libs.cache import CART, bump_namespaces, cache_stats, cached
+from app.libs.cache.decorators import DEFAULT_STALE_TTL, encode_entry, split_entry
+from app.libs.cache.single_flight import lock_key
+from app.utils.result import build
+
+
+class ItemsResponseDto(BaseModel):
+    status_code: int
+    data: list
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        # Nilai yang "ditulis pemegang lock lain" saat key dibaca ulang
+        self.fill_on_reread = {}
+        self.reads = {}
+
+    def get(self, key):
+        self.reads[key] = self.reads.get(key, 0) + 1
+        if self.reads[key] > 1 and key in self.fill_on_reread:
+            self.store[key] = self.fill_on_reread.pop(key)
+        return self.store.get(key)
+
+    def exists(self, *keys):
+        return sum(key in self.store for key in keys)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+            return 1
+        return 0
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.keys = []
+                self.seeds = {}
+
+            def set(self, key, value, nx=False):
+                self.seeds[key] = (value, nx)
+
+            def incr(self, key):
+                self.keys.append(key)
+
+            def expire(self, key, ttl):
+                pass
+
+            def setex(self, key, ttl, value):
+                client.store[key] = value
+
+            def publish(self, channel, message):
+                pass
+
+            def execute(self):
+                for key, (value, nx) in self.seeds.items():
+                    if not (nx and key in client.store):
+                        client.store[key] = str(value)
+                for key in self.keys:
+                    client.store[key] = str(int(client.store.get(key, 0)) + 1)
+
+        return Pipeline()
+
+
+class BrokenRedis:
+    def get(self, key):
+        raise ConnectionError("redis down")
+
+    def setex(self, key, ttl, value):
+        raise AssertionError("must not write when reads fail")
+
+
+@pytest.fixture
+def calls():
+    cache_stats.reset()
+    return []
+
+
+def make_service(calls):
+    @cached(
+        CART,
+        key_fn=lambda skip, limit, **_: ("items", skip, limit),
+        scope=lambda user_id, **_: user_id,
+        ttl=100,
+        dto=ItemsResponseDto,
+    )
+    def my_items(db, user_id, skip=0, limit=10):
+        calls.append((user_id, skip, limit))
+        if user_id == "missing":
+            return build(error=HTTPException(status_code=404))
+        return build(data=ItemsResponseDto(status_code=200, data=[user_id, skip, limit]))
+
+    return my_items
+
+
+def test_cached_reads_through_and_invalidates_per_scope(monkeypatch, calls):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    my_items = make_service(calls)
+
+    first = my_items(None, "user-1")
+    second = my_items(None, user_id="user-1", skip=0)
+
+    assert calls == [("user-1", 0, 10)]
+    assert second.data == first.data
+    assert 100 + DEFAULT_STALE_TTL <= client.ttls["cart:user-1:v0:items:0:10"] <= 110 + DEFAULT_STALE_TTL
+    assert lock_key("cart:user-1:v0:items:0:10") not in client.store
+
+    bump_namespaces((CART, "user-1"))
+    my_items(None, "user-1")
+    assert len(calls) == 2
+    stats = cache_stats.snapshot()[CART]
+    assert {field: stats[field] for field in ("hits", "local_hits", "stale_hits", "coalesced", "misses", "errors", "hit_ratio")} == {
+        "hits": 1, "local_hits": 0, "stale_hits": 0, "coalesced": 0, "misses": 2, "errors": 0, "hit_ratio": 0.3333
+    }
+    # Dua entri ditulis; setiap GET entri dan versi namespace tercatat sebagai round trip
+    assert stats["writes"] == 2
+    assert stats["bytes_written"] == sum(len(client.store[key]) for key in client.ttls)
+    assert stats["redis_calls"] >= 3
+    assert stats["max_latency_ms"] >= stats["avg_latency_ms"] >= 0
+
+
+def test_cached_skips_errors_and_fails_open(monkeypatch, calls):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    my_items = make_service(calls)
+
+    assert my_items(None, "missing").is_error()
+    assert not any(key.startswith("cart:missing") for key in client.store)
+
+    client.store["cart:user-2:v0:items:0:10"] = "{not json"
+    assert my_items(None, "user-2").data.data == ["user-2", 0, 10]
+    assert split_entry(client.store["cart:user-2:v0:items:0:10"])[1].startswith("{")
+
+    monkeypatch.setattr("app.libs.redis_config.redis_client", BrokenRedis())
+    assert my_items(None, "user-3").data.data == ["user-3", 0, 10]
+    assert cache_stats.snapshot()[CART]["errors"] == 2
+
+
+def test_stale_entry_is_served_while_one_background_refresh_runs(monkeypatch, calls):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    refreshed = threading.Event()
+    sessions = []
+
+    class FakeSession:
+        def close(self):
+            refreshed.set()
+
+    def session_factory():
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    @cached(
+        CART,
+        key_fn=lambda **_: ("items",),
+        scope=lambda user_id, **_: user_id,
+        ttl=100,
+        dto=ItemsResponseDto,
+        session_factory=session_factory,
+    )
+    def my_items(db, user_id):
+        calls.append(db)
+        return build(data=ItemsResponseDto(status_code=200, data=["fresh"]))
+
+    cache_key = "cart:user-1:v0:items"
+    client.store[cache_key] = encode_entry(ItemsResponseDto(status_code=200, data=["stale"]), fresh_for=-1)
+
+    assert my_items("request-db", "user-1").data.data == ["stale"]
+    assert refreshed.wait(2)
+    deadline = time.monotonic() + 2
+    while lock_key(cache_key) in client.store and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert lock_key(cache_key) not in client.store
+    assert calls == [sessions[0]]
+    assert my_items("request-db", "user-1").data.data == ["fresh"]
+    assert cache_stats.snapshot()[CART]["stale_hits"] == 1
+
+
+def test_concurrent_miss_waits_for_lock_holder_instead_of_querying(monkeypatch, calls):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    my_items = make_service(calls)
+
+    cache_key = "cart:user-1:v0:items:0:10"
+    client.store[lock_key(cache_key)] = "other-worker"
+    client.fill_on_reread[cache_key] = encode_entry(
+        ItemsResponseDto(status_code=200, data=["from-holder"]), fresh_for=60
+    )
+
+    assert my_items(None, "user-1").data.data == ["from-holder"]
+    assert calls == []
+    assert cache_stats.snapshot()[CART]["coalesced"] == 1
+
+
+def test_concurrent_miss_on_event_loop_computes_instead_of_blocking(monkeypatch, calls):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    monkeypatch.setattr("app.libs.cache.single_flight.time.sleep", lambda seconds: pytest.fail("slept on the event loop"))
+    my_items = make_service(calls)
+
+    cache_key = "cart:user-1:v0:items:0:10"
+    client.store[lock_key(cache_key)] = "other-worker"
+
+    async def handler():
+        return my_items(None, "user-1")
+
+    assert asyncio.run(handler()).data.data == ["user-1", 0, 10]
+    assert calls == [("user-1", 0, 10)]
+
+
+def test_miss_right_after_bump_reads_from_primary(monkeypatch, calls):
+    from app.libs import sql_alchemy_lib
+
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    routed = []
+
+    @cached(CART, key_fn=lambda **_: ("items",), scope=lambda user_id, **_: user_id, dto=ItemsResponseDto)
+    def my_items(db, user_id):
+        routed.append(sql_alchemy_lib.prefer_primary.get())
+        return build(data=ItemsResponseDto(status_code=200, data=[user_id]))
+
+    my_items(None, "user-1")
+    bump_namespaces((CART, "user-1"))
+    my_items(None, "user-1")
+    # Grup user lain tidak di-bump: tetap boleh dibaca dari replica
+    my_items(None, "user-2")
+
+    assert routed == [False, True, False]
+    assert sql_alchemy_lib.prefer_primary.get() is False
+
+
+class ThreadRecordingRedis(FakeRedis):
+    def __init__(self):
+        super().__init__()
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def setex(self, key, ttl, value):
+        self.threads.add(threading.get_ident())
+        return super().setex(key, ttl, value)
+
+    def set(self, key, value, nx=False, px=None):
+        self.threads.add(threading.get_ident())
+        return super().set(key, value, nx=nx, px=px)
+
+
+def test_async_service_keeps_redis_off_the_event_loop(monkeypatch, calls):
+    from app.libs import sql_alchemy_lib
+
+    client = ThreadRecordingRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    routed = []
+
+    @cached(CART, key_fn=lambda **_: ("items",), scope=lambda user_id, **_: user_id, dto=ItemsResponseDto)
+    async def my_items(db, user_id):
+        await asyncio.sleep(0)
+        calls.append(user_id)
+        routed.append(sql_alchemy_lib.prefer_primary.get())
+        return build(data=ItemsResponseDto(status_code=200, data=[user_id]))
+
+    async def handler():
+        loop_thread = threading.get_ident()
+        first = await my_items(None, "user-1")
+        second = await my_items(None, "user-1")
+        bump_namespaces((CART, "user-1"))
+        third = await my_items(None, "user-1")
+        return loop_thread, first, second, third
+
+    loop_thread, first, second, third = asyncio.run(handler())
+
+    assert first.data.data == second.data.data == third.data.data == ["user-1"]
+    assert calls == ["user-1", "user-1"]
+    # Miss setelah bump dibaca dari primary, sama seperti service sync
+    assert routed == [False, True]
+    assert client.threads and loop_thread not in client.threads
+    assert not any(key.startswith(lock_key("")) for key in client.store)
+
+
+def test_async_concurrent_miss_waits_in_threadpool(monkeypatch, calls):
+    client = ThreadRecordingRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+
+    @cached(CART, key_fn=lambda **_: ("items",), scope=lambda user_id, **_: user_id, dto=ItemsResponseDto)
+    async def my_items(db, user_id):
+        calls.append(user_id)
+        return build(data=ItemsResponseDto(status_code=200, data=[user_id]))
+
+    cache_key = "cart:user-1:v0:items"
+    client.store[lock_key(cache_key)] = "other-worker"
+    client.fill_on_reread[cache_key] = encode_entry(
+        ItemsResponseDto(status_code=200, data=["from-holder"]), fresh_for=60
+    )
+
+    assert asyncio.run(my_items(None, "user-1")).data.data == ["from-holder"]
+    assert calls == []
+    assert cache_stats.snapshot()[CART]["coalesced"] == 1
+
+
+def test_async_stale_entry_refreshes_with_its_own_session(monkeypatch, calls):
+    from contextlib import asynccontextmanager
+
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+
+    @asynccontextmanager
+    async def async_session_factory():
+        yield "refresh-db"
+
+    @cached(
+        CART,
+        key_fn=lambda **_: ("items",),
+        scope=lambda user_id, **_: user_id,
+        ttl=100,
+        dto=ItemsResponseDto,
+        async_session_factory=async_session_factory,
+    )
+    async def my_items(db, user_id):
+        calls.append(db)
+        return build(data=ItemsResponseDto(status_code=200, data=["fresh"]))
+
+    cache_key = "cart:user-1:v0:items"
+    client.store[cache_key] = encode_entry(ItemsResponseDto(status_code=200, data=["stale"]), fresh_for=-1)
+
+    async def handler():
+        stale = await my_items("request-db", "user-1")
+        for _ in range(200):
+            if lock_key(cache_key) not in client.store:
+                break
+            await asyncio.sleep(0.01)
+        return stale, await my_items("request-db", "user-1")
+
+    stale, fresh = asyncio.run(handler())
+
+    assert stale.data.data == ["stale"]
+    assert fresh.data.data == ["fresh"]
+    assert calls == ["refresh-db"]
@@ -0,0 +1,109 @@
+import asyncio
+import gzip
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.libs import compression
+from app.libs.cache import responses
+from app.libs.cache.responses import CachedBody, CachedJSONResponse
+from app.libs.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE_BODY = b'{"data":[' + b",".join(b'{"name":"Jahe Merah","price":15000}' for _ in range(200)) + b"]}"
+
+
+def build_client(cached_body=None):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    def large():
+        return Response(LARGE_BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"ok":true}', media_type="application/json")
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/cached")
+    def cached():
+        return CachedJSONResponse(cached_body)
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_respects_quality_values():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip;q=0.5") == "gzip"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding(None) is None
+    if compression.brotli is not None:
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("*") == "br"
+
+
+def test_middleware_compresses_only_large_allowlisted_bodies():
+    client = build_client()
+    headers = {"Accept-Encoding": "gzip"}
+
+    large = client.get("/large", headers=headers)
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.headers["vary"] == "Accept-Encoding"
+    assert large.content == LARGE_BODY
+    assert int(large.headers["content-length"]) < len(LARGE_BODY)
+
+    small = client.get("/small", headers=headers)
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
+
+    image = client.get("/image", headers=headers)
+    assert "content-encoding" not in image.headers
+    assert "vary" not in image.headers
+
+    plain = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.content == LARGE_BODY
+
+
+def test_cached_response_reuses_stored_compressed_variant(monkeypatch):
+    calls = []
+
+    def counting_compress(body, encoding):
+        calls.append(encoding)
+        return gzip.compress(body, mtime=0)
+
+    monkeypatch.setattr(responses, "compress", counting_compress)
+    monkeypatch.setattr(compression, "compress", counting_compress)
+    client = build_client(CachedBody(LARGE_BODY))
+
+    for _ in range(3):
+        response = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["x-cache"] == "HIT"
+        assert response.content == LARGE_BODY
+
+    # Dikompresi sekali untuk entri itu, dan middleware tidak mengompresi ulang
+    assert calls == ["gzip"]
+
+
+def test_cached_response_compresses_new_variant_off_the_event_loop(monkeypatch):
+    loops = []
+
+    def recording_compress(body, encoding):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return gzip.compress(body, mtime=0)
+
+    monkeypatch.setattr(responses, "compress", recording_compress)
+    client = build_client(CachedBody(LARGE_BODY))
+
+    response = client.get("/cached", headers={"Accept-Encoding": "gzip"})
+
+    assert response.content == LARGE_BODY
+    assert loops == [None]
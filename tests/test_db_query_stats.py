@@ -0,0 +1,49 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture
+def db_query_stats():
+    import importlib
+
+    return importlib.import_module("app.libs.db_query_stats")
+
+
+def test_normalize_statement_groups_same_shape(db_query_stats):
+    first = db_query_stats.normalize_statement("SELECT * FROM product_images WHERE product_id = 'a'  LIMIT 10")
+    second = db_query_stats.normalize_statement("SELECT * FROM product_images\nWHERE product_id = 'b' LIMIT 20")
+    in_list = db_query_stats.normalize_statement("SELECT * FROM ratings WHERE product_id IN (%(p_1)s, %(p_2)s)")
+
+    assert first == second == "SELECT * FROM product_images WHERE product_id = ? LIMIT ?"
+    assert in_list == "SELECT * FROM ratings WHERE product_id IN (?)"
+
+
+def test_middleware_reports_counts_and_warns_on_repeats(db_query_stats, monkeypatch, caplog):
+    engine = create_engine("sqlite://")
+    monkeypatch.setattr(db_query_stats, "REPEATED_STATEMENT_THRESHOLD", 3)
+
+    app = FastAPI()
+    app.add_middleware(db_query_stats.QueryStatsMiddleware, expose_headers=True)
+
+    @app.get("/n-plus-one")
+    def n_plus_one():
+        with engine.connect() as connection:
+            for product_id in range(4):
+                connection.execute(text("SELECT :id"), {"id": product_id})
+        return {"ok": True}
+
+    with caplog.at_level(logging.WARNING, logger=db_query_stats.logger.name):
+        response = TestClient(app).get("/n-plus-one")
+
+    assert response.headers["X-DB-Query-Count"] == "4"
+    assert response.headers["X-DB-Max-Repeated-Statement"] == "4"
+    assert "Possible N+1 on GET /n-plus-one" in caplog.text
+
+
+def test_headers_are_off_unless_enabled(db_query_stats):
+    middleware = db_query_stats.QueryStatsMiddleware(app=None)
+    assert middleware.expose_headers is False
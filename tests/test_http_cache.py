@@ -0,0 +1,60 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.libs import http_cache
+from app.libs.cache import CACHE_STATUS_HEADER, CachedJSONResponse
+
+
+class ItemsDto(BaseModel):
+    status_code: int
+    data: list
+
+
+def build_client(payload):
+    app = FastAPI()
+
+    @app.get("/items")
+    def items(request: Request):
+        return http_cache.conditional_response(request, payload(), http_cache.CATEGORIES)
+
+    return TestClient(app)
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcard():
+    etag = http_cache.compute_etag(b"{}")
+
+    assert http_cache.etag_matches(etag, etag)
+    assert http_cache.etag_matches(f'"other", W/{etag}', etag)
+    assert http_cache.etag_matches("*", etag)
+    assert not http_cache.etag_matches('"other"', etag)
+    assert not http_cache.etag_matches(None, etag)
+
+
+def test_dto_response_gets_etag_and_304_on_match():
+    client = build_client(lambda: ItemsDto(status_code=200, data=[1, 2]))
+
+    first = client.get("/items")
+    assert first.status_code == 200
+    assert first.json() == {"status_code": 200, "data": [1, 2]}
+    assert first.headers["cache-control"] == http_cache.cache_control_for(http_cache.CATEGORIES)
+
+    second = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_cached_body_keeps_cache_status_and_changes_etag_with_content():
+    body = {"value": b'{"status_code":200,"data":[1]}'}
+    client = build_client(lambda: CachedJSONResponse(body["value"]))
+
+    first = client.get("/items")
+    assert first.content == body["value"]
+    assert first.headers[CACHE_STATUS_HEADER] == "HIT"
+    assert first.headers["etag"] == http_cache.compute_etag(body["value"])
+
+    body["value"] = b'{"status_code":200,"data":[2]}'
+    changed = client.get("/items", headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
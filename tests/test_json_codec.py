@@ -0,0 +1,53 @@
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.libs import json_codec
+from app.models.enums import DeliveryTypeEnum
+
+
+class PriceDto(BaseModel):
+    amount: Decimal
+    created_at: datetime
+
+
+def test_codec_handles_decimal_datetime_uuid_enum_and_models():
+    order_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    payload = json_codec.loads(json_codec.dumps({
+        "id": order_id,
+        "total": Decimal("15000"),
+        "discount": Decimal("12.5"),
+        "created_at": created_at,
+        "delivery_type": DeliveryTypeEnum.pickup,
+        "price": PriceDto(amount=Decimal("9.90"), created_at=created_at),
+        "tags": {"herbal"},
+    }))
+
+    assert payload == {
+        "id": str(order_id),
+        "total": 15000,
+        "discount": 12.5,
+        "created_at": "2026-01-02T03:04:05+00:00",
+        "delivery_type": "pickup",
+        "price": {"amount": "9.90", "created_at": "2026-01-02T03:04:05Z"},
+        "tags": ["herbal"],
+    }
+
+
+def test_default_response_class_renders_with_orjson():
+    app = FastAPI(default_response_class=json_codec.ORJSONResponse)
+
+    @app.get("/price", response_model=PriceDto)
+    def price():
+        return PriceDto(amount=Decimal("1.50"), created_at=datetime(2026, 1, 1))
+
+    response = TestClient(app).get("/price")
+
+    assert response.status_code == 200
+    assert response.content == b'{"amount":"1.50","created_at":"2026-01-01T00:00:00"}'
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def sql_alchemy_lib():
+    import importlib
+
+    return importlib.import_module("app.libs.sql_alchemy_lib")
+
+
+@pytest.fixture
+def sqlite_session_factory():
+    return sessionmaker(bind=create_engine("sqlite://"))
+
+
+def test_lazy_session_is_not_created_when_unused(sql_alchemy_lib, sqlite_session_factory):
+    database = sql_alchemy_lib.LazySession(sqlite_session_factory)
+    database.close()
+
+    assert database._session is None
+    assert database.touched_database is False
+
+
+def test_lazy_session_marks_touched_after_first_statement(sql_alchemy_lib, sqlite_session_factory):
+    database = sql_alchemy_lib.LazySession(sqlite_session_factory)
+
+    database.rollback()
+    assert database.touched_database is False
+
+    assert database.execute(text("SELECT 1")).scalar() == 1
+    assert database.touched_database is True
+    database.close()
+
+
+def test_db_session_stats_counts_requests_without_db(sql_alchemy_lib):
+    stats = sql_alchemy_lib.DbSessionStats()
+    stats.record(touched_database=False)
+    stats.record(touched_database=False)
+    stats.record(touched_database=True)
+
+    snapshot = stats.snapshot()
+
+    assert snapshot["total_requests"] == 3
+    assert snapshot["requests_without_db"] == 2
+    assert snapshot["requests_with_db"] == 1
+    assert snapshot["without_db_ratio"] == round(2 / 3, 4)
@@ -0,0 +1,233 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def models():
+    import importlib
+
+    return importlib.import_module("app.models")
+
+
+@pytest.fixture
+def loader_profiles():
+    import importlib
+
+    return importlib.import_module("app.models.loader_profiles")
+
+
+@pytest.fixture
+def engine(models):
+    from app.libs.sql_alchemy_lib import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def session_factory(models, engine):
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        user = models.UserModel(id="user-1", firstname="Ani", email="ani@example.com", phone="0812", role="customer")
+        category = models.TagCategoryModel(name="Herbal")
+        session.add_all([user, category])
+        session.flush()
+        session.add(models.ProductionModel(id=1, name="Brand", herbal_category_id=category.id))
+        session.flush()
+
+        for index in range(3):
+            product_id = f"product-{index}"
+            session.add(models.ProductModel(id=product_id, name=f"Jamu {index}", weight=100, price=10000, product_by_id=1))
+            session.flush()
+            session.add_all([
+                models.PackTypeModel(product_id=product_id, name="Botol", min_amount=1, stock=10, price=10000, discount=10),
+                models.PackTypeModel(product_id=product_id, name="Sachet", min_amount=1, stock=10, price=5000),
+                models.RatingModel(rate=5, review="Mantap", product_id=product_id, user_id="user-1"),
+            ])
+        session.flush()
+
+        courier = models.CourierModel(id=1, courier_name="jne", customer_id="user-1", weight=100, cost=9000)
+        address = models.ShipmentAddressModel(
+            id=1, name="Ani", phone="0812", address="Jl. Melati", city="Bandung",
+            state="Jabar", country="ID", zip_code="40111", customer_id="user-1",
+        )
+        session.add_all([courier, address])
+        session.flush()
+        session.add(models.ShipmentModel(id="shipment-1", code_tracking="TRK", courier_id=1, address_id=1, customer_id="user-1"))
+        session.flush()
+
+        for index in range(2):
+            order_id = f"order-{index}"
+            session.add(models.OrderModel(id=order_id, status="pending", total_price=20000, customer_id="user-1", shipment_id="shipment-1"))
+            session.flush()
+            session.add_all([
+                models.OrderItemModel(order_id=order_id, product_id="product-0", variant_id=1, quantity=1, price_per_item=10000, total_price=10000),
+                models.OrderItemModel(order_id=order_id, product_id="product-1", variant_id=3, quantity=1, price_per_item=10000, total_price=10000),
+            ])
+            session.add(models.CartProductModel(quantity=2, product_id=f"product-{index}", variant_id=1, customer_id="user-1"))
+        session.commit()
+    return factory
+
+
+@contextmanager
+def count_statements(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_product_card_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        products = session.execute(
+            select(models.ProductModel).options(*loader_profiles.PRODUCT_CARD)
+        ).scalars().all()
+        for product in products:
+            assert product.brand_info == {"id": 1, "name": "Brand"}
+            assert len(product.all_variants) == 2
+            product.min_variant_price, product.max_variant_price
+
+    assert len(statements) == 3
+
+
+def test_product_card_profile_rejects_ratings(models, loader_profiles, session_factory):
+    with session_factory() as session:
+        product = session.execute(
+            select(models.ProductModel).options(*loader_profiles.PRODUCT_CARD)
+        ).scalars().first()
+        with pytest.raises(InvalidRequestError):
+            product.ratings
+
+
+def test_product_detail_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        product = session.execute(
+            select(models.ProductModel)
+            .options(*loader_profiles.PRODUCT_DETAIL)
+            .where(models.ProductModel.id == "product-0")
+        ).scalars().first()
+        assert product.company == "Brand"
+        assert len(product.variants_list) == 2
+        with pytest.raises(InvalidRequestError):
+            product.ratings
+
+    assert len(statements) == 3
+
+
+def test_cart_line_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        cart_items = session.execute(
+            select(models.CartProductModel).options(*loader_profiles.CART_LINE)
+        ).scalars().all()
+        for cart_item in cart_items:
+            cart_item.product_name, cart_item.variant_info, cart_item.total_price
+
+    assert len(cart_items) == 2
+    assert len(statements) == 3
+
+
+def test_order_summary_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        orders = session.execute(
+            select(models.OrderModel).options(*loader_profiles.ORDER_SUMMARY)
+        ).scalars().all()
+        for order in orders:
+            assert order.customer_name == "Ani"
+            assert order.shipping_cost == 9000
+            assert len(order.order_item_lists) == 2
+
+    assert len(orders) == 2
+    assert len(statements) == 7
+
+
+def test_order_detail_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        order = session.execute(
+            select(models.OrderModel)
+            .options(*loader_profiles.ORDER_DETAIL)
+            .where(models.OrderModel.id == "order-0")
+        ).scalars().first()
+        assert order.my_shipping["my_address"]["name"] == "Ani"
+        assert len(order.order_item_lists) == 2
+
+    assert len(statements) == 8
+
+
+def test_payment_summary_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session:
+        session.add_all([
+            models.PaymentModel(order_id=f"order-{index}", transaction_id=f"trx-{index}", gross_amount=20000)
+            for index in range(2)
+        ])
+        session.commit()
+
+    with session_factory() as session, count_statements(engine) as statements:
+        payments = session.execute(
+            select(models.PaymentModel).options(*loader_profiles.PAYMENT_SUMMARY)
+        ).scalars().all()
+        for payment in payments:
+            assert (payment.order.customer_name, payment.order.customer_email) == ("Ani", "ani@example.com")
+            with pytest.raises(InvalidRequestError):
+                payment.order.order_items
+
+    assert len(payments) == 2
+    assert len(statements) == 3
+
+
+def test_rating_line_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        ratings = session.execute(
+            select(models.RatingModel).options(*loader_profiles.RATING_LINE)
+        ).scalars().all()
+        assert sorted(rating.product_name for rating in ratings) == ["Jamu 0", "Jamu 1", "Jamu 2"]
+
+    assert len(statements) == 2
+
+
+def test_lazy_relations_raise_instead_of_loading_per_row(models, session_factory):
+    with session_factory() as session:
+        order = session.get(models.OrderModel, "order-0")
+        rating = session.execute(select(models.RatingModel)).scalars().first()
+        with pytest.raises(InvalidRequestError):
+            order.customer_name
+        with pytest.raises(InvalidRequestError):
+            rating.product_name
+
+
+def test_deleting_shipment_still_clears_order_references(models, session_factory):
+    with session_factory() as session:
+        session.delete(session.get(models.ShipmentModel, "shipment-1"))
+        session.commit()
+
+        shipment_ids = session.execute(select(models.OrderModel.shipment_id)).scalars().all()
+        assert shipment_ids == [None, None]
+
+
+def test_admin_user_summary_profile_statement_count(models, loader_profiles, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        users = session.execute(
+            select(models.UserModel).options(*loader_profiles.ADMIN_USER_SUMMARY)
+        ).scalars().all()
+        assert [user.firstname for user in users] == ["Ani"]
+
+    assert len(statements) == 1
+
+
+def test_loading_user_does_not_cascade_into_collections(models, engine, session_factory):
+    with session_factory() as session, count_statements(engine) as statements:
+        user = session.get(models.UserModel, "user-1")
+        with pytest.raises(InvalidRequestError):
+            user.orders
+
+    assert len(statements) == 1
@@ -0,0 +1,149 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from app.libs.cache import (
+    CATALOG,
+    CachedJSONResponse,
+    LocalCache,
+    bump_namespaces,
+    cached,
+    invalidation_listener,
+    local_cache,
+)
+from app.libs.cache.invalidation import INVALIDATION_CHANNEL, encode_invalidation
+from app.utils.result import build
+
+
+class CatalogDto(BaseModel):
+    data: list
+
+
+class CountingRedis:
+    def __init__(self):
+        self.store = {}
+        self.gets = 0
+        self.published = []
+
+    def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def set(self, key, value, nx=False):
+                if not (nx and key in client.store):
+                    client.store[key] = str(value)
+
+            def incr(self, key):
+                client.store[key] = str(int(client.store.get(key, 0)) + 1)
+
+            def expire(self, key, ttl):
+                pass
+
+            def setex(self, key, ttl, value):
+                client.store[key] = value
+
+            def publish(self, channel, message):
+                client.published.append((channel, json.loads(message)))
+
+            def execute(self):
+                pass
+
+        return Pipeline()
+
+
+def test_local_cache_evicts_lru_and_expires():
+    now = [0.0]
+    cache = LocalCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set("catalog", "catalog:a", 1)
+    cache.set("catalog", "catalog:b", 2)
+    assert cache.get("catalog:a") == 1
+    cache.set("product:1", "product:1:detail", 3)
+
+    assert cache.get("catalog:b") is None
+    assert len(cache) == 2
+
+    now[0] = 11
+    assert cache.get("catalog:a") is None
+
+
+def test_local_cache_rejects_writes_started_before_invalidation():
+    cache = LocalCache()
+    generation = cache.generation("catalog")
+    cache.invalidate("catalog")
+
+    assert cache.set("catalog", "catalog:products", "stale", generation) is False
+    assert cache.get("catalog:products") is None
+
+    generation = cache.generation("brand:1")
+    cache.clear()
+    assert cache.set("brand:1", "brand:1:detail", "stale", generation) is False
+
+
+@pytest.fixture
+def l1_redis(monkeypatch):
+    client = CountingRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    monkeypatch.setattr(invalidation_listener, "connected", True)
+    local_cache.clear()
+    yield client
+    local_cache.clear()
+
+
+def test_catalog_hits_are_served_from_l1_and_invalidated_by_pubsub(l1_redis):
+    calls = []
+
+    @cached(CATALOG, key_fn=lambda skip, **_: ("l1-test", skip), ttl=60, dto=CatalogDto, raw_response=False)
+    def listing(db, skip=0):
+        calls.append(skip)
+        return build(data=CatalogDto(data=[len(calls)]))
+
+    first = listing(None)
+    gets_after_miss = l1_redis.gets
+    assert listing(None).data is first.data
+    assert l1_redis.gets == gets_after_miss
+    assert calls == [0]
+
+    # Pesan dari worker lain membuang grup; pesan milik proses sendiri diabaikan
+    assert invalidation_listener.handle(encode_invalidation([CATALOG])) == []
+    assert invalidation_listener.handle(json.dumps({"origin": "other-worker", "groups": [CATALOG]})) == [CATALOG]
+    assert listing(None).data is not first.data
+    assert calls == [0]
+
+    bump_namespaces(CATALOG)
+    assert listing(None).data.data == [2]
+    channel, message = l1_redis.published[-1]
+    assert channel == INVALIDATION_CHANNEL and message["groups"] == [CATALOG]
+
+
+def test_catalog_hits_return_stored_json_without_revalidation(l1_redis, monkeypatch):
+    calls = []
+
+    @cached(CATALOG, key_fn=lambda **_: ("raw-test",), ttl=60, dto=CatalogDto)
+    def listing(db):
+        calls.append(db)
+        return build(data=CatalogDto(data=[1, "dua"]))
+
+    miss = listing(None)
+    assert isinstance(miss.data, CatalogDto)
+
+    # Hit dari Redis (L1 dikosongkan) dan dari L1 sama-sama tidak memanggil validasi DTO
+    monkeypatch.setattr(CatalogDto, "model_validate_json", None)
+    local_cache.clear()
+    from_redis = listing(None)
+    from_l1 = listing(None)
+
+    assert calls == [None]
+    for result in (from_redis, from_l1):
+        assert isinstance(result.data, CachedJSONResponse)
+        assert result.data.body == miss.data.model_dump_json().encode()
+        assert result.data.headers["content-type"] == "application/json"
+        assert result.data.headers["x-cache"] == "HIT"
+    assert any(key.startswith("catalog:v0:raw-test:s") for key in l1_redis.store)
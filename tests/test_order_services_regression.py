@@ -118,7 +118,7 @@ def test_checkout_creates_order_and_items(monkeypatch, checkout_module, fake_car
         "get_cart_total",
         lambda items: SimpleNamespace(total_all_active_prices=9000),
     )
-    monkeypatch.setattr(checkout_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = checkout_module.checkout(db, "user-1")
 
@@ -131,7 +131,7 @@ def test_checkout_creates_order_and_items(monkeypatch, checkout_module, fake_car
 
 def test_checkout_returns_404_style_payload_when_cart_empty(monkeypatch, checkout_module):
     db = DummyDB(execute_results=[[]], query_result=None)
-    monkeypatch.setattr(checkout_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = checkout_module.checkout(db, "user-1")
 
@@ -142,7 +142,7 @@ def test_checkout_returns_404_style_payload_when_cart_empty(monkeypatch, checkou
 
 def test_my_order_returns_empty_list(monkeypatch, my_order_module):
     db = DummyDB(execute_results=[[]])
-    monkeypatch.setattr(my_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = my_order_module.my_order(db, "user-1")
 
@@ -165,7 +165,7 @@ def test_my_order_handles_missing_shipping_relations(monkeypatch, my_order_modul
         order_item_lists=[],
     )
     db = DummyDB(execute_results=[[order]])
-    monkeypatch.setattr(my_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = my_order_module.my_order(db, "user-1")
 
@@ -177,7 +177,7 @@ def test_my_order_handles_missing_shipping_relations(monkeypatch, my_order_modul
 
 def test_detail_order_returns_404_when_missing(monkeypatch, detail_order_module):
     db = DummyDB(execute_results=[None])
-    monkeypatch.setattr(detail_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = detail_order_module.detail_order(db, "user-1", "order-x")
 
@@ -204,7 +204,7 @@ def test_detail_order_handles_missing_shipping_relations(monkeypatch, detail_ord
         order_item_lists=[],
     )
     db = DummyDB(execute_results=[order])
-    monkeypatch.setattr(detail_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = detail_order_module.detail_order(db, "user-1", "order-1")
 
@@ -226,7 +226,7 @@ def test_edit_order_switches_to_pickup(monkeypatch, edit_order_module):
         created_at="2026-04-21T00:00:00",
     )
     db = DummyDB(execute_results=[order])
-    monkeypatch.setattr(edit_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     payload = SimpleNamespace(order_id="order-1")
     order_dto = SimpleNamespace(delivery_type=edit_order_module.DeliveryTypeEnum.pickup, notes="ambil sendiri")
@@ -252,7 +252,7 @@ def test_edit_order_rejects_invalid_shipment(monkeypatch, edit_order_module):
         created_at="2026-04-21T00:00:00",
     )
     db = DummyDB(execute_results=[order], query_result=None)
-    monkeypatch.setattr(edit_order_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     payload = SimpleNamespace(order_id="order-1")
     order_dto = SimpleNamespace(
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.libs.pagination import decode_cursor, encode_cursor, keyset_paginate
+
+
+@pytest.fixture
+def db():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    base = datetime(2026, 1, 1, 8, 0, 0)
+    # Dua pasang artikel dengan created_at kembar untuk menguji tie-break id
+    session.add_all([
+        models.ArticleModel(id=index, title=f"Artikel {index}", created_at=base + timedelta(minutes=index // 2))
+        for index in range(1, 8)
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def article_keys():
+    from app.models.article_model import ArticleModel
+
+    return ArticleModel, (ArticleModel.created_at, ArticleModel.id)
+
+
+def test_cursor_pages_cover_all_rows_once_in_order(db):
+    model, keys = article_keys()
+    seen, cursor = [], None
+    while True:
+        page = keyset_paginate(db, select(model), keys, limit=3, cursor=cursor)
+        seen.extend(article.id for article in page.items)
+        if not page.has_more:
+            assert page.next_cursor is None
+            break
+        cursor = page.next_cursor
+
+    assert seen == [7, 6, 5, 4, 3, 2, 1]
+
+
+def test_offset_page_matches_cursor_page_and_returns_next_cursor(db):
+    model, keys = article_keys()
+    first = keyset_paginate(db, select(model), keys, limit=3, descending=False)
+    by_offset = keyset_paginate(db, select(model), keys, limit=3, skip=3, descending=False)
+    by_cursor = keyset_paginate(db, select(model), keys, limit=3, cursor=first.next_cursor, descending=False)
+
+    assert [article.id for article in by_offset.items] == [4, 5, 6]
+    assert [article.id for article in by_cursor.items] == [4, 5, 6]
+    assert by_offset.next_cursor == by_cursor.next_cursor
+
+
+def test_decode_cursor_restores_column_types_and_rejects_garbage():
+    _, keys = article_keys()
+    created_at = datetime(2026, 1, 1, 8, 30, 15, 123456)
+
+    assert decode_cursor(encode_cursor(created_at, 5), keys) == (created_at, 5)
+    for cursor in ["not-a-cursor", encode_cursor(1), encode_cursor("yesterday", 1)]:
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor, keys)
+        assert error.value.status_code == 400
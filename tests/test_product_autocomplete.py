@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def autocomplete():
+    import importlib
+
+    return importlib.import_module("app.services.product_services.product_autocomplete")
+
+
+@pytest.fixture
+def session():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id))
+    session.add_all([
+        models.ProductModel(id="prod-1", name="Jahe Merah Instan", weight=50, price=15000, product_by_id=1),
+        models.ProductModel(id="prod-2", name="Jamu Beras Kencur", weight=50, price=9000, product_by_id=1),
+        models.ProductModel(id="prod-3", name="Kunyit Asam", weight=50, price=12000, product_by_id=1, is_active=False),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_index_matches_word_and_brand_prefixes(autocomplete, session):
+    index = autocomplete.ProductAutocompleteIndex()
+    assert autocomplete.build_autocomplete_index(session, index) == 2
+
+    assert [entry.product_id for entry in index.suggest("ja")] == ["prod-1", "prod-2"]
+    assert [entry.product_id for entry in index.suggest("  MERAH")] == ["prod-1"]
+    assert [entry.product_id for entry in index.suggest("amim", limit=1)] == ["prod-1"]
+    assert index.suggest("kunyit") == []
+    assert index.suggest("") == []
+
+
+def test_index_follows_product_changes(autocomplete, session):
+    from app.models import ProductModel
+
+    index = autocomplete.ProductAutocompleteIndex()
+    autocomplete.build_autocomplete_index(session, index)
+
+    session.execute(update(ProductModel).where(ProductModel.id == "prod-1").values(name="Wedang Uwuh"))
+    session.execute(update(ProductModel).where(ProductModel.id == "prod-3").values(is_active=True))
+    session.commit()
+    autocomplete.sync_autocomplete_product(session, "prod-1", index)
+    autocomplete.sync_autocomplete_product(session, "prod-3", index)
+    index.remove("prod-2")
+
+    assert index.suggest("jahe") == []
+    assert index.suggest("ja") == []
+    assert [entry.name for entry in index.suggest("wedang")] == ["Wedang Uwuh"]
+    assert [entry.product_id for entry in index.suggest("asam")] == ["prod-3"]
+    assert len(index) == 2
+
+
+def test_index_follows_brand_rename_and_delete(autocomplete, session):
+    from app.models import ProductModel, ProductionModel
+
+    index = autocomplete.ProductAutocompleteIndex()
+    autocomplete.build_autocomplete_index(session, index)
+
+    session.execute(update(ProductionModel).where(ProductionModel.id == 1).values(name="Sehat Alami"))
+    session.execute(update(ProductModel).where(ProductModel.id == "prod-2").values(is_active=False))
+    session.commit()
+    autocomplete.sync_autocomplete_brand(session, 1, index)
+
+    assert index.suggest("amim") == []
+    assert [entry.product_id for entry in index.suggest("sehat")] == ["prod-1"]
+    assert [entry.brand_name for entry in index.suggest("jahe")] == ["Sehat Alami"]
+    assert len(index) == 1
+
+    session.query(ProductModel).delete()
+    session.commit()
+    autocomplete.sync_autocomplete_brand(session, 1, index)
+    assert len(index) == 0
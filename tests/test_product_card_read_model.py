@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+
+NOW = datetime(2026, 4, 21, 12, 0, 0)
+
+
+@pytest.fixture
+def read_model():
+    import importlib
+
+    return importlib.import_module("app.services.product_services.product_card_read_model")
+
+
+@pytest.fixture
+def session(monkeypatch):
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+    from app.services.product_services import product_stats
+
+    monkeypatch.setenv("DEFAULT_PRODUCT_IMAGE_URL", "https://cdn.example.com/default.webp")
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id))
+    session.add_all([
+        models.ProductModel(id="prod-1", name="Teh Herbal", weight=50, price=15000, product_by_id=1, created_at=NOW),
+        models.ProductModel(id="prod-2", name="Jamu", weight=50, price=9000, product_by_id=1, created_at=NOW),
+    ])
+    session.flush()
+    session.add_all([
+        models.PackTypeModel(product_id="prod-1", name="Sachet", min_amount=1, stock=10, price=12000, discount=12.5, updated_at=NOW),
+        models.PackTypeModel(product_id="prod-1", name="Botol", min_amount=1, stock=3, price=18000, updated_at=NOW),
+    ])
+    session.flush()
+    product_stats.backfill_product_stats(session)
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_product_cards_match_entity_mapping(read_model, session):
+    from app.dtos.product_dtos import AllProductInfoDTO
+    from app.models import ProductModel, loader_profiles
+
+    rows = session.execute(read_model.product_card_query().order_by(ProductModel.id)).all()
+    cards = read_model.build_product_cards(session, rows)
+
+    products = session.execute(
+        select(ProductModel).options(*loader_profiles.PRODUCT_CARD).order_by(ProductModel.id)
+    ).scalars().all()
+    expected = [
+        AllProductInfoDTO(
+            id=product.id,
+            name=product.name,
+            price=float(product.price),
+            min_variant_price=product.min_variant_price,
+            max_variant_price=product.max_variant_price,
+            brand_info=product.brand_info,
+            primary_image_url="https://cdn.example.com/default.webp",
+            all_variants=product.all_variants or [],
+            created_at=product.created_at,
+        )
+        for product in products
+    ]
+
+    assert [card.model_dump() for card in cards] == [dto.model_dump() for dto in expected]
+    assert cards[1].all_variants == []
+    assert cards[1].min_variant_price == 9000.0
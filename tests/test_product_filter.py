@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def product_services():
+    import importlib
+
+    return importlib.import_module("app.services.product_services")
+
+
+@pytest.fixture
+def session():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+    from app.services.product_services import product_stats
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    drinks, powders = models.TagCategoryModel(name="Minuman"), models.TagCategoryModel(name="Serbuk")
+    session.add_all([drinks, powders])
+    session.flush()
+    session.add_all([
+        models.ProductionModel(id=1, name="Amimum", herbal_category_id=drinks.id),
+        models.ProductionModel(id=2, name="Nusantara", herbal_category_id=powders.id),
+    ])
+    session.add_all([
+        models.ProductModel(id="prod-1", name="Jahe Merah", weight=50, price=15000, product_by_id=1,
+                            created_at=datetime(2026, 1, 3)),
+        models.ProductModel(id="prod-2", name="Teh Herbal", weight=50, price=60000, product_by_id=1,
+                            created_at=datetime(2026, 1, 2)),
+        models.ProductModel(id="prod-3", name="Kunyit Asam", weight=50, price=30000, product_by_id=2,
+                            created_at=datetime(2026, 1, 1)),
+        models.ProductModel(id="prod-4", name="Sereh", weight=50, price=5000, product_by_id=2, is_active=False),
+    ])
+    session.flush()
+    session.add_all([
+        models.PackTypeModel(product_id="prod-1", name="Sachet", min_amount=1, stock=5, price=12000, discount=10),
+        models.PackTypeModel(product_id="prod-2", name="Botol", min_amount=1, stock=0, price=60000),
+        models.PackTypeModel(product_id="prod-3", name="Pouch", min_amount=1, stock=3, price=30000),
+    ])
+    session.flush()
+    product_stats.backfill_product_stats(session)
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_filter_returns_products_and_disjunctive_facets(product_services, session):
+    from app.dtos.product_dtos import ProductFilterDTO
+
+    statements = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    result = product_services.filter_product(session, ProductFilterDTO(brand_ids=[1], max_price=50000))
+
+    response = result.unwrap()
+    assert response.total == 1
+    assert [card.id for card in response.data] == ["prod-1"]
+    # Facet brand mengabaikan filter brand, facet harga mengabaikan filter harga
+    assert [(facet.name, facet.count) for facet in response.facets.brands] == [("Amimum", 1), ("Nusantara", 1)]
+    assert [(facet.name, facet.count) for facet in response.facets.categories] == [("Minuman", 1)]
+    assert [bucket.count for bucket in response.facets.price_buckets] == [1, 0, 1, 0, 0]
+    assert sum("UNION ALL" in statement for statement in statements) == 1
+
+
+def test_filter_by_stock_discount_and_sort(product_services, session):
+    from app.dtos.product_dtos import ProductFilterDTO
+
+    in_stock = product_services.filter_product(session, ProductFilterDTO(in_stock=True, sort_by="price_desc")).unwrap()
+    assert [card.id for card in in_stock.data] == ["prod-3", "prod-1"]
+
+    discounted = product_services.filter_product(session, ProductFilterDTO(has_discount=True)).unwrap()
+    assert [card.id for card in discounted.data] == ["prod-1"]
+
+    invalid = product_services.filter_product(session, ProductFilterDTO(min_price=10, max_price=5))
+    assert invalid.error.status_code == 400
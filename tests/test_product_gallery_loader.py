@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def support_function():
+    import importlib
+
+    return importlib.import_module("app.services.product_services.support_function")
+
+
+@pytest.fixture
+def db_session():
+    from app.libs.sql_alchemy_lib import Base
+    from app.models import ProductImageModel
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    def image(image_id, product_id, url, is_primary=False, sort_order=0):
+        return ProductImageModel(
+            id=image_id, product_id=product_id, file_path=url, url=url, mime_type="image/webp",
+            size_bytes=10, is_primary=is_primary, sort_order=sort_order,
+        )
+
+    session.add_all([
+        image(1, "prod-1", "https://cdn.example.com/images/b.webp", sort_order=2),
+        image(2, "prod-1", "https://cdn.example.com/images/a.webp", is_primary=True, sort_order=1),
+        image(3, "prod-2", "http://127.0.0.1:8000/images/c.webp", is_primary=True),
+    ])
+    session.commit()
+    yield session, engine
+    session.close()
+
+
+def test_load_product_galleries_uses_single_query_for_page(support_function, db_session, monkeypatch):
+    session, engine = db_session
+    monkeypatch.setenv("HOST_URL", "https://api.example.com")
+    monkeypatch.setenv("DEFAULT_PRODUCT_IMAGE_URL", "https://cdn.example.com/default.webp")
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    galleries = support_function.load_product_galleries(session, ["prod-1", "prod-2", "prod-3"])
+
+    assert len(statements) == 1
+    assert [img["id"] for img in galleries["prod-1"]["gallery_images"]] == [2, 1]
+    assert galleries["prod-1"]["primary_image_url"] == "https://cdn.example.com/images/a.webp"
+    assert galleries["prod-2"]["primary_image_url"] == "https://api.example.com/images/c.webp"
+    assert galleries["prod-3"] == {
+        "primary_image_url": "https://cdn.example.com/default.webp",
+        "gallery_images": [],
+    }
+
+
+def test_load_product_galleries_falls_back_to_default_on_error(support_function, monkeypatch):
+    monkeypatch.setenv("DEFAULT_PRODUCT_IMAGE_URL", "https://cdn.example.com/default.webp")
+
+    class BrokenDB:
+        def execute(self, _stmt):
+            raise RuntimeError("boom")
+
+    galleries = support_function.load_product_galleries(BrokenDB(), ["prod-1"])
+
+    assert galleries == {
+        "prod-1": {"primary_image_url": "https://cdn.example.com/default.webp", "gallery_images": []}
+    }
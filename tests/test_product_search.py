@@ -0,0 +1,96 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def product_search():
+    import importlib
+
+    return importlib.import_module("app.services.product_services.product_search")
+
+
+@pytest.fixture
+def session():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add_all([
+        models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id),
+        models.ProductionModel(id=2, name="Jahe Nusantara", herbal_category_id=category.id),
+    ])
+    session.add_all([
+        models.ProductModel(id="prod-1", name="Jahe Merah Instan", weight=50, price=15000, product_by_id=1,
+                            description="Minuman serbuk dari jahe merah pilihan untuk menghangatkan badan."),
+        models.ProductModel(id="prod-2", name="Teh Herbal", weight=50, price=9000, product_by_id=2,
+                            info="Campuran daun teh dan jahe"),
+        models.ProductModel(id="prod-3", name="Kunyit Asam", weight=50, price=12000, product_by_id=1),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_search_ranks_name_matches_above_other_fields(product_search, session):
+    hits = product_search.search_products(session, "jahe")
+
+    assert [hit.product_id for hit in hits] == ["prod-1", "prod-2"]
+    assert hits[0].rank > hits[1].rank
+    assert "<mark>jahe</mark>" in hits[0].snippet
+
+
+def test_search_tolerates_typos_and_applies_filters(product_search, session):
+    from app.models import ProductModel
+
+    assert [hit.product_id for hit in product_search.search_products(session, "kunyt asam")] == ["prod-3"]
+    assert product_search.search_products(session, "jahe", filters=[ProductModel.product_by_id == 2])[0].product_id == "prod-2"
+    assert product_search.search_products(session, "  %% ") == []
+
+
+def test_search_results_keep_relevance_order(product_search, session):
+    hits = product_search.search_products(session, "jahe")
+    results = product_search.build_search_results(session, hits)
+
+    assert [result.id for result in results] == ["prod-1", "prod-2"]
+    assert results[0].search_snippet == hits[0].snippet
+    assert results[1].brand_info == {"id": 2, "name": "Jahe Nusantara"}
+
+
+def test_snippets_escape_product_text(product_search, session):
+    from app.models import ProductModel
+
+    session.get(ProductModel, "prod-3").description = 'Kunyit <script>alert("x")</script> asli'
+    session.commit()
+
+    snippet = product_search.search_products(session, "kunyit")[0].snippet
+    assert snippet == "<mark>Kunyit</mark> &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; asli"
+    assert product_search.render_headline("\ue000<b>\ue001 & co") == "<mark>&lt;b&gt;</mark> &amp; co"
+
+
+def test_postgres_search_sets_trigram_threshold_for_the_transaction(product_search):
+    from types import SimpleNamespace
+
+    from sqlalchemy.dialects import postgresql
+
+    statements = []
+
+    class RecordingSession:
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def execute(self, statement):
+            compiled = statement.compile(dialect=postgresql.dialect())
+            statements.append((str(compiled), compiled.params))
+            return SimpleNamespace(all=lambda: [])
+
+    assert product_search.search_products(RecordingSession(), "jahe") == []
+    sql, params = statements[0]
+    assert "set_config" in sql
+    assert list(params.values()) == ["pg_trgm.word_similarity_threshold", str(product_search.WORD_SIMILARITY_THRESHOLD), True]
+    assert "<%" in statements[1][0]
@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def product_stats():
+    import importlib
+
+    return importlib.import_module("app.services.product_services.product_stats")
+
+
+@pytest.fixture
+def session():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    category = models.TagCategoryModel(name="Herbal")
+    session.add(category)
+    session.flush()
+    session.add(models.ProductionModel(id=1, name="Amimum", herbal_category_id=category.id))
+    session.add(models.ProductModel(id="prod-1", name="Teh Herbal", weight=50, price=15000, product_by_id=1))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _product(session):
+    from app.models import ProductModel
+
+    session.expire_all()
+    return session.get(ProductModel, "prod-1")
+
+
+def test_rating_delta_keeps_running_average(product_stats, session):
+    product_stats.apply_rating_delta(session, "prod-1", 5, 1)
+    product_stats.apply_rating_delta(session, "prod-1", 4, 1)
+    product_stats.apply_rating_delta(session, "prod-1", 4, 1)
+    product = _product(session)
+    assert (product.total_rater, product.rating_sum, product.avg_rating) == (3, 13, 4.3)
+
+    product_stats.apply_rating_delta(session, "prod-1", -1, 0)  # edit 5 -> 4
+    product_stats.apply_rating_delta(session, "prod-1", -4, -1)
+    product_stats.apply_rating_delta(session, "prod-1", -4, -1)
+    product_stats.apply_rating_delta(session, "prod-1", -4, -1)
+    product = _product(session)
+    assert (product.total_rater, product.rating_sum, product.avg_rating) == (0, 0, 0)
+
+
+def test_variant_stats_follow_pack_types(product_stats, session):
+    from app.models import PackTypeModel
+
+    product_stats.refresh_variant_stats(session, "prod-1")
+    product = _product(session)
+    assert (float(product.min_variant_price), float(product.max_variant_price)) == (15000.0, 15000.0)
+    assert (product.highest_promo, product.avg_promo) == (0, 0)
+
+    session.add_all([
+        PackTypeModel(product_id="prod-1", name="Sachet", min_amount=1, stock=1, price=12000, discount=12.25),
+        PackTypeModel(product_id="prod-1", name="Botol", min_amount=1, stock=1, price=18000),
+    ])
+    product_stats.refresh_variant_stats(session, "prod-1")
+    product = _product(session)
+    assert (float(product.min_variant_price), float(product.max_variant_price)) == (12000.0, 18000.0)
+    assert product.highest_promo == pytest.approx(12.3, abs=0.05)
+    assert product.avg_promo == pytest.approx(6.1, abs=0.05)
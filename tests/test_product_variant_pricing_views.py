@@ -81,7 +81,7 @@ def test_product_detail_exposes_variant_price_range(detail_product_module, monke
         def rollback(self):
             pass
 
-    monkeypatch.setattr(detail_product_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = detail_product_module.get_product_by_id(DummyDB(), "prod-1")
 
@@ -92,32 +92,45 @@ def test_product_detail_exposes_variant_price_range(detail_product_module, monke
 
 
 def test_all_product_exposes_variant_price_range(all_product_module, monkeypatch):
-    product = SimpleNamespace(
+    card_row = SimpleNamespace(
         id="prod-1",
         name="Teh Herbal",
         price=15000.0,
-        min_variant_price=12000.0,
-        max_variant_price=18000.0,
-        brand_info={"id": 1, "name": "Amimum"},
-        all_variants=[VARIANT_GRID_ITEM],
+        brand_id=1,
+        brand_name="Amimum",
         created_at=NOW,
     )
-
-    class ScalarResult:
-        def scalars(self):
-            return self
+    variant_rows = [
+        SimpleNamespace(
+            id=1, product_id="prod-1", name="Sachet", variant="Jeruk", img=None, expiration=None,
+            stock=10, price=12000.0, discount=10.0, updated_at=NOW,
+        ),
+        SimpleNamespace(
+            id=2, product_id="prod-1", name="Botol", variant="Jahe", img=None, expiration=None,
+            stock=5, price=18000.0, discount=None, updated_at=NOW,
+        ),
+    ]
+
+    class RowResult:
+        def __init__(self, rows):
+            self.rows = rows
 
         def all(self):
-            return [product]
+            return self.rows
 
     class DummyDB:
-        def execute(self, _stmt):
-            return ScalarResult()
+        def execute(self, stmt):
+            statement = str(stmt)
+            if "FROM pack_types" in statement:
+                return RowResult(variant_rows)
+            if "FROM product_images" in statement:
+                return RowResult([])
+            return RowResult([card_row])
 
         def rollback(self):
             pass
 
-    monkeypatch.setattr(all_product_module, "redis_client", None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = all_product_module.all_product(DummyDB())
 
@@ -126,3 +139,5 @@ def test_all_product_exposes_variant_price_range(all_product_module, monkeypatch
     assert first.min_variant_price == 12000.0
     assert first.max_variant_price == 18000.0
     assert first.all_variants[0].price == 12000.0
+    assert first.all_variants[0].discounted_price == 10800.0
+    assert first.brand_info == {"id": 1, "name": "Amimum"}
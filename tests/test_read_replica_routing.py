@@ -0,0 +1,132 @@
+import pytest
+from sqlalchemy import column, create_engine, insert, table, text
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def sql_alchemy_lib():
+    import importlib
+
+    return importlib.import_module("app.libs.sql_alchemy_lib")
+
+
+@pytest.fixture
+def databases(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine, label in ((primary, "primary"), (replica, "replica")):
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, source TEXT)"))
+            connection.execute(text("INSERT INTO notes (source) VALUES (:source)"), {"source": label})
+    return primary, replica
+
+
+@pytest.fixture
+def session_factories(sql_alchemy_lib, databases):
+    primary, replica = databases
+    writers = sql_alchemy_lib.RecentWriters(window_seconds=30, client_getter=lambda: None)
+    write_factory = sessionmaker(class_=sql_alchemy_lib.RoutingSession, bind=primary, writers=writers)
+    read_factory = sessionmaker(
+        class_=sql_alchemy_lib.RoutingSession,
+        bind=primary,
+        replica_bind=replica,
+        writers=writers,
+        info={"read_only": True},
+    )
+    return write_factory, read_factory, writers
+
+
+def _first_source(session) -> str:
+    return session.execute(text("SELECT source FROM notes ORDER BY id LIMIT 1")).scalar()
+
+
+def test_read_only_session_uses_replica(session_factories):
+    write_factory, read_factory, _ = session_factories
+
+    with read_factory() as session:
+        assert _first_source(session) == "replica"
+
+    with write_factory() as session:
+        assert _first_source(session) == "primary"
+
+
+def test_user_sticks_to_primary_after_commit(sql_alchemy_lib, session_factories):
+    write_factory, read_factory, _ = session_factories
+    token = sql_alchemy_lib.current_db_user.set("user-1")
+    try:
+        with write_factory() as session:
+            session.execute(insert(table("notes", column("source"))).values(source="written"))
+            session.commit()
+
+        with read_factory() as session:
+            assert _first_source(session) == "primary"
+    finally:
+        sql_alchemy_lib.current_db_user.reset(token)
+
+    token = sql_alchemy_lib.current_db_user.set("user-2")
+    try:
+        with read_factory() as session:
+            assert _first_source(session) == "replica"
+    finally:
+        sql_alchemy_lib.current_db_user.reset(token)
+
+
+def test_stickiness_expires_after_window(sql_alchemy_lib, session_factories, monkeypatch):
+    _, read_factory, writers = session_factories
+    writers.mark("user-1")
+
+    clock = sql_alchemy_lib.time.monotonic() + 31
+    monkeypatch.setattr(sql_alchemy_lib.time, "monotonic", lambda: clock)
+
+    token = sql_alchemy_lib.current_db_user.set("user-1")
+    try:
+        with read_factory() as session:
+            assert _first_source(session) == "replica"
+    finally:
+        sql_alchemy_lib.current_db_user.reset(token)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def setex(self, key, ttl, value):
+        self.store[key] = (value, ttl)
+
+    def exists(self, key):
+        return int(key in self.store)
+
+
+def test_stickiness_is_shared_across_workers_through_redis(sql_alchemy_lib, databases):
+    primary, replica = databases
+    redis = FakeRedis()
+    worker_a = sql_alchemy_lib.RecentWriters(window_seconds=30, client_getter=lambda: redis)
+    worker_b = sql_alchemy_lib.RecentWriters(window_seconds=30, client_getter=lambda: redis)
+    read_factory = sessionmaker(
+        class_=sql_alchemy_lib.RoutingSession,
+        bind=primary,
+        replica_bind=replica,
+        writers=worker_b,
+        info={"read_only": True},
+    )
+
+    worker_a.mark("user-1")
+    assert redis.store["ryw:user-1"] == ("1", 30)
+
+    token = sql_alchemy_lib.current_db_user.set("user-1")
+    try:
+        with read_factory() as session:
+            assert _first_source(session) == "primary"
+    finally:
+        sql_alchemy_lib.current_db_user.reset(token)
+
+
+def test_primary_reads_block_bypasses_replica(sql_alchemy_lib, session_factories):
+    _, read_factory, _ = session_factories
+
+    with sql_alchemy_lib.primary_reads():
+        with read_factory() as session:
+            assert _first_source(session) == "primary"
+
+    with read_factory() as session:
+        assert _first_source(session) == "replica"
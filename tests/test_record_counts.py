@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.libs.cache import BRANDS, bump_namespaces
+from app.services import record_counts
+from app.services.record_counts import count_records
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.ops = []
+
+            def set(self, key, value, nx=False):
+                self.ops.append(lambda: None if nx and key in client.store else client.store.__setitem__(key, str(value)))
+
+            def incr(self, key):
+                self.ops.append(lambda: client.store.__setitem__(key, str(int(client.store.get(key, 0)) + 1)))
+
+            def expire(self, key, ttl):
+                pass
+
+            def setex(self, key, ttl, value):
+                self.ops.append(lambda: client.setex(key, ttl, value))
+
+            def publish(self, channel, message):
+                pass
+
+            def execute(self):
+                for op in self.ops:
+                    op()
+
+        return Pipeline()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr("app.libs.redis_config.redis_client", client)
+    return client
+
+
+@pytest.fixture
+def db():
+    from app.libs.sql_alchemy_lib import Base
+    from app import models
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    herbal, jamu = models.TagCategoryModel(name="Herbal"), models.TagCategoryModel(name="Jamu")
+    session.add_all([herbal, jamu])
+    session.flush()
+    session.add_all([
+        models.ProductionModel(id=index, name=f"Brand {index}", herbal_category_id=herbal.id if index <= 3 else jamu.id)
+        for index in range(1, 6)
+    ])
+    session.commit()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session.statements = statements
+    yield session
+    session.close()
+
+
+def test_exact_count_is_cached_until_namespace_is_bumped(db, redis):
+    from app.models.production_model import ProductionModel
+
+    first = count_records(db, ProductionModel, ProductionModel.herbal_category_id == 1, namespace=BRANDS, name="category:1")
+    second = count_records(db, ProductionModel, ProductionModel.herbal_category_id == 1, namespace=BRANDS, name="category:1")
+
+    assert (first.value, first.is_exact) == (3, True)
+    assert second == first
+    assert len(db.statements) == 1
+
+    db.add(ProductionModel(id=6, name="Brand 6", herbal_category_id=1))
+    db.commit()
+    bump_namespaces(BRANDS)
+
+    assert count_records(db, ProductionModel, ProductionModel.herbal_category_id == 1, namespace=BRANDS, name="category:1").value == 4
+
+
+def test_large_unfiltered_table_uses_planner_estimate(db, redis, monkeypatch):
+    from app.models.production_model import ProductionModel
+
+    monkeypatch.setattr(record_counts, "planner_estimate", lambda db, table_name: 250_000)
+
+    estimated = count_records(db, ProductionModel, namespace=BRANDS, name="all")
+    filtered = count_records(db, ProductionModel, ProductionModel.herbal_category_id == 2, namespace=BRANDS, name="category:2")
+
+    assert (estimated.value, estimated.is_exact) == (250_000, False)
+    assert (filtered.value, filtered.is_exact) == (2, True)
+
+
+def test_planner_estimate_is_unavailable_outside_postgres(db):
+    assert record_counts.planner_estimate(db, "productions") is None
@@ -0,0 +1,174 @@
+import time
+
+import pytest
+import redis
+
+from app.libs.redis_config import CLOSED, OPEN, CircuitOpenError, ResilientRedisClient
+
+
+class FlakyRedis:
+    def __init__(self):
+        self.down = False
+        self.calls = 0
+        self.store = {}
+
+    def _check(self):
+        self.calls += 1
+        if self.down:
+            raise redis.ConnectionError("connection refused")
+
+    def ping(self):
+        self._check()
+        return True
+
+    def get(self, key):
+        self._check()
+        return self.store.get(key)
+
+    def set(self, key, value):
+        self._check()
+        self.store[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return FlakyPipeline(self)
+
+    def pubsub(self, **kwargs):
+        return FlakyPubSub(self)
+
+
+class FlakyPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value):
+        self.commands.append((key, value))
+
+    def execute(self):
+        self.client._check()
+        self.client.store.update(self.commands)
+        return [True] * len(self.commands)
+
+
+class FlakyPubSub:
+    def __init__(self, client):
+        self.client = client
+
+    def subscribe(self, channel):
+        self.client._check()
+
+    def get_message(self, timeout=0.0):
+        self.client._check()
+        return None
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def flaky():
+    return FlakyRedis()
+
+
+def make_client(flaky, **kwargs):
+    return ResilientRedisClient(client=flaky, failure_threshold=3, cooldown_seconds=0.05, max_backoff=0.1, **kwargs)
+
+
+def test_commands_are_proxied_while_closed(flaky):
+    client = make_client(flaky)
+
+    assert client
+    assert client.set("a", "1") is True
+    assert client.get("a") == "1"
+    assert client.health()["state"] == CLOSED
+    client.close()
+
+
+def test_breaker_opens_after_threshold_and_fails_fast(flaky):
+    client = make_client(flaky, connect=False)
+    client.cooldown_seconds = 60
+    flaky.down = True
+
+    for _ in range(3):
+        with pytest.raises(redis.ConnectionError):
+            client.get("a")
+
+    assert not client
+    calls = flaky.calls
+    with pytest.raises(CircuitOpenError):
+        client.get("a")
+    assert flaky.calls == calls
+
+    health = client.health()
+    assert health["state"] == OPEN
+    assert health["times_opened"] == 1
+    assert health["rejected_calls"] == 1
+    assert health["total_failures"] == 3
+    client.close()
+
+
+def test_success_resets_consecutive_failures(flaky):
+    client = make_client(flaky, connect=False)
+    flaky.down = True
+    for _ in range(2):
+        with pytest.raises(redis.ConnectionError):
+            client.get("a")
+
+    flaky.down = False
+    client.get("a")
+
+    assert client.health()["consecutive_failures"] == 0
+    assert client
+    client.close()
+
+
+def test_background_reconnect_closes_breaker(flaky):
+    flaky.down = True
+    client = make_client(flaky)
+    assert not client
+
+    flaky.down = False
+
+    assert wait_for(lambda: bool(client))
+    assert client.health()["last_recovered_at"] is not None
+    assert client.get("missing") is None
+    client.close()
+
+
+def test_pipeline_and_pubsub_failures_count_toward_breaker(flaky):
+    client = make_client(flaky)
+    pipeline = client.pipeline(transaction=False)
+    pipeline.set("a", "1")
+    assert pipeline.execute() == [True]
+    assert client.health()["total_calls"] == 1
+
+    pubsub = client.pubsub()
+    pubsub.subscribe("channel")
+    assert client.health()["total_calls"] == 2
+    flaky.down = True
+    with pytest.raises(redis.ConnectionError):
+        pubsub.get_message(timeout=0)
+
+    # Poll idle yang sukses tidak dihitung dan tidak mereset hitungan kegagalan
+    flaky.down = False
+    for _ in range(5):
+        assert pubsub.get_message(timeout=0) is None
+    assert client.health()["total_calls"] == 3
+    assert client.health()["consecutive_failures"] == 1
+
+    flaky.down = True
+    with pytest.raises(redis.ConnectionError):
+        pubsub.get_message(timeout=0)
+    with pytest.raises(redis.ConnectionError):
+        client.pipeline(transaction=False).execute()
+
+    assert not client
+    assert client.health()["total_failures"] == 3
+    with pytest.raises(CircuitOpenError):
+        client.pipeline()
+    client.close()
@@ -87,14 +87,17 @@ def test_delete_type_rejects_variant_in_order_history(delete_type_module):
     assert result.error.status_code == 409
 
 
-def test_delete_type_deletes_safe_variant(delete_type_module):
-    variant = SimpleNamespace(id=5, variant="Jeruk", name="Sachet")
+def test_delete_type_deletes_safe_variant(delete_type_module, monkeypatch):
+    variant = SimpleNamespace(id=5, product_id="prod-1", variant="Jeruk", name="Sachet", discount=None)
     db = DeleteDB(variant=variant)
+    refreshed = []
+    monkeypatch.setattr(delete_type_module, "refresh_variant_stats", lambda _db, product_id: refreshed.append(product_id))
     result = delete_type_module.delete_type(db, SimpleNamespace(type_id=5))
 
     assert result.error is None
     assert db.deleted == [variant]
     assert db.committed is True
+    assert refreshed == ["prod-1"]
 
 
 def test_my_wishlist_returns_variant_pricing(wishlist_module, monkeypatch):
@@ -130,7 +133,7 @@ def test_my_wishlist_returns_variant_pricing(wishlist_module, monkeypatch):
         def rollback(self):
             pass
 
-    monkeypatch.setattr(wishlist_module, 'redis_client', None)
+    monkeypatch.setattr("app.libs.redis_config.redis_client", None)
 
     result = wishlist_module.my_wishlist(WishlistDB(), 'user-1')
 
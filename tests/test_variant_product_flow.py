@@ -97,9 +97,11 @@ def test_create_type_rejects_missing_product(create_type_module):
     assert result.error.status_code == 404
 
 
-def test_create_type_returns_variant_price(create_type_module):
+def test_create_type_returns_variant_price(create_type_module, monkeypatch):
     product = SimpleNamespace(id="prod-1", name="Teh Herbal")
     db = DummyDB(product=product)
+    refreshed = []
+    monkeypatch.setattr(create_type_module, "refresh_variant_stats", lambda _db, product_id: refreshed.append(product_id))
     payload = SimpleNamespace(
         product_id="prod-1",
         model_dump=lambda: {
@@ -119,9 +121,10 @@ def test_create_type_returns_variant_price(create_type_module):
     assert result.error is None
     assert result.data.data.price == 15000.0
     assert result.data.data.discounted_price == 13500.0
+    assert refreshed == ["prod-1"]
 
 
-def test_update_stock_only_updates_provided_fields(update_stock_module):
+def test_update_stock_only_updates_provided_fields(update_stock_module, monkeypatch):
     variant = SimpleNamespace(
         id=2,
         product_id="prod-1",
@@ -143,6 +146,8 @@ def test_update_stock_only_updates_provided_fields(update_stock_module):
         "price": 12000.0,
     })
     type_id_update = SimpleNamespace(type_id=2)
+    refreshed = []
+    monkeypatch.setattr(update_stock_module, "refresh_variant_stats", lambda _db, product_id: refreshed.append(product_id))
 
     result = update_stock_module.update_stock(db, type_id_update, payload)
 
@@ -150,6 +155,7 @@ def test_update_stock_only_updates_provided_fields(update_stock_module):
     assert variant.stock == 5
     assert variant.price == 12000.0
     assert variant.discount == 10.0
+    assert refreshed == ["prod-1"]
 
 
 def test_post_item_rejects_variant_product_mismatch(cart_post_item_module, monkeypatch):
@@ -176,7 +182,7 @@ def test_post_item_rejects_variant_product_mismatch(cart_post_item_module, monke
         def rollback(self):
             pass
 
-    monkeypatch.setattr(cart_post_item_module, 'redis_client', None)
+    monkeypatch.setattr('app.libs.redis_config.redis_client', None)
 
     result = cart_post_item_module.post_item(
         ExecDB(),